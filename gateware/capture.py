@@ -0,0 +1,335 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+from migen.genlib.cdc import MultiReg, PulseSynchronizer, BusSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+# Sniffer Capture Format ---------------------------------------------------------------------------
+
+# Captures are streamed as records of 64-bit little-endian words:
+#
+# +----------------------------------------------------------------+
+# | Header 0: magic [31:0], length [47:32], flags [55:48],         |
+# |           dropped records since previous record [63:56]        |
+# | Header 1: index of the first sample (capture clk cycles)       |
+# | Sample 0: channel 0 [31:0], channel 1 [63:32]                  |
+# | ...                                                            |
+# | Sample length - 1                                              |
+# +----------------------------------------------------------------+
+#
+# Each channel is a raw sniffer word (data in [15:0], ctl in [17:16], as the raw binary captures of
+# tools/ptm_extract.py): channel 0 is RX, channel 1 TX (when available).
+#
+# PAD words (magic [31:0], 0 in [63:32]) are inserted between records when the stream is idle to
+# complete partial DMA requests/buffers (the DMA only writes full requests and the host only sees
+# complete buffers), so that the records reach the host within the flush timeout.
+
+SNIFFER_CAPTURE_MAGIC     = 0x50414353 # "SCAP".
+SNIFFER_CAPTURE_PAD_MAGIC = 0x44415053 # "SPAD".
+
+SNIFFER_CAPTURE_FLAG_TRIGGERED = (1 << 0) # Record started on a trigger (vs continuous).
+SNIFFER_CAPTURE_FLAG_TX        = (1 << 1) # Channel 1 (TX) captured.
+
+sniffer_capture_header_layout = [
+    ("length",  16), # Samples.
+    ("flags",    8),
+    ("dropped",  8), # Records dropped since previous record (saturated).
+    ("index",   64), # Index of the first sample (capture clk cycles).
+]
+
+# Sniffer Capture ----------------------------------------------------------------------------------
+
+class SnifferCapture(LiteXModule):
+    """Sniffer Capture (to DMA).
+
+    Captures the raw sniffer words (one sample per capture clock cycle) in records of length samples
+    streamed on source (ex: to the DMA Writer), so captures are no longer limited to the depth of an
+    analyzer. Records are started on trigger (with pretrigger samples taken before the trigger from
+    a delay line) or back-to-back in continuous mode, without gaps between records.
+
+    Samples are buffered in a FIFO in the capture clock domain: a record is only started when the
+    FIFO has room for all its samples, otherwise the whole record is dropped (and counted, also in
+    the header of the next record), so records are never truncated when the host/DMA does not keep
+    up with the capture rate (ex: raw PIPE words at pclk exceed the DMA bandwidth of a Gen2 X1 link,
+    so only triggered records/bursts are lossless in practice).
+
+    When no record is pending for flush_timeout (or when disabled), the stream is padded to a
+    multiple of flush_length words, so that the last record is not held in a partial DMA request.
+    """
+    def __init__(self, clock_domain, channels, sys_clk_freq, depth=4096, pretrigger_depth=256, flush_length=64, with_csr=True):
+        assert 1 <= len(channels) <= 2
+        assert all(len(channel) <= 32 for channel in channels)
+        assert pretrigger_depth == 0 or log2_int(pretrigger_depth, need_pow2=True)
+        self.trigger = Signal() # Sys Clk Domain (ex: PTM Requester trigger).
+
+        # Control (Sys Clk Domain, configuration to be changed while disabled).
+        self.enable     = Signal()
+        self.continuous = Signal()
+        self.length     = Signal(16, reset=1024) # Samples (clamped to max_length).
+        self.pretrigger = Signal(16)             # Samples (clamped to max_pretrigger).
+        self.sw_trigger = Signal()
+
+        # Flush (Sys Clk Domain).
+        self.flush_timeout = Signal(32)                     # In sys_clk cycles.
+        self.flush_length  = Signal(32, reset=flush_length) # Words (0: Disabled).
+
+        # Status (Sys Clk Domain).
+        self.records = Signal(32)
+        self.dropped = Signal(32)
+
+        # Records (Sys Clk Domain).
+        self.source = stream.Endpoint([("data", 64)])
+
+        # # #
+
+        # Capture Clk Domain.
+        self.cd_capture = ClockDomain()
+        self.comb += [
+            self.cd_capture.clk.eq(ClockSignal(clock_domain)),
+            self.cd_capture.rst.eq(ResetSignal(clock_domain)),
+        ]
+
+        # Configuration clamped to the FIFO (record fitting in the FIFO) and Delay Line capacities.
+        self.max_length     = max_length     = min(depth - 1, 2**16 - 1)
+        self.max_pretrigger = max_pretrigger = max(pretrigger_depth - 1, 0)
+        length_clamped      = Signal(16)
+        pretrigger_clamped  = Signal(16)
+        self.comb += [
+            length_clamped.eq(Mux(self.length > max_length, max_length, self.length)),
+            pretrigger_clamped.eq(Mux(self.pretrigger > max_pretrigger, max_pretrigger, self.pretrigger)),
+        ]
+
+        # Resynchronization.
+        enable     = Signal()
+        continuous = Signal()
+        length     = Signal(16)
+        pretrigger = Signal(16)
+        self.specials += [
+            MultiReg(self.enable,     enable,     "capture"),
+            MultiReg(self.continuous, continuous, "capture"),
+            MultiReg(length_clamped,  length,     "capture"),
+        ]
+        if pretrigger_depth:
+            self.specials += MultiReg(pretrigger_clamped, pretrigger, "capture")
+        self.trigger_ps = trigger_ps = PulseSynchronizer("sys", "capture")
+        self.comb += trigger_ps.i.eq(self.trigger | self.sw_trigger)
+
+        # Samples (Channel 0 in [31:0], Channel 1 in [63:32]).
+        sample = Signal(64)
+        self.comb += [sample[32*n:32*n + len(channel)].eq(channel) for n, channel in enumerate(channels)]
+
+        # Sample Index.
+        index = Signal(64)
+        self.sync.capture += index.eq(index + 1)
+
+        # Pretrigger Delay Line: delayed sample is the sample pretrigger cycles before the previous one.
+        sample_d = Signal(64)
+        delayed  = Signal(64)
+        self.sync.capture += sample_d.eq(sample)
+        if pretrigger_depth:
+            mem = Memory(64, pretrigger_depth)
+            wr_port = mem.get_port(write_capable=True, clock_domain="capture")
+            rd_port = mem.get_port(clock_domain="capture")
+            self.specials += mem, wr_port, rd_port
+            pretrigger_d = Signal(16)
+            self.sync.capture += pretrigger_d.eq(pretrigger)
+            self.comb += [
+                wr_port.we.eq(1),
+                wr_port.adr.eq(index),
+                wr_port.dat_w.eq(sample),
+                rd_port.adr.eq(index - pretrigger),
+                delayed.eq(Mux(pretrigger_d == 0, sample_d, rd_port.dat_r)),
+            ]
+        else:
+            self.comb += delayed.eq(sample_d)
+
+        # FIFOs (Headers directly crossing to Sys Clk Domain).
+        self.header_fifo = header_fifo = stream.ClockDomainCrossing(sniffer_capture_header_layout,
+            cd_from = "capture",
+            cd_to   = "sys",
+            depth   = 16,
+        )
+        self.data_fifo = data_fifo = ClockDomainsRenamer("capture")(
+            stream.SyncFIFO([("data", 64)], depth=depth, buffered=True))
+        self.data_cdc  = data_cdc  = stream.ClockDomainCrossing([("data", 64)],
+            cd_from = "capture",
+            cd_to   = "sys",
+        )
+        self.comb += data_fifo.source.connect(data_cdc.sink)
+
+        # Records.
+        busy      = Signal()
+        keep      = Signal()
+        remaining = Signal(16)
+        last      = Signal()
+        start     = Signal()
+        room      = Signal()
+        dropped   = Signal(8)
+        records   = Signal(32)
+        drops     = Signal(32)
+        self.comb += [
+            last.eq(busy & (remaining == 1)),
+            start.eq(enable & (length != 0) & (continuous | trigger_ps.o) & (~busy | last)),
+            # Room for the record (including the sample of the previous record written this cycle).
+            room.eq(header_fifo.sink.ready & (data_fifo.level + length + 1 <= depth)),
+            header_fifo.sink.valid.eq(start & room),
+            header_fifo.sink.length.eq(length),
+            header_fifo.sink.flags.eq(Cat(
+                ~continuous,                      # SNIFFER_CAPTURE_FLAG_TRIGGERED.
+                Constant(len(channels) > 1, 1),   # SNIFFER_CAPTURE_FLAG_TX.
+            )),
+            header_fifo.sink.dropped.eq(dropped),
+            header_fifo.sink.index.eq(index - pretrigger),
+            data_fifo.sink.valid.eq(busy & keep),
+            data_fifo.sink.data.eq(delayed),
+        ]
+        self.sync.capture += [
+            If(start,
+                busy.eq(1),
+                keep.eq(room),
+                remaining.eq(length),
+                If(room,
+                    records.eq(records + 1),
+                    dropped.eq(0),
+                ).Else(
+                    drops.eq(drops + 1),
+                    If(dropped != (2**len(dropped) - 1),
+                        dropped.eq(dropped + 1),
+                    )
+                )
+            ).Elif(busy,
+                remaining.eq(remaining - 1),
+                If(last,
+                    busy.eq(0),
+                )
+            )
+        ]
+
+        # Record Framing (Sys Clk Domain): Header words then length samples. Done after the CDC so
+        # that the header words do not reduce the capture bandwidth: continuous records are lossless
+        # as long as the sink is faster than the capture clock.
+        count    = Signal(16)
+        position = Signal(32) # Words since the last flush_length boundary.
+        idle     = Signal(32)
+        aligned  = Signal()
+        pad      = Signal()
+        self.fsm = fsm = FSM(reset_state="HEADER-0")
+        self.comb += [
+            aligned.eq(position == 0),
+            # PAD when idle and not aligned (after flush timeout or when disabled).
+            pad.eq(~header_fifo.source.valid & ~aligned & ((idle >= self.flush_timeout) | ~self.enable)),
+        ]
+        self.sync += [
+            If(self.source.valid & self.source.ready,
+                If(position + 1 >= self.flush_length,
+                    position.eq(0)
+                ).Else(
+                    position.eq(position + 1)
+                )
+            ),
+            # Idle time since the last record (PAD words padding the stream back-to-back).
+            If(aligned | header_fifo.source.valid | ~fsm.ongoing("HEADER-0"),
+                idle.eq(0)
+            ).Elif(idle != (2**32 - 1),
+                idle.eq(idle + 1)
+            )
+        ]
+        fsm.act("HEADER-0",
+            self.source.valid.eq(header_fifo.source.valid),
+            self.source.data[0:32].eq(SNIFFER_CAPTURE_MAGIC),
+            self.source.data[32:48].eq(header_fifo.source.length),
+            self.source.data[48:56].eq(header_fifo.source.flags),
+            self.source.data[56:64].eq(header_fifo.source.dropped),
+            If(self.source.valid & self.source.ready,
+                NextState("HEADER-1")
+            ).Elif(pad,
+                NextState("PAD")
+            )
+        )
+        fsm.act("PAD",
+            self.source.valid.eq(1),
+            self.source.data[0:32].eq(SNIFFER_CAPTURE_PAD_MAGIC),
+            If(self.source.ready & (position + 1 >= self.flush_length),
+                NextState("HEADER-0")
+            )
+        )
+        fsm.act("HEADER-1",
+            self.source.valid.eq(1),
+            self.source.data.eq(header_fifo.source.index),
+            If(self.source.ready,
+                header_fifo.source.ready.eq(1),
+                NextValue(count, header_fifo.source.length),
+                NextState("DATA")
+            )
+        )
+        fsm.act("DATA",
+            data_cdc.source.connect(self.source, omit={"first", "last"}),
+            If(self.source.valid & self.source.ready,
+                NextValue(count, count - 1),
+                If(count == 1,
+                    NextState("HEADER-0")
+                )
+            )
+        )
+
+        # Status.
+        self.records_sync = BusSynchronizer(32, "capture", "sys")
+        self.dropped_sync = BusSynchronizer(32, "capture", "sys")
+        self.comb += [
+            self.records_sync.i.eq(records),
+            self.dropped_sync.i.eq(drops),
+            self.records.eq(self.records_sync.o),
+            self.dropped.eq(self.dropped_sync.o),
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr(sys_clk_freq, default_flush_length=flush_length)
+
+    def add_csr(self, sys_clk_freq, default_flush_timeout=10e-6, default_flush_length=64):
+        self._control = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, values=[
+                ("``0b0``", "Sniffer Capture Disabled (current record is completed, stream padded)."),
+                ("``0b1``", "Sniffer Capture Enabled."),
+            ]),
+            CSRField("continuous", size=1, offset=1, values=[
+                ("``0b0``", "Records started on trigger."),
+                ("``0b1``", "Records started back-to-back."),
+            ]),
+            CSRField("trigger", size=1, offset=2, pulse=True, description="Software trigger."),
+        ])
+        self._length     = CSRStorage(16, reset=1024,
+            description=f"Record length (in samples, clamped to {self.max_length}).")
+        self._pretrigger = CSRStorage(16,
+            description=f"Samples recorded before the trigger (clamped to {self.max_pretrigger}).")
+        self._flush_timeout = CSRStorage(32, reset=int(default_flush_timeout*sys_clk_freq),
+            description="Idle time before padding the stream (in sys_clk cycles).")
+        self._flush_length  = CSRStorage(32, reset=default_flush_length,
+            description="Stream padded to a multiple of flush_length words (0: Disabled).")
+        self._records    = CSRStatus(32, description="Captured records.")
+        self._dropped    = CSRStatus(32, description="Dropped records (FIFO full).")
+
+        # # #
+
+        self.comb += [
+            # Control.
+            self.enable.eq(self._control.fields.enable),
+            self.continuous.eq(self._control.fields.continuous),
+            self.sw_trigger.eq(self._control.fields.trigger),
+            self.length.eq(self._length.storage),
+            self.pretrigger.eq(self._pretrigger.storage),
+            self.flush_timeout.eq(self._flush_timeout.storage),
+            self.flush_length.eq(self._flush_length.storage),
+            # Status.
+            self._records.status.eq(self.records),
+            self._dropped.status.eq(self.dropped),
+        ]
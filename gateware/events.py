@@ -0,0 +1,275 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from gateware.ptm import ptm_sample_layout
+from gateware.pps import pps_timestamp_layout
+
+# Time Event Format --------------------------------------------------------------------------------
+
+# Time events are streamed (ex: to a DMA Writer) as fixed-size records of 4 64-bit little-endian
+# words, the header being the last word of the record:
+#
+# +----------------------------------------------------------------+
+# | Word 0: Type specific (TIME: Time, PTM: T1, PPS: Timestamp)    |
+# | Word 1: Type specific (TIME: sys_clk cycles, PTM: T2)          |
+# | Word 2: Type specific (PTM: T4)                                |
+# | Header: data [31:0] (PTM: Link Delay), sequence [55:32],       |
+# |         type [59:56], flags [63:60]                            |
+# +----------------------------------------------------------------+
+#
+# The sequence is the index of the record in the stream (restarting at 0 on enable, modulo 2^24):
+# a consumer polling a ring buffer written by DMA (and cleared on DMA start, type NONE) can detect
+# new records, records not yet written and records overwritten (overrun) from the header alone.
+# PAD records are inserted when the stream is idle to complete partial DMA requests (the DMA only
+# writes full requests), so that events reach the host within the flush timeout. The stream is padded
+# to the largest DMA request: the Max Payload Size negotiated by the PHY, up to 512 bytes (16 records).
+
+TIME_EVENT_RECORD_WORDS  = 4
+TIME_EVENT_SEQUENCE_BITS = 24
+TIME_EVENT_FLUSH_ALIGN   = 512//(TIME_EVENT_RECORD_WORDS*8)
+
+TIME_EVENT_TYPE_NONE = 0x0 # Never written (cleared buffer).
+TIME_EVENT_TYPE_PAD  = 0x1 # Padding (to be ignored).
+TIME_EVENT_TYPE_TIME = 0x2 # Periodic Time: Time (ns), sys_clk cycles.
+TIME_EVENT_TYPE_PTM  = 0x3 # Completed PTM exchange: T1, T2, T4 (ns), Link Delay (ns).
+TIME_EVENT_TYPE_PPS  = 0x4 # PPS/Event Timestamp (ns).
+
+TIME_EVENT_FLAG_LOST = (1 << 0) # Events lost (pending event overwritten) before this record.
+
+time_event_layout = [
+    ("type",   4),
+    ("data",  32),
+    ("word0", 64),
+    ("word1", 64),
+    ("word2", 64),
+]
+
+# Time Event Stream --------------------------------------------------------------------------------
+
+class TimeEventStream(LiteXModule):
+    """Time Event Stream (to DMA).
+
+    Streams the timing events (periodic Time, completed PTM exchanges, PPS timestamps) as
+    fixed-size records on source, so that the host receives them in a DMA ring buffer without
+    per-event CSR reads or ioctls.
+
+    Events are latched on ptm/pps sinks (valid only, always accepted) and on the Time period timer,
+    then pushed to a FIFO. An event arriving while the previous one of the same source is still
+    pending is lost (counted and signalled with the LOST flag of the next record). When disabled,
+    the FIFO is drained and the stream padded to a complete DMA request before the DMA is stopped.
+    """
+    def __init__(self, clk_domain, time, sys_clk_freq, fifo_depth=64, flush_align=TIME_EVENT_FLUSH_ALIGN, with_csr=True):
+        assert flush_align >= 1 and log2_int(flush_align, need_pow2=True) < TIME_EVENT_SEQUENCE_BITS
+        # Control.
+        self.enable        = Signal()
+        self.time_period   = Signal(32) # In sys_clk cycles (0: Disabled).
+        self.flush_timeout = Signal(32) # In sys_clk cycles.
+
+        # Events (Sys Clk Domain, valid only).
+        self.ptm = stream.Endpoint(ptm_sample_layout)
+        self.pps = stream.Endpoint(pps_timestamp_layout)
+
+        # Status.
+        self.records = Signal(32)
+        self.lost    = Signal(32)
+
+        # Records.
+        self.source = stream.Endpoint([("data", 64)])
+
+        # # #
+
+        # Time Clk Domain.
+        self.cd_time = ClockDomain()
+        self.comb += [
+            self.cd_time.clk.eq(ClockSignal(clk_domain)),
+            self.cd_time.rst.eq(ResetSignal(clk_domain)),
+        ]
+
+        # Time -> Sys CDC.
+        self.time_cdc = time_cdc = stream.ClockDomainCrossing([("time", 64)],
+            cd_from = "time",
+            cd_to   = "sys",
+        )
+        time_sys = Signal(64)
+        self.comb += [
+            time_cdc.sink.valid.eq(1),
+            time_cdc.sink.time.eq(time),
+            time_cdc.source.ready.eq(1),
+        ]
+        self.sync += If(time_cdc.source.valid, time_sys.eq(time_cdc.source.time))
+
+        # Sys Clk Cycles.
+        cycles = Signal(64)
+        self.sync += cycles.eq(cycles + 1)
+
+        # Time Period Timer.
+        tick  = Signal()
+        count = Signal(32)
+        self.sync += [
+            tick.eq(0),
+            If(~self.enable | (self.time_period == 0),
+                count.eq(0),
+            ).Elif(count == 0,
+                tick.eq(1),
+                count.eq(self.time_period - 1),
+            ).Else(
+                count.eq(count - 1),
+            )
+        ]
+
+        # Events (by priority).
+        self.comb += [
+            self.ptm.ready.eq(1),
+            self.pps.ready.eq(1),
+        ]
+        events = [
+            (self.ptm.valid, TIME_EVENT_TYPE_PTM, self.ptm.link_delay, [self.ptm.t1, self.ptm.t2, self.ptm.t4]),
+            (self.pps.valid, TIME_EVENT_TYPE_PPS, 0,                   [self.pps.timestamp]),
+            (tick,           TIME_EVENT_TYPE_TIME, 0,                  [time_sys, cycles]),
+        ]
+
+        # Event FIFO (drained when disabled).
+        self.fifo = fifo = stream.SyncFIFO(time_event_layout, depth=fifo_depth, buffered=True)
+
+        # Pending Events: latched on event, pushed to the FIFO by priority.
+        lost_event = Signal()
+        selected   = Signal()
+        for valid, _type, data, words in events:
+            pending = Signal()
+            event   = Record(time_event_layout)
+            push    = Signal()
+            self.comb += push.eq(pending & ~selected & fifo.sink.ready)
+            self.sync += [
+                If(~self.enable,
+                    pending.eq(0),
+                ).Elif(valid,
+                    pending.eq(1),
+                    event.type.eq(_type),
+                    event.data.eq(data),
+                    *[getattr(event, f"word{n}").eq(word) for n, word in enumerate(words)],
+                ).Elif(push,
+                    pending.eq(0),
+                )
+            ]
+            self.comb += If(self.enable & valid & pending & ~push, lost_event.eq(1))
+            # Highest priority pending event.
+            new_selected = Signal()
+            self.comb += [
+                If(push,
+                    fifo.sink.valid.eq(1),
+                    fifo.sink.type.eq(event.type),
+                    fifo.sink.data.eq(event.data),
+                    fifo.sink.word0.eq(event.word0),
+                    fifo.sink.word1.eq(event.word1),
+                    fifo.sink.word2.eq(event.word2),
+                ),
+                new_selected.eq(selected | pending),
+            ]
+            selected = new_selected
+
+        # Lost Events.
+        lost_flag = Signal()
+        self.sync += [
+            If(~self.enable,
+                lost_flag.eq(0),
+            ).Elif(lost_event,
+                self.lost.eq(self.lost + 1),
+                lost_flag.eq(1),
+            ).Elif(fifo.source.valid & fifo.source.ready,
+                lost_flag.eq(0),
+            )
+        ]
+
+        # Record Serialization (with PAD records inserted to flush partial DMA requests).
+        sequence  = Signal(TIME_EVENT_SEQUENCE_BITS)
+        aligned   = Signal()
+        idle      = Signal(32)
+        pad_start = Signal()
+        pad_d     = Signal()
+        pad       = Signal()
+        word      = Signal(2)
+        header    = Signal(64)
+        self.comb += aligned.eq(sequence[:log2_int(flush_align)] == 0)
+        self.sync += [
+            # Idle time since the last event (PAD records padding the request back-to-back).
+            If(aligned | fifo.source.valid,
+                idle.eq(0)
+            ).Elif(idle != (2**32 - 1),
+                idle.eq(idle + 1)
+            )
+        ]
+        self.comb += [
+            # PAD when idle and not aligned (after flush timeout or when disabled).
+            pad_start.eq(~fifo.source.valid & ~aligned & ((idle >= self.flush_timeout) | ~self.enable)),
+            pad.eq(Mux(word == 0, pad_start, pad_d)),
+            header[0:32].eq(Mux(pad, 0, fifo.source.data)),
+            header[32:56].eq(sequence),
+            header[56:60].eq(Mux(pad, TIME_EVENT_TYPE_PAD, fifo.source.type)),
+            header[60:64].eq(Cat(lost_flag & ~pad)),
+            self.source.valid.eq(fifo.source.valid | pad),
+            Case(word, {
+                0 : self.source.data.eq(Mux(pad, 0, fifo.source.word0)),
+                1 : self.source.data.eq(Mux(pad, 0, fifo.source.word1)),
+                2 : self.source.data.eq(Mux(pad, 0, fifo.source.word2)),
+                3 : self.source.data.eq(header),
+            }),
+            self.source.last.eq(word == (TIME_EVENT_RECORD_WORDS - 1)),
+            fifo.source.ready.eq(self.source.ready & self.source.last & ~pad),
+        ]
+        self.sync += [
+            If(self.source.valid & self.source.ready,
+                word.eq(word + 1),
+                If(word == 0,
+                    pad_d.eq(pad_start),
+                ),
+                If(self.source.last,
+                    sequence.eq(sequence + 1),
+                    If(~pad,
+                        self.records.eq(self.records + 1),
+                    )
+                )
+            # Sequence restarts on enable (Stream aligned, DMA restarting at the start of the ring).
+            ).Elif(~self.enable & ~fifo.source.valid & aligned & (word == 0),
+                sequence.eq(0),
+            )
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr(sys_clk_freq)
+
+    def add_csr(self, sys_clk_freq, default_flush_timeout=10e-6):
+        self._control = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, values=[
+                ("``0b0``", "Time Event Stream Disabled (partial DMA request padded)."),
+                ("``0b1``", "Time Event Stream Enabled (sequence restarted)."),
+            ]),
+        ])
+        self._time_period   = CSRStorage(32, description="TIME records period (in sys_clk cycles, 0: Disabled).")
+        self._flush_timeout = CSRStorage(32, reset=int(default_flush_timeout*sys_clk_freq),
+            description="Idle time before padding a partial DMA request (in sys_clk cycles).")
+        self._records = CSRStatus(32, description="Event records streamed (PAD records excluded).")
+        self._lost    = CSRStatus(32, description="Events lost (pending event overwritten).")
+
+        # # #
+
+        self.comb += [
+            # Control.
+            self.enable.eq(self._control.fields.enable),
+            self.time_period.eq(self._time_period.storage),
+            self.flush_timeout.eq(self._flush_timeout.storage),
+            # Status.
+            self._records.status.eq(self.records),
+            self._lost.status.eq(self.lost),
+        ]
@@ -6,37 +6,293 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 from migen import *
+from migen.genlib.cdc import MultiReg, PulseSynchronizer
 
 from litex.gen import *
-from litex.gen.genlib.misc import WaitTimer
 
-# PPS Generator ------------------------------------------------------------------------------------
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
 
-class PPSGenerator(LiteXModule):
-    def __init__(self, clk_freq, time, offset=int(500e6)):
+# PPS Channel --------------------------------------------------------------------------------------
+
+class PPSChannel(LiteXModule):
+    """Programmable periodic output (PPS/PEROUT) channel.
+
+    Rising edges are generated at start + k*period and falling edges width ns after each rising edge,
+    by comparing Time against incrementally updated next-edge registers (no multiplier). When Time
+    jumps forward past the next edge or backward by more than a period (Software Write/Offset), the
+    next-edge register is re-aligned on the period grid with a binary search (one bit per cycle, 64 cycles) and
+    no pulse is generated.
+    """
+    def __init__(self, clk_domain, time, period=int(1e9), width=int(200e6), start=int(500e6)):
         self.pps = Signal() # PPS Output.
 
+        # Control.
+        self.enable = Signal()
+        self.arm    = Signal() # Re-arm on start.
+        self.period = Signal(32, reset=period) # In ns.
+        self.width  = Signal(32, reset=width)  # In ns.
+        self.start  = Signal(64, reset=start)  # In ns (Time of first rising edge).
+
         # # #
 
-        # PPS Signals.
-        start = Signal()
-        count = Signal(32)
+        # Signals.
+        next_rise = Signal(64)
+        next_fall = Signal(64)
+        late      = Signal(64)
+        step      = Signal(96)
+        shift     = Signal(6)
+        backward  = Signal()
+
+        self.comb += late.eq(time - next_rise)
 
         # PPS FSM.
-        self.fsm = fsm = FSM(reset_state="IDLE")
+        self.fsm = fsm = ClockDomainsRenamer(clk_domain)(FSM(reset_state="IDLE"))
         fsm.act("IDLE",
-            If(time != 0,
+            NextValue(self.pps, 0),
+            NextValue(next_rise, self.start),
+            If(self.enable,
                 NextState("RUN")
             )
         )
         fsm.act("RUN",
-            If(time > ((count * int(1e9) + offset)),
-                start.eq(1),
-                NextValue(count, count + 1)
+            # Disable.
+            If(~self.enable,
+                NextState("IDLE")
+            # Re-arm.
+            ).Elif(self.arm,
+                NextValue(self.pps, 0),
+                NextValue(next_rise, self.start),
+            # Rising Edge.
+            ).Elif(time >= next_rise,
+                # Edge missed (Time jumped forward): Re-align on the period grid.
+                If(late >= self.width,
+                    NextValue(self.pps, 0),
+                    NextValue(backward, 0),
+                    NextValue(step, self.period << 63),
+                    NextValue(shift, 63),
+                    NextState("CATCH-UP")
+                ).Else(
+                    NextValue(self.pps, 1),
+                    NextValue(next_fall, next_rise + self.width),
+                    NextValue(next_rise, next_rise + self.period),
+                )
+            # Time jumped backward: Re-align on the period grid.
+            ).Elif((next_rise - time) > self.period,
+                NextValue(self.pps, 0),
+                NextValue(backward, 1),
+                NextValue(step, self.period << 63),
+                NextValue(shift, 63),
+                NextState("CATCH-UP")
+            # Falling Edge.
+            ).Elif(time >= next_fall,
+                NextValue(self.pps, 0),
             )
         )
+        fsm.act("CATCH-UP",
+            # Forward : Largest  next_rise + n*period <= time (n found MSB first), then + period.
+            # Backward: Smallest next_rise - n*period >  time (n found MSB first).
+            If(backward,
+                If((step < next_rise) & ((next_rise - step) > time),
+                    NextValue(next_rise, next_rise - step),
+                )
+            ).Else(
+                If((next_rise + step) <= time,
+                    NextValue(next_rise, next_rise + step),
+                )
+            ),
+            NextValue(step, step >> 1),
+            NextValue(shift, shift - 1),
+            If(shift == 0,
+                If(backward,
+                    NextState("RUN")
+                ).Else(
+                    NextState("ALIGN")
+                )
+            )
+        )
+        fsm.act("ALIGN",
+            NextValue(next_rise, next_rise + self.period),
+            NextState("RUN")
+        )
+
+    def add_csr(self, clk_domain, default_enable=0):
+        self._control = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, values=[
+                ("``0b0``", "PPS Channel Disabled."),
+                ("``0b1``", "PPS Channel Enabled."),
+            ], reset=default_enable),
+        ])
+        self._period = CSRStorage(32, reset=self.period.reset.value, description="Period (ns).")
+        self._width  = CSRStorage(32, reset=self.width.reset.value,  description="Pulse width (ns).")
+        self._start  = CSRStorage(64, reset=self.start.reset.value,  description="Phase: Time of the first rising edge (ns), re-arms the channel on LSB write.")
+
+        # # #
+
+        self.specials += [
+            MultiReg(self._control.fields.enable, self.enable, clk_domain),
+            MultiReg(self._period.storage,        self.period, clk_domain),
+            MultiReg(self._width.storage,         self.width,  clk_domain),
+            MultiReg(self._start.storage,         self.start,  clk_domain),
+        ]
+        arm_ps = PulseSynchronizer("sys", clk_domain)
+        self.submodules += arm_ps
+        self.comb += arm_ps.i.eq(self._start.re)
+        self.comb += self.arm.eq(arm_ps.o)
+
+# PPS Generator ------------------------------------------------------------------------------------
+
+class PPSGenerator(LiteXModule):
+    def __init__(self, clk_domain, time, nchannels=1, with_csr=True):
+        self.pps = Signal(nchannels) # PPS Outputs.
+
+        # # #
+
+        # PPS Clk Domain.
+        self.cd_time = ClockDomain()
+        self.comb += [
+            self.cd_time.clk.eq(ClockSignal(clk_domain)),
+            self.cd_time.rst.eq(ResetSignal(clk_domain)),
+        ]
+
+        # PPS Channels (Channel 0: 1s period/20% high PPS, enabled by default).
+        self.channels = []
+        for n in range(nchannels):
+            channel = PPSChannel(clk_domain="time", time=time)
+            self.add_module(name=f"ch{n}", module=channel)
+            self.channels.append(channel)
+            self.comb += self.pps[n].eq(channel.pps)
+
+        # CSRs.
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        for n, channel in enumerate(self.channels):
+            channel.add_csr(clk_domain="time", default_enable=int(n == 0))
+
+# PPS Timestamper ----------------------------------------------------------------------------------
+
+pps_timestamp_layout = [
+    ("timestamp", 64), # Rising edge Time (ns).
+]
+
+class PPSTimestamper(LiteXModule):
+    """External PPS/Event input Timestamper.
+
+    Rising edges of the (asynchronous) input are resynchronized to the Time clock domain (MultiReg)
+    and timestamped against Time (first Time sample after the edge), compensating the
+    resynchronization latency. When nsamples > 1, the input is provided oversampled (ex: from an
+    ISERDES, sample 0 first) and the edge is interpolated within the Time clock cycle. Timestamps are pushed to a FIFO that software can drain at its own
+    pace; events lost on FIFO overflow are counted.
+    """
+    def __init__(self, clk_domain, clk_freq, time, nsamples=1, fifo_depth=16, with_csr=True):
+        self.pps = Signal(nsamples) # PPS/Event Input (Asynchronous).
+
+        # Control.
+        self.enable = Signal()
+        self.flush  = Signal()
+
+        # Timestamps.
+        self.source    = stream.Endpoint(pps_timestamp_layout)
+        self.level     = Signal(max=fifo_depth + 1)
+        self.overflows = Signal(32)
+
+        # # #
+
+        # Time Clk Domain.
+        self.cd_time = ClockDomain()
+        self.comb += [
+            self.cd_time.clk.eq(ClockSignal(clk_domain)),
+            self.cd_time.rst.eq(ResetSignal(clk_domain)),
+        ]
+
+        # Resynchronization.
+        enable = Signal()
+        pps    = Signal(nsamples)
+        self.specials += MultiReg(self.enable, enable, "time")
+        self.specials += MultiReg(self.pps, pps, "time")
+
+        # Time of the resynchronized samples: Time when the edge has been sampled by the MultiReg.
+        time_d = Signal(64)
+        self.sync.time += time_d.eq(time)
+
+        # Rising Edge Detection/Interpolation (Sample at 1 following a sample at 0).
+        pps_d     = Signal()
+        samples   = Cat(pps_d, pps)
+        edges     = Signal(nsamples)
+        edge      = Signal()
+        timestamp = Signal(64)
+        self.sync.time += pps_d.eq(pps[-1])
+        self.comb += edge.eq(edges != 0)
+        for n in reversed(range(nsamples)): # First edge of the cycle has priority.
+            # Edge on sample n: nsamples - 1 - n samples before the end of the cycle.
+            correction = int(round((nsamples - 1 - n)*1e9/(clk_freq*nsamples)))
+            self.comb += edges[n].eq(~samples[n] & samples[n + 1])
+            self.comb += If(edges[n], timestamp.eq(time_d - correction))
+
+        # Time -> Sys CDC.
+        self.cdc = cdc = stream.ClockDomainCrossing(pps_timestamp_layout,
+            cd_from = "time",
+            cd_to   = "sys",
+        )
+        self.comb += [
+            cdc.sink.valid.eq(edge & enable),
+            cdc.sink.timestamp.eq(timestamp),
+        ]
+
+        # Timestamp FIFO.
+        self.fifo = fifo = ResetInserter()(stream.SyncFIFO(pps_timestamp_layout, depth=fifo_depth, buffered=True))
+        self.comb += [
+            fifo.reset.eq(self.flush),
+            cdc.source.connect(fifo.sink, omit={"ready"}),
+            cdc.source.ready.eq(1), # Drop (and count) timestamps on FIFO overflow.
+            fifo.source.connect(self.source),
+            self.level.eq(fifo.level),
+        ]
+
+        # Overflows.
+        self.sync += [
+            If(self.flush,
+                self.overflows.eq(0),
+            ).Elif(fifo.sink.valid & ~fifo.sink.ready,
+                self.overflows.eq(self.overflows + 1),
+            )
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        self._control = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, values=[
+                ("``0b0``", "PPS Timestamper Disabled."),
+                ("``0b1``", "PPS Timestamper Enabled."),
+            ]),
+            CSRField("flush", size=1, offset=1, pulse=True, description="Flush Timestamp FIFO and reset overflows count."),
+        ])
+        self._level     = CSRStatus(32, description="Timestamp FIFO level.")
+        self._overflows = CSRStatus(32, description="Timestamps lost on Timestamp FIFO overflow.")
+        self._timestamp = CSRStatus(64, description="Timestamp of the oldest PPS/Event rising edge (in ns).")
+        self._status    = CSRStatus(fields=[
+            CSRField("readable", size=1, offset=0, values=[
+                ("``0b0``", "Timestamp FIFO empty, timestamp register invalid."),
+                ("``0b1``", "Timestamp register holds the oldest timestamp."),
+            ]),
+        ], description="Timestamp status, reading it pops the timestamp from the FIFO.")
+
+        # # #
 
-        # PPS Generation.
-        self.timer = WaitTimer(clk_freq*200e-3) # 20% High / 80% Low PPS.
-        self.comb += self.timer.wait.eq(~start)
-        self.comb += self.pps.eq(~self.timer.done)
+        self.comb += [
+            # Control.
+            self.enable.eq(self._control.fields.enable),
+            self.flush.eq(self._control.fields.flush),
+            # Status.
+            self._level.status.eq(self.level),
+            self._overflows.status.eq(self.overflows),
+            # Timestamp (Popped when status is read: timestamp register must be read before status).
+            self._timestamp.status.eq(self.source.timestamp),
+            self._status.fields.readable.eq(self.source.valid),
+            self.source.ready.eq(self._status.we),
+        ]
@@ -0,0 +1,605 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litepcie.tlp.common import fmt_type_dict
+from litepcie.frontend.ptm.core import PTMRequester as LitePCIePTMRequester
+from litepcie.frontend.ptm.core import PTM_REQUEST_MESSAGE_CODE, PTM_RESPONSE_MESSAGE_CODE
+from litepcie.frontend.ptm.sniffer import RawDatapath, RawDescrambler
+
+from gateware.sniffer import PTMSymbolTimestamper, ptm_symbol_timestamp_layout
+
+# PTM Sample Layout --------------------------------------------------------------------------------
+
+ptm_sample_layout = [
+    ("completed",   1), # PTM exchange completed (0: Missed, Requester not ready at next period).
+    ("t1",         64), # PTM Request  Time (Local,  ns).
+    ("t2",         64), # PTM Master   Time (Remote, ns).
+    ("t4",         64), # PTM Response Time (Local,  ns).
+    ("link_delay", 32), # PTM Link Delay (ns).
+]
+
+# PTM Requester ------------------------------------------------------------------------------------
+
+class PTMRequester(LitePCIePTMRequester):
+    """LitePCIe's PTMRequester with multiple PTM Request trigger sources.
+
+    LitePCIe's PTMRequester drives its trigger from its CSR, so another source (ex: PTMScheduler)
+    would be a second driver of the same signal. Here, the CSR trigger is redirected to csr_trigger
+    and trigger is driven in a single place: the OR of csr_trigger and of the sources added with
+    add_trigger(). Without CSR and added sources, trigger is left to the user.
+
+    ready is asserted when a trigger would start a PTM exchange (Requester in a PTM context state):
+    busy only covers the Request/Response phase, not the 1us wait before retrying after a PTM
+    Response without timing information or the disabled Requester.
+    """
+    def __init__(self, *args, **kwargs):
+        self.csr_trigger = Signal()
+        self.triggers    = []
+        self.ready       = Signal()
+        LitePCIePTMRequester.__init__(self, *args, **kwargs)
+        self.comb += self.ready.eq(
+            self.fsm.ongoing("INVALID-PTM-CONTEXT") |
+            self.fsm.ongoing("VALID-PTM-CONTEXT")
+        )
+
+    def add_csr(self, *args, **kwargs):
+        # LitePCIe's CSRs, with their trigger connected to csr_trigger.
+        trigger, self.trigger = self.trigger, self.csr_trigger
+        LitePCIePTMRequester.add_csr(self, *args, **kwargs)
+        self.trigger = trigger
+        self.triggers.append(self.csr_trigger)
+
+    def add_trigger(self, trigger):
+        self.triggers.append(trigger)
+
+    def do_finalize(self):
+        if len(self.triggers):
+            self.comb += self.trigger.eq(reduce(or_, self.triggers))
+
+# PTM Scheduler ------------------------------------------------------------------------------------
+
+class PTMScheduler(LiteXModule):
+    """Autonomous periodic PTM Requests with hardware sample FIFO.
+
+    Triggers the PTMRequester every period (in sys_clk cycles) and pushes each PTM sample to a FIFO
+    that software can drain at its own pace: the host no longer has to trigger and poll each PTM
+    exchange and late reads do not lose samples (as long as the FIFO does not overflow, overflows
+    are counted).
+    """
+    def __init__(self, ptm_requester, sys_clk_freq, fifo_depth=512, with_csr=True):
+        # Control.
+        self.enable = Signal()
+        self.period = Signal(32) # In sys_clk cycles.
+        self.flush  = Signal()
+
+        # Samples.
+        self.source    = stream.Endpoint(ptm_sample_layout)
+        self.level     = Signal(max=fifo_depth + 1)
+        self.overflows = Signal(32)
+
+        # # #
+
+        # Signals.
+        tick = Signal()
+
+        # Period Timer.
+        count = Signal(32)
+        self.sync += [
+            tick.eq(0),
+            If(~self.enable,
+                count.eq(0),
+            ).Elif(count == 0,
+                tick.eq(1),
+                count.eq(self.period - 1),
+            ).Else(
+                count.eq(count - 1),
+            )
+        ]
+
+        # PTM Request Trigger (ORed with PTMRequester's CSR trigger, ignored by Requester when not ready).
+        ptm_requester.add_trigger(tick)
+
+        # Sample FIFO.
+        self.fifo = fifo = ResetInserter()(stream.SyncFIFO(ptm_sample_layout, depth=fifo_depth, buffered=True))
+        self.comb += [
+            fifo.reset.eq(self.flush),
+            # Completed PTM exchange.
+            If(ptm_requester.update,
+                fifo.sink.valid.eq(1),
+                fifo.sink.t1.eq(ptm_requester.t1),
+                fifo.sink.t2.eq(ptm_requester.master_time),
+                fifo.sink.t4.eq(ptm_requester.t4),
+                fifo.sink.link_delay.eq(ptm_requester.link_delay),
+            # Missed PTM exchange (Requester busy, waiting to retry or disabled at next period).
+            ).Elif(tick & ~ptm_requester.ready,
+                fifo.sink.valid.eq(1),
+                fifo.sink.t1.eq(ptm_requester.t1),
+            ),
+            fifo.sink.completed.eq(ptm_requester.update),
+            fifo.source.connect(self.source),
+            self.level.eq(fifo.level),
+        ]
+
+        # Overflows.
+        self.sync += [
+            If(self.flush,
+                self.overflows.eq(0),
+            ).Elif(fifo.sink.valid & ~fifo.sink.ready,
+                self.overflows.eq(self.overflows + 1),
+            )
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr(sys_clk_freq)
+
+    def add_csr(self, sys_clk_freq, default_period=1e-3):
+        self._control = CSRStorage(fields=[
+            CSRField("enable", size=1, offset=0, values=[
+                ("``0b0``", "PTM Scheduler Disabled."),
+                ("``0b1``", "PTM Scheduler Enabled."),
+            ]),
+            CSRField("flush", size=1, offset=1, pulse=True, description="Flush Sample FIFO and reset overflows count."),
+        ])
+        self._period    = CSRStorage(32, reset=int(default_period*sys_clk_freq), description="PTM Request period (in sys_clk cycles).")
+        self._level     = CSRStatus(32, description="Sample FIFO level.")
+        self._overflows = CSRStatus(32, description="Samples lost on Sample FIFO overflow.")
+        self._sample_t1         = CSRStatus(64, description="Sample T1 Time (in ns).")
+        self._sample_t2         = CSRStatus(64, description="Sample T2/Master Time (in ns).")
+        self._sample_t4         = CSRStatus(64, description="Sample T4 Time (in ns).")
+        self._sample_link_delay = CSRStatus(32, description="Sample Link Delay (in ns).")
+        self._sample_status     = CSRStatus(fields=[
+            CSRField("readable", size=1, offset=0, values=[
+                ("``0b0``", "Sample FIFO empty, sample registers invalid."),
+                ("``0b1``", "Sample registers hold the oldest sample."),
+            ]),
+            CSRField("completed", size=1, offset=1, values=[
+                ("``0b0``", "PTM exchange missed."),
+                ("``0b1``", "PTM exchange completed."),
+            ]),
+        ], description="Sample status, reading it pops the sample from the FIFO.")
+
+        # # #
+
+        self.comb += [
+            # Control.
+            self.enable.eq(self._control.fields.enable),
+            self.flush.eq(self._control.fields.flush),
+            self.period.eq(self._period.storage),
+            # Status.
+            self._level.status.eq(self.level),
+            self._overflows.status.eq(self.overflows),
+            # Sample (Popped when status is read: sample registers must be read before status).
+            self._sample_t1.status.eq(self.source.t1),
+            self._sample_t2.status.eq(self.source.t2),
+            self._sample_t4.status.eq(self.source.t4),
+            self._sample_link_delay.status.eq(self.source.link_delay),
+            self._sample_status.fields.readable.eq(self.source.valid),
+            self._sample_status.fields.completed.eq(self.source.completed),
+            self.source.ready.eq(self._sample_status.we),
+        ]
+
+# PTM Requester IRQ --------------------------------------------------------------------------------
+
+class PTMRequesterIRQ(LiteXModule):
+    """PTM exchange completion IRQ.
+
+    Pulses irq (to be connected to a MSI/MSI-X vector) on each completed PTM exchange (ResponseD
+    received and PTMRequester's t1/master_time/link_delay/t4 registers updated), whether triggered
+    by software or by the PTMScheduler: software no longer has to poll the PTMRequester's status.
+    Completions are counted, allowing software to detect stale samples or missed IRQs.
+    """
+    def __init__(self, ptm_requester, with_csr=True):
+        self.irq   = Signal()
+        self.count = Signal(32)
+
+        # # #
+
+        # IRQ (Registers already updated when update is asserted).
+        self.sync += [
+            self.irq.eq(ptm_requester.update),
+            If(ptm_requester.update,
+                self.count.eq(self.count + 1),
+            )
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        self._count = CSRStatus(32, description="Completed PTM exchanges count.")
+
+        # # #
+
+        self.comb += self._count.status.eq(self.count)
+
+# PTM Statistics -----------------------------------------------------------------------------------
+
+ptm_statistics_layout = [
+    ("count",               32),         # Completed PTM exchanges.
+    ("invalid",             32),         # PTM Responses without timing information (Requester retrying).
+    ("timeouts",            32),         # PTM exchanges not completed within timeout.
+    ("link_delay_min",      (32, True)), # Link Delay (ns).
+    ("link_delay_max",      (32, True)),
+    ("link_delay_sum",      (64, True)),
+    ("link_delay_sum2",     96),
+    ("round_trip_min",      (32, True)), # T4-T1 (ns).
+    ("round_trip_max",      (32, True)),
+    ("round_trip_sum",      (64, True)),
+    ("round_trip_sum2",     96),
+    ("offset_reference",    (64, True)), # T2-T1 of the first exchange of the window (ns).
+    ("offset_min",          (32, True)), # T2-T1 - offset_reference (ns).
+    ("offset_max",          (32, True)),
+    ("offset_sum",          (64, True)),
+    ("offset_sum2",         96),
+]
+
+class PTMStatistic(LiteXModule):
+    """Min/max/sum/sum of squares accumulator of a signed value (2 cycles latency).
+
+    clear starts a new window (a value accumulated on the same cycle being the first of it).
+    """
+    def __init__(self, width=32):
+        self.valid = Signal()
+        self.value = Signal((width, True))
+        self.clear = Signal()
+
+        self.min  = Signal((width, True))
+        self.max  = Signal((width, True))
+        self.sum  = Signal((2*width, True))
+        self.sum2 = Signal(3*width)
+
+        # # #
+
+        # Square.
+        valid  = Signal()
+        value  = Signal((width, True))
+        square = Signal(2*width)
+        self.sync += [
+            valid.eq(self.valid),
+            value.eq(self.value),
+            square.eq(self.value*self.value),
+        ]
+
+        # Accumulate.
+        empty = Signal(reset=1)
+        clear = Signal()
+        self.sync += clear.eq(self.clear)
+        self.sync += [
+            If(clear,
+                empty.eq(~valid),
+                self.min.eq(Mux(valid, value, 0)),
+                self.max.eq(Mux(valid, value, 0)),
+                self.sum.eq(Mux(valid, value, 0)),
+                self.sum2.eq(Mux(valid, square, 0)),
+            ).Elif(valid,
+                empty.eq(0),
+                If(empty | (value < self.min), self.min.eq(value)),
+                If(empty | (value > self.max), self.max.eq(value)),
+                self.sum.eq(self.sum + value),
+                self.sum2.eq(self.sum2 + square),
+            )
+        ]
+
+class PTMStatistics(LiteXModule):
+    """PTM exchange statistics.
+
+    Accumulates count/min/max/sum/sum of squares of the Link Delay, T4-T1 (round-trip) and T2-T1
+    (offset) of the PTM exchanges completed by the PTMRequester over a window (started by clear),
+    and counts the PTM Responses without timing information (invalid, Requester retrying) and the
+    exchanges not completed within timeout (in sys_clk cycles, 0: disabled). T2-T1 is accumulated
+    relative to the T2-T1 of the first exchange of the window (offset_reference), keeping sums of
+    squares meaningful whatever the offset between the local and master times. Values are
+    saturated to 32-bit signed.
+
+    snapshot freezes all the statistics in stats (read by software), consistent with each other;
+    snapshot and clear can be pulsed together to read consecutive windows without losing exchanges.
+    """
+    def __init__(self, ptm_requester, sys_clk_freq, with_csr=True):
+        # Control.
+        self.clear    = Signal()
+        self.snapshot = Signal()
+        self.timeout  = Signal(32) # In sys_clk cycles.
+
+        # Statistics (current window and snapshot).
+        self.window = window = Record(ptm_statistics_layout)
+        self.stats  = stats  = Record(ptm_statistics_layout)
+
+        # # #
+
+        # Clear/Snapshot, delayed to the accumulation stage of the exchange completed on the same cycle.
+        clear    = Signal()
+        snapshot = Signal()
+        clear_d    = Signal()
+        snapshot_d = Signal()
+        self.sync += [
+            clear_d.eq(self.clear),
+            snapshot_d.eq(self.snapshot),
+            clear.eq(clear_d),
+            snapshot.eq(snapshot_d),
+        ]
+
+        # Exchange values.
+        self.link_delay = PTMStatistic()
+        self.round_trip = PTMStatistic()
+        self.offset     = PTMStatistic()
+        round_trip = Signal((65, True))
+        offset     = Signal((65, True))
+        reference  = Signal((64, True))
+        empty      = Signal(reset=1)
+        self.comb += [
+            round_trip.eq(ptm_requester.t4 - ptm_requester.t1),
+            offset.eq(ptm_requester.master_time - ptm_requester.t1),
+        ]
+        self.sync += [
+            If(ptm_requester.update,
+                empty.eq(0),
+                If(empty | self.clear,
+                    reference.eq(offset),
+                ),
+            ).Elif(self.clear,
+                empty.eq(1),
+            ),
+        ]
+        self.sync += [
+            self.link_delay.value.eq(self._saturate(ptm_requester.link_delay)),
+            self.round_trip.value.eq(self._saturate(round_trip)),
+            self.offset.value.eq(self._saturate(Mux(empty | self.clear, 0, offset - reference))),
+        ]
+        for statistic in [self.link_delay, self.round_trip, self.offset]:
+            self.sync += statistic.valid.eq(ptm_requester.update)
+            self.comb += statistic.clear.eq(clear_d)
+
+        # Timeout.
+        timer   = Signal(32)
+        timeout = Signal()
+        self.sync += [
+            timeout.eq(0),
+            If(~ptm_requester.busy,
+                timer.eq(0),
+            ).Elif(timer < self.timeout,
+                timer.eq(timer + 1),
+                timeout.eq(timer == (self.timeout - 1)),
+            )
+        ]
+
+        # Invalid (PTM Response without timing information, see PTMRequester).
+        invalid = Signal()
+        self.sync += invalid.eq(
+            ptm_requester.fsm.ongoing("WAIT-PTM-RESPONSE") &
+            ptm_requester.res_ep.valid &
+            (ptm_requester.res_ep.message_code == PTM_RESPONSE_MESSAGE_CODE) &
+            (ptm_requester.res_ep.master_time == 0)
+        )
+
+        # Window (Aligned on the accumulation stage).
+        valid       = Signal()
+        reference_d = Signal((64, True))
+        self.sync += [
+            valid.eq(self.offset.valid),
+            reference_d.eq(reference),
+            window.offset_reference.eq(reference_d),
+        ]
+        counters = [
+            (window.count,    valid),
+            (window.invalid,  invalid),
+            (window.timeouts, timeout),
+        ]
+        for counter, event in counters:
+            self.sync += [
+                If(clear,
+                    counter.eq(event),
+                ).Elif(event,
+                    counter.eq(counter + 1),
+                )
+            ]
+        for name in ["link_delay", "round_trip", "offset"]:
+            statistic = getattr(self, name)
+            self.comb += [
+                getattr(window, f"{name}_min").eq(statistic.min),
+                getattr(window, f"{name}_max").eq(statistic.max),
+                getattr(window, f"{name}_sum").eq(statistic.sum),
+                getattr(window, f"{name}_sum2").eq(statistic.sum2),
+            ]
+
+        # Snapshot.
+        self.sync += If(snapshot, stats.eq(window))
+
+        # CSRs.
+        if with_csr:
+            self.add_csr(sys_clk_freq)
+
+    def _saturate(self, value, width=32):
+        saturated = Signal((width, True))
+        value_s   = Signal((len(value) + 1, True))
+        self.comb += [
+            value_s.eq(value),
+            If(value_s > (2**(width - 1) - 1),
+                saturated.eq(2**(width - 1) - 1),
+            ).Elif(value_s < -2**(width - 1),
+                saturated.eq(-2**(width - 1)),
+            ).Else(
+                saturated.eq(value_s),
+            )
+        ]
+        return saturated
+
+    def add_csr(self, sys_clk_freq, default_timeout=100e-6):
+        self._control = CSRStorage(fields=[
+            CSRField("snapshot", size=1, offset=0, pulse=True, description="Freeze the statistics in the statistics registers."),
+            CSRField("clear",    size=1, offset=1, pulse=True, description="Start a new window (after the snapshot when both are set)."),
+        ])
+        self._timeout = CSRStorage(32, reset=int(default_timeout*sys_clk_freq), description="PTM exchange timeout (in sys_clk cycles, 0: disabled).")
+        descriptions = {
+            "count"            : "Completed PTM exchanges.",
+            "invalid"          : "PTM Responses without timing information.",
+            "timeouts"         : "PTM exchanges not completed within timeout.",
+            "offset_reference" : "T2-T1 of the first PTM exchange of the window (in ns).",
+        }
+        for name, label in [("link_delay", "Link Delay"), ("round_trip", "T4-T1"), ("offset", "T2-T1 - offset_reference")]:
+            descriptions[f"{name}_min"]  = f"{label} min (in ns)."
+            descriptions[f"{name}_max"]  = f"{label} max (in ns)."
+            descriptions[f"{name}_sum"]  = f"{label} sum (in ns)."
+            descriptions[f"{name}_sum2"] = f"{label} sum of squares (in ns^2)."
+        for name, shape in ptm_statistics_layout:
+            csr = CSRStatus(shape if isinstance(shape, int) else shape[0], name=name, description=descriptions[name])
+            setattr(self, f"_{name}", csr)
+
+        # # #
+
+        self.comb += [
+            # Control.
+            self.snapshot.eq(self._control.fields.snapshot),
+            self.clear.eq(self._control.fields.clear),
+            self.timeout.eq(self._timeout.storage),
+        ]
+        # Statistics (Snapshot).
+        for name, shape in ptm_statistics_layout:
+            self.comb += getattr(self, f"_{name}").status.eq(getattr(self.stats, name))
+
+# PTM Wire Timestamper -----------------------------------------------------------------------------
+
+class PTMWireTimestamper(LiteXModule):
+    """PTM Request/Response wire timestamping (PIPE interface).
+
+    PTMRequester's t1 is taken when the PTM Request is accepted by the PHY's AXI interface and t4
+    when the PTM ResponseD comes out of the sniffer's TLP processing: both include latencies of the
+    PCIe hard block/TLP layers that are asymmetric and depend on the link/DMA load. The PTM Requests
+    are here timestamped at the symbol level on the PIPE TX interface and the PTM ResponseDs on the
+    PIPE RX interface (sniffer taps, between the hard block and the transceiver). Each PTM exchange
+    is latched on its PTM ResponseD: t1 is the last PTM Request transmitted, t4 the first PTM
+    ResponseD received after it; valid is set with them and cleared by the next PTM Request, so that
+    t1/t4 are the ones of the PTMRequester's last exchange when valid.
+
+    Timestamps are referenced to the taps: Time is brought to the sniffer clock domain (lagging by
+    time_cdc_latency sniffer clock cycles) and delayed to match the tap_latency sniffer clock
+    cycles of the raw datapath (tap to detection), by tap_latency - time_cdc_latency cycles. Both
+    latencies are from the gateware structure and checked in simulation (test_ptm_wire_timestamper),
+    the remaining error being +-2 sniffer clock cycles (position of the STP Symbol in the words, Word
+    Aligner alignment, Time CDC synchronization), centered.
+    """
+    def __init__(self, clk_domain, time, sniffer_rst_n, sniffer_clk, tx_data, tx_ctrl, rx_data, rx_ctrl,
+        tap_latency      = 10, # RawDatapath (Word Aligner) + RawDescrambler + Window, in sniffer clock cycles.
+        time_cdc_latency = 4,  # Time -> Sniffer AsyncFIFO (Synchronizer) + Register, in sniffer clock cycles.
+        with_csr         = True):
+        assert len(tx_data) == len(rx_data) == 16
+        assert len(tx_ctrl) == len(rx_ctrl) == 2
+        assert tap_latency >= time_cdc_latency
+        self.valid = Signal()
+        self.t1    = Signal(64)
+        self.t4    = Signal(64)
+
+        # # #
+
+        # Clocking.
+        self.cd_time    = ClockDomain()
+        self.cd_sniffer = ClockDomain()
+        self.comb += [
+            self.cd_time.clk.eq(ClockSignal(clk_domain)),
+            self.cd_time.rst.eq(ResetSignal(clk_domain)),
+            self.cd_sniffer.clk.eq(sniffer_clk),
+            self.cd_sniffer.rst.eq(~sniffer_rst_n),
+        ]
+
+        # Time -> Sniffer CDC (Lagging by time_cdc_latency cycles).
+        self.time_cdc = time_cdc = stream.ClockDomainCrossing([("time", 64)],
+            cd_from = "time",
+            cd_to   = "sniffer",
+        )
+        time_sniffer = Signal(64)
+        self.comb += [
+            time_cdc.sink.valid.eq(1),
+            time_cdc.sink.time.eq(time),
+            time_cdc.source.ready.eq(1),
+        ]
+        self.sync.sniffer += If(time_cdc.source.valid, time_sniffer.eq(time_cdc.source.time))
+
+        # Time at the Taps (Delayed by the raw datapath latency, minus the Time CDC lag).
+        time_tap = time_sniffer
+        for n in range(tap_latency - time_cdc_latency):
+            time_tap_d = Signal(64)
+            self.sync.sniffer += time_tap_d.eq(time_tap)
+            time_tap = time_tap_d
+
+        # TX/RX Symbol Timestamping.
+        timestamps = {}
+        for name, data, ctrl in [("tx", tx_data, tx_ctrl), ("rx", rx_data, rx_ctrl)]:
+            datapath    = ClockDomainsRenamer("sniffer")(RawDatapath(phy_dw=16))
+            descrambler = ClockDomainsRenamer("sniffer")(RawDescrambler())
+            timestamper = ClockDomainsRenamer("sniffer")(PTMSymbolTimestamper(time=time_tap))
+            cdc         = stream.ClockDomainCrossing(ptm_symbol_timestamp_layout,
+                cd_from = "sniffer",
+                cd_to   = "sys",
+            )
+            self.add_module(name=f"{name}_datapath",    module=datapath)
+            self.add_module(name=f"{name}_descrambler", module=descrambler)
+            self.add_module(name=f"{name}_timestamper", module=timestamper)
+            self.add_module(name=f"{name}_cdc",         module=cdc)
+            self.comb += [
+                datapath.sink.valid.eq(1),
+                datapath.sink.data.eq(data),
+                datapath.sink.ctrl.eq(ctrl),
+                cdc.source.ready.eq(1),
+            ]
+            self.submodules += stream.Pipeline(datapath, descrambler, timestamper, cdc)
+            timestamps[name] = cdc.source
+
+        # PTM exchanges (Latched on the PTM ResponseD).
+        tx           = timestamps["tx"]
+        rx           = timestamps["rx"]
+        tx_request   = tx.valid & (tx.message_code == PTM_REQUEST_MESSAGE_CODE)
+        rx_responsed = rx.valid & (rx.message_code == PTM_RESPONSE_MESSAGE_CODE) & (rx.fmt_type == fmt_type_dict["ptm_res"])
+        t1      = Signal(64)
+        t1_seen = Signal()
+        self.sync += [
+            If(rx_responsed & t1_seen,
+                # PTM ResponseD of the last PTM Request: Completed PTM exchange.
+                self.valid.eq(1),
+                self.t1.eq(t1),
+                self.t4.eq(rx.timestamp),
+                t1_seen.eq(0),
+            ),
+            If(tx_request,
+                # PTM Request (Retries included): New PTM exchange.
+                self.valid.eq(0),
+                t1.eq(tx.timestamp),
+                t1_seen.eq(1),
+            ),
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        self._status = CSRStatus(fields=[
+            CSRField("valid", size=1, offset=0, values=[
+                ("``0b0``", "Wire timestamps of the last PTM exchange not available (use PTMRequester's)."),
+                ("``0b1``", "Wire timestamps of the last PTM exchange valid."),
+            ]),
+        ])
+        self._t1_time = CSRStatus(64, description="Last PTM T1 Time at the PIPE TX interface (in ns).")
+        self._t4_time = CSRStatus(64, description="Last PTM T4 Time at the PIPE RX interface (in ns).")
+
+        # # #
+
+        self.comb += [
+            self._status.fields.valid.eq(self.valid),
+            self._t1_time.status.eq(self.t1),
+            self._t4_time.status.eq(self.t4),
+        ]
@@ -0,0 +1,331 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+from migen.genlib.cdc import BusSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litepcie.tlp.common import fmt_type_dict
+from litepcie.tlp.depacketizer import LitePCIeTLPDepacketizer
+from litepcie.frontend.ptm.core import PTM_REQUEST_MESSAGE_CODE, PTM_RESPONSE_MESSAGE_CODE
+from litepcie.frontend.ptm.sniffer import COM, SHP, RawDatapath, RawDescrambler
+from litepcie.frontend.ptm.sniffer import TLPAligner, TLPEndiannessSwap, TLPFilterFormater
+
+# Layouts ------------------------------------------------------------------------------------------
+
+raw_layout = [("data", 32), ("ctrl", 4)]
+
+def raw_lanes_layout(nlanes):
+    return [("data", 32*nlanes), ("ctrl", 4*nlanes)]
+
+ptm_symbol_timestamp_layout = [
+    ("fmt_type",      8), # PTM Request/Response: 0x34, PTM ResponseD: 0x74.
+    ("message_code",  8), # PTM Request: 0x52, PTM Response/ResponseD: 0x53.
+    ("timestamp",    64), # Time of the STP Symbol (ns).
+]
+
+# Raw Lane Deskew ----------------------------------------------------------------------------------
+
+class RawLaneDeskew(LiteXModule):
+    """Raw Lane Deskew
+
+    Deskew the (word-aligned, descrambled) per-lane streams of a multi-lane link. Ordered-Sets are
+    transmitted simultaneously on all lanes, so lanes are aligned by holding the lanes that present
+    a COM word (COM in symbol 0, as provided by the RawWordAligner) until all lanes present one; the
+    lanes are then read in lockstep. Alignment is re-acquired if lanes present COM words at
+    different times. Up to depth words of lane-to-lane skew can be absorbed.
+
+    The aligned lane words are concatenated on source (lane 0 in LSBs).
+    """
+    def __init__(self, nlanes, depth=8):
+        self.sinks   = [stream.Endpoint(raw_layout) for _ in range(nlanes)]
+        self.source  = source = stream.Endpoint(raw_lanes_layout(nlanes))
+        self.aligned = Signal()
+
+        # # #
+
+        # Lane FIFOs.
+        fifos = [stream.SyncFIFO(raw_layout, depth=depth) for _ in range(nlanes)]
+        self.submodules += fifos
+
+        # COM Words detection.
+        com   = Signal(nlanes)
+        valid = Signal(nlanes)
+        full  = Signal(nlanes)
+        for n, (sink, fifo) in enumerate(zip(self.sinks, fifos)):
+            self.comb += [
+                sink.connect(fifo.sink),
+                com[n].eq(fifo.source.ctrl[0] & (fifo.source.data[0:8] == COM.value)),
+                valid[n].eq(fifo.source.valid),
+                full[n].eq(fifo.level == depth),
+                source.data[32*n:32*(n+1)].eq(fifo.source.data),
+                source.ctrl[4*n:4*(n+1)].eq(fifo.source.ctrl),
+            ]
+        all_valid = (valid == (2**nlanes - 1))
+        all_com   = (com   == (2**nlanes - 1))
+
+        # Deskew FSM.
+        self.fsm = fsm = FSM(reset_state="ALIGN")
+        fsm.act("ALIGN",
+            # Hold lanes presenting a COM word, skip words on the others (or when skew is too large).
+            If(all_valid & all_com,
+                NextState("RUN")
+            ).Else(
+                *[fifo.source.ready.eq(fifo.source.valid & (~com[n] | full[n])) for n, fifo in enumerate(fifos)]
+            )
+        )
+        fsm.act("RUN",
+            self.aligned.eq(1),
+            # Lanes presenting COM words at different times: Re-align.
+            If(all_valid & (com != 0) & ~all_com,
+                NextState("ALIGN")
+            ).Else(
+                source.valid.eq(all_valid),
+                *[fifo.source.ready.eq(all_valid & source.ready) for fifo in fifos]
+            )
+        )
+
+# Raw Lane Merger ----------------------------------------------------------------------------------
+
+class RawLaneMerger(LiteXModule):
+    """Raw Lane Merger
+
+    Reassemble the symbol stream striped over the lanes (symbol n transmitted on lane n % nlanes)
+    from the deskewed lane words, and convert it to 32-bit words (first symbol in LSBs).
+    """
+    def __init__(self, nlanes):
+        self.sink   = sink   = stream.Endpoint(raw_lanes_layout(nlanes))
+        self.source = source = stream.Endpoint(raw_layout)
+
+        # # #
+
+        # Lane Symbols un-striping.
+        striped = stream.Endpoint(raw_lanes_layout(nlanes))
+        self.comb += sink.connect(striped, omit={"data", "ctrl"})
+        for lane in range(nlanes):
+            for symbol in range(4):
+                n = symbol*nlanes + lane
+                self.comb += [
+                    striped.data[8*n:8*(n+1)].eq(sink.data[32*lane + 8*symbol:32*lane + 8*(symbol+1)]),
+                    striped.ctrl[n].eq(sink.ctrl[4*lane + symbol]),
+                ]
+
+        # Data-width adaptation.
+        self.converter = converter = stream.StrideConverter(raw_lanes_layout(nlanes), raw_layout, reverse=False)
+        self.comb += [
+            striped.connect(converter.sink),
+            converter.source.connect(source),
+        ]
+
+# Multi-Lane Raw Datapath --------------------------------------------------------------------------
+
+class MultiLaneRawDatapath(LiteXModule):
+    """Multi-Lane Raw Datapath
+
+    Raw Datapath of a x1/x2/x4/x8 link: each lane is converted to 32-bit, crossed from the
+    transceiver's RX clock domain to the system clock domain, word-aligned and descrambled (the
+    scrambler is independent per lane) then lanes are deskewed and the symbol stream reassembled.
+
+    The reassembled 32-bit stream carries nlanes/2 words per RX clock cycle (16-bit lanes): the
+    system clock domain has to run at least at nlanes/2 times the RX clock frequency. Lane words
+    presented on a sink that is not ready (lane FIFO full) are lost and counted in overflows.
+    """
+    def __init__(self, clock_domain="sys", nlanes=1, phy_dw=16, deskew_depth=8):
+        self.sinks     = [stream.Endpoint([("data", phy_dw), ("ctrl", phy_dw//8)]) for _ in range(nlanes)]
+        self.source    = stream.Endpoint(raw_layout)
+        self.aligned   = Signal()
+        self.overflows = Signal(32) # Sys Clk Domain.
+
+        # # #
+
+        # Lanes Datapath/Descrambling.
+        self.deskew = deskew = RawLaneDeskew(nlanes=nlanes, depth=deskew_depth)
+        for n in range(nlanes):
+            datapath    = RawDatapath(clock_domain=clock_domain, phy_dw=phy_dw)
+            descrambler = RawDescrambler()
+            self.add_module(name=f"lane{n}_datapath",    module=datapath)
+            self.add_module(name=f"lane{n}_descrambler", module=descrambler)
+            self.submodules += stream.Pipeline(
+                self.sinks[n],
+                datapath,
+                descrambler,
+                deskew.sinks[n],
+            )
+        self.comb += self.aligned.eq(deskew.aligned)
+
+        # Lanes Overflows (counted in the RX Clk Domain).
+        overflows = Signal(32)
+        overflow  = reduce(or_, [sink.valid & ~sink.ready for sink in self.sinks])
+        sync_rx   = getattr(self.sync, clock_domain)
+        sync_rx  += If(overflow & (overflows != (2**32 - 1)), overflows.eq(overflows + 1))
+        if clock_domain == "sys":
+            self.comb += self.overflows.eq(overflows)
+        else:
+            self.overflows_sync = BusSynchronizer(32, clock_domain, "sys")
+            self.comb += [
+                self.overflows_sync.i.eq(overflows),
+                self.overflows.eq(self.overflows_sync.o),
+            ]
+
+        # Lanes Reassembly.
+        self.merger = merger = RawLaneMerger(nlanes=nlanes)
+        self.comb += [
+            deskew.source.connect(merger.sink),
+            merger.source.connect(self.source),
+        ]
+
+# Multi-Lane PCIe PTM Sniffer ----------------------------------------------------------------------
+
+class MultiLanePCIePTMSniffer(LiteXModule):
+    """Multi-Lane PCIe PTM Sniffer
+
+    PCIePTMSniffer equivalent for x2/x4/x8 links: rx_data/rx_ctrl are the concatenated 16-bit/2-bit
+    lanes data/K-flags (lane 0 in LSBs). Lanes are deskewed/reassembled by a MultiLaneRawDatapath
+    and TLPs sniffed in the system clock domain (see MultiLaneRawDatapath for the clock constraint,
+    lane words lost when not met are counted in overflows).
+    """
+    def __init__(self, rx_rst_n, rx_clk, rx_data, rx_ctrl, nlanes, deskew_depth=8, with_csr=True):
+        self.source    = source = stream.Endpoint([("message_code", 8), ("master_time", 64), ("link_delay", 32)])
+        self.overflows = Signal(32)
+        assert len(rx_data) == 16*nlanes
+        assert len(rx_ctrl) ==  2*nlanes
+
+        # # #
+
+        # Clocking.
+        self.cd_sniffer = ClockDomain()
+        self.comb += self.cd_sniffer.clk.eq(rx_clk)
+        self.comb += self.cd_sniffer.rst.eq(~rx_rst_n)
+
+        # Raw Sniffing.
+        self.raw_datapath = MultiLaneRawDatapath(
+            clock_domain = "sniffer",
+            nlanes       = nlanes,
+            phy_dw       = 16,
+            deskew_depth = deskew_depth,
+        )
+        for n, sink in enumerate(self.raw_datapath.sinks):
+            self.comb += [
+                sink.valid.eq(1),
+                sink.data.eq(rx_data[16*n:16*(n+1)]),
+                sink.ctrl.eq(rx_ctrl[2*n:2*(n+1)]),
+            ]
+        self.comb += self.overflows.eq(self.raw_datapath.overflows)
+
+        # TLP Sniffing.
+        self.tlp_aligner         = TLPAligner()
+        self.tlp_endianness_swap = TLPEndiannessSwap()
+        self.tlp_filter_formater = TLPFilterFormater()
+        self.submodules += stream.Pipeline(
+            self.raw_datapath,
+            self.tlp_aligner,
+            self.tlp_endianness_swap,
+            self.tlp_filter_formater,
+        )
+
+        # TLP Depacketizer.
+        self.tlp_depacketizer = LitePCIeTLPDepacketizer(
+            data_width   = 64,
+            endianness   = "big",
+            address_mask = 0,
+            capabilities = ["PTM"],
+        )
+        self.comb += [
+            self.tlp_filter_formater.source.connect(self.tlp_depacketizer.sink),
+            self.tlp_depacketizer.ptm_source.connect(source, keep={"valid", "ready"}),
+            source.message_code.eq(self.tlp_depacketizer.ptm_source.message_code),
+            source.master_time[ 0:32].eq(self.tlp_depacketizer.ptm_source.master_time[32:64]),
+            source.master_time[32:64].eq(self.tlp_depacketizer.ptm_source.master_time[ 0:32]),
+            source.link_delay.eq(reverse_bytes(self.tlp_depacketizer.ptm_source.dat[32:64])),
+        ]
+
+        # CSRs.
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        self._overflows = CSRStatus(32, description="Lane words lost (Lane FIFOs full, System Clk too slow).")
+
+        # # #
+
+        self.comb += self._overflows.status.eq(self.overflows)
+
+    def add_sources(self, platform):
+        cdir = os.path.abspath(os.path.dirname(__file__))
+        platform.add_source(os.path.join(cdir, "sniffer_tap.v"))
+
+# PTM Symbol Timestamper ---------------------------------------------------------------------------
+
+class PTMSymbolTimestamper(LiteXModule):
+    """PTM Symbol Timestamper
+
+    Detects PTM TLPs at the symbol level on a (word-aligned, descrambled) raw stream and timestamps
+    them with the time the word carrying their STP Symbol was presented on sink: STP Symbol followed
+    (after the 2-symbol Sequence Number) by a PTM Fmt/Type and, 7 symbols later, by a PTM Message
+    Code. Detection is done on a 4-word window (3 words after the STP word), timestamps are thus
+    not affected by the TLP processing (alignment/depacketization) or by the link load.
+
+    time is the time in the module's clock domain, to be delayed by the latency of the datapath
+    providing sink to get timestamps referenced to the datapath's input (ex: sniffer tap).
+    """
+    def __init__(self, time):
+        self.sink   = sink   = stream.Endpoint(raw_layout)
+        self.source = source = stream.Endpoint(ptm_symbol_timestamp_layout)
+
+        # # #
+
+        # Words Window (oldest word first, current sink word last).
+        data  = [Signal(32) for _ in range(3)] + [sink.data]
+        ctrl  = [Signal(4)  for _ in range(3)] + [sink.ctrl]
+        times = [Signal(64) for _ in range(3)]
+        self.comb += sink.ready.eq(1)
+        self.sync += If(sink.valid,
+            [data[n].eq(data[n + 1]) for n in range(3)],
+            [ctrl[n].eq(ctrl[n + 1]) for n in range(3)],
+            [times[n].eq(times[n + 1]) for n in range(2)],
+            times[2].eq(time),
+        )
+        symbols = Cat(*data)
+        k       = Cat(*ctrl)
+        def symbol(n):
+            return symbols[8*n:8*(n+1)]
+
+        # PTM TLP detection (STP Symbol in the oldest word).
+        detect       = Signal()
+        fmt_type     = Signal(8)
+        message_code = Signal(8)
+        for n in reversed(range(4)): # First STP of the word has priority.
+            stp = (symbol(n) == SHP.value) & k[n] # STP.
+            ptm = (~k[n + 3] & ((symbol(n + 3) == fmt_type_dict["ptm_req"]) | (symbol(n + 3) == fmt_type_dict["ptm_res"])) &
+                   ~k[n + 10] & ((symbol(n + 10) == PTM_REQUEST_MESSAGE_CODE) | (symbol(n + 10) == PTM_RESPONSE_MESSAGE_CODE)))
+            self.comb += If(sink.valid & stp & ptm,
+                detect.eq(1),
+                fmt_type.eq(symbol(n + 3)),
+                message_code.eq(symbol(n + 10)),
+            )
+
+        # Timestamp (Dropped when source is not ready).
+        self.sync += [
+            If(source.ready,
+                source.valid.eq(0),
+            ),
+            If(detect,
+                source.valid.eq(1),
+                source.fmt_type.eq(fmt_type),
+                source.message_code.eq(message_code),
+                source.timestamp.eq(times[0]),
+            )
+        ]
@@ -10,21 +10,32 @@ from migen.genlib.cdc import MultiReg, PulseSynchronizer
 
 from litex.gen import *
 from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+# Time Constants -----------------------------------------------------------------------------------
+
+TIME_INCREMENT_FRAC_BITS = 32 # Fractional ns bits of the Time increment (2^-32 ns resolution).
+
+def time_increment(clk_freq, ppb=0):
+    """Return the fixed-point (32.32) Time increment for a clk_freq Time clock with ppb adjustment."""
+    return int(round((1e9/clk_freq)*(1 + ppb*1e-9)*2**TIME_INCREMENT_FRAC_BITS))
 
 # Time Generator -----------------------------------------------------------------------------------
 
 class TimeGenerator(LiteXModule):
-    def __init__(self, clk_domain, clk_freq, with_csr=True):
-        assert 1e9/clk_freq == int(1e9/clk_freq)
-
+    def __init__(self, clk_domain, clk_freq, sys_clk_freq=None, with_csr=True):
         self.enable     = Signal()
         self.write      = Signal()
         self.write_time = Signal(64)
+        self.increment  = Signal(64, reset=time_increment(clk_freq)) # In ns, 32.32 fixed-point.
+        self.adjust     = Signal()
+        self.offset     = Signal(64) # In ns, signed (two's complement).
 
         # # #
 
         # Time Signals.
         self.time = time = Signal(64)
+        self.time_frac = time_frac = Signal(TIME_INCREMENT_FRAC_BITS)
 
         # Time Clk Domain.
         self.cd_time = ClockDomain()
@@ -38,20 +49,31 @@ class TimeGenerator(LiteXModule):
             # Disable: Reset Time to 0.
             If(~self.enable,
                 time.eq(0),
+                time_frac.eq(0),
             # Software Write.
             ).Elif(self.write,
                 time.eq(self.write_time),
-            # Increment.
+                time_frac.eq(0),
+            # Software Adjust: Atomic Offset Add (+ Increment, Time keeps running).
+            ).Elif(self.adjust,
+                Cat(time_frac, time).eq(Cat(time_frac, time) + self.increment + Cat(C(0, TIME_INCREMENT_FRAC_BITS), self.offset)),
+            # Increment (Fractional ns accumulated in time_frac).
             ).Else(
-                time.eq(time + int(1e9/clk_freq)),
+                Cat(time_frac, time).eq(Cat(time_frac, time) + self.increment),
             )
         ]
 
         # CSRs.
         if with_csr:
-            self.add_csr(clk_domain)
+            self.add_csr(clk_domain, clk_freq, clk_freq if sys_clk_freq is None else sys_clk_freq)
+
+    @staticmethod
+    def snapshot_latency(clk_freq, sys_clk_freq):
+        """Time -> sys_clk CDC latency of the Time Snapshot, in Time clock cycles: AsyncFIFO write (1
+        Time clock cycle) then pointer synchronization/read/register (3 sys_clk cycles)."""
+        return int(round(1 + 3*clk_freq/sys_clk_freq))
 
-    def add_csr(self, clk_domain, default_enable=1):
+    def add_csr(self, clk_domain, clk_freq, sys_clk_freq, default_enable=1):
         self._control = CSRStorage(fields=[
             CSRField("enable", size=1, offset=0, values=[
                 ("``0b0``", "Time Generator Disabled."),
@@ -62,6 +84,9 @@ class TimeGenerator(LiteXModule):
         ])
         self._read_time  = CSRStatus(64,  description="Read Time  (ns) (FPGA Time -> SW).")
         self._write_time = CSRStorage(64, description="Write Time (ns) (SW Time -> FPGA).")
+        self._increment  = CSRStorage(64, reset=time_increment(clk_freq), description="Time increment per Time clock cycle (ns, 32.32 fixed-point), applied on LSB write.")
+        self._offset     = CSRStorage(64, description="Time offset (ns, signed) atomically added to Time on LSB write.")
+        self._snapshot   = CSRStatus(64,  description="Time Snapshot (ns) (FPGA Time -> SW, CDC latency compensated), reading the LSB word latches the MSB word: read LSB first.")
 
         # # #
 
@@ -82,3 +107,40 @@ class TimeGenerator(LiteXModule):
         self.submodules += time_write_ps
         self.comb += time_write_ps.i.eq(self._control.fields.write)
         self.comb += self.write.eq(time_write_ps.o)
+
+        # Time Increment (SW -> FPGA).
+        increment = Signal(64)
+        self.specials += MultiReg(self._increment.storage, increment, "time")
+        time_increment_ps = PulseSynchronizer("sys", "time")
+        self.submodules += time_increment_ps
+        self.comb += time_increment_ps.i.eq(self._increment.re)
+        self.sync.time += If(time_increment_ps.o, self.increment.eq(increment))
+
+        # Time Offset (SW -> FPGA).
+        self.specials += MultiReg(self._offset.storage, self.offset, "time")
+        time_offset_ps = PulseSynchronizer("sys", "time")
+        self.submodules += time_offset_ps
+        self.comb += time_offset_ps.i.eq(self._offset.re)
+        self.comb += self.adjust.eq(time_offset_ps.o)
+
+        # Time Snapshot (FPGA -> SW, Single LSB access).
+        # Time is resynchronized to sys_clk continuously: the CDC latency is compensated by crossing
+        # the Time expected snapshot_latency Time clock cycles later (+ snapshot_latency increments).
+        snapshot_latency   = self.snapshot_latency(clk_freq, sys_clk_freq)
+        snapshot_increment = Signal(64)
+        self.sync.time += snapshot_increment.eq(self.increment*snapshot_latency)
+        time_cdc = stream.ClockDomainCrossing([("time", 64)],
+            cd_from = "time",
+            cd_to   = "sys",
+        )
+        self.submodules += time_cdc
+        self.comb += [
+            time_cdc.sink.valid.eq(1),
+            time_cdc.sink.time.eq((Cat(self.time_frac, self.time) + snapshot_increment)[TIME_INCREMENT_FRAC_BITS:]),
+            time_cdc.source.ready.eq(1),
+        ]
+        time_sys = Signal(64)
+        self.sync += If(time_cdc.source.valid, time_sys.eq(time_cdc.source.time))
+        time_snapshot_msb = Signal(32)
+        self.sync += If(self._snapshot.we, time_snapshot_msb.eq(time_sys[32:]))
+        self.comb += self._snapshot.status.eq(Cat(time_sys[:32], time_snapshot_msb))
@@ -8,6 +8,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import tempfile
 
 from migen import *
 
@@ -25,13 +26,19 @@ from litex.soc.cores.dna  import DNA
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.frontend.ptm import PCIePTMSniffer
-from litepcie.frontend.ptm import PTMCapabilities, PTMRequester
-from litepcie.software import generate_litepcie_software
+from litepcie.frontend.ptm import PTMCapabilities
+from litepcie.software import generate_litepcie_software, generate_litepcie_software_headers
 
 from litescope import LiteScopeAnalyzer
 
-from gateware.time import TimeGenerator
-from gateware.pps import PPSGenerator
+from gateware.time import TimeGenerator, time_increment
+from gateware.pps import PPSGenerator, PPSTimestamper
+from gateware.ptm import PTMRequester, PTMScheduler, PTMRequesterIRQ, PTMStatistics, PTMWireTimestamper
+from gateware.sniffer import MultiLanePCIePTMSniffer
+from gateware.capture import SnifferCapture
+from gateware.events import TimeEventStream
+
+from tools.build_cache import BuildTimings, BuildCache, build_hash, soc_build_time
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -55,15 +62,22 @@ class CRG(LiteXModule):
 class BaseSoC(SoCMini):
     SoCMini.mem_map["csr"] = 0x00000000
     SoCMini.csr_map = {
-        "ctrl"             : 0,
-        "crg"              : 1,
-        "pcie_phy"         : 2,
-        "pcie_msi"         : 3,
-        "pcie_msi_table"   : 4,
-        "ptm_capabilities" : 5,
-        "ptm_requester"    : 6,
-        "time_generator"   : 7,
-        "pps_generator"    : 8,
+        "ctrl"              : 0,
+        "crg"               : 1,
+        "pcie_phy"          : 2,
+        "pcie_msi"          : 3,
+        "pcie_msi_table"    : 4,
+        "ptm_capabilities"  : 5,
+        "ptm_requester"     : 6,
+        "time_generator"    : 7,
+        "pps_generator"     : 8,
+        "ptm_scheduler"     : 9,
+        "pps_timestamper"   : 10,
+        "ptm_irq"           : 11,
+        "ptm_statistics"    : 12,
+        "sniffer_capture"   : 13,
+        "time_events"       : 14,
+        "ptm_wire_timestamper" : 15,
     }
     def __init__(self, sys_clk_freq=125e6, pcie_address_width=32, pcie_msi_type="msi-x", with_ptm=True,
         with_jtagbone                  = True,
@@ -73,6 +87,9 @@ class BaseSoC(SoCMini):
         with_pcie_ptm_sniffer_analyzer = False,
         with_pcie_requester_analyzer   = False,
         with_pcie_delays_analyzer      = False,
+        with_sniffer_capture           = False,
+        with_time_events               = False,
+        with_ptm_wire_timestamper      = True,
         **kwargs):
         platform = ocp_tap_timecard.Platform(with_multiboot=False)
 
@@ -112,7 +129,10 @@ class BaseSoC(SoCMini):
             msi_type   = pcie_msi_type,
             with_ptm   = with_ptm,
         )
-        self.add_pcie(phy=self.pcie_phy, ndmas=1, address_width=pcie_address_width, msi_type=pcie_msi_type, with_ptm=with_ptm)
+        ptm_requester_irq = Signal() # PTM exchange completion, driven by PTMRequesterIRQ.
+        self.add_pcie(phy=self.pcie_phy, ndmas=1 + with_time_events, address_width=pcie_address_width, msi_type=pcie_msi_type, with_ptm=with_ptm,
+            msis = {"PTM_REQUESTER": ptm_requester_irq},
+        )
         # FIXME: Apply it to all targets (integrate it in LitePCIe?).
         platform.add_period_constraint(self.crg.cd_sys.clk, 1e9/sys_clk_freq)
         platform.toolchain.pre_placement_commands.append("reset_property LOC [get_cells -hierarchical -filter {{NAME=~*gtp_channel.gtpe2_channel_i}}]")
@@ -136,18 +156,25 @@ class BaseSoC(SoCMini):
 
         # Sniffer Signals.
         # ----------------
+        nlanes          = self.pcie_phy.nlanes
         sniffer_rst_n   = Signal()
         sniffer_clk     = Signal()
-        sniffer_rx_data = Signal(16)
-        sniffer_rx_ctl  = Signal(2)
+        sniffer_rx_data = Signal(16*nlanes)
+        sniffer_rx_ctl  = Signal(2*nlanes)
+        sniffer_tx_data = Signal(16)
+        sniffer_tx_ctl  = Signal(2)
+        sniffer_tx_tap  = with_ptm_wire_timestamper and (nlanes == 1) # Only used by the PTM Wire Timestamper.
 
         # Sniffer Tap.
         # ------------
-        rx_data = Signal(16)
-        rx_ctl  = Signal(2)
+        rx_data = Signal(16*nlanes)
+        rx_ctl  = Signal(2*nlanes)
         self.sync.pclk += rx_data.eq(rx_data + 1)
         self.sync.pclk += rx_ctl.eq(rx_ctl + 1)
-        self.specials += Instance("sniffer_tap",
+        sniffer_tap_params = {} if nlanes == 1 else {"p_NLANES": nlanes}
+        self.specials += Instance("sniffer_tap" if nlanes == 1 else "multilane_sniffer_tap",
+            name = "pcie_ptm_sniffer_tap",
+            **sniffer_tap_params,
             i_rst_n_in    = 1,
             i_clk_in     = ClockSignal("pclk"),
             i_rx_data_in = rx_data, # /!\ Fake, will be re-connected post-synthesis /!\.
@@ -159,29 +186,73 @@ class BaseSoC(SoCMini):
             o_rx_ctl_out  = sniffer_rx_ctl,
         )
 
+        # Sniffer TX Tap (PCIE2 -> GTPE2 TX Data).
+        # ---------------
+        if sniffer_tx_tap:
+            tx_data = Signal(16)
+            tx_ctl  = Signal(2)
+            self.sync.pclk += tx_data.eq(tx_data + 1)
+            self.sync.pclk += tx_ctl.eq(tx_ctl + 1)
+            self.specials += Instance("sniffer_tap",
+                name = "pcie_ptm_sniffer_tx_tap",
+                i_rst_n_in   = 1,
+                i_clk_in     = ClockSignal("pclk"),
+                i_rx_data_in = tx_data, # /!\ Fake, will be re-connected post-synthesis /!\.
+                i_rx_ctl_in  = tx_ctl,  # /!\ Fake, will be re-connected post-synthesis /!\.
+
+                o_rx_data_out = sniffer_tx_data,
+                o_rx_ctl_out  = sniffer_tx_ctl,
+            )
+
         # Sniffer.
         # --------
-        self.pcie_ptm_sniffer = PCIePTMSniffer(
-            rx_rst_n = sniffer_rst_n,
-            rx_clk   = sniffer_clk,
-            rx_data  = sniffer_rx_data,
-            rx_ctrl  = sniffer_rx_ctl,
-        )
+        # Lanes received at up to 250MHz (16-bit PIPE, Gen2) and reassembled in 32-bit words in the
+        # System Clk domain: System Clk must be >= nlanes/2 x RX Clk (lane words lost otherwise).
+        sniffer_clk_freq = 250e6
+        assert sys_clk_freq >= nlanes/2*sniffer_clk_freq, \
+            f"x{nlanes} PTM Sniffer requires sys_clk_freq >= {nlanes/2*sniffer_clk_freq/1e6:.0f}MHz."
+        if nlanes == 1:
+            self.pcie_ptm_sniffer = PCIePTMSniffer(
+                rx_rst_n = sniffer_rst_n,
+                rx_clk   = sniffer_clk,
+                rx_data  = sniffer_rx_data,
+                rx_ctrl  = sniffer_rx_ctl,
+            )
+        # x2/x4/x8: Lanes deskew/reassembly.
+        else:
+            self.pcie_ptm_sniffer = MultiLanePCIePTMSniffer(
+                rx_rst_n = sniffer_rst_n,
+                rx_clk   = sniffer_clk,
+                rx_data  = sniffer_rx_data,
+                rx_ctrl  = sniffer_rx_ctl,
+                nlanes   = nlanes,
+            )
         self.pcie_ptm_sniffer.add_sources(platform)
 
         # Sniffer Post-Synthesis connections.
         # -----------------------------------
         pcie_ptm_sniffer_connections = []
-        for n in range(2):
+        for n in range(2*nlanes):
             pcie_ptm_sniffer_connections.append((
                 f"pcie_s7/inst/inst/gt_top_i/gt_rx_data_k_wire_filter[{n}]", # Src.
                 f"pcie_ptm_sniffer_tap/rx_ctl_in[{n}]",                      # Dst.
             ))
-        for n in range(16):
+        for n in range(16*nlanes):
             pcie_ptm_sniffer_connections.append((
                 f"pcie_s7/inst/inst/gt_top_i/gt_rx_data_wire_filter[{n}]", # Src.
                 f"pcie_ptm_sniffer_tap/rx_data_in[{n}]",                   # Dst.
             ))
+        if sniffer_tx_tap:
+            for n in range(2):
+                pcie_ptm_sniffer_connections.append((
+                    f"pcie_s7/inst/inst/gt_top_i/gt_tx_data_k[{n}]",  # Src.
+                    f"pcie_ptm_sniffer_tx_tap/rx_ctl_in[{n}]",        # Dst.
+                ))
+            for n in range(16):
+                pcie_ptm_sniffer_connections.append((
+                    f"pcie_s7/inst/inst/gt_top_i/gt_tx_data[{n}]",    # Src.
+                    f"pcie_ptm_sniffer_tx_tap/rx_data_in[{n}]",       # Dst.
+                ))
         for _from, _to in pcie_ptm_sniffer_connections:
             platform.toolchain.pre_optimize_commands.append(f"set pin_driver [get_nets -of [get_pins {_to}]]")
             platform.toolchain.pre_optimize_commands.append(f"disconnect_net -net $pin_driver -objects {_to}")
@@ -190,9 +261,11 @@ class BaseSoC(SoCMini):
         # Time -------------------------------------------------------------------------------------
 
         self.time_generator = TimeGenerator(
-            clk_domain = "clk50",
-            clk_freq   = 50e6,
+            clk_domain   = "clk50",
+            clk_freq     = 50e6,
+            sys_clk_freq = sys_clk_freq,
         )
+        self.add_constant("TIME_GENERATOR_INCREMENT", time_increment(50e6)) # Nominal increment (Driver's adjfine).
 
         # PTM --------------------------------------------------------------------------------------
 
@@ -202,7 +275,7 @@ class BaseSoC(SoCMini):
             requester_capable = True,
         )
 
-        # PTM Requester.
+        # PTM Requester (Triggered from its CSR or from the PTM Scheduler).
         self.ptm_requester = PTMRequester(
             pcie_endpoint    = self.pcie_endpoint,
             pcie_ptm_sniffer = self.pcie_ptm_sniffer,
@@ -214,12 +287,106 @@ class BaseSoC(SoCMini):
             self.ptm_requester.time.eq(self.time_generator.time)
         ]
 
+        # PTM Requester IRQ (Completion signalled on PTM_REQUESTER MSI/MSI-X vector).
+        self.ptm_irq = PTMRequesterIRQ(ptm_requester=self.ptm_requester)
+        self.comb += ptm_requester_irq.eq(self.ptm_irq.irq)
+
+        # PTM Scheduler (Periodic PTM Requests, Samples FIFO).
+        self.ptm_scheduler = PTMScheduler(
+            ptm_requester = self.ptm_requester,
+            sys_clk_freq  = sys_clk_freq,
+        )
+
+        # PTM Statistics (Windowed Link Delay/Round-Trip/T2-T1 Statistics, Invalid/Timeout Counters).
+        self.ptm_statistics = PTMStatistics(
+            ptm_requester = self.ptm_requester,
+            sys_clk_freq  = sys_clk_freq,
+        )
+
+        # PTM Wire Timestamper (T1/T4 at the PIPE TX/RX interfaces, used by the driver, x1 links).
+        if sniffer_tx_tap:
+            self.ptm_wire_timestamper = PTMWireTimestamper(
+                clk_domain    = "clk50",
+                time          = self.time_generator.time,
+                sniffer_rst_n = sniffer_rst_n,
+                sniffer_clk   = sniffer_clk,
+                tx_data       = sniffer_tx_data,
+                tx_ctrl       = sniffer_tx_ctl,
+                rx_data       = sniffer_rx_data,
+                rx_ctrl       = sniffer_rx_ctl,
+            )
+
+        # Sniffer Capture --------------------------------------------------------------------------
+
+        # Raw sniffer words (RX Lane 0, TX when the TX Tap is present) streamed to the host over DMA
+        # (litepcie_capture), records triggered on PTM Requests or back-to-back (continuous).
+        if with_sniffer_capture:
+            self.cd_sniffer_capture = ClockDomain()
+            self.comb += [
+                self.cd_sniffer_capture.clk.eq(sniffer_clk),
+                self.cd_sniffer_capture.rst.eq(~sniffer_rst_n),
+            ]
+            sniffer_capture_channels = [Cat(sniffer_rx_data[0:16], sniffer_rx_ctl[0:2])]
+            if sniffer_tx_tap:
+                sniffer_capture_channels += [Cat(sniffer_tx_data, sniffer_tx_ctl)]
+            self.sniffer_capture = SnifferCapture(
+                clock_domain = "sniffer_capture",
+                channels     = sniffer_capture_channels,
+                sys_clk_freq = sys_clk_freq,
+            )
+            self.add_constant("SNIFFER_CAPTURE_MAX_LENGTH",     self.sniffer_capture.max_length)
+            self.add_constant("SNIFFER_CAPTURE_MAX_PRETRIGGER", self.sniffer_capture.max_pretrigger)
+            self.comb += [
+                self.sniffer_capture.trigger.eq(self.ptm_requester.trigger),
+                self.sniffer_capture.source.connect(self.pcie_dma0.sink),
+            ]
+
         # PPS --------------------------------------------------------------------------------------
 
-        pps_generator = PPSGenerator(clk_freq=50e6, time=self.time_generator.time)
-        pps_generator = ClockDomainsRenamer("clk50")(pps_generator)
-        self.submodules += pps_generator
-        self.comb += platform.request("som_led").eq(~pps_generator.pps)
+        # PPS Generator (Channel 0: SoM Led, Channel 1: PMOD0, programmable from the driver (PEROUT)).
+        self.pps_generator = PPSGenerator(
+            clk_domain = "clk50",
+            time       = self.time_generator.time,
+            nchannels  = 2,
+        )
+        self.add_constant("PPS_GENERATOR_CHANNELS", 2)
+        self.comb += platform.request("som_led").eq(~self.pps_generator.pps[0])
+        self.comb += platform.request("pmod")[0].eq(self.pps_generator.pps[1])
+
+        # PPS Timestamper (External PPS/Event input on SMA 0, exposed by the driver as EXTTS).
+        pps_in_pads = platform.request("sma", 0)
+        self.comb += pps_in_pads.dat_in_en.eq(1)
+        self.comb += pps_in_pads.dat_out_en.eq(0)
+        self.pps_timestamper = PPSTimestamper(
+            clk_domain = "clk50",
+            clk_freq   = 50e6,
+            time       = self.time_generator.time,
+        )
+        self.comb += self.pps_timestamper.pps.eq(pps_in_pads.dat_in)
+
+        # Time Events ------------------------------------------------------------------------------
+
+        # Time/PTM/PPS event records streamed to the host over DMA (DMA channel 1, /dev/litepcie1),
+        # consumed in place from the mmapped DMA buffers (liblitepcie's litepcie_events, tools/time_events.py).
+        if with_time_events:
+            self.time_events = TimeEventStream(
+                clk_domain   = "clk50",
+                time         = self.time_generator.time,
+                sys_clk_freq = sys_clk_freq,
+            )
+            self.comb += [
+                # Completed PTM exchanges.
+                self.time_events.ptm.valid.eq(self.ptm_requester.update),
+                self.time_events.ptm.t1.eq(self.ptm_requester.t1),
+                self.time_events.ptm.t2.eq(self.ptm_requester.master_time),
+                self.time_events.ptm.t4.eq(self.ptm_requester.t4),
+                self.time_events.ptm.link_delay.eq(self.ptm_requester.link_delay),
+                # PPS/Event Timestamps.
+                self.time_events.pps.valid.eq(self.pps_timestamper.cdc.source.valid),
+                self.time_events.pps.timestamp.eq(self.pps_timestamper.cdc.source.timestamp),
+                # DMA.
+                self.time_events.source.connect(self.pcie_dma1.sink),
+            ]
 
         # Analyzers --------------------------------------------------------------------------------
 
@@ -290,14 +457,14 @@ class BaseSoC(SoCMini):
                 # PTM Request Observation.
                 self.ptm_requester.req_ep.valid,
                 self.ptm_requester.req_ep.ready,
-                self.pcie_phy.sniffer_tx_data,
-                self.pcie_phy.sniffer_tx_ctl,
                 # PTM Response Observation.
                 self.ptm_requester.res_ep.valid,
                 self.ptm_requester.res_ep.ready,
-                self.pcie_phy.sniffer_rx_data,
-                self.pcie_phy.sniffer_rx_ctl,
+                sniffer_rx_data,
+                sniffer_rx_ctl,
             ]
+            if sniffer_tx_tap:
+                analyzer_signals += [sniffer_tx_data, sniffer_tx_ctl]
             self.analyzer = LiteScopeAnalyzer(analyzer_signals,
                 depth        = 8192,
                 register     = True,
@@ -308,25 +475,103 @@ class BaseSoC(SoCMini):
 
 # Build --------------------------------------------------------------------------------------------
 
+def run_toolchain(builder):
+    """Run the toolchain on the project generated by builder.build(run=False)."""
+    toolchain = builder.soc.platform.toolchain
+    cwd = os.getcwd()
+    os.chdir(builder.gateware_dir)
+    try:
+        toolchain.run_script(toolchain.build_script())
+    finally:
+        os.chdir(cwd)
+
+def build_artifacts(builder):
+    """Return the build outputs ({cache name: path}) restored along with a cached bitstream."""
+    artifacts = {}
+    for mode in ["sram", "flash"]:
+        bitstream = builder.get_bitstream_filename(mode=mode)
+        artifacts[os.path.join("gateware", os.path.basename(bitstream))] = bitstream
+    if builder.csr_csv is not None:
+        artifacts["csr.csv"] = builder.csr_csv
+    if builder.csr_json is not None:
+        artifacts["csr.json"] = builder.csr_json
+    artifacts["generated"] = builder.generated_dir
+    return artifacts
+
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=ocp_tap_timecard.Platform, description="LiteX SoC on OCP-TAP TimeCard.")
-    parser.add_target_argument("--flash",        action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--flash",                action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",         default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--driver",               action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sniffer-capture", action="store_true",       help="Enable Sniffer Capture (raw sniffer words streamed over DMA).")
+    parser.add_target_argument("--with-time-events",     action="store_true",       help="Enable Time Event Stream (Time/PTM/PPS records streamed over DMA).")
+    parser.add_target_argument("--build-cache-dir",      default="build/cache",     help="Build cache directory (bitstreams/CSR CSV/headers of previous builds).")
+    parser.add_target_argument("--no-build-cache",       action="store_true",       help="Disable the build cache (always run the toolchain).")
     args = parser.parse_args()
 
-    soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        **parser.soc_argdict
-    )
+    timings = BuildTimings()
+    with timings.stage("SoC elaboration"):
+        soc = BaseSoC(
+            sys_clk_freq         = args.sys_clk_freq,
+            with_sniffer_capture = args.with_sniffer_capture,
+            with_time_events     = args.with_time_events,
+            **parser.soc_argdict
+        )
 
     builder  = Builder(soc, **parser.builder_argdict)
+    cache    = None
     if args.build:
-        builder.build(**parser.toolchain_argdict)
+        # Generate Verilog/Constraints/Project only, run the toolchain on cache miss.
+        with timings.stage("Verilog/constraints generation"):
+            builder.build(**parser.toolchain_argdict, run=False)
+        if builder.compile_gateware:
+            if not args.no_build_cache:
+                with timings.stage("Build hash"):
+                    cache  = BuildCache(args.build_cache_dir)
+                    params = {
+                        "soc"       : dict(parser.soc_argdict,
+                            sys_clk_freq         = args.sys_clk_freq,
+                            with_sniffer_capture = args.with_sniffer_capture,
+                            with_time_events     = args.with_time_events,
+                        ),
+                        "toolchain" : parser.toolchain_argdict,
+                    }
+                    key = build_hash(
+                        gateware_dir = builder.gateware_dir,
+                        build_name   = soc.get_build_name(),
+                        sources      = [f for f, *_ in soc.platform.sources],
+                        params       = params,
+                        build_time   = soc_build_time(soc),
+                    )
+            if cache is not None and key in cache:
+                with timings.stage("Build cache restore"):
+                    print(f"Build cache hit ({key[:16]}, built {cache.metadata(key)['date']}), reusing {cache.path(key)}.")
+                    cache.restore(key, build_artifacts(builder))
+            else:
+                with timings.stage("Toolchain"):
+                    run_toolchain(builder)
+                if cache is not None:
+                    with timings.stage("Build cache store"):
+                        with tempfile.TemporaryDirectory() as driver_headers:
+                            generate_litepcie_software_headers(soc, driver_headers)
+                            cache.store(key, dict(build_artifacts(builder), driver=driver_headers), metadata={
+                                "build_name" : soc.get_build_name(),
+                                "params"     : params,
+                                "build_time" : soc_build_time(soc),
+                                "timings"    : timings.stages,
+                            })
 
     if args.driver:
-        generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        with timings.stage("Driver generation"):
+            driver_dir = os.path.join(builder.output_dir, "driver")
+            generate_litepcie_software(soc, driver_dir)
+            # Keep driver headers consistent with the cached bitstream.
+            if cache is not None:
+                cache.restore(key, {"driver": os.path.join(driver_dir, "kernel")})
+
+    if timings.stages:
+        print(timings.report())
 
     if args.load:
         prog = soc.platform.create_programmer()
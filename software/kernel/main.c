@@ -28,6 +28,8 @@
 #include <linux/pci_regs.h>
 #include <linux/delay.h>
 #include <linux/wait.h>
+#include <linux/completion.h>
+#include <linux/workqueue.h>
 #include <linux/log2.h>
 #include <linux/poll.h>
 #include <linux/cdev.h>
@@ -110,6 +112,20 @@ struct litepcie_device {
 	struct ptp_clock_info ptp_caps;
 	u64 t1_prev;
 	u64 t4_prev;
+#ifdef PTM_REQUESTER_INTERRUPT
+	/* PTM exchange completions (IRQ -> work) and latest PTM sample (cached by the work) */
+	struct work_struct ptm_work;
+	wait_queue_head_t ptm_wait;
+	spinlock_t ptm_lock;
+	u64 ptm_device_time;
+	u64 ptm_master_time;
+	u32 ptm_count;
+	bool ptm_valid;
+#endif
+#ifdef CSR_PPS_TIMESTAMPER_CONTROL_ADDR
+	/* PPS Timestamper overflows count at the last poll (hardware counter is cumulative) */
+	u32 pps_timestamper_overflows;
+#endif
 };
 
 struct litepcie_chan_priv {
@@ -398,6 +414,14 @@ static irqreturn_t litepcie_interrupt(int irq, void *data)
 		}
 	}
 
+#ifdef PTM_REQUESTER_INTERRUPT
+	/* ptm exchange completion (sample read deferred to the PTM work: no MMIO read here) */
+	if (irq_vector & (1 << PTM_REQUESTER_INTERRUPT)) {
+		schedule_work(&s->ptm_work);
+		clear_mask |= (1 << PTM_REQUESTER_INTERRUPT);
+	}
+#endif
+
 #ifdef CSR_PCIE_MSI_CLEAR_ADDR
 	litepcie_writel(s, CSR_PCIE_MSI_CLEAR_ADDR, clear_mask);
 #endif
@@ -980,6 +1004,40 @@ static void litepcie_free_chdev(struct litepcie_device *s)
 #define TIME_CONTROL_ENABLE       (1 << CSR_TIME_GENERATOR_CONTROL_ENABLE_OFFSET)
 #define TIME_CONTROL_READ         (1 << CSR_TIME_GENERATOR_CONTROL_READ_OFFSET)
 #define TIME_CONTROL_WRITE        (1 << CSR_TIME_GENERATOR_CONTROL_WRITE_OFFSET)
+#ifdef CSR_TIME_GENERATOR_INCREMENT_ADDR
+#define TIME_CONTROL_INCREMENT_L  (CSR_TIME_GENERATOR_INCREMENT_ADDR + (4))
+#define TIME_CONTROL_INCREMENT_H  (CSR_TIME_GENERATOR_INCREMENT_ADDR + (0))
+#endif
+#ifdef CSR_TIME_GENERATOR_SNAPSHOT_ADDR
+#define TIME_CONTROL_SNAPSHOT_L   (CSR_TIME_GENERATOR_SNAPSHOT_ADDR + (4))
+#define TIME_CONTROL_SNAPSHOT_H   (CSR_TIME_GENERATOR_SNAPSHOT_ADDR + (0))
+#endif
+#ifdef CSR_TIME_GENERATOR_OFFSET_ADDR
+#define TIME_CONTROL_OFFSET_L     (CSR_TIME_GENERATOR_OFFSET_ADDR + (4))
+#define TIME_CONTROL_OFFSET_H     (CSR_TIME_GENERATOR_OFFSET_ADDR + (0))
+#endif
+
+/* PPS */
+#ifdef CSR_PPS_GENERATOR_CH0_CONTROL_ADDR
+#define PPS_CONTROL_ENABLE  (1 << CSR_PPS_GENERATOR_CH0_CONTROL_ENABLE_OFFSET)
+#if PPS_GENERATOR_CHANNELS > 1
+#define PPS_CHANNEL_STRIDE  (CSR_PPS_GENERATOR_CH1_CONTROL_ADDR - CSR_PPS_GENERATOR_CH0_CONTROL_ADDR)
+#else
+#define PPS_CHANNEL_STRIDE  0
+#endif
+#define PPS_CONTROL(n)      (CSR_PPS_GENERATOR_CH0_CONTROL_ADDR + (n)*PPS_CHANNEL_STRIDE)
+#define PPS_PERIOD(n)       (CSR_PPS_GENERATOR_CH0_PERIOD_ADDR  + (n)*PPS_CHANNEL_STRIDE)
+#define PPS_WIDTH(n)        (CSR_PPS_GENERATOR_CH0_WIDTH_ADDR   + (n)*PPS_CHANNEL_STRIDE)
+#define PPS_START_L(n)      (CSR_PPS_GENERATOR_CH0_START_ADDR   + (n)*PPS_CHANNEL_STRIDE + (4))
+#define PPS_START_H(n)      (CSR_PPS_GENERATOR_CH0_START_ADDR   + (n)*PPS_CHANNEL_STRIDE + (0))
+#endif
+
+#ifdef CSR_PPS_TIMESTAMPER_CONTROL_ADDR
+#define PPS_TIMESTAMPER_CONTROL_ENABLE  (1 << CSR_PPS_TIMESTAMPER_CONTROL_ENABLE_OFFSET)
+#define PPS_TIMESTAMPER_CONTROL_FLUSH   (1 << CSR_PPS_TIMESTAMPER_CONTROL_FLUSH_OFFSET)
+#define PPS_TIMESTAMPER_STATUS_READABLE (1 << CSR_PPS_TIMESTAMPER_STATUS_READABLE_OFFSET)
+#define PPS_TIMESTAMPER_POLL_INTERVAL   (HZ/10)
+#endif
 
 /* PTM */
 #define PTM_CONTROL_ENABLE  (1 << CSR_PTM_REQUESTER_CONTROL_ENABLE_OFFSET)
@@ -995,6 +1053,13 @@ static void litepcie_free_chdev(struct litepcie_device *s)
 /* t4 */
 #define PTM_T4_TIME_L       (CSR_PTM_REQUESTER_T4_TIME_ADDR + (4))
 #define PTM_T4_TIME_H       (CSR_PTM_REQUESTER_T4_TIME_ADDR + (0))
+/* completion */
+#define PTM_COMPLETION_TIMEOUT_MS 10
+
+/* PTM Wire Timestamper */
+#ifdef CSR_PTM_WIRE_TIMESTAMPER_STATUS_ADDR
+#define PTM_WIRE_STATUS_VALID (1 << CSR_PTM_WIRE_TIMESTAMPER_STATUS_VALID_OFFSET)
+#endif
 
 static u64 litepcie_read64(struct litepcie_device *dev, uint32_t addr)
 {
@@ -1031,6 +1096,30 @@ static int litepcie_write_time(struct litepcie_device *dev, const struct timespe
 	return 0;
 }
 
+#ifdef CSR_TIME_GENERATOR_INCREMENT_ADDR
+static void litepcie_write_increment(struct litepcie_device *dev, u64 increment)
+{
+	/* Increment is applied on LSB write: write MSB first. */
+	litepcie_writel(dev, TIME_CONTROL_INCREMENT_H, (increment >> 32) & 0xffffffff);
+	litepcie_writel(dev, TIME_CONTROL_INCREMENT_L, (increment >>  0) & 0xffffffff);
+}
+
+static u64 litepcie_scaled_ppm_to_increment(u64 increment, long scaled_ppm)
+{
+	bool neg_adj = false;
+	u64 diff;
+
+	/* scaled_ppm: ppm with 16-bit binary fractional part. */
+	if (scaled_ppm < 0) {
+		neg_adj = true;
+		scaled_ppm = -scaled_ppm;
+	}
+	diff = mul_u64_u64_div_u64(increment, (u64)scaled_ppm, 1000000ULL << 16);
+
+	return neg_adj ? (increment - diff) : (increment + diff);
+}
+#endif
+
 static int litepcie_ptp_gettimex64(struct ptp_clock_info *ptp,
                    struct timespec64 *ts,
                    struct ptp_system_timestamp *sts)
@@ -1039,6 +1128,21 @@ static int litepcie_ptp_gettimex64(struct ptp_clock_info *ptp,
 							   ptp_caps);
 	unsigned long flags;
 
+#ifdef CSR_TIME_GENERATOR_SNAPSHOT_ADDR
+	u32 time_l, time_h;
+
+	spin_lock_irqsave(&dev->tmreg_lock, flags);
+
+	/* Single PCIe read in the system timestamps window: LSB read latches the MSB. */
+	ptp_read_system_prets(sts);
+	time_l = litepcie_readl(dev, TIME_CONTROL_SNAPSHOT_L);
+	ptp_read_system_postts(sts);
+	time_h = litepcie_readl(dev, TIME_CONTROL_SNAPSHOT_H);
+
+	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+
+	*ts = ns_to_timespec64((((s64) time_h) << 32) | time_l);
+#else
 	spin_lock_irqsave(&dev->tmreg_lock, flags);
 
 	ptp_read_system_prets(sts);
@@ -1046,6 +1150,7 @@ static int litepcie_ptp_gettimex64(struct ptp_clock_info *ptp,
 	ptp_read_system_postts(sts);
 
 	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+#endif
 
 	return 0;
 }
@@ -1067,40 +1172,45 @@ static int litepcie_ptp_settime(struct ptp_clock_info *ptp, const struct timespe
 
 static int litepcie_ptp_adjfine(struct ptp_clock_info *ptp, long scaled_ppm)
 {
-#if 1
-	if (scaled_ppm != 0)
-		return -EOPNOTSUPP;
-#else
+#ifdef CSR_TIME_GENERATOR_INCREMENT_ADDR
 	struct litepcie_device *dev = container_of(ptp, struct litepcie_device,
 							   ptp_caps);
-    int neg_adj = 0;
-    u64 rate;
-    u32 inca;
-
-    if (scaled_ppm < 0) {
-        neg_adj = 1;
-        scaled_ppm = -scaled_ppm;
-    }
-    rate = scaled_ppm;
-    rate <<= 14;
-    rate = div_u64(rate, 78125);
-
-    inca = rate & INCVALUE_MASK;
-    if (neg_adj)
-        inca |= ISGN;
-
-    litepcie_write_time(IGC_TIMINCA, inca);
+	unsigned long flags;
+	u64 increment;
+
+	/* Fractional Time increment (ns, 32.32 fixed-point): Time slews at the adjusted rate. */
+	increment = litepcie_scaled_ppm_to_increment(TIME_GENERATOR_INCREMENT, scaled_ppm);
+
+	spin_lock_irqsave(&dev->tmreg_lock, flags);
+
+	litepcie_write_increment(dev, increment);
+
+	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+#else
+	if (scaled_ppm != 0)
+		return -EOPNOTSUPP;
 #endif
 
-    return 0;
+	return 0;
 }
 
 static int litepcie_ptp_adjtime(struct ptp_clock_info *ptp, s64 delta)
 {
 	struct litepcie_device *dev = container_of(ptp, struct litepcie_device,
 							   ptp_caps);
-	struct timespec64 now, then = ns_to_timespec64(delta);
 	unsigned long flags;
+#ifdef CSR_TIME_GENERATOR_OFFSET_ADDR
+	u64 offset = (u64)delta;
+
+	spin_lock_irqsave(&dev->tmreg_lock, flags);
+
+	/* Signed offset atomically added to Time by hardware on LSB write: write MSB first. */
+	litepcie_writel(dev, TIME_CONTROL_OFFSET_H, (offset >> 32) & 0xffffffff);
+	litepcie_writel(dev, TIME_CONTROL_OFFSET_L, (offset >>  0) & 0xffffffff);
+
+	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+#else
+	struct timespec64 now, then = ns_to_timespec64(delta);
 
 	spin_lock_irqsave(&dev->tmreg_lock, flags);
 
@@ -1109,26 +1219,123 @@ static int litepcie_ptp_adjtime(struct ptp_clock_info *ptp, s64 delta)
 	litepcie_write_time(dev, &now);
 
 	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+#endif
 	return 0; // Return success
 }
 
-static int litepcie_phc_get_syncdevicetime(ktime_t *device,
-                      struct system_counterval_t *system,
-                      void *ctx)
+/* PTM t1/t4: wire timestamps (PTM Request/ResponseD at the PIPE TX/RX interfaces, independent of
+ * the DMA load) when valid for the last PTM dialog, PTM Requester ones (TLP layer) otherwise */
+static void litepcie_ptm_read_t1_t4(struct litepcie_device *dev, u64 *t1, u64 *t4)
+{
+#ifdef CSR_PTM_WIRE_TIMESTAMPER_STATUS_ADDR
+	if (litepcie_readl(dev, CSR_PTM_WIRE_TIMESTAMPER_STATUS_ADDR) & PTM_WIRE_STATUS_VALID) {
+		*t1 = litepcie_read64(dev, CSR_PTM_WIRE_TIMESTAMPER_T1_TIME_ADDR);
+		*t4 = litepcie_read64(dev, CSR_PTM_WIRE_TIMESTAMPER_T4_TIME_ADDR);
+		return;
+	}
+#endif
+	*t1 = litepcie_read64(dev, CSR_PTM_REQUESTER_T1_TIME_ADDR);
+	*t4 = litepcie_read64(dev, CSR_PTM_REQUESTER_T4_TIME_ADDR);
+}
+
+/* PTM Master Time at t1: t2/link delay of a PTM ResponseD are the ones of the previous PTM dialog */
+static u64 litepcie_ptm_master_time(struct litepcie_device *dev, u64 t2, u32 prop_delay)
+{
+	return t2 - (((dev->t4_prev - dev->t1_prev) - prop_delay) >> 1);
+}
+
+#ifdef PTM_REQUESTER_INTERRUPT
+static void litepcie_ptm_work(struct work_struct *work)
+{
+	struct litepcie_device *dev = container_of(work, struct litepcie_device, ptm_work);
+	unsigned long flags;
+	u64 t1, t2, t4;
+	u32 prop_delay, count;
+	bool torn;
+
+	/* Read the PTM sample once per completion(s), count re-read to detect a new completion during
+	 * the read (sample mixing two PTM dialogs) */
+	count      = litepcie_readl(dev, CSR_PTM_IRQ_COUNT_ADDR);
+	t2         = litepcie_read64(dev, CSR_PTM_REQUESTER_MASTER_TIME_ADDR);
+	litepcie_ptm_read_t1_t4(dev, &t1, &t4);
+	prop_delay = litepcie_readl(dev, CSR_PTM_REQUESTER_LINK_DELAY_ADDR);
+	torn       = litepcie_readl(dev, CSR_PTM_IRQ_COUNT_ADDR) != count;
+
+	spin_lock_irqsave(&dev->ptm_lock, flags);
+	/* Valid if previous t1/t4 are from the previous PTM dialog (no missed/coalesced completion), the
+	 * sample is not torn and t1 not already updated by a new PTM Request (ex: from the PTM Scheduler) */
+	dev->ptm_valid       = (count == dev->ptm_count + 1) && !torn && (dev->t4_prev != 0) && (t1 < t4);
+	dev->ptm_device_time = t1;
+	dev->ptm_master_time = litepcie_ptm_master_time(dev, t2, prop_delay);
+	dev->ptm_count       = count;
+	dev->t1_prev         = torn ? 0 : t1;
+	dev->t4_prev         = torn ? 0 : t4;
+	spin_unlock_irqrestore(&dev->ptm_lock, flags);
+
+	wake_up_all(&dev->ptm_wait);
+}
+
+/* PTM completions processed by the PTM work since count */
+static bool litepcie_ptm_completed(struct litepcie_device *dev, u32 count)
+{
+	unsigned long flags;
+	bool completed;
+
+	spin_lock_irqsave(&dev->ptm_lock, flags);
+	completed = (s32)(dev->ptm_count - count) > 0;
+	spin_unlock_irqrestore(&dev->ptm_lock, flags);
+
+	return completed;
+}
+
+/* Issue a PTM Request and return the sample of a PTM dialog started during the call: a PTM dialog
+ * already in flight (ex: from the PTM Scheduler) is waited for (its completion not being used) */
+static int litepcie_ptm_request(struct litepcie_device *dev, u64 *device_time, u64 *master_time)
+{
+	unsigned long flags;
+	u32 status, count;
+	bool valid;
+	int tries = PTM_COMPLETION_TIMEOUT_MS;
+
+	/* Tag: PTM completion count with the PTM Requester idle (status read first: completions
+	 * after count are then from PTM dialogs started during the call) */
+	for (;;) {
+		status = litepcie_readl(dev, CSR_PTM_REQUESTER_STATUS_ADDR);
+		count  = litepcie_readl(dev, CSR_PTM_IRQ_COUNT_ADDR);
+		if ((status & PTM_STATUS_BUSY) == 0)
+			break;
+		if (!--tries)
+			return -ETIMEDOUT;
+		wait_event_timeout(dev->ptm_wait, litepcie_ptm_completed(dev, count), msecs_to_jiffies(1));
+	}
+
+	/* request (posted write) and sleep until a completion after the tag */
+	litepcie_writel(dev, CSR_PTM_REQUESTER_CONTROL_ADDR,
+		PTM_CONTROL_ENABLE | PTM_CONTROL_TRIGGER);
+	if (!wait_event_timeout(dev->ptm_wait, litepcie_ptm_completed(dev, count),
+		msecs_to_jiffies(PTM_COMPLETION_TIMEOUT_MS)))
+		return -ETIMEDOUT;
+
+	spin_lock_irqsave(&dev->ptm_lock, flags);
+	valid        = dev->ptm_valid;
+	*device_time = dev->ptm_device_time;
+	*master_time = dev->ptm_master_time;
+	spin_unlock_irqrestore(&dev->ptm_lock, flags);
+
+	return valid ? 0 : -EAGAIN;
+}
+#else
+/* Issue a PTM Request and return its sample (polling) */
+static int litepcie_ptm_request(struct litepcie_device *dev, u64 *device_time, u64 *master_time)
 {
-	u32 t1_curr_h, t1_curr_l;
 	u32 t2_curr_h, t2_curr_l;
 	u32 prop_delay;
 	u32 reg;
-	u64 ptm_master_time;
-	struct litepcie_device *dev = ctx;
 	u64 t1_curr;
-	ktime_t t1, t2_curr;
+	u64 t2_curr;
+	u64 t4_curr;
 	int count = 100;
 
-	/* Get a snapshot of system clocks to use as historic value. */
-	ktime_get_snapshot(&dev->snapshot);
-
 	/* request */
 
 	litepcie_writel(dev, CSR_PTM_REQUESTER_CONTROL_ADDR,
@@ -1145,10 +1352,7 @@ static int litepcie_phc_get_syncdevicetime(ktime_t *device,
 		return -ETIMEDOUT;
 	}
 
-	t1_curr_l = litepcie_readl(dev, PTM_T1_TIME_L);
-	t1_curr_h = litepcie_readl(dev, PTM_T1_TIME_H);
-	t1_curr = ((u64)t1_curr_h << 32 | t1_curr_l);
-	t1 = ns_to_ktime(t1_curr);
+	litepcie_ptm_read_t1_t4(dev, &t1_curr, &t4_curr);
 
 	t2_curr_l = litepcie_readl(dev, PTM_MASTER_TIME_L);
 	t2_curr_h = litepcie_readl(dev, PTM_MASTER_TIME_H);
@@ -1157,19 +1361,36 @@ static int litepcie_phc_get_syncdevicetime(ktime_t *device,
 	/* t3-t2 from downstream port */
 	prop_delay = litepcie_readl(dev, CSR_PTM_REQUESTER_LINK_DELAY_ADDR);
 	/* PTM Master Time formula */
-	ptm_master_time = t2_curr - (((dev->t4_prev - dev->t1_prev) - prop_delay) >> 1);
+	*master_time = litepcie_ptm_master_time(dev, t2_curr, prop_delay);
+	*device_time = t1_curr;
+
+	/* store T4 & T1 for next request */
+	dev->t4_prev = t4_curr;
+	dev->t1_prev = t1_curr;
+
+	return 0;
+}
+#endif
+
+/* PTM sample of a cross timestamp: Device Time and PTM Master Time at t1 */
+struct litepcie_crosststamp {
+	u64 device_time;
+	u64 master_time;
+};
+
+static int litepcie_phc_get_syncdevicetime(ktime_t *device,
+                      struct system_counterval_t *system,
+                      void *ctx)
+{
+	struct litepcie_crosststamp *xtstamp = ctx;
 
-	*device = t1;
+	*device = ns_to_ktime(xtstamp->device_time);
 #if IS_ENABLED(CONFIG_X86_TSC) && !defined(CONFIG_UML)
-	*system = convert_art_ns_to_tsc(ptm_master_time);
+	*system = convert_art_ns_to_tsc(xtstamp->master_time);
 #else
-    *system (struct system_counterval_t) { };
+	*system = (struct system_counterval_t) { };
 #endif
 
-	/* store T4 & T1 for next request */
-	dev->t4_prev = litepcie_read64(dev, CSR_PTM_REQUESTER_T4_TIME_ADDR);
-	dev->t1_prev = t1_curr;
-
 	return 0;
 }
 
@@ -1178,16 +1399,136 @@ static int litepcie_ptp_getcrosststamp(struct ptp_clock_info *ptp,
 {
 	struct litepcie_device *dev= container_of(ptp, struct litepcie_device,
                            ptp_caps);
+	struct litepcie_crosststamp xtstamp;
+	int ret;
+
+	/* Get a snapshot of system clocks to use as historic value (before the PTM dialog). */
+	ktime_get_snapshot(&dev->snapshot);
+
+	/* PTM dialog issued once here, not on each get_device_system_crosststamp retry */
+	ret = litepcie_ptm_request(dev, &xtstamp.device_time, &xtstamp.master_time);
+	if (ret)
+		return ret;
 
 	return get_device_system_crosststamp(litepcie_phc_get_syncdevicetime,
-                         dev, &dev->snapshot, cts);
+                         &xtstamp, &dev->snapshot, cts);
+}
+
+#ifdef CSR_PPS_GENERATOR_CH0_CONTROL_ADDR
+static int litepcie_ptp_perout(struct litepcie_device *dev,
+                 struct ptp_perout_request *perout, int on)
+{
+	unsigned int index = perout->index;
+	u64 start, period, width;
+	unsigned long flags;
+
+	/* Rising edges at start + k*period, width from duty cycle (default: 50%). */
+	if (perout->flags & ~PTP_PEROUT_DUTY_CYCLE)
+		return -EOPNOTSUPP;
+	if (index >= PPS_GENERATOR_CHANNELS)
+		return -EINVAL;
+
+	start  = perout->start.sec  * NSEC_PER_SEC + perout->start.nsec;
+	period = perout->period.sec * NSEC_PER_SEC + perout->period.nsec;
+	if (perout->flags & PTP_PEROUT_DUTY_CYCLE)
+		width = perout->on.sec * NSEC_PER_SEC + perout->on.nsec;
+	else
+		width = period >> 1;
+	if (on && ((period == 0) || (period > U32_MAX) || (width == 0) || (width >= period)))
+		return -EINVAL;
+
+	spin_lock_irqsave(&dev->tmreg_lock, flags);
+
+	litepcie_writel(dev, PPS_CONTROL(index), 0);
+	if (on) {
+		litepcie_writel(dev, PPS_PERIOD(index),  period);
+		litepcie_writel(dev, PPS_WIDTH(index),   width);
+		/* Start is applied (channel re-armed) on LSB write: write MSB first. */
+		litepcie_writel(dev, PPS_START_H(index), (start >> 32) & 0xffffffff);
+		litepcie_writel(dev, PPS_START_L(index), (start >>  0) & 0xffffffff);
+		litepcie_writel(dev, PPS_CONTROL(index), PPS_CONTROL_ENABLE);
+	}
+
+	spin_unlock_irqrestore(&dev->tmreg_lock, flags);
+
+	return 0;
+}
+#endif
+
+#ifdef CSR_PPS_TIMESTAMPER_CONTROL_ADDR
+static int litepcie_ptp_extts(struct litepcie_device *dev,
+                 struct ptp_extts_request *extts, int on)
+{
+	/* Rising edges only. */
+	if (extts->flags & ~(PTP_ENABLE_FEATURE | PTP_RISING_EDGE | PTP_STRICT_FLAGS))
+		return -EOPNOTSUPP;
+	if (extts->index != 0)
+		return -EINVAL;
+
+	/* Flush timestamps from previous runs (also resets overflows), enable and start polling. */
+	litepcie_writel(dev, CSR_PPS_TIMESTAMPER_CONTROL_ADDR, PPS_TIMESTAMPER_CONTROL_FLUSH);
+	dev->pps_timestamper_overflows = 0;
+	if (on) {
+		litepcie_writel(dev, CSR_PPS_TIMESTAMPER_CONTROL_ADDR, PPS_TIMESTAMPER_CONTROL_ENABLE);
+		ptp_schedule_worker(dev->litepcie_ptp_clock, 0);
+	}
+
+	return 0;
+}
+
+static long litepcie_ptp_aux_work(struct ptp_clock_info *ptp)
+{
+	struct litepcie_device *dev = container_of(ptp, struct litepcie_device,
+							   ptp_caps);
+	struct ptp_clock_event event;
+	u32 overflows;
+	u64 timestamp;
+
+	if (!(litepcie_readl(dev, CSR_PPS_TIMESTAMPER_CONTROL_ADDR) & PPS_TIMESTAMPER_CONTROL_ENABLE))
+		return -1;
+
+	/* Drain Timestamp FIFO (timestamp register read before status, status read pops it). */
+	while (litepcie_readl(dev, CSR_PPS_TIMESTAMPER_LEVEL_ADDR)) {
+		timestamp = litepcie_read64(dev, CSR_PPS_TIMESTAMPER_TIMESTAMP_ADDR);
+		if (!(litepcie_readl(dev, CSR_PPS_TIMESTAMPER_STATUS_ADDR) & PPS_TIMESTAMPER_STATUS_READABLE))
+			break;
+		event.type      = PTP_CLOCK_EXTTS;
+		event.index     = 0;
+		event.timestamp = timestamp;
+		ptp_clock_event(dev->litepcie_ptp_clock, &event);
+	}
+
+	/* Warn on new overflows only. */
+	overflows = litepcie_readl(dev, CSR_PPS_TIMESTAMPER_OVERFLOWS_ADDR);
+	if (overflows != dev->pps_timestamper_overflows)
+		dev_warn_ratelimited(&dev->dev->dev, "PPS Timestamper: %u timestamps lost\n",
+			overflows - dev->pps_timestamper_overflows);
+	dev->pps_timestamper_overflows = overflows;
+
+	return PPS_TIMESTAMPER_POLL_INTERVAL;
 }
+#endif
 
-static int litepcie_ptp_enable(struct ptp_clock_info __always_unused *ptp,
-                 struct ptp_clock_request __always_unused *request,
-                 int __always_unused on)
+static int litepcie_ptp_enable(struct ptp_clock_info *ptp,
+                 struct ptp_clock_request *request, int on)
 {
-    return -EOPNOTSUPP;
+	struct litepcie_device __maybe_unused *dev = container_of(ptp, struct litepcie_device,
+							   ptp_caps);
+
+	switch (request->type) {
+#ifdef CSR_PPS_GENERATOR_CH0_CONTROL_ADDR
+	case PTP_CLK_REQ_PEROUT:
+		return litepcie_ptp_perout(dev, &request->perout, on);
+#endif
+#ifdef CSR_PPS_TIMESTAMPER_CONTROL_ADDR
+	case PTP_CLK_REQ_EXTTS:
+		return litepcie_ptp_extts(dev, &request->extts, on);
+#endif
+	default:
+		break;
+	}
+
+	return -EOPNOTSUPP;
 }
 
 static struct ptp_clock_info litepcie_ptp_info = {
@@ -1195,8 +1536,17 @@ static struct ptp_clock_info litepcie_ptp_info = {
 	.name           = LITEPCIE_NAME,
 	.max_adj        = 1000000000,
 	.n_alarm        = 0,
+#ifdef CSR_PPS_TIMESTAMPER_CONTROL_ADDR
+	.n_ext_ts       = 1,
+	.do_aux_work    = litepcie_ptp_aux_work,
+#else
 	.n_ext_ts       = 0,
+#endif
+#ifdef CSR_PPS_GENERATOR_CH0_CONTROL_ADDR
+	.n_per_out      = PPS_GENERATOR_CHANNELS,
+#else
 	.n_per_out      = 0,
+#endif
 	.n_pins         = 0,
 	.pps            = 0,
 	.gettimex64     = litepcie_ptp_gettimex64,
@@ -1440,6 +1790,14 @@ static int litepcie_pci_probe(struct pci_dev *dev, const struct pci_device_id *i
 	}
 #endif
 
+#ifdef PTM_REQUESTER_INTERRUPT
+	/* PTM exchange completion IRQ */
+	INIT_WORK(&litepcie_dev->ptm_work, litepcie_ptm_work);
+	init_waitqueue_head(&litepcie_dev->ptm_wait);
+	spin_lock_init(&litepcie_dev->ptm_lock);
+	litepcie_enable_interrupt(litepcie_dev, PTM_REQUESTER_INTERRUPT);
+#endif
+
 	/* PTP */
 	litepcie_dev->ptp_caps = litepcie_ptp_info;
 	litepcie_dev->litepcie_ptp_clock = ptp_clock_register(&litepcie_dev->ptp_caps, &dev->dev);
@@ -1449,6 +1807,9 @@ static int litepcie_pci_probe(struct pci_dev *dev, const struct pci_device_id *i
 
 	/* enable timer (time) counter */
 	litepcie_writel(litepcie_dev, CSR_TIME_GENERATOR_CONTROL_ADDR, TIME_CONTROL_ENABLE);
+#ifdef CSR_TIME_GENERATOR_INCREMENT_ADDR
+	litepcie_write_increment(litepcie_dev, TIME_GENERATOR_INCREMENT);
+#endif
 
 	/* enable PTM control and start first request */
 	litepcie_writel(litepcie_dev, CSR_PTM_REQUESTER_CONTROL_ADDR, PTM_CONTROL_ENABLE | PTM_CONTROL_TRIGGER);
@@ -1465,10 +1826,9 @@ static int litepcie_pci_probe(struct pci_dev *dev, const struct pci_device_id *i
 			break;
 	} while (--count);
 
-	litepcie_dev->t4_prev = litepcie_read64(litepcie_dev, CSR_PTM_REQUESTER_T4_TIME_ADDR);
-
-	litepcie_dev->t1_prev = (((u64)litepcie_readl(litepcie_dev, PTM_T1_TIME_L) << 32) |
-		litepcie_readl(litepcie_dev, PTM_T1_TIME_H));
+#ifndef PTM_REQUESTER_INTERRUPT
+	litepcie_ptm_read_t1_t4(litepcie_dev, &litepcie_dev->t1_prev, &litepcie_dev->t4_prev);
+#endif
 
 	spin_lock_init(&litepcie_dev->tmreg_lock);
 
@@ -1508,6 +1868,9 @@ static void litepcie_pci_remove(struct pci_dev *dev)
 		irq = pci_irq_vector(dev, i);
 		free_irq(irq, litepcie_dev);
 	}
+#ifdef PTM_REQUESTER_INTERRUPT
+	cancel_work_sync(&litepcie_dev->ptm_work);
+#endif
 
 	platform_device_unregister(litepcie_dev->uart);
 
@@ -16,6 +16,7 @@ extern "C" {
 #endif
 
 #include "litepcie_dma.h"
+#include "litepcie_events.h"
 #include "litepcie_flash.h"
 #include "litepcie_helpers.h"
 #include "litepcie.h"
@@ -0,0 +1,91 @@
+/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe library
+ *
+ * This file is part of LitePCIe-PTM.
+ *
+ * Copyright (C) 2023 / NetTimeLogic
+ * Copyright (C) 2023 / EnjoyDigital  / florent@enjoy-digital.fr
+ *
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <unistd.h>
+#include "litepcie_events.h"
+#include "litepcie_helpers.h"
+
+int litepcie_time_events_init(struct litepcie_time_events *events, const char *device_name, uint32_t time_period)
+{
+#ifdef CSR_TIME_EVENTS_CONTROL_ADDR
+    int fd;
+    int64_t hw_count, sw_count;
+
+    /* Map DMA Writer buffers (zero-copy). */
+    events->dma.use_reader = 0;
+    events->dma.use_writer = 1;
+    events->dma.loopback   = 0;
+    if (litepcie_dma_init(&events->dma, device_name, 1))
+        return -1;
+    fd = events->dma.fds.fd;
+
+    events->ring         = (const struct litepcie_time_event *)events->dma.buf_rd;
+    events->ring_records = DMA_BUFFER_TOTAL_SIZE / sizeof(struct litepcie_time_event);
+    events->position     = 0;
+    events->lost         = 0;
+
+    /* Stop Time Event Stream and clear the ring (records not written since start are detected
+     * from their cleared header), then start DMA Writer (restarting at first buffer) and Time Event
+     * Stream (sequence restarting at 0). */
+    litepcie_writel(fd, CSR_TIME_EVENTS_CONTROL_ADDR, 0);
+    memset(events->dma.buf_rd, 0, DMA_BUFFER_TOTAL_SIZE);
+    litepcie_dma_writer(fd, 1, &hw_count, &sw_count);
+    litepcie_writel(fd, CSR_TIME_EVENTS_TIME_PERIOD_ADDR, time_period);
+    litepcie_writel(fd, CSR_TIME_EVENTS_CONTROL_ADDR, 1 << CSR_TIME_EVENTS_CONTROL_ENABLE_OFFSET);
+
+    return 0;
+#else
+    fprintf(stderr, "No Time Event Stream in the gateware (build with --with-time-events).\n");
+    return -1;
+#endif
+}
+
+void litepcie_time_events_cleanup(struct litepcie_time_events *events)
+{
+#ifdef CSR_TIME_EVENTS_CONTROL_ADDR
+    /* Stop Time Event Stream (drained/padded) before the DMA Writer. */
+    litepcie_writel(events->dma.fds.fd, CSR_TIME_EVENTS_CONTROL_ADDR, 0);
+    usleep(1000);
+#endif
+    litepcie_dma_cleanup(&events->dma);
+}
+
+/* Return the next event record (pointer in the DMA ring, valid until the DMA laps the ring) or
+ * NULL when no new record is available. Overwritten records are skipped and counted in lost. */
+const struct litepcie_time_event *litepcie_time_events_next(struct litepcie_time_events *events)
+{
+    const struct litepcie_time_event *event;
+    uint64_t header;
+    uint32_t expected, ahead;
+
+    for (;;) {
+        event    = &events->ring[events->position % events->ring_records];
+        expected = events->position & TIME_EVENT_SEQUENCE_MASK;
+        /* Header written last: payload valid once the header is. */
+        header   = __atomic_load_n(&event->header, __ATOMIC_ACQUIRE);
+        ahead    = ((uint32_t)(header >> 32) - expected) & TIME_EVENT_SEQUENCE_MASK;
+
+        /* Not written yet (cleared buffer or previous ring lap). */
+        if (((header >> 56) & 0xf) == TIME_EVENT_TYPE_NONE || ahead >= (1 << (TIME_EVENT_SEQUENCE_BITS - 1)))
+            return NULL;
+        /* Overwritten (later ring lap): skip the lost records. */
+        if (ahead != 0) {
+            events->lost     += ahead;
+            events->position += ahead;
+            continue;
+        }
+        events->position++;
+        if (((header >> 56) & 0xf) != TIME_EVENT_TYPE_PAD)
+            return event;
+    }
+}
@@ -0,0 +1,57 @@
+/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe library
+ *
+ * This file is part of LitePCIe-PTM.
+ *
+ * Copyright (C) 2023 / NetTimeLogic
+ * Copyright (C) 2023 / EnjoyDigital  / florent@enjoy-digital.fr
+ *
+ */
+
+#ifndef LITEPCIE_LIB_EVENTS_H
+#define LITEPCIE_LIB_EVENTS_H
+
+#include <stdint.h>
+#include "litepcie_dma.h"
+
+/* Time Event records streamed by the TimeEventStream (gateware/events.py) to a DMA Writer ring
+ * buffer (see tools/time_events.py for the format), consumed in place from the mmapped DMA
+ * buffers (zero-copy): no syscall/copy per record. */
+
+#define TIME_EVENT_SEQUENCE_BITS 24
+#define TIME_EVENT_SEQUENCE_MASK ((1 << TIME_EVENT_SEQUENCE_BITS) - 1)
+
+#define TIME_EVENT_TYPE_NONE 0x0 /* Never written (cleared buffer). */
+#define TIME_EVENT_TYPE_PAD  0x1 /* Padding (skipped). */
+#define TIME_EVENT_TYPE_TIME 0x2 /* Time (word0, ns), sys_clk cycles (word1). */
+#define TIME_EVENT_TYPE_PTM  0x3 /* T1, T2, T4 (word0-2, ns), Link Delay (data, ns). */
+#define TIME_EVENT_TYPE_PPS  0x4 /* PPS/Event Timestamp (word0, ns). */
+
+#define TIME_EVENT_FLAG_LOST (1 << 0) /* Events lost before this record. */
+
+struct litepcie_time_event {
+    uint64_t word0;
+    uint64_t word1;
+    uint64_t word2;
+    uint64_t header; /* Written last by the DMA. */
+};
+
+#define TIME_EVENT_DATA(e)     ((uint32_t)((e)->header & 0xffffffff))
+#define TIME_EVENT_SEQUENCE(e) ((uint32_t)(((e)->header >> 32) & TIME_EVENT_SEQUENCE_MASK))
+#define TIME_EVENT_TYPE(e)     ((uint8_t)(((e)->header >> 56) & 0xf))
+#define TIME_EVENT_FLAGS(e)    ((uint8_t)(((e)->header >> 60) & 0xf))
+
+struct litepcie_time_events {
+    struct litepcie_dma_ctrl dma;
+    const struct litepcie_time_event *ring;
+    uint64_t ring_records;
+    uint64_t position; /* Records consumed since stream start (PAD included). */
+    uint64_t lost;     /* Records overwritten before being consumed (Overruns). */
+};
+
+int litepcie_time_events_init(struct litepcie_time_events *events, const char *device_name, uint32_t time_period);
+void litepcie_time_events_cleanup(struct litepcie_time_events *events);
+const struct litepcie_time_event *litepcie_time_events_next(struct litepcie_time_events *events);
+
+#endif /* LITEPCIE_LIB_EVENTS_H */
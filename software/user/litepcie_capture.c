@@ -0,0 +1,271 @@
+/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe Sniffer Capture
+ *
+ * This file is part of LitePCIe-PTM.
+ *
+ * Copyright (C) 2023 / NetTimeLogic
+ * Copyright (C) 2023 / EnjoyDigital  / florent@enjoy-digital.fr
+ *
+ */
+
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <inttypes.h>
+#include <unistd.h>
+#include <fcntl.h>
+#include <math.h>
+#include <signal.h>
+#include "liblitepcie.h"
+
+/* Variables */
+/*-----------*/
+
+sig_atomic_t keep_running = 1;
+
+void intHandler(int dummy) {
+    keep_running = 0;
+}
+
+/* Sniffer Capture */
+/*-----------------*/
+
+/* Records streamed by the SnifferCapture over DMA (see gateware/capture.py and tools/capture.py
+ * for the record format) are written to file as received, until CTRL+C or size is reached. The
+ * stream is padded (when idle for the flush timeout and when disabled) to the DMA buffers signalled
+ * to the host by an interrupt, so that triggered records reach the file without waiting for the
+ * next ones and the last records are drained on exit. */
+
+#ifdef CSR_SNIFFER_CAPTURE_CONTROL_ADDR
+
+#define SNIFFER_CAPTURE_CONTROL_ENABLE     (1 << CSR_SNIFFER_CAPTURE_CONTROL_ENABLE_OFFSET)
+#define SNIFFER_CAPTURE_CONTROL_CONTINUOUS (1 << CSR_SNIFFER_CAPTURE_CONTROL_CONTINUOUS_OFFSET)
+
+#define SNIFFER_CAPTURE_FLUSH_LENGTH (DMA_BUFFER_SIZE*DMA_BUFFER_PER_IRQ/8) /* In 64-bit words. */
+#define SNIFFER_CAPTURE_DRAIN_MS     200
+
+/* Write the DMA buffers available for Read to file (up to size when non-zero), return the number
+ * of buffers. */
+static int litepcie_capture_write(struct litepcie_dma_ctrl *dma, FILE *fo, uint64_t size, uint64_t *total_len)
+{
+    int n = 0;
+    size_t len;
+
+    while (1) {
+        /* Get Read buffer. */
+        char *buf_rd = litepcie_dma_next_read_buffer(dma);
+        /* Break when no buffer available for Read. */
+        if (!buf_rd)
+            break;
+        n++;
+        /* Copy Read data to File. */
+        len = DMA_BUFFER_SIZE;
+        if (size > 0)
+            len = fmin(size - *total_len, DMA_BUFFER_SIZE);
+        *total_len += fwrite(buf_rd, 1, len, fo);
+    }
+    return n;
+}
+
+static void litepcie_capture(const char *device_name, const char *filename, uint64_t size, uint8_t zero_copy,
+    uint32_t length, uint32_t pretrigger, uint8_t continuous)
+{
+    static struct litepcie_dma_ctrl dma = {.use_writer = 1};
+
+    FILE * fo;
+    int i = 0;
+    int fd;
+    uint64_t total_len = 0;
+    int64_t last_time;
+    int64_t writer_sw_count_last = 0;
+    uint32_t control;
+
+    /* Check Record length/pretrigger (clamped by the gateware to the FIFO/Delay Line capacities). */
+    if (length < 1 || length > SNIFFER_CAPTURE_MAX_LENGTH) {
+        fprintf(stderr, "Invalid record length %" PRIu32 " (1 to %d samples).\n", length, SNIFFER_CAPTURE_MAX_LENGTH);
+        exit(1);
+    }
+    if (pretrigger > SNIFFER_CAPTURE_MAX_PRETRIGGER) {
+        fprintf(stderr, "Invalid pretrigger %" PRIu32 " (0 to %d samples).\n", pretrigger, SNIFFER_CAPTURE_MAX_PRETRIGGER);
+        exit(1);
+    }
+
+    /* Open File to write to. */
+    fo = fopen(filename, "wb");
+    if (!fo) {
+        perror(filename);
+        exit(1);
+    }
+
+    /* Initialize DMA. */
+    if (litepcie_dma_init(&dma, device_name, zero_copy))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Configure/Enable Sniffer Capture (DMA Writer already running). */
+    control = SNIFFER_CAPTURE_CONTROL_ENABLE;
+    if (continuous)
+        control |= SNIFFER_CAPTURE_CONTROL_CONTINUOUS;
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_CONTROL_ADDR,    0);
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_LENGTH_ADDR,     length);
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_PRETRIGGER_ADDR, pretrigger);
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_FLUSH_LENGTH_ADDR, SNIFFER_CAPTURE_FLUSH_LENGTH);
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_CONTROL_ADDR,    control);
+
+    /* Capture Loop. */
+    last_time = get_time_ms();
+    for (;;) {
+        /* Exit loop on CTRL+C. */
+        if (!keep_running)
+            break;
+
+        /* Update DMA status. */
+        litepcie_dma_process(&dma);
+
+        /* Read from DMA. */
+        litepcie_capture_write(&dma, fo, size, &total_len);
+
+        /* Stop when specified size is reached */
+        if (size > 0 && total_len >= size)
+            keep_running = 0;
+
+        /* Statistics every 200ms. */
+        int64_t duration = get_time_ms() - last_time;
+        if (duration > 200) {
+            /* Print banner every 10 lines. */
+            if (i % 10 == 0)
+                printf("\e[1mSPEED(Gbps)    RECORDS    DROPPED  SIZE(MB)\e[0m\n");
+            i++;
+            /* Print statistics. */
+            printf("%10.2f %10" PRIu32 " %10" PRIu32 "  %8" PRIu64 "\n",
+                    (double)(dma.writer_sw_count - writer_sw_count_last) * DMA_BUFFER_SIZE * 8 / ((double)duration * 1e6),
+                    litepcie_readl(fd, CSR_SNIFFER_CAPTURE_RECORDS_ADDR),
+                    litepcie_readl(fd, CSR_SNIFFER_CAPTURE_DROPPED_ADDR),
+                    total_len / 1024 / 1024);
+            /* Update time/count. */
+            last_time = get_time_ms();
+            writer_sw_count_last = dma.writer_sw_count;
+        }
+    }
+
+    /* Disable Sniffer Capture (current record completed, stream padded) and drain the DMA until no
+     * buffer is received for SNIFFER_CAPTURE_DRAIN_MS. */
+    litepcie_writel(fd, CSR_SNIFFER_CAPTURE_CONTROL_ADDR, 0);
+    last_time = get_time_ms();
+    while ((get_time_ms() - last_time) < SNIFFER_CAPTURE_DRAIN_MS) {
+        litepcie_dma_process(&dma);
+        if (litepcie_capture_write(&dma, fo, size, &total_len))
+            last_time = get_time_ms();
+    }
+    printf("Captured %" PRIu32 " records (%" PRIu32 " dropped), %" PRIu64 " bytes written to %s.\n",
+        litepcie_readl(fd, CSR_SNIFFER_CAPTURE_RECORDS_ADDR),
+        litepcie_readl(fd, CSR_SNIFFER_CAPTURE_DROPPED_ADDR),
+        total_len,
+        filename);
+
+    /* Cleanup DMA. */
+    litepcie_dma_cleanup(&dma);
+
+    /* Close File. */
+    fclose(fo);
+}
+
+#else
+
+static void litepcie_capture(const char *device_name, const char *filename, uint64_t size, uint8_t zero_copy,
+    uint32_t length, uint32_t pretrigger, uint8_t continuous)
+{
+    fprintf(stderr, "No Sniffer Capture in the gateware (build with --with-sniffer-capture).\n");
+    exit(1);
+}
+
+#endif
+
+/* Help */
+/*------*/
+
+static void help(void)
+{
+    printf("LitePCIe Sniffer Capture utility\n"
+           "usage: litepcie_capture [options] filename [size]\n"
+           "\n"
+           "options:\n"
+           "-h                               Help.\n"
+           "-c device_num                    Select the device (default = 0).\n"
+           "-z                               Enable zero-copy DMA mode.\n"
+           "-l length                        Record length in samples (default = 1024).\n"
+           "-p pretrigger                    Samples recorded before the trigger (default = 0).\n"
+           "-C                               Continuous capture (back-to-back records, no trigger).\n"
+           "\n"
+           "Records are written to filename until CTRL+C or size (bytes) is reached.\n"
+           );
+    exit(1);
+}
+
+/* Main */
+/*------*/
+
+int main(int argc, char **argv)
+{
+    int c;
+    const char *filename;
+    uint64_t size = 0;
+    static char litepcie_device[1024];
+    static int litepcie_device_num;
+    static uint8_t litepcie_device_zero_copy;
+    static uint32_t length;
+    static uint32_t pretrigger;
+    static uint8_t continuous;
+
+    litepcie_device_num = 0;
+    litepcie_device_zero_copy = 0;
+    length     = 1024;
+    pretrigger = 0;
+    continuous = 0;
+
+    signal(SIGINT, intHandler);
+
+    /* Parameters. */
+    for (;;) {
+        c = getopt(argc, argv, "hc:zl:p:C");
+        if (c == -1)
+            break;
+        switch(c) {
+        case 'h':
+            help();
+            break;
+        case 'c':
+            litepcie_device_num = atoi(optarg);
+            break;
+        case 'z':
+            litepcie_device_zero_copy = 1;
+            break;
+        case 'l':
+            length = strtoul(optarg, NULL, 0);
+            break;
+        case 'p':
+            pretrigger = strtoul(optarg, NULL, 0);
+            break;
+        case 'C':
+            continuous = 1;
+            break;
+        default:
+            exit(1);
+        }
+    }
+
+    /* Show help when no filename. */
+    if (optind >= argc)
+        help();
+    filename = argv[optind++];
+    if (optind < argc)
+        size = strtoull(argv[optind++], NULL, 0);
+
+    /* Select device. */
+    snprintf(litepcie_device, sizeof(litepcie_device), "/dev/litepcie%d", litepcie_device_num);
+
+    litepcie_capture(litepcie_device, filename, size, litepcie_device_zero_copy, length, pretrigger, continuous);
+
+    return 0;
+}
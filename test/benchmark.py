@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import platform
+import datetime
+import multiprocessing
+from importlib import metadata
+
+import numpy as np
+
+from migen import *
+from migen.sim.core import Simulator
+
+# Simulation benchmarks of the test DUTs (Sniffer pipelines, TimeGenerator, PPSGenerator):
+#
+#   python3 -m test.benchmark --output=benchmark.json
+#   python3 -m test.benchmark --output=benchmark.json --baseline=previous.json
+#
+# Each case (benchmark, stimulus length, VCD on/off) runs in its own process so that its peak memory
+# is measured independently. Results (elaboration time, simulated cycles/s, peak memory) are written
+# as JSON and can be compared against a baseline to catch regressions (ex: on LitePCIe updates).
+
+BENCHMARK_FORMAT_VERSION = 1
+
+DUMPS_DIR = os.path.join(os.path.dirname(__file__), "dumps")
+
+# Stimulus -----------------------------------------------------------------------------------------
+
+def capture_columns(filename, names, cycles):
+    """Load capture columns (one sample per cycle), looped to cycles samples."""
+    from tools.dump import load_dump, samples_per_cycle
+    dump = load_dump(os.path.join(DUMPS_DIR, filename))
+    return [np.resize(np.asarray(dump[name][::samples_per_cycle(dump)]), cycles) for name in names]
+
+def replay_generator(signals, columns):
+    """Drive signals with capture columns, one sample per cycle."""
+    for samples in zip(*columns):
+        for signal, sample in zip(signals, samples):
+            yield signal.eq(int(sample))
+        yield
+
+@passive
+def ready_generator(*endpoints):
+    for endpoint in endpoints:
+        yield endpoint.ready.eq(1)
+    while True:
+        yield
+
+@passive
+def cycles_counter(counter):
+    while True:
+        counter[0] += 1
+        yield
+
+def idle_generator(cycles):
+    for i in range(cycles):
+        yield
+
+# Benchmarks ---------------------------------------------------------------------------------------
+
+def raw_sniffer_benchmark(cycles):
+    from test.test_raw_sniffer import RawSnifferDUT
+    dut = RawSnifferDUT()
+    rx  = capture_columns("dump003.bin", ["s7pciephy_debug_rx_data", "s7pciephy_debug_rx_ctl"], cycles)
+    tx  = capture_columns("dump003.bin", ["s7pciephy_debug_tx_data", "s7pciephy_debug_tx_ctl"], cycles)
+    generators = [
+        replay_generator([dut.rx_sink.data, dut.rx_sink.ctrl], rx),
+        replay_generator([dut.tx_sink.data, dut.tx_sink.ctrl], tx),
+        ready_generator(dut.rx_source, dut.tx_source),
+    ]
+    return dut, generators, {"sys": 10}
+
+def tlp_sniffer_benchmark(cycles):
+    from test.test_tlp_sniffer import DUT
+    dut     = DUT()
+    columns = capture_columns("dump_ptm_response001.bin", [
+        "ptmtlpaligner_sink_valid",
+        "ptmtlpaligner_sink_payload_data",
+        "ptmtlpaligner_sink_payload_ctrl",
+    ], cycles)
+    generators = [
+        replay_generator([dut.sink.valid, dut.sink.data, dut.sink.ctrl], columns),
+    ]
+    return dut, generators, {"sys": 10}
+
+def time_generator_benchmark(cycles):
+    from test.test_time_generator import DUT
+    dut = DUT(clk_freq=156.25e6)
+    return dut, [idle_generator(cycles)], {"sys": 10, "time": 10}
+
+def pps_generator_benchmark(cycles):
+    from test.test_pps_generator import DUT
+    dut = DUT(nchannels=2)
+    def config_generator():
+        for channel, (period, width, start) in zip(dut.pps_generator.channels, [(1000, 200, 504), (1600, 800, 1696)]):
+            yield from channel._period.write(period)
+            yield from channel._width.write(width)
+            yield from channel._start.write(start)
+            yield from channel._control.write(1)
+    return dut, [config_generator(), idle_generator(cycles)], {"sys": 10, "time": 10}
+
+benchmarks = {
+    "raw_sniffer"    : raw_sniffer_benchmark,
+    "tlp_sniffer"    : tlp_sniffer_benchmark,
+    "time_generator" : time_generator_benchmark,
+    "pps_generator"  : pps_generator_benchmark,
+}
+
+# Run ----------------------------------------------------------------------------------------------
+
+def run_benchmark(name, cycles, vcd=False):
+    """Elaborate and simulate a benchmark, return its result (dict)."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        vcd_name = os.path.join(output_dir, f"{name}.vcd") if vcd else None
+
+        # Elaboration (DUT creation, finalization and lowering to the simulator).
+        t0 = time.perf_counter()
+        dut, generators, clocks = benchmarks[name](cycles)
+        counter = [0]
+        generators.append(cycles_counter(counter))
+        simulator = Simulator(dut, {"sys": generators}, clocks, vcd_name)
+        t1 = time.perf_counter()
+
+        # Simulation.
+        with simulator:
+            simulator.run()
+        t2 = time.perf_counter()
+
+        vcd_bytes = os.path.getsize(vcd_name) if vcd else 0
+
+    return {
+        "name"          : name,
+        "cycles"        : counter[0],
+        "vcd"           : vcd,
+        "elaboration_s" : t1 - t0,
+        "simulation_s"  : t2 - t1,
+        "cycles_per_s"  : counter[0]/(t2 - t1),
+        "peak_rss_kib"  : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "vcd_bytes"     : vcd_bytes,
+    }
+
+def _run_case(case):
+    return run_benchmark(*case)
+
+def run_benchmarks(names, lengths, vcds=(False, True)):
+    """Run each case (name, length, vcd) in a fresh process (independent peak memory)."""
+    cases = [(name, length, vcd) for name in names for length in lengths for vcd in vcds]
+    ctx   = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+        for result in pool.imap(_run_case, cases):
+            yield result
+
+def environment():
+    packages = {}
+    for package in ["migen", "litex", "litepcie", "numpy"]:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            packages[package] = None
+    return {
+        "python"   : platform.python_version(),
+        "machine"  : platform.machine(),
+        "packages" : packages,
+    }
+
+# Compare ------------------------------------------------------------------------------------------
+
+def compare_results(results, baseline, tolerance=0.25):
+    """Return regressions of results vs baseline: slower simulation or elaboration beyond tolerance."""
+    def key(r):
+        return (r["name"], r["cycles"], r["vcd"])
+    reference   = {key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        ref = reference.get(key(result))
+        if ref is None:
+            continue
+        if result["cycles_per_s"] < ref["cycles_per_s"]*(1 - tolerance):
+            regressions.append((key(result), "cycles_per_s", ref["cycles_per_s"], result["cycles_per_s"]))
+        if result["elaboration_s"] > ref["elaboration_s"]*(1 + tolerance):
+            regressions.append((key(result), "elaboration_s", ref["elaboration_s"], result["elaboration_s"]))
+    return regressions
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation benchmarks of the LitePCIe-PTM test DUTs.")
+    parser.add_argument("--benchmarks", default=",".join(benchmarks), help="Benchmarks to run (comma separated).")
+    parser.add_argument("--lengths",    default="256,1024",           help="Stimulus lengths in cycles (comma separated).")
+    parser.add_argument("--vcd",        default="both", choices=["off", "on", "both"], help="VCD dump.")
+    parser.add_argument("--output",     default="benchmark.json",     help="JSON results file.")
+    parser.add_argument("--baseline",   default=None,                 help="JSON results file to compare against.")
+    parser.add_argument("--tolerance",  default=0.25, type=float,     help="Regression tolerance (relative).")
+    args = parser.parse_args()
+
+    names   = args.benchmarks.split(",")
+    lengths = [int(length) for length in args.lengths.split(",")]
+    vcds    = {"off": (False,), "on": (True,), "both": (False, True)}[args.vcd]
+    for name in names:
+        if name not in benchmarks:
+            parser.error(f"Unknown benchmark {name} (available: {', '.join(benchmarks)}).")
+
+    results = []
+    print(f"{'Benchmark':<16s} {'Cycles':>8s} {'VCD':>4s} {'Elab (s)':>9s} {'Sim (s)':>9s} {'Cycles/s':>10s} {'Peak RSS (MiB)':>15s}")
+    for result in run_benchmarks(names, lengths, vcds):
+        results.append(result)
+        print(f"{result['name']:<16s} {result['cycles']:>8d} {('on' if result['vcd'] else 'off'):>4s} "
+              f"{result['elaboration_s']:>9.3f} {result['simulation_s']:>9.3f} {result['cycles_per_s']:>10.0f} "
+              f"{result['peak_rss_kib']/1024:>15.1f}")
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "version"     : BENCHMARK_FORMAT_VERSION,
+            "date"        : datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "environment" : environment(),
+            "results"     : results,
+        }, f, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_results(results, baseline, tolerance=args.tolerance)
+        for (name, cycles, vcd), metric, ref, new in regressions:
+            print(f"Regression: {name} ({cycles} cycles, VCD {'on' if vcd else 'off'}) {metric}: {ref:.3f} -> {new:.3f}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import glob
+import multiprocessing
+
+from tools.dump import load_dump
+
+# Captures used by the tests (test/dumps), simulated in parallel worker processes:
+#
+# - Every capture providing the columns of a test is used by this test (new captures are picked up
+#   automatically).
+# - Workers: TEST_JOBS environment variable (defaults to the number of CPUs, 1: no worker process).
+# - Per-capture outputs: TEST_OUTPUT_DIR/<test>/<capture>/ (TEST_OUTPUT_DIR defaults to build/test).
+
+DUMPS_DIR = os.path.join(os.path.dirname(__file__), "dumps")
+
+# Captures -----------------------------------------------------------------------------------------
+
+def list_captures(columns):
+    """Return the captures (sorted filenames) of test/dumps providing all the given columns."""
+    captures = []
+    for filename in sorted(glob.glob(os.path.join(DUMPS_DIR, "*.bin"))):
+        with load_dump(filename) as dump:
+            if all(column in dump for column in columns):
+                captures.append(filename)
+    return captures
+
+def capture_name(capture):
+    return os.path.splitext(os.path.basename(capture))[0]
+
+def capture_output_dir(test, capture):
+    """Return (and create) the output directory of a test on a capture."""
+    output_dir = os.path.join(os.environ.get("TEST_OUTPUT_DIR", os.path.join("build", "test")),
+        test, capture_name(capture))
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+# Parallel Run -------------------------------------------------------------------------------------
+
+def capture_jobs():
+    return int(os.environ.get("TEST_JOBS", os.cpu_count() or 1))
+
+def run_captures(function, captures, jobs=None):
+    """Return [function(capture) for capture in captures], each capture run in a worker process."""
+    jobs = min(capture_jobs() if jobs is None else jobs, len(captures))
+    if jobs <= 1:
+        return [function(capture) for capture in captures]
+    with multiprocessing.Pool(processes=jobs) as pool:
+        return pool.map(function, captures, chunksize=1)
@@ -1,9 +0,0 @@
-dump = {
-"analyzer_state" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"s7pciephy_debug_rx_data" : [28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 23762, 23762, 18139, 18139, 2540, 2540, 3835, 3835, 23805, 23805, 47811, 47811, 11334, 11334, 42607, 42607, 23805, 23805, 49655, 49655, 41826, 41826, 8764, 8764, 1789, 1789, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914, 63112, 63112, 14469, 14469, 17881, 17881, 62225, 62225, 54746, 54746, 13458, 13458, 10477, 10477, 22073, 22073, 31532, 31532, 34, 34, 55333, 55333, 47202, 47202, 10539, 10539, 30677, 30677, 24044, 24044, 20832, 20832, 58577, 58577, 61728, 61728, 3999, 3999, 63209, 63209, 63725, 63725, 38841, 38841, 18568, 18568, 8021, 8021, 40368, 40368, 816, 816, 41852, 41852, 20543, 20543, 28090, 28090, 28091, 28091, 21946, 21946, 20731, 20731, 32108, 32108, 55036, 55036, 53243, 53243, 15492, 15492, 31032, 31032, 43589, 43589, 47355, 47355, 33196, 33196, 52622, 52622, 22155, 22155, 52102, 52102, 10258, 10258, 38609, 38609, 2512, 2512, 28729, 28729, 55996, 55996, 37525, 37525, 48506, 48506, 23785, 23785, 51293, 51293, 25489, 25489, 64198, 64198, 3556, 3556, 62697, 62697, 31389, 31389, 47539, 47539, 26835, 26835, 4098, 4098, 25474, 25474, 31446, 31446, 23031, 23031, 11673, 11673, 50079, 50079, 10697, 10697, 24354, 24354, 19405, 19405, 21590, 21590, 20795, 20795, 52358, 52358, 61370, 61370, 29643, 29643, 63760, 63760, 26219, 26219, 42995, 42995, 42061, 42061, 53154, 53154, 25809, 25809, 27936, 27936, 36159, 36159, 57378, 57378, 11557, 11557, 6970, 6970, 12599, 12599, 48523, 48523, 62478, 62478, 35439, 35439, 49111, 49111, 63022, 63022, 41016, 41016, 9021, 9021, 42096, 42096, 36762, 36762, 45804, 45804, 27144, 27144, 6841, 6841, 39056, 39056, 61135, 61135, 55948, 55948, 62113, 62113, 21578, 21578, 33061, 33061, 44314, 44314, 46848, 46848, 28456, 28456, 63302, 63302, 57696, 57696, 19537, 19537, 58236, 58236, 7743, 7743, 44266, 44266, 26334, 26334, 48990, 48990, 38586, 38586, 16819, 16819, 34707, 34707, 31524, 31524, 63531, 63531, 63341, 63341, 63821, 63821, 56890, 56890, 42735, 42735, 13675, 13675, 14651, 14651, 44102, 44102, 30312, 30312, 64624, 64624, 56282, 56282, 48066, 48066, 58072, 58072, 47032, 47032, 22409, 22409, 64188, 64188, 46485, 46485, 24018, 24018, 22875, 22875, 15663, 15663, 32945, 32945, 25769, 25769, 42323, 42323, 11910, 11910, 39114, 39114, 65177, 65177, 49495, 49495, 41826, 41826, 61475, 61475, 1700, 1700, 28207, 28207, 7801, 7801, 27810, 27810, 7321, 7321, 46631, 46631, 11824, 11824, 51300, 51300, 50093, 50093, 14847, 14847, 48272, 48272, 52527, 52527, 26161, 26161, 47013, 47013, 49046, 49046, 40545, 40545, 49336, 49336, 60065, 60065, 19978, 19978, 18779, 18779, 11951, 11951, 61669, 61669, 26224, 26224, 57322, 57322, 57110, 57110, 22525, 22525, 10946, 10946, 11360, 11360, 53833, 53833, 54198, 54198, 21094, 21094, 47007, 47007, 22441, 22441, 48283, 48283, 7196, 7196, 65308, 65308, 49175, 49175, 45588, 45588, 743, 743, 29314, 29314, 10350, 10350, 48806, 48806, 49005, 49005, 48781, 48781, 42816, 42816, 11494, 11494, 58067, 58067, 1970, 1970, 30466, 30466, 52522, 52522, 48692, 48692, 42976, 42976, 9309, 9309, 39857, 39857, 48545, 48545, 54306, 54306, 7493, 7493, 55251, 55251, 30442, 30442, 11502, 11502, 6874, 6874, 10490, 10490, 13869, 13869, 14907, 14907, 28430, 28430, 53095, 53095, 19462, 19462, 54054, 54054, 15081, 15081, 10189, 10189, 12406, 12406, 38140, 38140, 907, 907, 54238, 54238, 20998, 20998, 20470, 20470, 32904, 32904, 50325, 50325, 26218, 26218, 40946, 40946, 41228, 41228, 57909, 57909, 53057, 53057, 29735, 29735, 32320, 32320, 42398, 42398, 65112, 65112, 2436, 2436, 2144, 2144, 61865, 61865, 28427, 28427, 5986, 5986, 23619, 23619, 18669, 18669, 16185, 16185, 23252, 23252, 3829, 3829, 51123, 51123, 40195, 40195, 35739, 35739, 36365, 36365, 13148, 13148, 30616, 30616, 11694, 11694, 2988, 2988, 55870, 55870, 16907, 16907, 31866, 31866, 53201, 53201, 7336, 7336, 60946, 60946, 49729, 49729, 14399, 14399, 3450, 3450, 62569, 62569, 55809, 55809, 29233, 29233, 41157, 41157, 37847, 37847, 56334, 56334, 42159, 42159, 59221, 59221, 29424, 29424, 26646, 26646, 14549, 14549, 56708, 56708, 52480, 52480, 40472, 40472, 12490, 12490, 19545, 19545, 7029, 7029, 12663, 12663, 60869, 60869, 37327, 37327, 28260, 28260, 65085, 65085, 10728, 10728, 52996, 52996, 64620, 64620, 3012, 3012, 55902, 55902, 47714, 47714, 43867, 43867, 23007, 23007, 32183, 32183, 24119, 24119, 6883, 6883, 35014, 35014, 62740, 62740, 35663, 35663, 22216, 22216, 54219, 54219, 16912, 16912, 1123, 1123, 46218, 46218, 34039, 34039, 40961, 40961, 33537, 33537, 26441, 26441, 16110, 16110, 35626, 35626, 30372, 30372, 5295, 5295, 20437, 20437, 24748, 24748, 31158, 31158, 25302, 25302, 17335, 17335, 58855, 58855, 16426, 16426, 28204, 28204, 22138, 22138, 25441, 25441, 27168, 27168, 19095, 19095, 1336, 1336, 56805, 56805, 3432, 3432, 19576, 19576, 35667, 35667, 34518, 34518, 45655, 45655, 6826, 6826, 6272, 6272, 47836, 47836, 1020, 1020, 19363, 19363, 50224, 50224, 46804, 46804, 63189, 63189, 32980, 32980, 17605, 17605, 25143, 25143, 9027, 9027, 64517, 64517, 13221, 13221, 10102, 10102, 16596, 16596, 38597, 38597, 8647, 8647, 16109, 16109, 49961, 49961, 31079, 31079, 25110, 25110, 45925, 45925, 19364, 19364, 27703, 27703, 44051, 44051, 13872, 13872, 53796, 53796, 3027, 3027, 47690, 47690, 64373, 64373, 50295, 50295, 20125, 20125, 35283, 35283, 42042, 42042, 22495, 22495, 62183, 62183, 37890, 37890, 64354, 64354, 42083, 42083, 3978, 3978, 59135, 59135, 45944, 45944, 41915, 41915, 2282, 2282, 55614, 55614, 33091, 33091, 50549, 50549, 32679, 32679, 5204, 5204, 28473, 28473, 1876, 1876, 49137, 49137, 52751, 52751, 3422, 3422, 48202, 48202, 32229, 32229, 46696, 46696, 11888, 11888, 38954, 38954, 42604, 42604, 56820, 56820, 64890, 64890, 4841, 4841, 2317, 2317, 26868, 26868, 4130, 4130, 52133, 52133, 51254, 51254, 11250, 11250, 3436, 3436, 44156, 44156, 40535, 40535, 12426, 12426, 7191, 7191, 32436, 32436, 54652, 54652, 44079, 44079, 19977, 19977, 344, 344, 8556, 8556, 34396, 34396, 39616, 39616, 62690, 62690, 51863, 51863, 39224, 39224, 24389, 24389, 7075, 7075, 39344, 39344, 2000, 2000, 65385, 65385, 4233, 4233, 29460, 29460, 37343, 37343, 42615, 42615, 42477, 42477, 34337, 34337, 35510, 35510, 18206, 18206, 10676, 10676, 20308, 20308, 63537, 63537, 46965, 46965, 34647, 34647, 27634, 27634, 17260, 17260, 27948, 27948, 38194, 38194, 55918, 55918, 55894, 55894, 17003, 17003, 33811, 33811, 6384, 6384, 35494, 35494, 36621, 36621, 29284, 29284, 57501, 57501, 48515, 48515, 3079, 3079, 42279, 42279, 65272, 65272, 319, 319, 28930, 28930, 19386, 19386, 52267, 52267, 50957, 50957, 13732, 13732, 39399, 39399, 14218, 14218, 56255, 56255, 39854, 39854, 9660, 9660, 47741, 47741, 13126, 13126, 14208, 14208, 21428, 21428, 48740, 48740, 16317, 16317, 6732, 6732, 53363, 53363, 47609, 47609, 45206, 45206, 20489, 20489, 40328, 40328, 39693, 39693, 25860, 25860, 52444, 52444, 65516, 65516, 26640, 26640, 43219, 43219, 49666, 49666, 8306, 8306, 26488, 26488, 26331, 26331, 26459, 26459, 34559, 34559, 55928, 55928, 33347, 33347, 1597, 1597, 50856, 50856, 42018, 42018, 26565, 26565, 34431, 34431, 31460, 31460, 18881, 18881, 52779, 52779, 17789, 17789, 7086, 7086, 47548, 47548, 14557, 14557, 9613, 9613, 57928, 57928, 57143, 57143, 51163, 51163, 40291, 40291, 29682, 29682, 22828, 22828, 42322, 42322, 5767, 5767, 40331, 40331, 54030, 54030, 27335, 27335, 47717, 47717, 860, 860, 17176, 17176, 48466, 48466, 3271, 3271, 22005, 22005, 20667, 20667, 11554, 11554, 45885, 45885, 11248, 11248, 32110, 32110, 42750, 42750, 50553, 50553, 26538, 26538, 11800, 11800, 38986, 38986, 24069, 24069, 2773, 2773, 27508, 27508, 29686, 29686, 47400, 47400, 45142, 45142, 41179, 41179, 13259, 13259, 46864, 46864, 42811, 42811, 44182, 44182, 20137, 20137, 2531, 2531, 22542, 22542, 15439, 15439, 14816, 14816, 9357, 9357, 41840, 41840, 18482, 18482, 22518, 22518, 39624, 39624, 3307, 3307, 58847, 58847, 55319, 55319, 43092, 43092, 51865, 51865, 61751, 61751, 28555, 28555, 47102, 47102, 38849, 38849, 33019, 33019, 48364, 48364, 58712, 58712, 53388, 53388, 30993, 30993, 49770, 49770, 8210, 8210, 40721, 40721, 45562, 45562, 61781, 61781, 59360, 59360, 27229, 27229, 23265, 23265, 46788, 46788, 16070, 16070, 56068, 56068, 60172, 60172, 10117, 10117, 38961, 38961, 56949, 56949, 42671, 42671, 25893, 25893, 23802, 23802, 18509, 18509, 14210, 14210, 9142, 9142, 46310, 46310, 25747, 25747, 19820, 19820, 57980, 57980, 24327, 24327, 15343, 15343, 63219, 63219, 47349, 47349, 59811, 59811, 64832, 64832, 64214, 64214, 50679, 50679, 44857, 44857, 54612, 54612, 64513, 64513, 54177, 54177, 12914, 12914],
-"s7pciephy_debug_rx_ctl" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 3, 3, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"s7pciephy_debug_tx_data" : [44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 46940, 46940, 41823, 41823, 45659, 45659, 64886, 64886, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 62300, 62300, 35333, 35333, 10684, 10684, 64989, 64989, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344],
-"s7pciephy_debug_tx_ctl" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"scope_clk" : [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0],
-"scope_trig" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-}
\ No newline at end of file
@@ -1,10 +0,0 @@
-dump = {
-"analyzer_state" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"ptm_core_done" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"s7pciephy_debug_rx_data" : [5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35676, 35676, 64879, 64879, 63173, 63173, 64804, 64804, 27740, 27740, 23447, 23447, 3537, 3537, 64838, 64838, 27228, 27228, 4546, 4546, 9810, 9810, 64812, 64812, 22267, 22267, 38023, 38023, 24039, 24039, 57707, 57707, 50258, 50258, 50917, 50917, 1086, 1086, 5840, 5840, 30481, 30481, 12661, 12661, 30104, 30104, 32318, 32318, 26425, 26425, 64834, 64834, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 36956, 36956, 59560, 59560, 58221, 58221, 64969, 64969, 61788, 61788, 31820, 31820, 8419, 8419, 64972, 64972, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 13404, 13404, 32597, 32597, 44769, 44769, 64826, 64826, 51292, 51292, 44062, 44062, 63779, 63779, 64952, 64952, 16988, 16988, 38900, 38900, 10186, 10186, 64843, 64843, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574],
-"s7pciephy_debug_rx_ctl" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 2, 2, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"s7pciephy_debug_tx_data" : [52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 13051, 13051, 37140, 37140, 38583, 38583, 24767, 24767, 47262, 47262, 41362, 41362, 2794, 2794, 23374, 23374, 44873, 44873, 34094, 34094, 19856, 19856, 64953, 64953, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11868, 11868, 11232, 11232, 50499, 50499, 65020, 65020, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 27163, 27163, 6748, 6748, 52366, 52366, 25808, 25808, 64962, 64962, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 43868, 43868, 3521, 3521, 63400, 63400, 64889, 64889, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 60764, 60764, 34472, 34472, 46182, 46182, 64939, 64939, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470, 25646, 25646, 44488, 44488, 65475, 65475, 36921, 36921, 12220, 12220, 12749, 12749, 42342, 42342, 38583, 38583, 25023, 25023, 47262, 47262, 41408, 41408, 2794, 2794, 23374, 23374, 44873, 44873, 58670, 58670, 28912, 28912, 60006, 60006, 5855, 5855, 64991, 64991, 49751, 49751, 24618, 24618, 18732, 18732, 46802, 46802, 26323, 26323, 40786, 40786, 43447, 43447, 39767, 39767, 30034, 30034, 55047, 55047, 44591, 44591, 52345, 52345, 12114, 12114, 311, 311, 35083, 35083, 25842, 25842, 36100, 36100, 12316, 12316, 58526, 58526, 61792, 61792, 24529, 24529, 37672, 37672, 7398, 7398, 54867, 54867, 38734, 38734, 28777, 28777, 17121, 17121, 44164, 44164, 63160, 63160, 22705, 22705, 44265, 44265, 11997, 11997, 45213, 45213, 57347, 57347, 48387, 48387, 44187, 44187, 28325, 28325, 14062, 14062, 33514, 33514, 52878, 52878, 38339, 38339, 29321, 29321, 39012, 39012, 40493, 40493, 35067, 35067, 46380, 46380, 23922, 23922, 20960, 20960, 17485, 17485, 15010, 15010, 51081, 51081, 30012, 30012, 18273, 18273, 18880, 18880, 63018, 63018, 16444, 16444, 13881, 13881, 4652, 4652, 8666, 8666, 55026, 55026, 42996, 42996, 3146, 3146, 54629, 54629, 42036, 42036, 16336, 16336, 49705, 49705, 14431, 14431, 62739, 62739, 9032, 9032, 19471, 19471, 4910, 4910, 4320, 4320, 19317, 19317, 27895, 27895, 23745, 23745, 39027, 39027, 65081, 65081, 51692, 51692, 55808, 55808, 18992, 18992, 42372, 42372, 48704, 48704, 30622, 30622, 48552, 48552, 5162, 5162, 14156, 14156, 47979, 47979, 10859, 10859, 58579, 58579, 33058, 33058, 1309, 1309, 44487, 44487, 45005, 45005, 42422, 42422, 44662, 44662, 37932, 37932, 15178, 15178, 9805, 9805, 53714, 53714, 51323, 51323, 23472, 23472, 22432, 22432, 37523, 37523, 11644, 11644, 17263, 17263, 9519, 9519, 39665, 39665, 44247, 44247, 9958, 9958, 26979, 26979, 37266, 37266, 54837, 54837, 65313, 65313, 47310, 47310, 14749, 14749, 13563, 13563, 4236, 4236, 43793, 43793, 33178, 33178, 15804, 15804, 41021, 41021, 64312, 64312, 46133, 46133, 5201, 5201, 46908, 46908, 5905, 5905, 9274, 9274, 52191, 52191, 28743, 28743, 33481, 33481, 11946, 11946, 10464, 10464, 30261, 30261, 17441, 17441, 56006, 56006, 10980, 10980, 5185, 5185, 32559, 32559, 19649, 19649, 35827, 35827, 36461, 36461, 52021, 52021, 41145, 41145, 48032, 48032, 27315, 27315, 7356, 7356, 7196, 7196, 6143, 6143, 5312, 5312, 59314, 59314, 33282, 33282, 28274, 28274, 42536, 42536, 28094, 28094, 36287, 36287, 16574, 16574, 59047, 59047, 54060, 54060, 45794, 45794, 519, 519, 10871, 10871, 13517, 13517, 57534, 57534, 23975, 23975, 45348, 45348, 41371, 41371, 8893, 8893, 17876, 17876, 54045, 54045, 60119, 60119, 61046, 61046, 55852, 55852, 64026, 64026, 11560, 11560, 15158, 15158, 3642, 3642, 26479, 26479, 1743, 1743, 9804, 9804, 59859, 59859, 52538, 52538, 30247, 30247, 64560, 64560, 35732, 35732, 56835, 56835, 1747, 1747, 63058, 63058, 34895, 34895, 38272, 38272, 27332, 27332, 62054, 62054, 3231, 3231, 13729, 13729, 16866, 16866, 10191, 10191, 16500, 16500, 40574, 40574, 22693, 22693, 34046, 34046, 24585, 24585, 43272, 43272, 3057, 3057, 25199, 25199, 17175, 17175, 60764, 60764, 14664, 14664, 54335, 54335, 62810, 62810, 45838, 45838, 967, 967, 39837, 39837, 3467, 3467, 23694, 23694, 38963, 38963, 44663, 44663, 44077, 44077, 15883, 15883, 3034, 3034, 31298, 31298, 53628, 53628, 43215, 43215, 4636, 4636, 16878, 16878, 16322, 16322, 31288, 31288, 26893, 26893, 500, 500, 12762, 12762, 50546, 50546, 55200, 55200, 3731, 3731, 45020, 45020, 21924, 21924, 61671, 61671, 5746, 5746, 54632, 54632, 33848, 33848, 221, 221, 6349, 6349, 51870, 51870, 22832, 22832, 30028, 30028, 30491, 30491, 50481, 50481, 53229, 53229, 25745, 25745, 15726, 15726, 59646, 59646, 1065, 1065, 27855, 27855, 50428, 50428, 24075, 24075, 25306, 25306, 23482, 23482, 57259, 57259, 46937, 46937, 14205, 14205, 58206, 58206, 50714, 50714, 5256, 5256, 20469, 20469, 51339, 51339, 52054, 52054, 4307, 4307, 25410, 25410, 35332, 35332, 63412, 63412, 388, 388, 416, 416, 18819, 18819, 61031, 61031, 10814, 10814, 42123, 42123, 44918, 44918, 54548, 54548, 44111, 44111, 46688, 46688, 54905, 54905, 46946, 46946, 59203, 59203, 10981, 10981, 11328, 11328, 31342, 31342, 24918, 24918, 8291, 8291, 38762, 38762, 14410, 14410, 58629, 58629, 26845, 26845, 30733, 30733, 21324, 21324, 54923, 54923, 22406, 22406, 43698, 43698, 32794, 32794, 56344, 56344, 64698, 64698, 41731, 41731, 12363, 12363, 54468, 54468, 54710, 54710, 54518, 54518, 50560, 50560, 14148, 14148, 17250, 17250, 1315, 1315, 42492, 42492, 30259, 30259, 54311, 54311, 50496, 50496, 51094, 51094, 60705, 60705, 10558, 10558, 26563, 26563, 5753, 5753, 25954, 25954, 42163, 42163, 14155, 14155, 4972, 4972, 12460, 12460, 9270, 9270, 54226, 54226, 18955, 18955, 30138, 30138, 30715, 30715, 40388, 40388, 54094, 54094, 14985, 14985, 57252, 57252, 59223, 59223, 754, 754, 25236, 25236, 25595, 25595, 35492, 35492, 65295, 65295, 30950, 30950, 48051, 48051, 60067, 60067, 15880, 15880, 17369, 17369, 30081, 30081, 42949, 42949, 21631, 21631, 14612, 14612, 21615, 21615, 61703, 61703, 4031, 4031, 24270, 24270, 18957, 18957, 58812, 58812, 26749, 26749, 28854, 28854, 10798, 10798, 27800, 27800, 62630, 62630, 31453, 31453, 59901, 59901, 3346, 3346, 62473, 62473, 8808, 8808, 42256, 42256, 14027, 14027, 62152, 62152, 27691, 27691, 31757, 31757, 22444, 22444, 35486, 35486, 5936, 5936, 46108, 46108, 31870, 31870, 12245, 12245, 2476, 2476, 22606, 22606, 27649, 27649, 23585, 23585, 49286, 49286, 58010, 58010, 38900, 38900, 14538, 14538, 17817, 17817, 41823, 41823, 45083, 45083, 53401, 53401, 26887, 26887, 35327, 35327, 5136, 5136, 57203, 57203, 30609, 30609, 60838, 60838, 8613, 8613, 46726, 46726, 7818, 7818, 46151, 46151, 21545, 21545, 12623, 12623, 30200, 30200, 22455, 22455, 62087, 62087, 27755, 27755, 11331, 11331, 12909, 12909, 28309, 28309, 22234, 22234, 27610, 27610, 4930, 4930, 61572, 61572, 42520, 42520, 3466, 3466, 25743, 25743, 40306, 40306, 33760, 33760, 1981, 1981, 9996, 9996, 63653, 63653, 16382, 16382, 513, 513, 47729, 47729, 11083, 11083, 3532, 3532, 42183, 42183, 59189, 59189, 35481, 35481, 48951, 48951, 44763, 44763, 48283, 48283, 32037, 32037, 18106, 18106, 32819, 32819, 46135, 46135, 25683, 25683, 48574, 48574, 19519, 19519, 29466, 29466, 63952, 63952, 38585, 38585, 2480, 2480, 34896, 34896, 3485, 3485, 1179, 1179, 56421, 56421, 60620, 60620, 4351, 4351, 54120, 54120, 680, 680, 29378, 29378, 30752, 30752, 56167, 56167, 23398, 23398, 65383, 65383, 30854, 30854, 17370, 17370, 15746, 15746, 43014, 43014, 8902, 8902, 50596, 50596, 32615, 32615, 58502, 58502, 49530, 49530, 11081, 11081, 32206, 32206, 44613, 44613, 48155, 48155, 56761, 56761, 36152, 36152, 18469, 18469, 14306, 14306, 56287, 56287, 25543, 25543, 62109, 62109, 11379, 11379, 21081, 21081, 34725, 34725, 35606, 35606, 3741, 3741, 51155, 51155, 25962, 25962, 23738, 23738, 6147, 6147, 21059, 21059, 51133, 51133, 62732, 62732, 47957, 47957, 8784, 8784, 15661, 15661, 61619, 61619, 28203, 28203, 65149, 65149, 31142, 31142, 43717, 43717, 6247, 6247, 18990, 18990, 1432, 1432, 54622, 54622, 29706, 29706, 63083, 63083, 10355, 10355, 22201, 22201, 56240, 56240, 52128, 52128, 4147, 4147, 15287, 15287, 38567, 38567, 43436, 43436, 58190, 58190, 3593, 3593, 20312, 20312, 57404, 57404, 36153, 36153, 28708, 28708, 12963, 12963, 63048, 63048, 51287, 51287, 60314, 60314, 57100, 57100, 6117, 6117, 21720, 21720, 39336, 39336, 14282, 14282, 35825, 35825, 65135, 65135, 49591, 49591, 64407, 64407, 60544, 60544, 22716, 22716, 36069, 36069, 4560, 4560, 27257, 27257, 4802, 4802, 4384, 4384, 64159, 64159, 21937, 21937, 57585, 57585, 24039, 24039, 57706, 57706, 50266, 50266, 50870, 50870, 1086, 1086, 3291, 3291, 34283, 34283, 12583, 12583, 30104, 30104, 45022, 45022, 9638, 9638, 64101, 64101, 19804, 19804, 33352, 33352, 46647, 46647, 58915, 58915, 37812, 37812, 27748, 27748, 31821, 31821, 2018, 2018, 61279, 61279, 62267, 62267, 62966, 62966, 41912, 41912, 16617, 16617, 55037, 55037, 63482, 63482, 14789, 14789, 21679, 21679, 469, 469, 41468, 41468, 29395, 29395, 34866, 34866, 34294, 34294, 55608, 55608, 4421, 4421, 56051, 56051, 37589, 37589, 60724, 60724, 14632, 14632, 11350, 11350, 8827, 8827, 9472, 9472, 25304, 25304, 11192, 11192, 54569, 54569, 60535, 60535, 24669, 24669, 53585, 53585, 8420, 8420, 40945, 40945, 59663, 59663, 60918, 60918, 47608, 47608, 34967, 34967, 21832, 21832, 45087, 45087, 12445, 12445, 31747, 31747, 16291, 16291, 47696, 47696, 47981, 47981, 47725, 47725, 64341, 64341, 27728, 27728, 64637, 64637, 64470, 64470, 33999, 33999, 14396, 14396, 17785, 17785, 64426, 64426, 44216, 44216, 36481, 36481, 35789, 35789, 34390, 34390, 4811, 4811, 53544, 53544, 53398, 53398, 14601, 14601, 48240, 48240, 38362, 38362, 31378, 31378, 59837, 59837, 23900, 23900, 37320, 37320, 50787, 50787, 58618, 58618, 59661, 59661, 40436, 40436, 45946, 45946, 54201, 54201, 616, 616, 33296, 33296, 54883, 54883, 63354, 63354, 39257, 39257, 40749, 40749, 51651, 51651, 8745, 8745, 52575, 52575, 22091, 22091, 15188, 15188, 34385, 34385, 47820, 47820, 52207, 52207, 4211, 4211, 27641, 27641, 62310, 62310, 19879, 19879, 41636, 41636, 53711, 53711, 8292, 8292, 16237, 16237, 8845, 8845, 9696, 9696, 14893, 14893, 14107, 14107, 35633, 35633, 3773, 3773, 28660, 28660, 55178, 55178, 11967, 11967, 14582, 14582, 15776, 15776, 28707, 28707, 39588, 39588, 60559, 60559, 2226, 2226, 47466, 47466, 36890, 36890, 53144, 53144, 36078, 36078, 41434, 41434, 19186, 19186, 9556, 9556, 6785, 6785, 173, 173, 10423, 10423, 18031, 18031, 24823, 24823, 20961, 20961, 31820, 31820, 16355, 16355, 59934, 59934, 57004, 57004, 24166, 24166, 47807, 47807, 45974, 45974, 37697, 37697, 9351, 9351, 11131, 11131, 28152, 28152, 19959, 19959, 15097, 15097, 61406, 61406, 27558, 27558, 15157, 15157, 17977, 17977, 26796, 26796, 28790, 28790, 56060, 56060, 49883, 49883, 55483, 55483, 47330, 47330, 35255, 35255, 48215, 48215, 38394, 38394, 53941, 53941, 23389, 23389, 12121, 12121, 45373, 45373, 43392, 43392, 21348, 21348, 34469, 34469, 51758, 51758, 39320, 39320, 22526, 22526, 25281, 25281, 9123, 9123, 42224, 42224, 12038, 12038, 31086, 31086, 41502, 41502, 39276, 39276, 10012, 10012, 12470, 12470],
-"s7pciephy_debug_tx_ctl" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-"scope_clk" : [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0],
-"scope_trig" : [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-}
\ No newline at end of file
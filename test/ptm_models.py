@@ -0,0 +1,71 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+
+from litepcie.common import ptm_layout
+from litepcie.frontend.ptm.core import PTM_RESPONSE_MESSAGE_CODE, PTM_RESPONSED_MESSAGE_CODE
+
+# PCIe Models used by the PTM tests: PTM Requests are sent to the Endpoint model (Packetizer PTM
+# sink) and answered by the Root Complex generator on the PTM Sniffer model source. The DUT must
+# expose endpoint, sniffer and time (Local Time, in ns).
+
+# PCIe Models --------------------------------------------------------------------------------------
+
+class PCIeEndpointModel(LiteXModule):
+    def __init__(self):
+        self.packetizer = LiteXModule()
+        self.packetizer.ptm_sink = stream.Endpoint(ptm_layout(64))
+        self.phy = LiteXModule()
+        self.phy.id = Signal(16, reset=0x0100)
+
+class PCIePTMSnifferModel(LiteXModule):
+    def __init__(self):
+        self.source = stream.Endpoint([("message_code", 8), ("master_time", 64), ("link_delay", 32)])
+
+# Root Complex -------------------------------------------------------------------------------------
+
+def _draw(prng, value):
+    """Return value, or a random value in [min, max) when value is a (min, max) range."""
+    return prng.randrange(*value) if isinstance(value, tuple) else value
+
+@passive
+def root_complex_generator(dut, responses=None, offset=int(1e9), jitter=0, latency=64, link_delay=0xe1,
+    invalid=[], drop=[], seed=0):
+    """Answer PTM Requests with PTM ResponseDs (master_time = local time + offset +/- jitter), with PTM
+    Responses without timing information for invalid ones, except dropped ones.
+
+    latency (in cycles) and link_delay are either fixed or drawn from a (min, max) range. The master
+    time of the ResponseDs is appended to responses.
+    """
+    prng   = random.Random(seed)
+    req_ep = dut.endpoint.packetizer.ptm_sink
+    res_ep = dut.sniffer.source
+    n = 0
+    yield req_ep.ready.eq(1)
+    while True:
+        yield
+        if (yield req_ep.valid):
+            master_time = (yield dut.time) + offset + _draw(prng, (-jitter, jitter) if jitter else 0)
+            for i in range(_draw(prng, latency)):
+                yield
+            if n not in drop:
+                yield res_ep.valid.eq(1)
+                yield res_ep.message_code.eq(PTM_RESPONSE_MESSAGE_CODE if n in invalid else PTM_RESPONSED_MESSAGE_CODE)
+                yield res_ep.master_time.eq(0 if n in invalid else master_time)
+                yield res_ep.link_delay.eq(_draw(prng, link_delay))
+                yield
+                yield res_ep.valid.eq(0)
+                if responses is not None and n not in invalid:
+                    responses.append(master_time)
+            n += 1
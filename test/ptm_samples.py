@@ -0,0 +1,34 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import numpy as np
+
+# Synthetic PTM Samples ----------------------------------------------------------------------------
+
+def ptm_samples(n=2048, period=10_000_000, offset=1000, freq=50, delay=500, jitter=20, outliers=0.05, seed=0):
+    """PTM samples (t1, t2, t4, link_delay) of a local Time with an offset (ns)/frequency error (ppb)
+    vs the Master Time, with link delay jitter (ns) and delayed (by 1-5us, in one direction) PTM
+    TLPs. As for PTM ResponseDs, t2/link_delay of sample n are the ones of PTM dialog n - 1.
+
+    Returns the samples, the true offsets of the dialogs and the outlier dialogs.
+    """
+    prng      = np.random.default_rng(seed)
+    t1        = 1_700_000_000_000_000_000 + period*np.arange(n, dtype=np.int64)
+    theta     = offset + freq*1e-9*(t1 - t1[0])
+    d_up      = delay/2 + jitter*prng.standard_normal(n)
+    d_down    = delay/2 + jitter*prng.standard_normal(n)
+    outlier   = prng.random(n) < outliers
+    excess    = prng.uniform(1000, 5000, n)*outlier
+    up        = prng.random(n) < 0.5
+    d_up     += np.where(up,  excess, 0)
+    d_down   += np.where(~up, excess, 0)
+    t2        = t1 - np.round(theta - d_up).astype(np.int64)
+    link_delay = prng.integers(900, 1100, n)
+    t4        = t2 + link_delay + np.round(d_down + theta).astype(np.int64)
+    t2_sample = np.concatenate([[0], t2[:-1]])
+    ld_sample = np.concatenate([[0], link_delay[:-1]])
+    return (t1, t2_sample, t4, ld_sample), theta, outlier
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from tools.allan import phase_series, load_ptm_log_phase, load_ptm_samples_phase, load_pps_phase
+from tools.allan import adev, mdev, tdev, deviations, tau_factors, input_format
+from tools.ptm_log import PTMLogWriter
+from tools.ptm_servo import save_samples
+
+from test.ptm_samples import ptm_samples
+
+# Reference Implementations ------------------------------------------------------------------------
+
+def adev_reference(x, tau0, m):
+    n = len(x) - 2*m
+    s = sum((x[i + 2*m] - 2*x[i + m] + x[i])**2 for i in range(n))
+    return np.sqrt(s/(2*n*(m*tau0)**2))
+
+def mdev_reference(x, tau0, m):
+    n = len(x) - 3*m + 1
+    s = 0.0
+    for j in range(n):
+        s += sum(x[i + 2*m] - 2*x[i + m] + x[i] for i in range(j, j + m))**2
+    return np.sqrt(s/(2*m**2*(m*tau0)**2*n))
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestAllan(unittest.TestCase):
+    def test_deviations_reference(self):
+        x = np.random.default_rng(0).normal(0, 1e-9, 300) + 1e-6 # Phase (s), with an offset.
+        for m in [1, 2, 3, 7, 33]:
+            self.assertAlmostEqual(adev(x, 0.1, m)[0], adev_reference(x, 0.1, m), delta=1e-6*adev_reference(x, 0.1, m))
+            self.assertAlmostEqual(mdev(x, 0.1, m)[0], mdev_reference(x, 0.1, m), delta=1e-6*mdev_reference(x, 0.1, m))
+            self.assertAlmostEqual(tdev(x, 0.1, m)[0], m*0.1*mdev_reference(x, 0.1, m)/np.sqrt(3), delta=1e-18)
+        # Blocks.
+        self.assertAlmostEqual(mdev(x, 0.1, 5, block=7)[0], mdev(x, 0.1, 5)[0], delta=1e-18)
+        self.assertAlmostEqual(adev(x, 0.1, 5, block=7)[0], adev(x, 0.1, 5)[0], delta=1e-18)
+
+        # Deviations insensitive to phase offset/frequency error (removed before cumulative sum).
+        devs = deviations(x + 50e-9*0.1*np.arange(len(x)), 0.1, taus="all", max_factor=40)
+        for m, a, d in zip(devs.m, devs.adev, devs.mdev):
+            self.assertAlmostEqual(a, adev_reference(x, 0.1, m), delta=1e-6*a)
+            self.assertAlmostEqual(d, mdev_reference(x, 0.1, m), delta=1e-6*d)
+        self.assertEqual(list(devs.adev_n[:2]), [298, 296])
+        self.assertEqual(list(devs.mdev_n[:2]), [298, 295])
+
+    def test_deviations_noise_slopes(self):
+        # White phase noise: ADEV ~ tau^-1, MDEV ~ tau^-3/2, TDEV ~ tau^-1/2.
+        x    = np.random.default_rng(1).normal(0, 1e-9, 2**20)
+        devs = deviations(x, 1.0, max_factor=1024)
+        k    = (devs.m >= 8)
+        for dev, slope in [(devs.adev, -1), (devs.mdev, -1.5), (devs.tdev, -0.5)]:
+            fit = np.polyfit(np.log(devs.tau[k]), np.log(dev[k]), 1)[0]
+            self.assertAlmostEqual(fit, slope, delta=0.1)
+        self.assertAlmostEqual(devs.tdev[0], 1e-9, delta=0.05e-9) # TDEV(tau0) = sigma.
+
+        # White frequency noise: ADEV ~ tau^-1/2.
+        x    = np.cumsum(np.random.default_rng(2).normal(0, 1e-9, 2**20))
+        devs = deviations(x, 1.0, max_factor=1024)
+        fit  = np.polyfit(np.log(devs.tau), np.log(devs.adev), 1)[0]
+        self.assertAlmostEqual(fit, -0.5, delta=0.1)
+
+    def test_tau_factors(self):
+        self.assertEqual(list(tau_factors(100)), [1, 2, 4, 8, 16, 32])
+        self.assertEqual(list(tau_factors(1000, taus="decade")), [1, 2, 5, 10, 20, 50, 100, 200])
+        self.assertEqual(list(tau_factors(1000, taus="all", max_factor=4)), [1, 2, 3, 4])
+
+    def test_phase_series(self):
+        t = 10_000_000*np.arange(100)
+        x = np.arange(100, dtype=np.float64)
+        phase = phase_series(t, x)
+        self.assertEqual(phase.tau0, 0.01)
+        self.assertEqual(phase.gaps, 0)
+        # Missing samples are interpolated.
+        keep  = np.ones(100, dtype=bool)
+        keep[[10, 11, 50]] = False
+        phase = phase_series(t[keep] + 1000, x[keep])
+        self.assertEqual(phase.gaps, 3)
+        np.testing.assert_allclose(phase.x, x)
+
+    def test_inputs(self):
+        samples, theta, _ = ptm_samples(n=256, jitter=0, outliers=0)
+        with tempfile.TemporaryDirectory() as d:
+            # PTM log (as recorded by test_ptm.py), interleaved with the samples of another board.
+            prefix = os.path.join(d, "ptm")
+            with PTMLogWriter(prefix) as log:
+                for t1, t2, t4, link_delay in zip(*samples):
+                    log.write(t1, t1, t2, t4, link_delay)
+                    log.write(t1, 0, 0, 0, 0, board=1)
+            self.assertEqual(input_format(prefix), "ptmlog")
+            phase = load_ptm_log_phase(prefix)
+            self.assertEqual(len(phase.x), 255)
+            self.assertAlmostEqual(phase.tau0, 0.01)
+            np.testing.assert_allclose(phase.x, theta[:-1], atol=1)
+
+            # PTM samples CSV.
+            filename = os.path.join(d, "samples.csv")
+            save_samples(filename, *samples)
+            self.assertEqual(input_format(filename), "samples")
+            np.testing.assert_array_equal(load_ptm_samples_phase(filename).x, phase.x)
+
+            # PPS timestamps (testptp -e output), 12ns wander around the second.
+            filename = os.path.join(d, "pps.txt")
+            with open(filename, "w") as f:
+                f.write("external time stamp request okay\n")
+                for n in range(1, 17):
+                    f.write(f"event index 0 at {1700000000 + n}.{(n*12) % 1000000000:09d}\n" if n % 2 else
+                            f"event index 0 at {1700000000 + n - 1}.{1000000000 - 12*n:09d}\n")
+            self.assertEqual(input_format(filename), "pps")
+            phase = load_pps_phase(filename)
+            self.assertEqual(phase.tau0, 1.0)
+            np.testing.assert_array_equal(phase.x, [12*n if n % 2 else -12*n for n in range(1, 17)])
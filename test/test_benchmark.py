@@ -0,0 +1,28 @@
+import unittest
+
+from test.benchmark import run_benchmark, compare_results
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_benchmark(self):
+        for vcd in [False, True]:
+            result = run_benchmark("pps_generator", cycles=64, vcd=vcd)
+            self.assertGreaterEqual(result["cycles"], 64)
+            self.assertGreater(result["cycles_per_s"], 0)
+            self.assertGreater(result["peak_rss_kib"], 0)
+            self.assertEqual(result["vcd_bytes"] > 0, vcd)
+
+    def test_compare_results(self):
+        baseline = [
+            {"name": "raw_sniffer", "cycles": 256, "vcd": False, "cycles_per_s": 100.0, "elaboration_s": 1.0},
+            {"name": "raw_sniffer", "cycles": 256, "vcd": True,  "cycles_per_s": 100.0, "elaboration_s": 1.0},
+        ]
+        results = [
+            {"name": "raw_sniffer", "cycles": 256, "vcd": False, "cycles_per_s":  90.0, "elaboration_s": 1.1},
+            {"name": "raw_sniffer", "cycles": 256, "vcd": True,  "cycles_per_s":  50.0, "elaboration_s": 2.0},
+            {"name": "tlp_sniffer", "cycles": 256, "vcd": False, "cycles_per_s":   1.0, "elaboration_s": 9.0},
+        ]
+        regressions = compare_results(results, baseline, tolerance=0.25)
+        self.assertEqual([(key, metric) for key, metric, ref, new in regressions], [
+            (("raw_sniffer", 256, True), "cycles_per_s"),
+            (("raw_sniffer", 256, True), "elaboration_s"),
+        ])
@@ -0,0 +1,120 @@
+import os
+import time
+import tempfile
+import unittest
+
+from tools.build_cache import BuildTimings, BuildCache, build_hash, normalize
+
+# Generated Build ----------------------------------------------------------------------------------
+
+BUILD_NAME = "ocp_tap_timecard"
+
+def write_file(filename, contents):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(contents)
+
+def generate_build(gateware_dir, build_time="2023-06-01 12:00:00", tcl_commands=[], hierarchy=["a", "b"]):
+    """Write a generated build (as builder.build(run=False)) to gateware_dir."""
+    write_file(os.path.join(gateware_dir, BUILD_NAME + ".v"), "\n".join([
+        "// Filename   : ocp_tap_timecard.v",
+        f"// Date       : {build_time}",
+        *[f"// └─── {name}" for name in hierarchy],
+        "module ocp_tap_timecard();",
+        "endmodule",
+        f"//  Auto-Generated by LiteX on {build_time}.",
+    ]))
+    write_file(os.path.join(gateware_dir, BUILD_NAME + "_mem.init"),
+        "\n".join(f"{c:02x}" for c in f"LiteX SoC {build_time}".encode()) + "\n00\n")
+    write_file(os.path.join(gateware_dir, BUILD_NAME + ".xdc"), "create_clock -period 8.0 [get_nets sys_clk]\n")
+    write_file(os.path.join(gateware_dir, BUILD_NAME + ".tcl"), "\n".join([
+        f"read_verilog {{{os.path.abspath(gateware_dir)}/{BUILD_NAME}.v}}",
+        *tcl_commands,
+    ]))
+    write_file(os.path.join(gateware_dir, "build_" + BUILD_NAME + ".sh"), f"vivado -mode batch -source {BUILD_NAME}.tcl\n")
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestBuildCache(unittest.TestCase):
+    def test_normalize(self):
+        data = b"// Date : 2023-06-01 12:00:00\n// x\nassign a = b; // c\n6c\n31\n32\n"
+        self.assertEqual(normalize(data, verilog=True), b"assign a = b; // c\n6c\n31\n32\n")
+        self.assertEqual(normalize(b"4c\n31\n32\n00\n", build_time="12"), b"4c\n<build-time>\n00\n")
+        self.assertEqual(normalize(b"read_verilog {/tmp/build/top.v}", gateware_dir="/tmp/build"),
+            b"read_verilog {<gateware-dir>/top.v}")
+
+    def test_build_hash(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            def hash(name, params={}, build_time="2023-06-01 12:00:00", sources=[], **kwargs):
+                gateware_dir = os.path.join(tmp, name)
+                generate_build(gateware_dir, build_time=build_time, **kwargs)
+                return build_hash(gateware_dir, BUILD_NAME, sources=sources, params=params, build_time=build_time)
+            sniffer_commands = ["connect_net -hier -net gt_rx_data_wire_filter[0] -objects sniffer_tap/rx_data_in[0]"]
+            reference = hash("reference", tcl_commands=sniffer_commands)
+
+            # Same build regenerated later/elsewhere (dates, build directory, hierarchy order).
+            self.assertEqual(reference, hash("regenerated",
+                build_time   = "2023-06-02 08:30:00",
+                tcl_commands = sniffer_commands,
+                hierarchy    = ["b", "a"],
+            ))
+
+            # Different constraints/post-synthesis commands, parameters or sources.
+            self.assertNotEqual(reference, hash("commands"))
+            self.assertNotEqual(reference, hash("params", params={"sys_clk_freq": 100e6}, tcl_commands=sniffer_commands))
+            source = os.path.join(tmp, "sniffer_tap.v")
+            write_file(source, "module sniffer_tap(); endmodule\n")
+            with_source = hash("source", tcl_commands=sniffer_commands, sources=[source])
+            self.assertNotEqual(reference, with_source)
+            write_file(source, "module sniffer_tap(input rx); endmodule\n")
+            self.assertNotEqual(with_source, hash("source", tcl_commands=sniffer_commands, sources=[source]))
+
+    def test_build_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache  = BuildCache(os.path.join(tmp, "cache"))
+            output = os.path.join(tmp, "build")
+            artifacts = {
+                "gateware/top.bit" : os.path.join(output, "gateware", "top.bit"),
+                "gateware/top.bin" : os.path.join(output, "gateware", "top.bin"), # Not generated.
+                "csr.csv"          : os.path.join(output, "csr.csv"),
+                "generated"        : os.path.join(output, "software", "include", "generated"),
+            }
+            write_file(artifacts["gateware/top.bit"], "bitstream 0")
+            write_file(artifacts["csr.csv"], "csr 0")
+            write_file(os.path.join(artifacts["generated"], "soc.h"), "soc 0")
+            self.assertNotIn("0"*64, cache)
+            cache.store("0"*64, artifacts, metadata={"params": {"soc": {"with_analyzer": False}}})
+            self.assertIn("0"*64, cache)
+            self.assertEqual(cache.metadata("0"*64)["artifacts"], ["csr.csv", "gateware/top.bit", "generated"])
+            self.assertFalse(os.path.exists(cache.path("0"*64 + ".tmp")))
+
+            # Restore overwrites the regenerated outputs.
+            write_file(artifacts["gateware/top.bit"], "bitstream 1")
+            write_file(artifacts["csr.csv"], "csr 1")
+            write_file(os.path.join(artifacts["generated"], "soc.h"), "soc 1")
+            self.assertEqual(cache.restore("0"*64, artifacts), ["gateware/top.bit", "csr.csv", "generated"])
+            for filename, contents in [
+                (artifacts["gateware/top.bit"], "bitstream 0"),
+                (artifacts["csr.csv"], "csr 0"),
+                (os.path.join(artifacts["generated"], "soc.h"), "soc 0")]:
+                with open(filename) as f:
+                    self.assertEqual(f.read(), contents)
+
+            # Clean keeps the most recently used builds.
+            cache.store("1"*64, artifacts)
+            time.sleep(0.01)
+            cache.restore("0"*64, {})
+            self.assertEqual(cache.keys(), ["0"*64, "1"*64])
+            self.assertEqual(cache.clean(keep=1), ["1"*64])
+            self.assertEqual(cache.keys(), ["0"*64])
+
+    def test_build_timings(self):
+        timings = BuildTimings()
+        with timings.stage("SoC elaboration"):
+            pass
+        with self.assertRaises(ValueError):
+            with timings.stage("Toolchain"):
+                raise ValueError
+        self.assertEqual([name for name, _ in timings.stages], ["SoC elaboration", "Toolchain"])
+        self.assertIn("- Toolchain       :", timings.report())
+        self.assertIn("- Total           :", timings.report())
@@ -0,0 +1,134 @@
+import os
+import json
+import random
+import tempfile
+import unittest
+
+from tools.dump import load_dump, write_dump, convert_capture, samples_per_cycle
+
+# LiteScope Exports --------------------------------------------------------------------------------
+
+def litescope_columns(columns, trigger):
+    """Return the columns of a LiteScope export of columns (2 samples per cycle, scope_clk/trig)."""
+    samples = 2*len(next(iter(columns.values())))
+    columns = {name: [v for v in values for _ in range(2)] for name, values in columns.items()}
+    columns["scope_clk"]  = [1, 0]*(samples//2)
+    columns["scope_trig"] = [0]*trigger + [1]*(samples - trigger)
+    return columns
+
+def write_litescope_csv(filename, columns, widths):
+    with open(filename, "w") as f:
+        f.write("".join(f"{name}," for name in columns) + "\n")
+        f.write("".join(f"{widths[name]}," for name in columns) + "\n")
+        for values in zip(*columns.values()):
+            f.write("".join(f"{v:0{widths[name]}b}, " for name, v in zip(columns, values)) + "\n")
+
+def write_litescope_vcd(filename, columns, widths, timescale="4000ps"):
+    codes = {name: chr(33 + n) for n, name in enumerate(columns)}
+    with open(filename, "w") as f:
+        f.write(f"$date\n\t2023-01-01 00:00\n$end\n$timescale {timescale} $end\n$scope dumped_signals $end\n")
+        for name in columns:
+            f.write(f"$var wire {widths[name]} {codes[name]} {name} $end\n")
+        f.write("$unscope  $end\n$enddefinitions  $end\n$dumpvars\n")
+        for name in columns:
+            f.write(f"b{'x'*widths[name]} {codes[name]}\n")
+        f.write("$end\n")
+        previous = {}
+        for t, values in enumerate(zip(*columns.values())):
+            changes = [f"b{v:0{widths[name]}b} {codes[name]}\n" for name, v in zip(columns, values) if previous.get(name) != v]
+            previous = dict(zip(columns, values))
+            if changes:
+                f.write(f"#{t}\n" + "".join(changes))
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestDump(unittest.TestCase):
+    def test_dump_roundtrip(self):
+        prng = random.Random(42)
+        dump = {
+            "valid" : [prng.randrange(2**1)   for _ in range(1000)],
+            "ctrl"  : [prng.randrange(2**4)   for _ in range(1000)],
+            "data"  : [prng.randrange(2**32)  for _ in range(1000)],
+            "time"  : [prng.randrange(2**64)  for _ in range(1000)],
+            "wide"  : [prng.randrange(2**100) for _ in range(1000)],
+        }
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "dump.bin")
+            write_dump(filename, dump, metadata={"samplerate": 125e6})
+            with load_dump(filename) as r:
+                self.assertEqual(r.samples, 1000)
+                self.assertEqual(list(r.keys()), list(dump.keys()))
+                self.assertEqual(r.metadata, {"samplerate": 125e6})
+                for name in dump.keys():
+                    self.assertEqual(list(r[name]), dump[name])
+                    self.assertEqual(list(r[name][10:500:2]), dump[name][10:500:2])
+
+    def test_dumps(self):
+        dumps_dir = os.path.join(os.path.dirname(__file__), "dumps")
+        for filename in sorted(os.listdir(dumps_dir)):
+            if not filename.endswith(".bin"):
+                continue
+            with load_dump(os.path.join(dumps_dir, filename)) as dump:
+                for name in dump.keys():
+                    self.assertEqual(len(dump[name]), dump.samples)
+                self.assertEqual(samples_per_cycle(dump), 1)
+
+    def test_capture_conversion(self):
+        prng    = random.Random(0)
+        widths  = {"valid": 1, "data": 32, "wide": 100, "scope_clk": 1, "scope_trig": 1}
+        cycles  = {name: [prng.randrange(2**widths[name]) for _ in range(500)] for name in ["valid", "data", "wide"]}
+        columns = litescope_columns(cycles, trigger=200)
+        with tempfile.TemporaryDirectory() as d:
+            # Analyzer configuration (exported by LiteScopeAnalyzer).
+            analyzer_csv = os.path.join(d, "analyzer.csv")
+            with open(analyzer_csv, "w") as f:
+                f.write("config,None,data_width,133\nconfig,None,depth,512\nconfig,None,samplerate,125000000.0\n")
+                f.write("signal,0,valid,1\nsignal,0,data,32\nsignal,0,wide,100\n")
+
+            # LiteScope exports.
+            captures = {ext: os.path.join(d, f"capture.{ext}") for ext in ["csv", "vcd", "py", "json"]}
+            write_litescope_csv(captures["csv"], columns, widths)
+            write_litescope_vcd(captures["vcd"], columns, widths)
+            with open(captures["py"], "w") as f:
+                f.write("dump = {\n" + "".join(f"\"{name}\" : {values},\n" for name, values in columns.items()) + "}")
+            with open(captures["json"], "w") as f:
+                json.dump(columns, f)
+
+            for ext, capture in captures.items():
+                with self.subTest(format=ext):
+                    # Streaming conversion: decimated to 1 sample per cycle, LiteScope columns dropped.
+                    filename = convert_capture(capture, chunk_size=7, analyzer_csv=analyzer_csv)
+                    with load_dump(filename) as dump:
+                        self.assertEqual(list(dump.keys()), ["valid", "data", "wide"])
+                        self.assertEqual(dump.samples, 500)
+                        for name in cycles:
+                            self.assertEqual(dump.width(name), widths[name])
+                            self.assertEqual(list(dump[name]), cycles[name])
+                        self.assertEqual(dump.metadata["samples_per_cycle"], 1)
+                        self.assertEqual(dump.metadata["samplerate"],   125e6)
+                        self.assertEqual(dump.metadata["depth"],        512)
+                        self.assertEqual(dump.metadata["clock_domain"], "sys")
+                        self.assertEqual(dump.metadata["trigger"],      100)
+
+                    # Column selection, samples kept as-is.
+                    filename = convert_capture(capture, os.path.join(d, "all.bin"), columns=["*a*", "scope_clk"], decimate=1)
+                    with load_dump(filename) as dump:
+                        self.assertEqual(list(dump.keys()), ["valid", "data", "scope_clk"])
+                        self.assertEqual(list(dump["data"]), columns["data"])
+                        self.assertEqual(samples_per_cycle(dump), 2)
+                        self.assertEqual(dump.metadata["depth"], 500)
+
+            # Samplerate deduced from the VCD timescale, re-conversion of a dump.
+            filename = convert_capture(captures["vcd"], clock_domain="pcie")
+            with load_dump(filename) as dump:
+                self.assertEqual(dump.metadata["samplerate"], 125e6)
+            filename = convert_capture(os.path.join(d, "all.bin"), columns=["data"])
+            with load_dump(filename) as dump:
+                self.assertEqual(list(dump["data"]), cycles["data"])
+                self.assertEqual(dump.metadata["decimation"], 2)
+
+            # Non-redundant samples are not dropped.
+            columns["data"][301] ^= 1
+            write_litescope_csv(captures["csv"], columns, widths)
+            with self.assertRaises(ValueError):
+                convert_capture(captures["csv"], chunk_size=64)
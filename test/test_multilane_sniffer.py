@@ -0,0 +1,202 @@
+import os
+import unittest
+
+import numpy as np
+
+from migen import *
+
+from litex.gen import *
+
+from tools.dump import load_dump
+from tools.sniffer import COM, SKP, STP, SDP, END, EDB, RawDecoder, TLPExtractor, words_to_symbols, symbols_to_words
+from tools.ptm_extract import decode_ptm_tlp
+
+from gateware.sniffer import MultiLaneRawDatapath, MultiLanePCIePTMSniffer
+
+dump = load_dump(os.path.join(os.path.dirname(__file__), "dumps", "dump_ptm_response001.bin"))
+
+# Lane-Striped Stimulus ----------------------------------------------------------------------------
+
+def capture_symbols(start=56, stop=136):
+    """Descrambled symbols of the TLPAligner input capture (PTM ResponseD TLP), Ordered-Sets removed."""
+    valid = np.asarray(dump["ptmtlpaligner_sink_valid"])
+    data  = np.asarray(dump["ptmtlpaligner_sink_payload_data"])[valid == 1][start:stop]
+    ctrl  = np.asarray(dump["ptmtlpaligner_sink_payload_ctrl"])[valid == 1][start:stop]
+    symbols, k = words_to_symbols(data, ctrl)
+    com  = ((symbols == COM) & k).reshape(-1, 4).any(axis=1)
+    keep = np.repeat(~com, 4)
+    return symbols[keep], k[keep]
+
+def packet_open(symbols, k):
+    """For each symbol, return if a packet (TLP/DLLP) is still open after it."""
+    opened = np.zeros(len(symbols), dtype=bool)
+    state  = False
+    for n, (symbol, is_k) in enumerate(zip(symbols, k)):
+        if is_k and symbol in [STP, SDP]:
+            state = True
+        elif is_k and symbol in [END, EDB]:
+            state = False
+        opened[n] = state
+    return opened
+
+def lane_striped_stimulus(symbols, k, nlanes, skews, interval=8):
+    """Stripe symbols over nlanes lanes with SKP Ordered-Sets every interval words (on all lanes,
+    between packets), scramble each lane and skew them (in symbols).
+
+    Returns the 16-bit (data, ctrl) words of each lane and the expected reassembled (descrambled)
+    32-bit words.
+    """
+    # Pad to whole Ordered-Set intervals (Logical Idle).
+    block   = 4*nlanes*interval
+    padding = -len(symbols) % block
+    symbols = np.concatenate([symbols, np.zeros(padding, dtype=np.uint8)])
+    k       = np.concatenate([k,       np.zeros(padding, dtype=bool)])
+
+    # Insert Ordered-Sets and stripe symbols.
+    os_symbols  = np.array([COM, SKP, SKP, SKP], dtype=np.uint8)
+    os_k        = np.ones(4, dtype=bool)
+    opened      = packet_open(symbols, k)
+    lanes       = [([], []) for _ in range(nlanes)]
+    expected    = ([], [])
+    for n in range(0, len(symbols), block):
+        if n == 0 or not opened[n - 1]:
+            expected[0].append(np.repeat(os_symbols, nlanes))
+            expected[1].append(np.repeat(os_k, nlanes))
+            for lane_symbols, lane_k in lanes:
+                lane_symbols.append(os_symbols)
+                lane_k.append(os_k)
+        expected[0].append(symbols[n:n+block])
+        expected[1].append(k[n:n+block])
+        for lane, (lane_symbols, lane_k) in enumerate(lanes):
+            lane_symbols.append(symbols[n+lane:n+block:nlanes])
+            lane_k.append(k[n+lane:n+block:nlanes])
+
+    # Scramble (Descrambler is its own inverse), skew and pad lanes to the same length.
+    lanes    = [(np.concatenate(lane_symbols), np.concatenate(lane_k)) for lane_symbols, lane_k in lanes]
+    length   = 2*((max(skews) + len(lanes[0][0]) + 64 + 1)//2)
+    stimulus = []
+    for (lane_symbols, lane_k), skew in zip(lanes, skews):
+        lane_symbols, lane_k = RawDecoder().descrambler(lane_symbols, lane_k)
+        lane_symbols = np.concatenate([np.zeros(skew, dtype=np.uint8), lane_symbols])
+        lane_k       = np.concatenate([np.zeros(skew, dtype=bool),     lane_k])
+        lane_symbols = np.concatenate([lane_symbols, np.zeros(length - len(lane_symbols), dtype=np.uint8)])
+        lane_k       = np.concatenate([lane_k,       np.zeros(length - len(lane_k),       dtype=bool)])
+        stimulus.append(symbols_to_words(lane_symbols, lane_k, dw=16))
+    expected = symbols_to_words(np.concatenate(expected[0]), np.concatenate(expected[1]))
+    return stimulus, list(zip(expected[0].tolist(), expected[1].tolist()))
+
+def lanes_generator(sinks, stimulus):
+    for words in zip(*[zip(data, ctrl) for data, ctrl in stimulus]):
+        for sink, (data, ctrl) in zip(sinks, words):
+            yield sink.valid.eq(1)
+            yield sink.data.eq(int(data))
+            yield sink.ctrl.eq(int(ctrl))
+        yield
+
+# DUTs ---------------------------------------------------------------------------------------------
+
+class RawDUT(LiteXModule):
+    def __init__(self, nlanes):
+        self.cd_sys     = ClockDomain()
+        self.cd_sniffer = ClockDomain()
+
+        # # #
+
+        self.datapath = MultiLaneRawDatapath(clock_domain="sniffer", nlanes=nlanes)
+
+class SnifferDUT(LiteXModule):
+    def __init__(self, nlanes):
+        self.cd_sys  = ClockDomain()
+        self.rx_clk  = Signal()
+        self.rx_data = Signal(16*nlanes)
+        self.rx_ctrl = Signal(2*nlanes)
+
+        # # #
+
+        self.sniffer = MultiLanePCIePTMSniffer(
+            rx_rst_n = 1,
+            rx_clk   = self.rx_clk,
+            rx_data  = self.rx_data,
+            rx_ctrl  = self.rx_ctrl,
+            nlanes   = nlanes,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestMultiLaneSniffer(unittest.TestCase):
+    def run_raw_datapath(self, nlanes, skews, sniffer_clk_period=None):
+        symbols, k         = capture_symbols()
+        stimulus, expected = lane_striped_stimulus(symbols, k, nlanes, skews)
+        dut       = RawDUT(nlanes)
+        words     = []
+        overflows = []
+
+        @passive
+        def words_checker():
+            source = dut.datapath.source
+            yield source.ready.eq(1)
+            while True:
+                if (yield source.valid):
+                    words.append(((yield source.data), (yield source.ctrl)))
+                overflows.append((yield dut.datapath.overflows))
+                yield
+
+        # 16-bit lanes: nlanes/2 32-bit words per RX clock cycle, System clock at least nlanes/2 faster.
+        if sniffer_clk_period is None:
+            sniffer_clk_period = 10*max(nlanes//2, 1)
+        run_simulation(dut, {
+                "sniffer" : lanes_generator(dut.datapath.sinks, stimulus),
+                "sys"     : words_checker(),
+            },
+            clocks={"sys": 10, "sniffer": sniffer_clk_period},
+        )
+        return words, expected, overflows[-1]
+
+    def test_multilane_raw_datapath_x2(self):
+        words, expected, overflows = self.run_raw_datapath(nlanes=2, skews=[0, 7])
+        self.assertEqual(words[:len(expected)], expected)
+        self.assertEqual(overflows, 0)
+
+    def test_multilane_raw_datapath_x4(self):
+        words, expected, overflows = self.run_raw_datapath(nlanes=4, skews=[3, 0, 13, 6])
+        self.assertEqual(words[:len(expected)], expected)
+        self.assertEqual(overflows, 0)
+
+    def test_multilane_raw_datapath_overflow(self):
+        # x4 with a System clock only as fast as the RX clock (2x required): lane words lost, counted.
+        words, expected, overflows = self.run_raw_datapath(nlanes=4, skews=[3, 0, 13, 6], sniffer_clk_period=10)
+        self.assertGreater(overflows, 0)
+        self.assertNotEqual(words[:len(expected)], expected)
+
+    def test_multilane_ptm_sniffer_x2(self):
+        symbols, k  = capture_symbols()
+        stimulus, _ = lane_striped_stimulus(symbols, k, nlanes=2, skews=[5, 0])
+        dut         = SnifferDUT(nlanes=2)
+        ptms        = []
+
+        # Expected PTM ResponseD (Software model).
+        records = [decode_ptm_tlp(*tlp) for tlp in TLPExtractor().extract(symbols, k, np.arange(len(symbols)))]
+        records = [r for r in records if r is not None]
+        self.assertEqual(len(records), 1)
+
+        def rx_generator():
+            for words in zip(*[zip(data, ctrl) for data, ctrl in stimulus]):
+                yield dut.rx_data.eq(sum(int(data) << 16*n for n, (data, ctrl) in enumerate(words)))
+                yield dut.rx_ctrl.eq(sum(int(ctrl) <<  2*n for n, (data, ctrl) in enumerate(words)))
+                yield
+
+        @passive
+        def ptm_checker():
+            source = dut.sniffer.source
+            yield source.ready.eq(1)
+            while True:
+                if (yield source.valid):
+                    ptms.append(((yield source.message_code), (yield source.master_time), (yield source.link_delay)))
+                yield
+
+        run_simulation(dut, {"sniffer": rx_generator(), "sys": ptm_checker()}, clocks={"sys": 10, "sniffer": 10})
+        self.assertEqual(len(ptms), 1)
+        message_code, master_time, link_delay = ptms[0]
+        self.assertEqual(message_code, 0x53)
+        self.assertEqual(master_time,  records[0].master_time)
+        self.assertEqual(link_delay,   records[0].link_delay)
@@ -0,0 +1,109 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.pps import PPSGenerator
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, nchannels=2):
+        self.cd_sys     = ClockDomain()
+        self.time       = Signal(64)
+        self.write      = Signal()
+        self.write_time = Signal(64)
+
+        # # #
+
+        # Local Time (8ns increment, Software Write).
+        self.sync += [
+            If(self.write,
+                self.time.eq(self.write_time)
+            ).Else(
+                self.time.eq(self.time + 8)
+            )
+        ]
+
+        # PPS Generator.
+        self.pps_generator = PPSGenerator(clk_domain="sys", time=self.time, nchannels=nchannels)
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPPSGenerator(unittest.TestCase):
+    def run_pps_generator(self, channels, cycles=2048, writes={}):
+        """Run PPSGenerator with channels (period, width, start) config, return pulses (rise, fall) per channel."""
+        dut    = DUT(nchannels=len(channels))
+        pulses = [[] for _ in channels]
+
+        def config_generator():
+            for channel, (period, width, start) in zip(dut.pps_generator.channels, channels):
+                yield from channel._control.write(0)
+                yield from channel._period.write(period)
+                yield from channel._width.write(width)
+                yield from channel._start.write(start)
+                yield from channel._control.write(1)
+
+        def time_generator():
+            for i in range(cycles):
+                if i in writes:
+                    yield dut.write_time.eq(writes[i])
+                    yield dut.write.eq(1)
+                else:
+                    yield dut.write.eq(0)
+                yield
+
+        @passive
+        def pps_generator():
+            last = [0]*len(channels)
+            rise = [None]*len(channels)
+            while True:
+                time = (yield dut.time)
+                pps  = (yield dut.pps_generator.pps)
+                for n in range(len(channels)):
+                    level = (pps >> n) & 0b1
+                    if level and not last[n]:
+                        rise[n] = time
+                    if not level and last[n]:
+                        pulses[n].append((rise[n], time))
+                    last[n] = level
+                yield
+
+        generators = [
+            config_generator(),
+            time_generator(),
+            pps_generator(),
+        ]
+        run_simulation(dut, {"sys": generators}, clocks={"sys": 10, "time": 10})
+        return pulses
+
+    def check_pulses(self, pulses, period, width, start):
+        """Check pulses are on the start + k*period grid (with a constant latency) with correct width."""
+        self.assertGreater(len(pulses), 0)
+        latencies = set()
+        for rise, fall in pulses:
+            edge = start + ((rise - start)//period)*period
+            latencies.add(rise - edge)
+            self.assertEqual(fall - rise, width)
+        self.assertEqual(len(latencies), 1)
+        self.assertLessEqual(latencies.pop(), 16)
+
+    def test_pps_generator_channels(self):
+        # Two channels with independent period/width/phase.
+        channels = [(1000, 200, 504), (1600, 800, 1696)]
+        pulses   = self.run_pps_generator(channels)
+        for n, (period, width, start) in enumerate(channels):
+            self.check_pulses(pulses[n], period, width, start)
+        self.assertEqual(len(pulses[0]), 16)
+        self.assertEqual(len(pulses[1]), 9)
+
+    def test_pps_generator_time_jump(self):
+        # Time jumps forward (far) then backward: edges re-aligned on the period grid, no runt pulses.
+        period, width, start = 1000, 400, 504
+        forward  = 123_456_789_000_040
+        backward = forward - 5_000_000
+        writes   = {512: forward, 1024: backward}
+        pulses   = self.run_pps_generator([(period, width, start)], cycles=1536, writes=writes)[0]
+        for t0, t1 in [(0, forward), (forward, 2*forward), (backward, forward)]:
+            self.check_pulses([p for p in pulses if t0 <= p[0] < t1], period, width, start)
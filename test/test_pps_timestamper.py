@@ -0,0 +1,93 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.pps import PPSTimestamper
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, nsamples=1, fifo_depth=16):
+        self.cd_sys = ClockDomain()
+        self.time   = Signal(64)
+
+        # # #
+
+        # Local Time (50MHz, 20ns increment).
+        self.sync += self.time.eq(self.time + 20)
+
+        # PPS Timestamper.
+        self.pps_timestamper = PPSTimestamper(
+            clk_domain = "sys",
+            clk_freq   = 50e6,
+            time       = self.time,
+            nsamples   = nsamples,
+            fifo_depth = fifo_depth,
+            with_csr   = False,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPPSTimestamper(unittest.TestCase):
+    def run_timestamper(self, events, nsamples=1, fifo_depth=16, drain_delay=0):
+        """Generate rising edges (cycle, sample), return (edge times, timestamps, overflows)."""
+        dut        = DUT(nsamples=nsamples, fifo_depth=fifo_depth)
+        edges      = []
+        timestamps = []
+        overflows  = []
+        ones       = 2**nsamples - 1
+
+        def pps_generator():
+            yield dut.pps_timestamper.enable.eq(1)
+            for i in range(max(c for c, s in events) + 16):
+                for c, s in events:
+                    if i == c:
+                        # First high sample at s (Sample 0 first).
+                        yield dut.pps_timestamper.pps.eq(ones & ~(2**s - 1))
+                        edges.append((yield dut.time) + 20) # Applied on next clock edge.
+                    elif i == c + 1:
+                        yield dut.pps_timestamper.pps.eq(ones)
+                    elif i == c + 4:
+                        yield dut.pps_timestamper.pps.eq(0)
+                yield
+
+        def timestamp_generator():
+            for i in range(drain_delay):
+                yield
+            while len(timestamps) < min(len(events), fifo_depth):
+                yield dut.pps_timestamper.source.ready.eq(1)
+                yield
+                if (yield dut.pps_timestamper.source.valid):
+                    timestamps.append((yield dut.pps_timestamper.source.timestamp))
+            overflows.append((yield dut.pps_timestamper.overflows))
+
+        run_simulation(dut, {"sys": [pps_generator(), timestamp_generator()]}, clocks={"sys": 10, "time": 10})
+        return edges, timestamps, overflows[0]
+
+    def test_pps_timestamper(self):
+        # Timestamps track the input edges: first Time sample after the edge (Resynchronization compensated).
+        events = [(16 + 37*n, 0) for n in range(8)]
+        edges, timestamps, overflows = self.run_timestamper(events)
+        self.assertEqual(overflows, 0)
+        self.assertEqual(len(timestamps), len(events))
+        lags = set(t - e for e, t in zip(edges, timestamps))
+        self.assertEqual(len(lags), 1)
+        self.assertIn(lags.pop(), range(0, 20 + 1))
+
+    def test_pps_timestamper_interpolation(self):
+        # 4x oversampled input: edge interpolated within the cycle (5ns resolution).
+        events = [(16 + 37*n, n % 4) for n in range(8)]
+        edges, timestamps, overflows = self.run_timestamper(events, nsamples=4)
+        lags = [t - e for e, t in zip(edges, timestamps)]
+        for (c, s), lag in zip(events, lags):
+            self.assertEqual(lag - lags[0], 5*s)
+
+    def test_pps_timestamper_overflow(self):
+        # Timestamps not drained: FIFO fills up, overflows are counted, oldest timestamps kept.
+        events = [(16 + 37*n, 0) for n in range(8)]
+        edges, timestamps, overflows = self.run_timestamper(events, fifo_depth=4, drain_delay=16 + 37*8)
+        self.assertEqual(overflows, len(events) - (4 + 1)) # +1: FIFO output buffer.
+        lags = set(t - e for e, t in zip(edges, timestamps))
+        self.assertEqual(len(lags), 1)
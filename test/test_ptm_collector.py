@@ -0,0 +1,98 @@
+import os
+import time
+import tempfile
+import unittest
+
+import numpy as np
+
+from litex.tools.litex_server import RemoteServer
+
+from tools.timecard      import PTMSample
+from tools.ptm_log       import load_ptm_log
+from tools.ptm_collector import COLLECTOR_FIELDS, Board, collect
+
+from test.timecard_models import csr_csv, PTMRequesterComm
+
+# Slow Client --------------------------------------------------------------------------------------
+
+class SlowClient:
+    """TimeCard client whose PTM Requests take delay seconds."""
+    def __init__(self, delay):
+        self.delay = delay
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def ptm_request(self, enable=1):
+        time.sleep(self.delay)
+        return PTMSample(valid=True, t1=1000, t2=2000, t3=2225, t4=3000, link_delay=225)
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMCollector(unittest.TestCase):
+    def test_board_parse(self):
+        board = Board.parse("192.168.1.50:1235:board1.csv")
+        self.assertEqual((board.host, board.port, board.csr_csv), ("192.168.1.50", 1235, "board1.csv"))
+        board = Board.parse("localhost", csr_csv="csr.csv")
+        self.assertEqual((board.host, board.port, board.csr_csv), ("localhost", 1234, "csr.csv"))
+
+    def test_ptm_collector(self):
+        # Two boards (litex_servers) sampled concurrently, merged in a single log.
+        comms   = [PTMRequesterComm(), PTMRequesterComm()]
+        servers = [RemoteServer(comm, "127.0.0.1", bind_port=0) for comm in comms]
+        for server in servers:
+            server.open()
+            server.start(1)
+        try:
+            with tempfile.TemporaryDirectory() as d:
+                filename = os.path.join(d, "csr.csv")
+                with open(filename, "w") as f:
+                    f.write(csr_csv)
+                boards = [Board("127.0.0.1", server.socket.getsockname()[1], filename) for server in servers]
+                t_start = time.monotonic()
+                stats, files = collect(boards, period=0.02, log_prefix=os.path.join(d, "ptm"), count=25)
+                elapsed = time.monotonic() - t_start
+                with load_ptm_log(files) as log:
+                    self.assertEqual(log.metadata["boards"], [str(board) for board in boards])
+                    self.assertEqual([name for name, _ in log.dtype.descr], [name for name, _ in COLLECTOR_FIELDS])
+                    records = log.read()
+        finally:
+            for server in servers:
+                server.close()
+
+        # Sampled on the schedule (host timing dependent checks limited to the schedule invariants:
+        # the number of missed deadlines depends on the host load).
+        self.assertGreaterEqual(elapsed, 24*0.02)
+        self.assertEqual(len(records), 50)
+        for n in range(2):
+            board = records[records["board"] == n]
+            self.assertEqual(len(board), 25)
+            self.assertEqual(stats[n].samples, 25)
+            self.assertTrue(np.all(board["t1"] == 0x1_23450000))
+            self.assertTrue(np.all(board["t2"] == 0x1_23456789))
+            self.assertTrue(np.all(board["link_delay"] == 0xe1))
+            self.assertTrue(np.all(board["flags"] == 1))
+            # Host monotonic timestamps on the period grid (lateness recorded), missed deadlines skipped.
+            deadlines = board["host_time"] - board["lateness"]
+            slots, remainders = np.divmod(deadlines - deadlines[0], 20_000_000)
+            self.assertTrue(np.all(remainders == 0))
+            self.assertTrue(np.all(np.diff(slots) >= 1))
+            self.assertEqual(slots[-1], 24 + stats[n].missed)
+            self.assertTrue(np.all(board["lateness"] >= 0))
+            self.assertTrue(np.all(board["duration"] > 0))
+
+    def test_ptm_collector_missed(self):
+        # Requests longer than the period: missed deadlines skipped, samples stay on the grid.
+        stats, files = collect([Board(), Board()], period=0.01, duration=0.2,
+            client_factory=lambda board: SlowClient(0.025))
+        for board_stats in stats:
+            # Requests of 2.5 periods: at most 9 fit in the duration, each skips at least 2 deadlines
+            # (no burst on missed deadlines).
+            self.assertGreaterEqual(board_stats.samples, 1)
+            self.assertLessEqual(board_stats.samples, 9)
+            self.assertGreaterEqual(board_stats.missed, 2*board_stats.samples)
+            self.assertGreaterEqual(board_stats.lateness.min, 0)
+        self.assertEqual(files, [])
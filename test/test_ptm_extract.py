@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from tools.dump import load_dump
+from tools.sniffer import TLPExtractor, words_to_symbols
+from tools.ptm_extract import PTM_REQUEST, PTM_RESPONSED, decode_ptm_tlp, extract_ptm, iter_capture_chunks
+
+dumps_dir = os.path.join(os.path.dirname(__file__), "dumps")
+
+class TestPTMExtract(unittest.TestCase):
+    def test_ptm_extract_rx(self):
+        chunks  = iter_capture_chunks(os.path.join(dumps_dir, "dump002.bin"), direction="rx")
+        records = list(extract_ptm(chunks))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].type,        PTM_RESPONSED)
+        self.assertEqual(records[0].master_time, 0x00000006_72e60ed9)
+        self.assertEqual(records[0].link_delay,  0xe1)
+
+    def test_ptm_extract_tx(self):
+        chunks  = iter_capture_chunks(os.path.join(dumps_dir, "dump002.bin"), direction="tx")
+        records = list(extract_ptm(chunks))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].type,         PTM_REQUEST)
+        self.assertEqual(records[0].requester_id, 0x0100)
+
+    def test_ptm_extract_streaming(self):
+        for direction in ["rx", "tx"]:
+            filename = os.path.join(dumps_dir, "dump002.bin")
+            ref = list(extract_ptm(iter_capture_chunks(filename, direction=direction)))
+            for chunk_size in [1, 7, 64, 1000]:
+                chunks = iter_capture_chunks(filename, direction=direction, chunk_size=chunk_size)
+                self.assertEqual(list(extract_ptm(chunks)), ref)
+
+    def test_ptm_extract_raw(self):
+        with load_dump(os.path.join(dumps_dir, "dump002.bin")) as dump:
+            data = np.array(dump["s7pciephy_debug_rx_data"], dtype=np.uint32)
+            ctrl = np.array(dump["s7pciephy_debug_rx_ctl"],  dtype=np.uint32)
+        ref = list(extract_ptm([(data, ctrl)]))
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "capture.raw")
+            (data | (ctrl << 16)).astype("<u4").tofile(filename)
+            self.assertEqual(list(extract_ptm(iter_capture_chunks(filename, chunk_size=100))), ref)
+
+    def test_tlp_extractor(self):
+        # Descrambled/aligned stream captured at TLPAligner's sink.
+        with load_dump(os.path.join(dumps_dir, "dump_ptm_response001.bin")) as dump:
+            valid = np.array(dump["ptmtlpaligner_sink_valid"],        dtype=bool)
+            data  = np.array(dump["ptmtlpaligner_sink_payload_data"])[valid]
+            ctrl  = np.array(dump["ptmtlpaligner_sink_payload_ctrl"])[valid]
+        symbols, k = words_to_symbols(data, ctrl)
+        records = [decode_ptm_tlp(offset, tlp) for offset, tlp in
+            TLPExtractor().extract(symbols, k, np.arange(len(symbols)))]
+        records = [r for r in records if r is not None]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].type,        PTM_RESPONSED)
+        self.assertEqual(records[0].master_time, 0x00000003_10694e56)
+        self.assertEqual(records[0].link_delay,  0xdf)
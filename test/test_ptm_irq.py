@@ -0,0 +1,110 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from litepcie.core.msi import LitePCIeMSI
+from litepcie.frontend.ptm import PTMRequester
+
+from gateware.ptm import PTMRequesterIRQ
+
+from test.ptm_models import PCIeEndpointModel, PCIePTMSnifferModel, root_complex_generator
+
+PTM_REQUESTER_INTERRUPT = 2 # After PCIE_DMA0_READER/WRITER.
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.time    = Signal(64)
+        self.enable  = Signal()
+        self.trigger = Signal()
+
+        # # #
+
+        # Local Time (8ns increment).
+        self.sync += self.time.eq(self.time + 8)
+
+        # PCIe Models.
+        self.endpoint = PCIeEndpointModel()
+        self.sniffer  = PCIePTMSnifferModel()
+
+        # PTM Requester.
+        self.ptm_requester = PTMRequester(
+            pcie_endpoint    = self.endpoint,
+            pcie_ptm_sniffer = self.sniffer,
+            sys_clk_freq     = 125e6,
+            with_csr         = False,
+        )
+        self.comb += [
+            self.ptm_requester.time.eq(self.time),
+            self.ptm_requester.enable.eq(self.enable),
+            self.ptm_requester.trigger.eq(self.trigger),
+        ]
+
+        # PTM Requester IRQ -> MSI.
+        self.ptm_requester_irq = PTMRequesterIRQ(self.ptm_requester)
+        self.msi = LitePCIeMSI(width=32)
+        self.comb += self.msi.irqs[PTM_REQUESTER_INTERRUPT].eq(self.ptm_requester_irq.irq)
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMRequesterIRQ(unittest.TestCase):
+    def run_irq(self, requests, drop=[], msi_enable=1 << PTM_REQUESTER_INTERRUPT):
+        dut       = DUT()
+        responses = []
+        msis      = []
+        samples   = []
+
+        def control_generator():
+            yield dut.enable.eq(1)
+            yield dut.msi.enable.storage.eq(msi_enable)
+            yield
+            for n in range(requests):
+                yield dut.trigger.eq(1)
+                yield
+                yield dut.trigger.eq(0)
+                for i in range(512):
+                    yield
+
+        @passive
+        def msi_monitor():
+            yield dut.msi.source.ready.eq(1)
+            while True:
+                if (yield dut.msi.source.valid):
+                    # PTM sample registers/completions count already updated when the MSI is issued.
+                    msis.append((yield dut.msi.vector.status))
+                    samples.append((
+                        (yield dut.ptm_requester.master_time),
+                        (yield dut.ptm_requester.link_delay),
+                        (yield dut.ptm_requester_irq.count),
+                    ))
+                yield
+
+        generators = [
+            control_generator(),
+            msi_monitor(),
+            root_complex_generator(dut, responses, drop=drop),
+        ]
+        run_simulation(dut, {"sys": generators}, clocks={"sys": 10, "time": 10})
+        return dut, responses, msis, samples
+
+    def test_ptm_irq(self):
+        # One MSI per completed PTM exchange, on the PTM Requester vector.
+        dut, responses, msis, samples = self.run_irq(requests=4)
+        self.assertEqual(len(responses), 4)
+        self.assertEqual(msis, [1 << PTM_REQUESTER_INTERRUPT]*4)
+        self.assertEqual(samples, [(master_time, 0xe1, n + 1) for n, master_time in enumerate(responses)])
+
+    def test_ptm_irq_unanswered(self):
+        # PTM Request unanswered: no completion, no MSI (Requester stays busy).
+        dut, responses, msis, samples = self.run_irq(requests=3, drop=[1])
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(len(msis), 1)
+
+    def test_ptm_irq_disabled(self):
+        # MSI vector disabled: no MSI.
+        dut, responses, msis, samples = self.run_irq(requests=2, msi_enable=0)
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(msis, [])
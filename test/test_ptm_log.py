@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+import importlib.util
+
+import numpy as np
+
+from tools.ptm_log import PTMLOG_FLAG_VALID, PTMLogWriter, PTMLogSummary, RunningStats
+from tools.ptm_log import load_ptm_log, log_files, log_summary, summarize, log_to_vcd
+
+# Synthetic PTM Records ----------------------------------------------------------------------------
+
+def ptm_records(n=10000, seed=0):
+    """Return (host_time, t1, t2, t4, link_delay, valid) arrays of n PTM samples."""
+    prng       = np.random.default_rng(seed)
+    host_time  = 1_700_000_000_000_000_000 + 10_000_000*np.arange(n, dtype=np.int64)
+    t1         = (host_time + 12345).astype(np.uint64)
+    t2         = t1 - 2000 + prng.integers(-50, 50, n).astype(np.uint64)
+    t4         = t1 + 1500 + prng.integers(0, 100, n).astype(np.uint64)
+    link_delay = prng.integers(900, 1100, n).astype(np.uint32)
+    valid      = prng.random(n) > 0.05
+    return host_time, t1, t2, t4, link_delay, valid
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMLog(unittest.TestCase):
+    def write_log(self, prefix, records, **kwargs):
+        with PTMLogWriter(prefix, **kwargs) as log:
+            for host_time, t1, t2, t4, link_delay, valid in zip(*records):
+                log.write(host_time, t1, t2, t4, link_delay, valid=valid)
+        return log
+
+    def check_log(self, log, records):
+        host_time, t1, t2, t4, link_delay, valid = records
+        data = log.read()
+        np.testing.assert_array_equal(data["host_time"],  host_time)
+        np.testing.assert_array_equal(data["t1"],         t1)
+        np.testing.assert_array_equal(data["t2"],         t2)
+        np.testing.assert_array_equal(data["t4"],         t4)
+        np.testing.assert_array_equal(data["link_delay"], link_delay)
+        np.testing.assert_array_equal((data["flags"] & PTMLOG_FLAG_VALID) != 0, valid)
+
+    def test_ptm_log(self):
+        records = ptm_records(n=1000)
+        with tempfile.TemporaryDirectory() as d:
+            prefix = os.path.join(d, "ptm")
+            writer = self.write_log(prefix, records, metadata={"board": "timecard"}, buffer_records=64)
+            self.assertEqual(writer.records, 1000)
+            self.assertEqual(len(writer.files), 1)
+            with load_ptm_log(prefix) as log:
+                self.assertEqual(len(log), 1000)
+                self.assertEqual(log.metadata, {"board": "timecard"})
+                self.check_log(log, records)
+
+    def test_ptm_log_rotation(self):
+        records = ptm_records(n=1000)
+        with tempfile.TemporaryDirectory() as d:
+            prefix = os.path.join(d, "ptm")
+            writer = self.write_log(prefix, records, max_bytes=4096, buffer_records=100)
+            self.assertGreater(len(writer.files), 8)
+            for filename in writer.files:
+                self.assertLessEqual(os.path.getsize(filename), 4096)
+            with load_ptm_log(prefix) as log:
+                self.assertEqual(log.files, writer.files)
+                self.check_log(log, records)
+                # Chunks are split on file boundaries and chunk size.
+                chunks = list(log.chunks(size=50))
+                self.assertEqual(sum(len(chunk) for chunk in chunks), 1000)
+                self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+
+            # A new recording continues the numbering (previous recording kept).
+            writer = self.write_log(prefix, ptm_records(n=10), max_bytes=4096)
+            self.assertEqual(len(log_files(prefix)), len(log.files) + 1)
+            with load_ptm_log(writer.files) as log:
+                self.assertEqual(len(log), 10)
+
+    def test_ptm_log_partial_record(self):
+        # Interrupted recording: the partially written record is ignored.
+        records = ptm_records(n=100)
+        with tempfile.TemporaryDirectory() as d:
+            prefix = os.path.join(d, "ptm")
+            writer = self.write_log(prefix, records)
+            with open(writer.files[-1], "ab") as f:
+                f.write(bytes(7))
+            with load_ptm_log(writer.files[-1]) as log:
+                self.assertEqual(len(log), 100)
+                self.check_log(log, records)
+
+    def test_running_stats(self):
+        values = np.random.default_rng(1).normal(1000, 25, 10000)
+        stats  = RunningStats()
+        for chunk in np.array_split(values, 17):
+            stats.update(chunk)
+        self.assertEqual(stats.count, len(values))
+        self.assertEqual(stats.min, values.min())
+        self.assertEqual(stats.max, values.max())
+        self.assertAlmostEqual(stats.mean, values.mean(), places=9)
+        self.assertAlmostEqual(stats.std,  values.std(),  places=9)
+
+    def test_ptm_log_summary(self):
+        records = ptm_records(n=10000)
+        host_time, t1, t2, t4, link_delay, valid = records
+        with tempfile.TemporaryDirectory() as d:
+            prefix = os.path.join(d, "ptm")
+            self.write_log(prefix, records, max_bytes=64*1024)
+            with load_ptm_log(prefix) as log:
+                # Whole log.
+                stats = log_summary(log, chunk_size=999)
+                t2_t1 = (t2.astype(np.int64) - t1.astype(np.int64))[valid]
+                self.assertEqual(stats["t2-t1"].count, np.count_nonzero(valid))
+                self.assertEqual(stats["t2-t1"].min, t2_t1.min())
+                self.assertEqual(stats["t2-t1"].max, t2_t1.max())
+                self.assertAlmostEqual(stats["t2-t1"].mean,     t2_t1.mean(), places=6)
+                self.assertAlmostEqual(stats["t2-t1"].std,      t2_t1.std(),  places=6)
+                self.assertAlmostEqual(stats["link_delay"].mean, link_delay[valid].mean(), places=6)
+                stats = log_summary(log, valid_only=False)
+                self.assertEqual(stats["link_delay"].count, 10000)
+
+                # Intervals (not aligned on chunks/files).
+                intervals = list(summarize(log, interval=3000, chunk_size=1024))
+                self.assertEqual(len(intervals), 4)
+                for n, stats in enumerate(intervals):
+                    interval = slice(3000*n, 3000*(n + 1))
+                    self.assertEqual(stats["link_delay"].count, np.count_nonzero(valid[interval]))
+                    self.assertEqual(stats["link_delay"].max, link_delay[interval][valid[interval]].max())
+
+                # Intervals and total from the same pass.
+                summary = PTMLogSummary(interval=5000)
+                self.assertEqual(sum(len(summary.update(chunk)) for chunk in log.chunks(size=777)), 2)
+                self.assertIsNone(summary.flush())
+                self.assertEqual(summary.total["t2-t1"].count, np.count_nonzero(valid))
+
+    @unittest.skipUnless(importlib.util.find_spec("vcd"), "pyvcd not installed.")
+    def test_ptm_log_vcd(self):
+        with tempfile.TemporaryDirectory() as d:
+            prefix = os.path.join(d, "ptm")
+            self.write_log(prefix, ptm_records(n=100))
+            with load_ptm_log(prefix) as log:
+                log_to_vcd(log, os.path.join(d, "ptm.vcd"))
+            with open(os.path.join(d, "ptm.vcd")) as f:
+                vcd = f.read()
+            for name in ["t1", "t2", "t3", "t4", "t2-t1", "t4-t1"]:
+                self.assertIn(f" {name} $end", vcd)
@@ -0,0 +1,133 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.ptm import PTMRequester, PTMScheduler
+
+from test.ptm_models import PCIeEndpointModel, PCIePTMSnifferModel, root_complex_generator
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, fifo_depth=16):
+        self.time = Signal(64)
+
+        # # #
+
+        # Local Time (8ns increment).
+        self.sync += self.time.eq(self.time + 8)
+
+        # PCIe Models.
+        self.endpoint = PCIeEndpointModel()
+        self.sniffer  = PCIePTMSnifferModel()
+
+        # PTM Requester.
+        self.ptm_requester = PTMRequester(
+            pcie_endpoint    = self.endpoint,
+            pcie_ptm_sniffer = self.sniffer,
+            sys_clk_freq     = 125e6,
+        )
+        self.comb += [
+            self.ptm_requester.time.eq(self.time),
+        ]
+
+        # PTM Scheduler.
+        self.ptm_scheduler = PTMScheduler(self.ptm_requester,
+            sys_clk_freq = 125e6,
+            fifo_depth   = fifo_depth,
+            with_csr     = False,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMScheduler(unittest.TestCase):
+    def run_scheduler(self, period, samples, fifo_depth=16, drain_delay=0, invalid=[], drop=[],
+        csr_trigger_period=None):
+        dut       = DUT(fifo_depth=fifo_depth)
+        responses = []
+        received  = []
+        overflows = []
+
+        def control_generator():
+            yield dut.ptm_requester._control.fields.enable.eq(1)
+            yield
+            yield dut.ptm_scheduler.period.eq(period)
+            yield dut.ptm_scheduler.enable.eq(1)
+            for i in range(drain_delay):
+                yield
+            while len(received) < samples:
+                yield dut.ptm_scheduler.source.ready.eq(1)
+                yield
+                if (yield dut.ptm_scheduler.source.valid) & (yield dut.ptm_scheduler.source.ready):
+                    received.append({
+                        "completed"  : (yield dut.ptm_scheduler.source.completed),
+                        "t1"         : (yield dut.ptm_scheduler.source.t1),
+                        "t2"         : (yield dut.ptm_scheduler.source.t2),
+                        "t4"         : (yield dut.ptm_scheduler.source.t4),
+                        "link_delay" : (yield dut.ptm_scheduler.source.link_delay),
+                    })
+            overflows.append((yield dut.ptm_scheduler.overflows))
+
+        @passive
+        def csr_trigger_generator():
+            # PTM Requests also triggered from PTMRequester's CSR, between the scheduler's ones.
+            for i in range(period//2):
+                yield
+            while True:
+                yield from dut.ptm_requester._control.write(0b11) # Enable + Trigger.
+                for i in range(csr_trigger_period - 1):
+                    yield
+
+        generators = [
+            control_generator(),
+            root_complex_generator(dut, responses, invalid=invalid, drop=drop),
+        ]
+        if csr_trigger_period is not None:
+            generators.append(csr_trigger_generator())
+        run_simulation(dut, {"sys": generators}, clocks={"sys": 10, "time": 10})
+        return received, responses, overflows[0]
+
+    def test_ptm_scheduler_periodic(self):
+        period = 256
+        received, responses, overflows = self.run_scheduler(period=period, samples=8)
+        self.assertEqual(overflows, 0)
+        for n, sample in enumerate(received):
+            self.assertEqual(sample["completed"],  1)
+            self.assertEqual(sample["t2"],         responses[n])
+            self.assertEqual(sample["link_delay"], 0xe1)
+            self.assertGreater(sample["t4"], sample["t1"])
+        # PTM Requests are issued every period (8ns time increment, +-1 increment from Time CDC).
+        for s0, s1 in zip(received[:-1], received[1:]):
+            self.assertLessEqual(abs(s1["t1"] - s0["t1"] - 8*period), 8)
+        self.assertLessEqual(abs(received[-1]["t1"] - received[0]["t1"] - 8*period*(len(received) - 1)), 8)
+
+    def test_ptm_scheduler_csr_trigger(self):
+        # Scheduler and CSR triggers both issue PTM Requests (trigger driven as their OR).
+        period = 512
+        received, responses, overflows = self.run_scheduler(period=period, samples=8, csr_trigger_period=period)
+        self.assertEqual([s["completed"] for s in received], [1]*8)
+        # Interleaved PTM Requests (CSR triggers a few cycles off the half period).
+        for s0, s1 in zip(received[:-1], received[1:]):
+            self.assertLessEqual(abs(s1["t1"] - s0["t1"] - 8*period//2), 8*8)
+
+    def test_ptm_scheduler_missed(self):
+        # Second PTM Request unanswered: Requester stays busy and missed samples are pushed.
+        received, responses, overflows = self.run_scheduler(period=256, samples=4, drop=[1])
+        self.assertEqual([s["completed"] for s in received], [1, 0, 0, 0])
+
+    def test_ptm_scheduler_missed_retry(self):
+        # First PTM Response without timing information: Requester waits 1us (125 cycles) before
+        # retrying, the periods ending during this wait are pushed as missed samples.
+        received, responses, overflows = self.run_scheduler(period=160, samples=4, invalid=[0])
+        self.assertEqual([s["completed"] for s in received], [0, 1, 1, 1])
+        self.assertEqual([s["t2"] for s in received if s["completed"]], responses[:3])
+
+    def test_ptm_scheduler_overflow(self):
+        # Samples not drained by the host: FIFO fills up, overflows are counted, no sample corrupted.
+        received, responses, overflows = self.run_scheduler(period=128, samples=4, fifo_depth=4,
+            drain_delay=128*16)
+        self.assertGreater(overflows, 0)
+        for n, sample in enumerate(received):
+            self.assertEqual(sample["t2"], responses[n])
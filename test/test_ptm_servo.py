@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from tools.ptm_servo import ptm_exchanges, load_samples, save_samples
+from tools.ptm_servo import DelayFilter, PIServo, KalmanServo, run_servo, servo_stats
+
+from test.ptm_samples import ptm_samples
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMServo(unittest.TestCase):
+    def test_ptm_exchanges(self):
+        samples, theta, _ = ptm_samples(n=64, jitter=0, outliers=0)
+        exchanges = ptm_exchanges(*samples)
+        self.assertEqual(len(exchanges.t), 63)
+        np.testing.assert_array_equal(exchanges.t, samples[0][:-1])
+        np.testing.assert_allclose(exchanges.offset, theta[:-1], atol=1)
+        np.testing.assert_allclose(exchanges.delay, 500, atol=1)
+
+        # Exchanges involving an invalid sample are dropped.
+        valid     = np.ones(64, dtype=bool)
+        valid[10] = False
+        exchanges = ptm_exchanges(*samples, valid=valid)
+        self.assertEqual(len(exchanges.t), 61)
+        self.assertNotIn(samples[0][9],  exchanges.t)
+        self.assertNotIn(samples[0][10], exchanges.t)
+
+    def test_samples_file(self):
+        samples, _, _ = ptm_samples(n=16)
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "samples.csv")
+            save_samples(filename, *samples)
+            for a, b in zip(load_samples(filename), samples):
+                np.testing.assert_array_equal(a, b)
+
+    def test_delay_filter(self):
+        samples, _, outlier = ptm_samples()
+        exchanges    = ptm_exchanges(*samples)
+        delay_filter = DelayFilter()
+        accepted     = np.array([delay_filter.update(delay) for delay in exchanges.delay])
+        outlier      = outlier[:-1]
+        self.assertGreater(np.count_nonzero(outlier), 50)
+        self.assertFalse(np.any(accepted[outlier]))
+        self.assertLess(np.count_nonzero(~accepted[~outlier]), 0.02*len(accepted))
+
+    def check_servo(self, servo):
+        samples, theta, _ = ptm_samples()
+        exchanges = ptm_exchanges(*samples)
+        results   = run_servo(exchanges, servo, DelayFilter())
+        settled   = np.nonzero(results.accepted)[0][256:]
+        theta     = theta[:-1]
+        # Tighter offset than single exchanges, frequency error estimated.
+        measured_error  = np.sqrt(np.mean((results.measured[settled] - theta[settled])**2))
+        estimated_error = np.sqrt(np.mean((results.offset[settled]   - theta[settled])**2))
+        self.assertLess(estimated_error, measured_error/2)
+        self.assertAlmostEqual(np.mean(results.freq[settled]), 50, delta=5)
+        stats = servo_stats(results)
+        self.assertEqual(stats["rejected"], np.count_nonzero(~results.accepted))
+        self.assertLess(stats["offset_std"], stats["measured_std"])
+        return estimated_error
+
+    def test_pi_servo(self):
+        self.check_servo(PIServo())
+
+    def test_kalman_servo(self):
+        self.check_servo(KalmanServo())
+
+    def test_servo_shift(self):
+        # Corrections applied to the local Time (1000ns offset, 50ppb frequency error removed) are
+        # compensated in the estimates.
+        for servo in [PIServo(), KalmanServo()]:
+            for n in range(64):
+                servo.update(n*10_000_000, 1000.0 + 0.5*n)
+            offset, freq, _ = servo.update(64*10_000_000, 1032.0)
+            self.assertAlmostEqual(offset, 1032.0, delta=1)
+            self.assertAlmostEqual(freq,   50.0,   delta=1)
+            servo.shift(offset=-offset, freq=-freq)
+            offset, freq, _ = servo.update(65*10_000_000, 0.0)
+            self.assertAlmostEqual(offset, 0.0, delta=1)
+            self.assertAlmostEqual(freq,   0.0, delta=1)
@@ -0,0 +1,146 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from litepcie.frontend.ptm import PTMRequester
+
+from gateware.ptm import PTMStatistics, ptm_statistics_layout
+
+from tools.timecard import PTMSample, decode_ptm_statistics, ptm_statistics_reference
+
+from test.ptm_models import PCIeEndpointModel, PCIePTMSnifferModel, root_complex_generator
+
+# Monitor ------------------------------------------------------------------------------------------
+
+@passive
+def sample_monitor(dut, samples):
+    """Record the PTMSamples of the completed PTM exchanges."""
+    while True:
+        yield
+        if (yield dut.ptm_requester.update):
+            t2 = (yield dut.ptm_requester.master_time)
+            link_delay = (yield dut.ptm_requester.link_delay)
+            samples.append(PTMSample(
+                valid      = True,
+                t1         = (yield dut.ptm_requester.t1),
+                t2         = t2,
+                t3         = t2 + link_delay,
+                t4         = (yield dut.ptm_requester.t4),
+                link_delay = link_delay,
+            ))
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.time    = Signal(64)
+        self.enable  = Signal()
+        self.trigger = Signal()
+
+        # # #
+
+        # Local Time (8ns increment).
+        self.sync += self.time.eq(self.time + 8)
+
+        # PCIe Models.
+        self.endpoint = PCIeEndpointModel()
+        self.sniffer  = PCIePTMSnifferModel()
+
+        # PTM Requester.
+        self.ptm_requester = PTMRequester(
+            pcie_endpoint    = self.endpoint,
+            pcie_ptm_sniffer = self.sniffer,
+            sys_clk_freq     = 125e6,
+            with_csr         = False,
+        )
+        self.comb += [
+            self.ptm_requester.time.eq(self.time),
+            self.ptm_requester.enable.eq(self.enable),
+            self.ptm_requester.trigger.eq(self.trigger),
+        ]
+
+        # PTM Statistics.
+        self.ptm_statistics = PTMStatistics(self.ptm_requester, sys_clk_freq=125e6, with_csr=False)
+
+def read_statistics(dut):
+    """Read the snapshot statistics (as registers), return the PTMStatistics."""
+    values = {}
+    for name, shape in ptm_statistics_layout:
+        signal = getattr(dut.ptm_statistics.stats, name)
+        values[name] = (yield signal) & (2**len(signal) - 1)
+    return decode_ptm_statistics(values)
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMStatistics(unittest.TestCase):
+    def run_statistics(self, windows, period=256, timeout=0, invalid=[], drop=[]):
+        """Run PTM exchanges every period, snapshot after each windows (samples, clear) entry, return
+        (samples, [(samples count at snapshot, statistics)])."""
+        dut       = DUT()
+        samples   = []
+        snapshots = []
+
+        def control_generator():
+            yield dut.ptm_statistics.timeout.eq(timeout)
+            yield dut.enable.eq(1)
+            yield
+            for window_samples, clear in windows:
+                # PTM exchanges.
+                cycles = 0
+                while len(samples) < window_samples:
+                    yield dut.trigger.eq((cycles % period) == 0)
+                    yield
+                    cycles += 1
+                    if cycles > 16*period:
+                        break
+                yield dut.trigger.eq(0)
+                for i in range(16):
+                    yield
+                # Snapshot (and clear).
+                yield dut.ptm_statistics.snapshot.eq(1)
+                yield dut.ptm_statistics.clear.eq(clear)
+                yield
+                yield dut.ptm_statistics.snapshot.eq(0)
+                yield dut.ptm_statistics.clear.eq(0)
+                for i in range(4):
+                    yield
+                snapshots.append((len(samples), (yield from read_statistics(dut))))
+
+        generators = [
+            control_generator(),
+            root_complex_generator(dut, offset=2**40, jitter=200, latency=(32, 96), link_delay=(200, 300),
+                invalid=invalid, drop=drop),
+            sample_monitor(dut, samples),
+        ]
+        run_simulation(dut, {"sys": generators}, clocks={"sys": 10, "time": 10})
+        return samples, snapshots
+
+    def test_ptm_statistics_windows(self):
+        # Window 0: samples 0-5 (with a PTM Response without timing information), snapshot + clear.
+        # Window 1: samples 6-9 snapshot, samples 6-13 snapshot (window not cleared).
+        samples, snapshots = self.run_statistics(windows=[(6, True), (10, False), (14, False)], invalid=[2])
+        self.assertEqual([n for n, _ in snapshots], [6, 10, 14])
+        references = [
+            ptm_statistics_reference(samples[0:6], invalid=1),
+            ptm_statistics_reference(samples[6:10]),
+            ptm_statistics_reference(samples[6:14]),
+        ]
+        for (n, stats), reference in zip(snapshots, references):
+            self.assertEqual(stats, reference)
+        # T2-T1 accumulated relative to the first exchange of the window (2^40ns offset).
+        stats = snapshots[0][1]
+        self.assertEqual(stats.offset.reference, samples[0].t2 - samples[0].t1)
+        self.assertGreater(stats.offset.reference, 2**40 - 2**20)
+        self.assertLess(stats.offset.std, 200)
+        self.assertGreaterEqual(stats.link_delay.min, 200)
+        self.assertLess(stats.link_delay.max, 300)
+        self.assertAlmostEqual(stats.link_delay.mean, sum(s.link_delay for s in samples[:6])/6)
+
+    def test_ptm_statistics_timeout(self):
+        # Third PTM Request unanswered: Requester stays busy, a single timeout is counted.
+        samples, snapshots = self.run_statistics(windows=[(3, True)], timeout=1000, drop=[2])
+        n, stats = snapshots[0]
+        self.assertEqual(n, 2)
+        self.assertEqual(stats, ptm_statistics_reference(samples, timeouts=1))
@@ -0,0 +1,142 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from litepcie.tlp.common import fmt_type_dict
+from litepcie.frontend.ptm.core import PTM_REQUEST_MESSAGE_CODE, PTM_RESPONSE_MESSAGE_CODE
+
+from gateware.ptm import PTMWireTimestamper
+
+from tools.ptm_extract import PTM_REQUEST, PTM_RESPONSE, PTM_RESPONSED
+from tools.symbol_generator import SymbolGenerator, stream_words
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.cd_sys  = ClockDomain()
+        self.time    = Signal(64)
+        self.tx_data = Signal(16)
+        self.tx_ctrl = Signal(2)
+        self.rx_data = Signal(16)
+        self.rx_ctrl = Signal(2)
+
+        # # #
+
+        # Local Time (1 per cycle, Sys/Sniffer clocks in phase: Time in tap words).
+        self.sync += self.time.eq(self.time + 1)
+
+        # PTM Wire Timestamper.
+        self.timestamper = PTMWireTimestamper(
+            clk_domain    = "sys",
+            time          = self.time,
+            sniffer_rst_n = 1,
+            sniffer_clk   = Signal(),
+            tx_data       = self.tx_data,
+            tx_ctrl       = self.tx_ctrl,
+            rx_data       = self.rx_data,
+            rx_ctrl       = self.rx_ctrl,
+            with_csr      = False,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestPTMWireTimestamper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Loaded links with PTM TLPs at various symbol positions (Packets on 2-symbol boundaries, Word
+        # Aligner re-alignments): PTM Requests on TX, PTM Response/ResponseD bursts on RX.
+        cls.tx_stream = SymbolGenerator(seed=4, load=1.0, min_gap=2, skp_align=2, skp_interval=256,
+            ptm_interval=192, ptm_burst=[PTM_REQUEST]).generate(2**12)
+        cls.rx_stream = SymbolGenerator(seed=5, load=1.0, min_gap=2, skp_align=2, skp_interval=256,
+            ptm_interval=256, ptm_burst=[PTM_RESPONSE, PTM_RESPONSED]).generate(2**12)
+        cls.timestamps, cls.exchanges = cls.run_timestamper(cls.tx_stream, cls.rx_stream)
+
+    @staticmethod
+    def run_timestamper(tx_stream, rx_stream):
+        """Return the TX/RX symbol timestamps ({"tx"/"rx": [(fmt_type, message_code, timestamp)]}) and
+        the latched exchanges ((valid, t1, t4), expected (valid, t1, t4)) after each RX timestamp."""
+        tx_data, tx_ctrl = stream_words(tx_stream)
+        rx_data, rx_ctrl = stream_words(rx_stream)
+        dut        = DUT()
+        timestamps = {"tx": [], "rx": []}
+        exchanges  = []
+
+        def tap_generator(data, ctrl, data_signal, ctrl_signal):
+            for d, c in zip(data.tolist(), ctrl.tolist()):
+                yield data_signal.eq(d)
+                yield ctrl_signal.eq(c)
+                yield
+            for i in range(64):
+                yield
+
+        @passive
+        def exchange_generator():
+            # Software model of the PTM exchange registers (updated as in gateware).
+            t1, t1_seen = 0, False
+            latched     = (0, 0, 0)
+            check       = False
+            while True:
+                events = {}
+                for name in ["tx", "rx"]:
+                    source = getattr(dut.timestamper, f"{name}_cdc").source
+                    if (yield source.valid):
+                        events[name] = ((yield source.fmt_type), (yield source.message_code), (yield source.timestamp))
+                        timestamps[name].append(events[name])
+                # Latched on previous cycle.
+                if check:
+                    exchanges.append((((yield dut.timestamper.valid), (yield dut.timestamper.t1), (yield dut.timestamper.t4)), latched))
+                    check = False
+                # Model.
+                if events.get("rx", (None, None))[:2] == (fmt_type_dict["ptm_res"], PTM_RESPONSE_MESSAGE_CODE) and t1_seen:
+                    latched, t1_seen = (1, t1, events["rx"][2]), False
+                if events.get("tx", (None, None))[1] == PTM_REQUEST_MESSAGE_CODE:
+                    latched, t1, t1_seen = (0, *latched[1:]), events["tx"][2], True
+                check = "rx" in events
+                yield
+
+        generators = {
+            "sniffer" : [
+                tap_generator(tx_data, tx_ctrl, dut.tx_data, dut.tx_ctrl),
+                tap_generator(rx_data, rx_ctrl, dut.rx_data, dut.rx_ctrl),
+            ],
+            "sys" : exchange_generator(),
+        }
+        run_simulation(dut, generators, clocks={"sys": 10, "time": 10, "sniffer": 10})
+        return timestamps, exchanges
+
+    def check_timestamps(self, stream, timestamps):
+        # Every PTM TLP is timestamped (in order) with the time its STP Symbol was presented on the
+        # tap (1 tap word per cycle, Time CDC lag compensated): +-2 cycles depending on the STP
+        # position in the words, the Word Aligner alignment and the Time CDC synchronization.
+        self.assertGreater(len(stream.ptms), 8)
+        self.assertEqual(len(timestamps), len(stream.ptms))
+        codes = {
+            PTM_REQUEST   : (fmt_type_dict["ptm_req"], PTM_REQUEST_MESSAGE_CODE),
+            PTM_RESPONSE  : (fmt_type_dict["ptm_req"], PTM_RESPONSE_MESSAGE_CODE),
+            PTM_RESPONSED : (fmt_type_dict["ptm_res"], PTM_RESPONSE_MESSAGE_CODE),
+        }
+        errors = []
+        for record, (fmt_type, message_code, timestamp) in zip(stream.ptms, timestamps):
+            self.assertEqual((fmt_type, message_code), codes[record.type])
+            errors.append(timestamp - record.offset//2)
+        self.assertLessEqual(max(errors), 2)
+        self.assertGreaterEqual(min(errors), -2)
+        self.assertLessEqual(abs(sum(errors)/len(errors)), 0.5)
+
+    def test_tx_timestamps(self):
+        self.check_timestamps(self.tx_stream, self.timestamps["tx"])
+
+    def test_rx_timestamps(self):
+        self.check_timestamps(self.rx_stream, self.timestamps["rx"])
+
+    def test_exchanges(self):
+        # Latched on the PTM ResponseD: last PTM Request and first PTM ResponseD received after it
+        # (valid until the next PTM Request).
+        self.assertEqual(len(self.exchanges), len(self.timestamps["rx"]))
+        for latched, expected in self.exchanges:
+            self.assertEqual(latched, expected)
+        self.assertGreater(sum(expected[0] for latched, expected in self.exchanges), 2)
+        self.assertGreater(sum(1 - expected[0] for latched, expected in self.exchanges), 2)
@@ -1,3 +1,4 @@
+import os
 import unittest
 import random
 
@@ -7,48 +8,39 @@ from litex.gen import *
 
 from litex.soc.interconnect import stream
 
-from test.dumps.dump003 import *
+from tools.dump import load_dump
+from tools.sniffer import raw_decode, scrambler_keystream
 
 from litepcie.frontend.ptm.sniffer import RawDatapath, RawDescrambler
 
-def rx_data_generator(dut, length=8192-1024):
-    rx_data = dump["s7pciephy_debug_rx_data"][:length:2]
-    rx_ctrl = dump["s7pciephy_debug_rx_ctl"][:length:2]
-    for data, ctrl in zip(rx_data, rx_ctrl):
-        yield dut.rx_sink.data.eq(data)
-        yield dut.rx_sink.ctrl.eq(ctrl)
-        yield
+from test.captures import list_captures, capture_output_dir, run_captures
 
-@passive
-def rx_data_checker(dut, length=4096):
-    yield dut.rx_source.ready.eq(1)
-    while (yield dut.rx_source.ctrl) != 0xf:
-        yield
-    f = open("rx_data.bin", "wb")
-    while True:
-        if (yield dut.rx_source.valid):
-            f.write((yield dut.rx_source.data).to_bytes(4, byteorder="little"))
-        yield
+def raw_sniffer_captures():
+    """Captures of the PHY RX/TX debug interfaces."""
+    return list_captures([f"s7pciephy_debug_{d}_{c}" for d in ["rx", "tx"] for c in ["data", "ctl"]])
 
-def tx_data_generator(dut, length=8192-1024):
-    tx_data = dump["s7pciephy_debug_tx_data"][:length:2]
-    tx_ctrl = dump["s7pciephy_debug_tx_ctl"][:length:2]
-    for data, ctrl in zip(tx_data, tx_ctrl):
-        yield dut.tx_sink.data.eq(data)
-        yield dut.tx_sink.ctrl.eq(ctrl)
+def data_generator(sink, data, ctrl, length=4096-512):
+    for data, ctrl in zip(data[:length], ctrl[:length]):
+        yield sink.data.eq(data)
+        yield sink.ctrl.eq(ctrl)
         yield
 
 @passive
-def tx_data_checker(dut, length=4096):
-    yield dut.tx_source.ready.eq(1)
-    while (yield dut.tx_source.ctrl) != 0xf:
+def data_checker(source, words):
+    yield source.ready.eq(1)
+    while (yield source.ctrl) != 0xf:
         yield
-    f = open("tx_data.bin", "wb")
     while True:
-        if (yield dut.tx_source.valid):
-            f.write((yield dut.tx_source.data).to_bytes(4, byteorder="little"))
+        if (yield source.valid):
+            words.append(((yield source.data), (yield source.ctrl)))
         yield
 
+def reference_words(data, ctrl, length=4096-512):
+    # Software model of RawDatapath + RawDescrambler (the DUT sees the reset value on first cycle).
+    data, ctrl = raw_decode([0] + list(data[:length]), [0] + list(ctrl[:length]))
+    sync = list(ctrl).index(0xf)
+    return list(zip(data[sync:].tolist(), ctrl[sync:].tolist()))
+
 
 class RawSnifferDUT(LiteXModule):
     def __init__(self):
@@ -82,13 +74,52 @@ class RawSnifferDUT(LiteXModule):
             self.tx_descrambler.source.connect(self.tx_source),
         ]
 
-class TestRawSniffer(unittest.TestCase):
-    def test_raw_sniffer(self):
-        dut        = RawSnifferDUT()
+def simulate_raw_sniffer(capture):
+    """Simulate RawSnifferDUT on a capture, return (rx_words, tx_words).
+
+    Descrambled data (rx_data.bin/tx_data.bin) and VCD are written to the capture output directory.
+    """
+    output_dir = capture_output_dir("raw_sniffer", capture)
+    dut        = RawSnifferDUT()
+    rx_words   = []
+    tx_words   = []
+    with load_dump(capture) as dump:
         generators = [
-            rx_data_generator(dut),
-            tx_data_generator(dut),
-            rx_data_checker(dut),
-            tx_data_checker(dut),
+            data_generator(dut.rx_sink, dump["s7pciephy_debug_rx_data"], dump["s7pciephy_debug_rx_ctl"]),
+            data_generator(dut.tx_sink, dump["s7pciephy_debug_tx_data"], dump["s7pciephy_debug_tx_ctl"]),
+            data_checker(dut.rx_source, rx_words),
+            data_checker(dut.tx_source, tx_words),
         ]
-        run_simulation(dut, generators, vcd_name="test_raw_sniffer.vcd")
+        run_simulation(dut, generators, vcd_name=os.path.join(output_dir, "test_raw_sniffer.vcd"))
+    for filename, words in [("rx_data.bin", rx_words), ("tx_data.bin", tx_words)]:
+        with open(os.path.join(output_dir, filename), "wb") as f:
+            for data, ctrl in words:
+                f.write(data.to_bytes(4, byteorder="little"))
+    return rx_words, tx_words
+
+class TestRawSniffer(unittest.TestCase):
+    def test_raw_sniffer(self):
+        captures = raw_sniffer_captures()
+        self.assertGreater(len(captures), 0)
+        for capture, (rx_words, tx_words) in zip(captures, run_captures(simulate_raw_sniffer, captures)):
+            with self.subTest(capture=os.path.basename(capture)):
+                # Compare Gateware with Software model.
+                with load_dump(capture) as dump:
+                    rx_reference = reference_words(dump["s7pciephy_debug_rx_data"], dump["s7pciephy_debug_rx_ctl"])
+                    tx_reference = reference_words(dump["s7pciephy_debug_tx_data"], dump["s7pciephy_debug_tx_ctl"])
+                self.assertGreater(len(rx_words), 1000)
+                self.assertGreater(len(tx_words), 1000)
+                self.assertEqual(rx_words, rx_reference[:len(rx_words)])
+                self.assertEqual(tx_words, tx_reference[:len(tx_words)])
+
+    def test_raw_decode_model(self):
+        # Scrambler keystream after a COM (PCIe Base Specification, Appendix C).
+        self.assertEqual(list(scrambler_keystream(8)), [0xff, 0x17, 0xc0, 0x14, 0xb2, 0xe7, 0x02, 0x82])
+
+        # Decoded RX stream: SKP Ordered-Set followed by Logical Idles.
+        for capture in raw_sniffer_captures():
+            with self.subTest(capture=os.path.basename(capture)):
+                with load_dump(capture) as dump:
+                    rx_words = reference_words(dump["s7pciephy_debug_rx_data"], dump["s7pciephy_debug_rx_ctl"])
+                self.assertEqual(rx_words[0], (0x1c1c1cbc, 0b1111))
+                self.assertEqual(rx_words[1], (0x00000000, 0b0000))
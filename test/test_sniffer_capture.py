@@ -0,0 +1,213 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.capture import SnifferCapture
+
+from tools.capture import SNIFFER_CAPTURE_MAGIC, SNIFFER_CAPTURE_PAD_MAGIC
+from tools.capture import SNIFFER_CAPTURE_FLAG_TRIGGERED, SNIFFER_CAPTURE_FLAG_TX
+from tools.capture import SnifferCapture as SnifferCaptureReader, capture_channel, capture_summary, capture_to_dump
+from tools.dump import load_dump
+from tools.ptm_extract import capture_format
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def write_words(filename, words):
+    np.array(words, dtype="<u8").tofile(filename)
+
+def record_words(index, samples, flags=SNIFFER_CAPTURE_FLAG_TX, dropped=0):
+    header = SNIFFER_CAPTURE_MAGIC | (len(samples) << 32) | (flags << 48) | (dropped << 56)
+    return [header, index] + list(samples)
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, depth=64, pretrigger_depth=16, flush_length=64):
+        self.cd_sniffer = ClockDomain()
+
+        # # #
+
+        # Raw sniffer words (RX: counter, TX: counter MSBs).
+        self.counter = Signal(32)
+        self.sync.sniffer += self.counter.eq(self.counter + 1)
+
+        # Sniffer Capture.
+        self.capture = SnifferCapture(
+            clock_domain     = "sniffer",
+            channels         = [self.counter[0:18], self.counter[8:26]],
+            sys_clk_freq     = 100e6,
+            depth            = depth,
+            pretrigger_depth = pretrigger_depth,
+            flush_length     = flush_length,
+            with_csr         = False,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestSnifferCapture(unittest.TestCase):
+    def run_capture(self, cycles, length=16, pretrigger=0, continuous=False, triggers=[], ready=1.0, depth=64, sys_clk_period=10,
+        flush_timeout=2**32 - 1, flush_length=64, request_size=None, disable=True, truncated=False):
+        """Run the capture, return (records, dropped) with records decoded by the host reader.
+
+        With request_size (in bytes), words are only returned by complete DMA requests (as written
+        by the DMA).
+        """
+        dut     = DUT(depth=depth, flush_length=flush_length)
+        prng    = random.Random(0)
+        words   = []
+        dropped = []
+
+        def control_generator():
+            yield dut.capture.length.eq(length)
+            yield dut.capture.pretrigger.eq(pretrigger)
+            yield dut.capture.continuous.eq(continuous)
+            yield dut.capture.flush_timeout.eq(flush_timeout)
+            yield dut.capture.enable.eq(1)
+            for i in range(cycles):
+                yield dut.capture.trigger.eq(i in triggers)
+                yield
+            yield dut.capture.enable.eq(not disable)
+            for i in range(1024):
+                yield
+            dropped.append((yield dut.capture.dropped))
+
+        @passive
+        def source_generator():
+            request = []
+            while True:
+                yield dut.capture.source.ready.eq(prng.random() < ready)
+                yield
+                if (yield dut.capture.source.valid) & (yield dut.capture.source.ready):
+                    request.append((yield dut.capture.source.data))
+                if len(request) >= (1 if request_size is None else request_size//8):
+                    words.extend(request)
+                    request.clear()
+
+        generators = {"sys": [control_generator(), source_generator()]}
+        run_simulation(dut, generators, clocks={"sys": sys_clk_period, "sniffer": 10, "capture": 10})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "capture.bin")
+            write_words(filename, words)
+            with SnifferCaptureReader(filename) as capture:
+                records = [r._replace(samples=np.array(r.samples)) for r in capture.records()]
+                self.assertEqual(capture.skipped, 0)
+                self.assertEqual(capture.truncated, truncated)
+        return records, dropped[0]
+
+    def check_records(self, records, length):
+        """Check records are complete and their samples are the sniffer words of their index."""
+        offsets = set()
+        for record in records:
+            self.assertEqual(record.length, length)
+            self.assertEqual(record.flags & SNIFFER_CAPTURE_FLAG_TX, SNIFFER_CAPTURE_FLAG_TX)
+            rx, rx_ctl = capture_channel(record.samples, "rx")
+            tx, tx_ctl = capture_channel(record.samples, "tx")
+            counter = (rx_ctl.astype(np.int64) << 16) | rx.astype(np.int64)
+            np.testing.assert_array_equal(np.diff(counter) % 2**18, 1)
+            np.testing.assert_array_equal((tx.astype(np.int64) | (tx_ctl.astype(np.int64) << 16)), (counter >> 8) & (2**18 - 1))
+            offsets.add((int(counter[0]) - record.index) % 2**18)
+        # Same sample/index relationship in all the records.
+        self.assertEqual(len(offsets), 1)
+        return offsets.pop()
+
+    def test_sniffer_capture_triggered(self):
+        triggers = [100, 300, 550]
+        records, dropped = self.run_capture(cycles=800, length=32, triggers=triggers)
+        self.assertEqual(dropped, 0)
+        self.assertEqual(len(records), len(triggers))
+        offset = self.check_records(records, length=32)
+        for record in records:
+            self.assertTrue(record.flags & SNIFFER_CAPTURE_FLAG_TRIGGERED)
+        self.assertEqual([r.index - records[0].index for r in records], [t - triggers[0] for t in triggers])
+
+        # Pretrigger: records start pretrigger samples earlier, with the same sample/index relationship.
+        pretrigger_records, _ = self.run_capture(cycles=800, length=32, pretrigger=12, triggers=triggers)
+        self.assertEqual(self.check_records(pretrigger_records, length=32), offset)
+        self.assertEqual([r.index for r in pretrigger_records], [r.index - 12 for r in records])
+
+    def test_sniffer_capture_bounds(self):
+        # Length/pretrigger clamped to the FIFO/Delay Line capacities (depth - 1, pretrigger_depth - 1):
+        # records captured, not dropped.
+        triggers = [100, 300]
+        records, dropped = self.run_capture(cycles=600, length=100, pretrigger=20, triggers=triggers, depth=64)
+        self.assertEqual(dropped, 0)
+        self.assertEqual(len(records), len(triggers))
+        self.check_records(records, length=63)
+        reference, _ = self.run_capture(cycles=600, length=63, pretrigger=15, triggers=triggers, depth=64)
+        self.assertEqual([r.index for r in records], [r.index for r in reference])
+
+    def test_sniffer_capture_continuous(self):
+        # Sink keeping up (faster than the capture rate + record headers): back-to-back records
+        # without gaps.
+        records, dropped = self.run_capture(cycles=2000, length=16, continuous=True, sys_clk_period=4)
+        self.assertEqual(dropped, 0)
+        self.assertGreaterEqual(len(records), 2000*4//10//16 - 2)
+        self.check_records(records, length=16)
+        for previous, record in zip(records, records[1:]):
+            self.assertEqual(record.index, previous.index + previous.length)
+            self.assertFalse(record.flags & SNIFFER_CAPTURE_FLAG_TRIGGERED)
+
+    def test_sniffer_capture_flush(self):
+        # Triggered records reach the host with 512-byte DMA requests: stream padded after the flush
+        # timeout (still enabled) or when disabled, last record truncated when flush is disabled.
+        triggers = [100, 300, 550]
+        for flush_timeout, flush_length, disable, n in [
+            (64,          64, False, 3),
+            (2**32 - 1,   64, True,  3),
+            (64,           0, True,  1)]:
+            with self.subTest(flush_timeout=flush_timeout, flush_length=flush_length, disable=disable):
+                records, _ = self.run_capture(cycles=800, length=32, triggers=triggers, flush_timeout=flush_timeout,
+                    flush_length=flush_length, request_size=512, disable=disable, truncated=(flush_length == 0))
+                self.assertEqual(len(records), n)
+                self.check_records(records, length=32)
+
+    def test_sniffer_capture_overflow(self):
+        # Slow sink: whole records dropped (and reported in the next record header), never truncated.
+        records, dropped = self.run_capture(cycles=4000, length=16, continuous=True, ready=0.25, sys_clk_period=4)
+        self.assertGreater(dropped, 0)
+        self.check_records(records, length=16)
+        for previous, record in zip(records, records[1:]):
+            self.assertEqual(record.index, previous.index + (1 + record.dropped)*16)
+        self.assertLessEqual(sum(r.dropped for r in records), dropped)
+
+class TestSnifferCaptureReader(unittest.TestCase):
+    def test_sniffer_capture_reader(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "capture.bin")
+            samples  = [[(n << 32) | (n + 1), (n << 32) | (n + 2)] for n in range(3)]
+            words    = [0x1234, 0x5678] # Capture started mid-record.
+            words   += record_words(100, samples[0])
+            words   += [SNIFFER_CAPTURE_PAD_MAGIC]*3 # Flush.
+            words   += record_words(102, samples[1], flags=SNIFFER_CAPTURE_FLAG_TX)
+            words   += record_words(110, samples[2], flags=SNIFFER_CAPTURE_FLAG_TX, dropped=3)
+            words   += record_words(112, [1, 2, 3])[:3] # Truncated.
+            write_words(filename, words)
+            with SnifferCaptureReader(filename) as capture:
+                records = list(capture.records())
+                self.assertEqual([r.index for r in records], [100, 102, 110])
+                self.assertEqual([list(r.samples) for r in records], samples)
+                self.assertEqual(capture.skipped, 2)
+                self.assertTrue(capture.truncated)
+                summary = capture_summary(capture)
+                self.assertEqual((summary["records"], summary["samples"], summary["dropped"], summary["gaps"]), (3, 6, 3, 1))
+
+                # Dump conversion (raw sniffer columns, as LiteScope dumps).
+                dump_filename = os.path.join(tmp, "capture.dump.bin")
+                self.assertEqual(capture_to_dump(capture, dump_filename, records=slice(1, None)), 2)
+            with load_dump(dump_filename) as dump:
+                self.assertEqual(list(dump["capture_record"]), [0, 0, 1, 1])
+                self.assertEqual(list(dump["capture_index"]),  [102, 103, 110, 111])
+                self.assertEqual(list(dump["s7pciephy_debug_rx_data"]), [2, 3, 3, 4])
+                self.assertEqual(list(dump["s7pciephy_debug_tx_data"]), [1, 1, 2, 2])
+                self.assertEqual(dump.metadata["samples_per_cycle"], 1)
+            self.assertEqual(capture_format(filename), "raw")
+            write_words(filename, record_words(0, [0]))
+            self.assertEqual(capture_format(filename), "capture")
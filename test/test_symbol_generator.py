@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+
+from migen import *
+
+from litex.gen import *
+
+from litepcie.frontend.ptm import PCIePTMSniffer
+
+from tools.sniffer import RawDecoder, words_to_symbols
+from tools.ptm_extract import extract_ptm, PTM_RESPONSE, PTM_RESPONSED
+from tools.symbol_generator import SymbolGenerator, stream_words, scramble
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.cd_sys  = ClockDomain()
+        self.rx_data = Signal(16)
+        self.rx_ctrl = Signal(2)
+
+        # # #
+
+        self.sniffer = PCIePTMSniffer(
+            rx_rst_n = 1,
+            rx_clk   = Signal(),
+            rx_data  = self.rx_data,
+            rx_ctrl  = self.rx_ctrl,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestSymbolGenerator(unittest.TestCase):
+    def test_scramble(self):
+        # Scrambler is its own inverse and matches the RawDescrambler model on Ordered-Set aligned streams.
+        stream     = SymbolGenerator(seed=0).generate(2**16)
+        symbols, k = RawDecoder().descrambler(stream.symbols, stream.k)
+        np.testing.assert_array_equal(symbols, scramble(stream.symbols, stream.k))
+        np.testing.assert_array_equal(scramble(symbols, stream.k), stream.symbols)
+
+    def test_ptm_ground_truth(self):
+        # PTM TLPs extracted by the software model match the generated ones (loaded link).
+        for load in [0.5, 1.0]:
+            stream     = SymbolGenerator(seed=1, load=load, ptm_interval=1024).generate(2**18)
+            data, ctrl = stream_words(stream)
+            self.assertGreater(len(stream.ptms), 100)
+            self.assertEqual(list(extract_ptm([(data, ctrl)])), stream.ptms)
+
+    def test_symbol_errors(self):
+        # Corrupted PTM TLPs are flagged, all the others are extracted.
+        stream     = SymbolGenerator(seed=2, ptm_interval=1024, error_rate=1e-3).generate(2**18)
+        data, ctrl = stream_words(stream)
+        records    = set(extract_ptm([(data, ctrl)]))
+        valid      = [r for r in stream.ptms if r.type is not None]
+        self.assertGreater(len(stream.errors), 0)
+        self.assertLess(len(valid), len(stream.ptms))
+        for record in valid:
+            self.assertIn(record, records)
+
+    def simulate_sniffer(self, stream):
+        data, ctrl = stream_words(stream)
+        dut        = DUT()
+        ptms       = []
+
+        def rx_generator():
+            for d, c in zip(data.tolist(), ctrl.tolist()):
+                yield dut.rx_data.eq(d)
+                yield dut.rx_ctrl.eq(c)
+                yield
+            for i in range(64):
+                yield
+
+        @passive
+        def ptm_checker():
+            source = dut.sniffer.source
+            yield source.ready.eq(1)
+            while True:
+                if (yield source.valid):
+                    ptms.append(((yield source.message_code), (yield source.master_time), (yield source.link_delay)))
+                yield
+
+        run_simulation(dut, {"sniffer": rx_generator(), "sys": ptm_checker()}, clocks={"sys": 10, "sniffer": 10})
+        return ptms
+
+    def check_sniffer_stress(self, min_gap):
+        # Full link load with PTM Response/ResponseD bursts: every PTM TLP is sniffed (in order), with
+        # the Master Time/Link Delay of the ResponseDs.
+        generator = SymbolGenerator(seed=3, load=1.0, min_gap=min_gap, skp_interval=256, ptm_interval=256,
+            ptm_burst=[PTM_RESPONSE, PTM_RESPONSED, PTM_RESPONSED])
+        stream    = generator.generate(2**12)
+        ptms      = self.simulate_sniffer(stream)
+        self.assertGreater(len(stream.ptms), 12)
+        self.assertEqual(len(ptms), len(stream.ptms))
+        for record, (message_code, master_time, link_delay) in zip(stream.ptms, ptms):
+            self.assertEqual(message_code, 0x53)
+            if record.type == PTM_RESPONSED:
+                self.assertEqual((master_time, link_delay), (record.master_time, record.link_delay))
+
+    def test_ptm_sniffer_stress(self):
+        # Packets separated by at least 3 words of Logical Idle.
+        self.check_sniffer_stress(min_gap=12)
+
+    @unittest.expectedFailure
+    def test_ptm_sniffer_stress_back_to_back(self):
+        # Known limitation: TLPAligner only detects END on its 2-word delayed data before returning
+        # to STP search, a TLP starting less than 3 words after the END of the previous packet is
+        # dropped.
+        self.check_sniffer_stress(min_gap=0)
@@ -0,0 +1,204 @@
+import random
+import unittest
+
+import numpy as np
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.events import TimeEventStream, TIME_EVENT_FLUSH_ALIGN
+
+from tools.time_events import TIME_EVENT_TYPE_NONE, TIME_EVENT_TYPE_PAD, TIME_EVENT_TYPE_TIME
+from tools.time_events import TIME_EVENT_TYPE_PTM, TIME_EVENT_TYPE_PPS, TIME_EVENT_FLAG_LOST
+from tools.time_events import TimeEventRing, time_event_dtype, time_event_header
+from tools.time_events import time_event_data, time_event_flags, time_event_sequence, time_event_type
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def ring_records(n, start=0, type=TIME_EVENT_TYPE_PPS):
+    """Records start..start+n-1 (word0 = index)."""
+    records = np.zeros(n, dtype=time_event_dtype)
+    records["word0"]  = np.arange(start, start + n)
+    records["header"] = [time_event_header(start + i, type) for i in range(n)]
+    return records
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, fifo_depth=16, flush_align=TIME_EVENT_FLUSH_ALIGN):
+        self.cd_sys = ClockDomain()
+        self.time   = Signal(64)
+
+        # # #
+
+        # Local Time (8ns increment).
+        self.sync += self.time.eq(self.time + 8)
+
+        # Time Event Stream.
+        self.events = TimeEventStream(
+            clk_domain   = "sys",
+            time         = self.time,
+            sys_clk_freq = 125e6,
+            fifo_depth   = fifo_depth,
+            flush_align  = flush_align,
+            with_csr     = False,
+        )
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestTimeEventStream(unittest.TestCase):
+    def run_events(self, cycles, ptm=[], pps=[], time_period=0, flush_timeout=64, ready=1.0, disable=None, drain=256,
+        flush_align=TIME_EVENT_FLUSH_ALIGN, request_size=None):
+        """Generate PTM/PPS events at the given cycles, return (DMA words, lost).
+
+        With request_size (in bytes), words are only returned by complete DMA requests (as written
+        by the DMA).
+        """
+        dut   = DUT(flush_align=flush_align)
+        prng  = random.Random(0)
+        words = []
+        lost  = []
+
+        def event_generator():
+            yield dut.events.time_period.eq(time_period)
+            yield dut.events.flush_timeout.eq(flush_timeout)
+            yield dut.events.enable.eq(1)
+            for i in range(cycles):
+                if i == disable:
+                    yield dut.events.enable.eq(0)
+                yield dut.events.ptm.valid.eq(i in ptm)
+                yield dut.events.ptm.t1.eq(1000 + i)
+                yield dut.events.ptm.t2.eq(2000 + i)
+                yield dut.events.ptm.t4.eq(3000 + i)
+                yield dut.events.ptm.link_delay.eq(i)
+                yield dut.events.pps.valid.eq(i in pps)
+                yield dut.events.pps.timestamp.eq(4000 + i)
+                yield
+            for i in range(drain):
+                yield
+            lost.append((yield dut.events.lost))
+
+        @passive
+        def dma_generator():
+            request = []
+            while True:
+                yield dut.events.source.ready.eq(prng.random() < ready)
+                yield
+                if (yield dut.events.source.valid) & (yield dut.events.source.ready):
+                    request.append((yield dut.events.source.data))
+                if len(request) >= (1 if request_size is None else request_size//8):
+                    words.extend(request)
+                    request.clear()
+
+        run_simulation(dut, {"sys": [event_generator(), dma_generator()]}, clocks={"sys": 10, "time": 10})
+        return words, lost[0]
+
+    def dma_ring(self, words, nrecords=64):
+        """Write the DMA words to a (cleared) ring, return the ring consumer."""
+        ring = np.zeros(nrecords*4, dtype="<u8")
+        for n, word in enumerate(words):
+            ring[n % len(ring)] = word
+        return TimeEventRing(ring.tobytes())
+
+    def test_time_events(self):
+        ptm = [100, 400]
+        pps = [100, 250]
+        words, lost = self.run_events(cycles=600, ptm=ptm, pps=pps)
+        self.assertEqual(lost, 0)
+        ring    = self.dma_ring(words)
+        records = ring.poll()
+        # Records padded to complete DMA requests (16 records) after each burst of events.
+        self.assertEqual(len(words), 4*len(records))
+        self.assertEqual(len(records) % 16, 0)
+        np.testing.assert_array_equal(time_event_sequence(records), np.arange(len(records)))
+        events = ring.records[:len(records)]
+        events = events[time_event_type(events) != TIME_EVENT_TYPE_PAD]
+        # Simultaneous events: PTM first.
+        self.assertEqual(list(time_event_type(events)), [TIME_EVENT_TYPE_PTM, TIME_EVENT_TYPE_PPS, TIME_EVENT_TYPE_PPS, TIME_EVENT_TYPE_PTM])
+        ptm_events = events[time_event_type(events) == TIME_EVENT_TYPE_PTM]
+        self.assertEqual(list(ptm_events["word0"]), [1000 + c for c in ptm])
+        self.assertEqual(list(ptm_events["word1"]), [2000 + c for c in ptm])
+        self.assertEqual(list(ptm_events["word2"]), [3000 + c for c in ptm])
+        self.assertEqual(list(time_event_data(ptm_events)), ptm)
+        pps_events = events[time_event_type(events) == TIME_EVENT_TYPE_PPS]
+        self.assertEqual(list(pps_events["word0"]), [4000 + c for c in pps])
+        self.assertTrue(np.all(time_event_flags(events) == 0))
+        self.assertEqual(len(ring.poll()), 0)
+
+    def test_time_events_period(self):
+        words, lost = self.run_events(cycles=1000, time_period=100, flush_timeout=2**32 - 1, drain=0)
+        ring   = self.dma_ring(words)
+        events = ring.events()
+        self.assertEqual(list(time_event_type(events)), [TIME_EVENT_TYPE_TIME]*10)
+        # Records 100 sys_clk cycles apart (Time resynchronized to sys_clk, +-2 cycles).
+        np.testing.assert_array_equal(np.diff(events["word1"].astype(np.int64)), 100)
+        self.assertLessEqual(np.max(np.abs(np.diff(events["word0"].astype(np.int64)) - 800)), 16)
+
+    def test_time_events_disable(self):
+        # Disabling pads the stream (no flush timeout) and restarts the sequence.
+        words, _ = self.run_events(cycles=400, ptm=[10, 300], flush_timeout=2**32 - 1, disable=100)
+        ring    = self.dma_ring(words)
+        records = ring.poll()
+        self.assertEqual(len(records), 16)
+        self.assertEqual(len(words), 4*16)
+        self.assertEqual(list(time_event_type(records[:2])), [TIME_EVENT_TYPE_PTM, TIME_EVENT_TYPE_PAD])
+
+    def test_time_events_flush(self):
+        # Events reach the host with 512-byte DMA requests (maximum Max Payload Size) after the
+        # flush timeout, not with a stream only padded to 256 bytes.
+        for flush_align, n in [(TIME_EVENT_FLUSH_ALIGN, 3), (TIME_EVENT_FLUSH_ALIGN//2, 2)]:
+            with self.subTest(flush_align=flush_align):
+                words, _ = self.run_events(cycles=600, ptm=[10, 300], pps=[500], flush_align=flush_align, request_size=512)
+                ring = self.dma_ring(words)
+                self.assertEqual(len(ring.events()), n)
+
+    def test_time_events_lost(self):
+        # DMA stalled: pending events overwritten are lost and flagged.
+        pps = list(range(100, 400, 4))
+        words, lost = self.run_events(cycles=600, pps=pps, ready=0.05, drain=8000)
+        self.assertGreater(lost, 0)
+        ring   = self.dma_ring(words, nrecords=1024)
+        events = ring.events()
+        self.assertEqual(len(events) + lost, len(pps))
+        self.assertTrue(np.any(time_event_flags(events) & TIME_EVENT_FLAG_LOST))
+        self.assertTrue(np.all(np.diff(events["word0"].astype(np.int64)) > 0))
+
+class TestTimeEventRing(unittest.TestCase):
+    def test_time_event_ring(self):
+        ring = np.zeros(16, dtype=time_event_dtype)
+        consumer = TimeEventRing(ring)
+        self.assertEqual(len(consumer.poll()), 0)
+
+        # New records, consumed in place (views of the ring).
+        ring[0:5] = ring_records(5)
+        records = consumer.poll()
+        self.assertEqual(list(records["word0"]), list(range(5)))
+        self.assertTrue(np.shares_memory(records, ring))
+        self.assertEqual(len(consumer.poll()), 0)
+
+        # Ring wrap: contiguous views up to the end of the ring.
+        ring[5:16] = ring_records(11, start=5)
+        ring[0:3]  = ring_records(3, start=16)
+        self.assertEqual(list(consumer.poll(max_records=4)["word0"]), [5, 6, 7, 8])
+        self.assertEqual(list(consumer.poll()["word0"]), list(range(9, 16)))
+        self.assertEqual(list(consumer.poll()["word0"]), [16, 17, 18])
+        # Records of the previous lap are not new records.
+        self.assertEqual(len(consumer.poll()), 0)
+        self.assertEqual(consumer.lost, 0)
+
+        # Overrun: records of a later lap, the overwritten records are skipped/counted.
+        ring[:] = ring_records(16, start=32)
+        ring[3:8] = ring_records(5, start=35)
+        records = consumer.poll()
+        self.assertEqual(consumer.lost, 16)
+        self.assertEqual(list(records["word0"]), list(range(35, 48)))
+
+        # PAD records are filtered by events.
+        ring[0:4] = ring_records(4, start=48, type=TIME_EVENT_TYPE_PAD)
+        ring[0]["header"] = time_event_header(48, TIME_EVENT_TYPE_PTM, data=0xe1)
+        events = consumer.events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(time_event_data(events)[0], 0xe1)
+        self.assertEqual(time_event_type(events)[0], TIME_EVENT_TYPE_PTM)
+        self.assertNotIn(TIME_EVENT_TYPE_NONE, time_event_type(events))
@@ -0,0 +1,116 @@
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from gateware.time import TimeGenerator, time_increment, TIME_INCREMENT_FRAC_BITS
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, clk_freq):
+        self.cd_sys = ClockDomain()
+
+        # # #
+
+        self.time_generator = TimeGenerator(clk_domain="sys", clk_freq=clk_freq)
+
+# Test ---------------------------------------------------------------------------------------------
+
+class TestTimeGenerator(unittest.TestCase):
+    def run_time_generator(self, clk_freq, increments, offsets={}, cycles=256):
+        """Run TimeGenerator, updating increment/offset (through CSR) at given cycles; return time samples."""
+        dut     = DUT(clk_freq)
+        samples = []
+
+        def generator():
+            for i in range(cycles):
+                if i in increments:
+                    yield from dut.time_generator._increment.write(increments[i])
+                elif i in offsets:
+                    yield from dut.time_generator._offset.write(offsets[i] & (2**64 - 1))
+                else:
+                    yield
+                samples.append((yield dut.time_generator.time))
+
+        run_simulation(dut, {"sys": generator()}, clocks={"sys": 10, "time": 10})
+        return samples
+
+    def test_time_increment(self):
+        self.assertEqual(time_increment(50e6),     20 << TIME_INCREMENT_FRAC_BITS)
+        self.assertEqual(time_increment(156.25e6), int(6.4*2**TIME_INCREMENT_FRAC_BITS))
+        # Sub-ppb resolution.
+        self.assertLess(1/time_increment(50e6), 1e-9)
+        self.assertNotEqual(time_increment(50e6, ppb=0.1), time_increment(50e6))
+
+    def test_time_generator_integer(self):
+        # 50MHz: 20ns per cycle, as the previous integer TimeGenerator.
+        samples = self.run_time_generator(50e6, increments={})
+        diffs   = [t1 - t0 for t0, t1 in zip(samples[:-1], samples[1:]) if t0 != 0]
+        self.assertEqual(set(diffs), {20})
+
+    def test_time_generator_fractional(self):
+        # 156.25MHz: 6.4ns per cycle, accumulated without drift.
+        samples = self.run_time_generator(156.25e6, increments={})
+        start   = [i for i, t in enumerate(samples) if t != 0][0] - 1
+        for n in range(start, len(samples)):
+            expected = ((n - start)*time_increment(156.25e6)) >> TIME_INCREMENT_FRAC_BITS
+            self.assertEqual(samples[n], expected)
+
+    def test_time_generator_adjust(self):
+        # +1% then -1% rate adjustment: time slews at the programmed rate (no step).
+        fast    = time_increment(50e6, ppb=+1e7)
+        slow    = time_increment(50e6, ppb=-1e7)
+        samples = self.run_time_generator(50e6, increments={32: fast, 128: slow}, cycles=256)
+        diffs   = [t1 - t0 for t0, t1 in zip(samples[:-1], samples[1:])]
+        for d in diffs:
+            self.assertIn(d, [0, 19, 20, 21])
+        # Time elapsed over a window matches the programmed increment (+-1ns truncation).
+        for a, b, increment in [(64, 128, fast), (160, 255, slow)]:
+            expected = (b - a)*increment/2**TIME_INCREMENT_FRAC_BITS
+            self.assertLessEqual(abs((samples[b] - samples[a]) - expected), 1)
+        self.assertGreater(samples[128] - samples[64], 64*20)
+        self.assertLess(samples[255] - samples[160], 95*20)
+
+    def test_time_generator_offset(self):
+        # Positive/Negative offsets added atomically: a single step of exactly offset, no lost increment.
+        offsets = {32: +2**40, 96: -500, 160: -2**39}
+        samples = self.run_time_generator(50e6, increments={}, offsets=offsets, cycles=256)
+        diffs   = [t1 - t0 for t0, t1 in zip(samples[:-1], samples[1:]) if t0 != 0]
+        steps   = [d - 20 for d in diffs if d != 20]
+        self.assertEqual(steps, [+2**40, -500, -2**39])
+        self.assertEqual(samples[-1], 20*(len(diffs) + 1) + sum(offsets.values()))
+
+    def test_time_generator_snapshot(self):
+        # Reading the LSB word latches the MSB word: coherent 64-bit Time across 32-bit carries.
+        dut       = DUT(50e6)
+        snapshots = []
+
+        def generator():
+            tg = dut.time_generator
+            yield from tg._write_time.write(2**32 - 20*64)
+            yield from tg._control.write(0b101) # Enable + Write.
+            for i in range(16):
+                yield
+            for i in range(32):
+                # LSB read (Latches MSB).
+                lsb = (yield tg._snapshot.status) & 0xffffffff
+                now = (yield tg.time)
+                yield tg._snapshot.we.eq(1)
+                yield
+                yield tg._snapshot.we.eq(0)
+                # MSB read, a few cycles later.
+                for j in range(4):
+                    yield
+                msb = (yield tg._snapshot.status) >> 32
+                snapshots.append(((msb << 32) | lsb, now))
+
+        run_simulation(dut, {"sys": generator()}, clocks={"sys": 10, "time": 10})
+        values = [value for value, now in snapshots]
+        self.assertEqual(values, sorted(values))
+        self.assertTrue(any(v < 2**32 for v in values) and any(v >= 2**32 for v in values))
+        # CDC latency compensated: Snapshot within 2 increments of Time (never off by a 32-bit carry).
+        for value, now in snapshots:
+            self.assertLessEqual(abs(now - value), 20*2)
+        self.assertLess(abs(sum(now - value for value, now in snapshots)/len(snapshots)), 20)
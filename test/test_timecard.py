@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from litex.soc.integration.builder import Builder
+
+from litex.tools.litex_server import RemoteServer
+
+from tools.timecard import TimeCardClient
+
+from ocp_tap_timecard import BaseSoC
+
+from test.timecard_models import csr_csv, PTMRequesterComm, PTMSchedulerComm
+
+class TestTimeCard(unittest.TestCase):
+    def run_client(self, comm, fn):
+        server = RemoteServer(comm, "127.0.0.1", bind_port=0)
+        server.open()
+        server.start(1)
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "csr.csv")
+            with open(filename, "w") as f:
+                f.write(csr_csv)
+            with TimeCardClient(port=server.socket.getsockname()[1], csr_csv=filename) as client:
+                r = fn(client)
+        server.close()
+        return r
+
+    def test_ptm_request(self):
+        comm = PTMRequesterComm()
+        def fn(client):
+            block = client.block("ptm_requester")
+            self.assertEqual((block.base, block.length), (0x3000, 11))
+            return client.ptm_request()
+        sample = self.run_client(comm, fn)
+        self.assertTrue(sample.valid)
+        self.assertEqual(sample.t1, 0x1_23450000)
+        self.assertEqual(sample.t2, 0x1_23456789)
+        self.assertEqual(sample.t3, 0x1_23456789 + 0xe1)
+        self.assertEqual(sample.t4, 0x1_2345f000)
+        # Trigger pipelined with block read, block re-read while busy.
+        self.assertEqual(comm.writes,       1)
+        self.assertEqual(comm.status_reads, 2)
+
+    def test_ptm_scheduler_samples(self):
+        samples = [(0x1_0000_0000 + n*1000, 0x2_0000_0000 + n*1000, 0x1_0000_0200 + n*1000, 0xe1, n != 2)
+            for n in range(10)]
+        comm = PTMSchedulerComm(samples)
+        received, overflows = self.run_client(comm, lambda client: client.ptm_scheduler_samples(max_samples=8))
+        self.assertEqual(overflows, 3)
+        self.assertEqual(len(received), 8)
+        self.assertEqual(len(comm.samples), 2)
+        for sample, (t1, t2, t4, link_delay, completed) in zip(received, samples):
+            self.assertEqual((sample.t1, sample.t2, sample.t4, sample.link_delay, sample.valid),
+                (t1, t2, t4, link_delay, completed))
+
+    def test_time_adjust(self):
+        comm = PTMRequesterComm()
+        def fn(client):
+            client.write_increment(0x8_00000001)
+            increment = client.read_increment()
+            client.adjust_time(-5)
+            return increment
+        self.assertEqual(self.run_client(comm, fn), 0x8_00000001)
+        # MSB word first (registers applied on LSB write), offset in two's complement.
+        self.assertEqual(comm.writes, 2)
+        self.assertEqual((comm.mem[0x5014], comm.mem[0x5018]), (0x00000008, 0x00000001))
+        self.assertEqual((comm.mem[0x501c], comm.mem[0x5020]), (0xffffffff, 0xfffffffb))
+
+    def test_soc_blocks(self):
+        # CSR blocks of the real SoC's CSR map: each block only covers the registers of its own CSR
+        # region (ex: PTM Requester block not extended to the other ptm_requester* modules).
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "csr.csv")
+            builder  = Builder(BaseSoC(), output_dir=d, csr_csv=filename,
+                compile_software = False,
+                compile_gateware = False,
+            )
+            builder.build(run=False)
+            client = TimeCardClient(csr_csv=filename)
+        block = client.block("ptm_requester")
+        self.assertEqual(block.base, client.bus.bases.ptm_requester)
+        self.assertEqual(set(block.regs), {"control", "status", "phy_tx_delay", "phy_rx_delay",
+            "master_time", "link_delay", "t1_time", "t4_time"})
+        self.assertEqual(block.length, 11)
+        for prefix in ["ptm_requester", "ptm_scheduler", "ptm_statistics", "time_generator", "pps_timestamper"]:
+            block = client.block(prefix)
+            for name, reg in client.bus.regs.d.items():
+                self.assertEqual(name in [prefix + "_" + n for n in block.regs],
+                    block.base <= reg.addr < block.base + 4*block.length, name)
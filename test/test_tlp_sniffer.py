@@ -1,3 +1,4 @@
+import os
 import unittest
 import random
 
@@ -7,22 +8,49 @@ from litex.gen import *
 
 from litex.soc.interconnect import stream
 
-from test.dumps.dump_ptm_response001 import *
+from tools.dump import load_dump
 
 from litepcie.frontend.ptm.sniffer import TLPAligner, TLPEndiannessSwap, TLPFilterFormater
 
 from litepcie.tlp.depacketizer import LitePCIeTLPDepacketizer
 
-def data_generator(dut, length=4096-1024):
-    valid = dump["ptmtlpaligner_sink_valid"][:length:2]
-    data  = dump["ptmtlpaligner_sink_payload_data"][:length:2]
-    ctrl  = dump["ptmtlpaligner_sink_payload_ctrl"][:length:2]
+from test.captures import list_captures, capture_output_dir, run_captures
+
+def tlp_sniffer_captures():
+    """Captures of the TLPAligner input/output."""
+    return list_captures([f"ptmtlpaligner_{e}_{c}" for e in ["sink", "source"] for c in ["valid", "payload_data", "payload_ctrl"]])
+
+def data_generator(dut, dump, length=2048-512):
+    valid = dump["ptmtlpaligner_sink_valid"][:length]
+    data  = dump["ptmtlpaligner_sink_payload_data"][:length]
+    ctrl  = dump["ptmtlpaligner_sink_payload_ctrl"][:length]
     for valid, data, ctrl in zip(valid, data, ctrl):
         yield dut.sink.valid.eq(valid)
         yield dut.sink.data.eq(data)
         yield dut.sink.ctrl.eq(ctrl)
         yield
 
+@passive
+def data_checker(endpoint, words):
+    while True:
+        if (yield endpoint.valid) and (yield endpoint.ready):
+            words.append(((yield endpoint.data), (yield endpoint.ctrl)))
+        yield
+
+@passive
+def ptm_checker(endpoint, ptms):
+    while True:
+        if (yield endpoint.valid) and (yield endpoint.first):
+            ptms.append((yield endpoint.message_code))
+        yield
+
+def reference_words(dump, length=2048-512):
+    # TLPAligner output captured in hardware.
+    valid = dump["ptmtlpaligner_source_valid"][:length]
+    ready = dump["ptmtlpaligner_source_ready"][:length]
+    data  = dump["ptmtlpaligner_source_payload_data"][:length]
+    ctrl  = dump["ptmtlpaligner_source_payload_ctrl"][:length]
+    return [(int(d), int(c)) for v, r, d, c in zip(valid, ready, data, ctrl) if v and r]
 
 class DUT(LiteXModule):
     def __init__(self):
@@ -53,10 +81,34 @@ class DUT(LiteXModule):
             self.tlp_depacketizer.ptm_source.ready.eq(1),
         ]
 
-class TestTLPSniffer(unittest.TestCase):
-    def test_tlp_sniffer(self):
-        dut        = DUT()
+def simulate_tlp_sniffer(capture):
+    """Simulate DUT on a capture, return (TLPAligner output words, PTM message codes).
+
+    VCD is written to the capture output directory.
+    """
+    output_dir = capture_output_dir("tlp_sniffer", capture)
+    dut        = DUT()
+    words      = []
+    ptms       = []
+    with load_dump(capture) as dump:
         generators = [
-            data_generator(dut),
+            data_generator(dut, dump),
+            data_checker(dut.tlp_aligner.source, words),
+            ptm_checker(dut.tlp_depacketizer.ptm_source, ptms),
         ]
-        run_simulation(dut, generators, vcd_name="test_tlp_sniffer.vcd")
+        run_simulation(dut, generators, vcd_name=os.path.join(output_dir, "test_tlp_sniffer.vcd"))
+    return words, ptms
+
+class TestTLPSniffer(unittest.TestCase):
+    def test_tlp_sniffer(self):
+        captures = tlp_sniffer_captures()
+        self.assertGreater(len(captures), 0)
+        for capture, (words, ptms) in zip(captures, run_captures(simulate_tlp_sniffer, captures)):
+            with self.subTest(capture=os.path.basename(capture)):
+                # Compare Gateware with Hardware capture (TLPAligner output).
+                with load_dump(capture) as dump:
+                    reference = reference_words(dump)
+                self.assertGreater(len(reference), 0)
+                self.assertEqual(words[:len(reference)], reference)
+                # PTM TLPs decoded.
+                self.assertGreater(len(ptms), 0)
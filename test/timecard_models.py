@@ -0,0 +1,102 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from tools.timecard import PTM_CONTROL_TRIGGER, PTM_STATUS_VALID, PTM_STATUS_BUSY
+
+# PTM Requester CSR map (as generated by ocp_tap_timecard.py, csr_data_width=32).
+csr_csv = """\
+constant,config_csr_data_width,32,,
+constant,config_bus_address_width,32,,
+csr_base,ptm_requester,0x00003000,,
+csr_base,ptm_scheduler,0x00004800,,
+csr_base,time_generator,0x00005000,,
+csr_register,ptm_requester_control,0x3000,1,rw
+csr_register,ptm_requester_status,0x3004,1,ro
+csr_register,ptm_requester_phy_tx_delay,0x3008,1,ro
+csr_register,ptm_requester_phy_rx_delay,0x300c,1,ro
+csr_register,ptm_requester_master_time,0x3010,2,ro
+csr_register,ptm_requester_link_delay,0x3018,1,ro
+csr_register,ptm_requester_t1_time,0x301c,2,ro
+csr_register,ptm_requester_t4_time,0x3024,2,ro
+csr_register,ptm_scheduler_control,0x4800,1,rw
+csr_register,ptm_scheduler_period,0x4804,1,rw
+csr_register,ptm_scheduler_level,0x4808,1,ro
+csr_register,ptm_scheduler_overflows,0x480c,1,ro
+csr_register,ptm_scheduler_sample_t1,0x4810,2,ro
+csr_register,ptm_scheduler_sample_t2,0x4818,2,ro
+csr_register,ptm_scheduler_sample_t4,0x4820,2,ro
+csr_register,ptm_scheduler_sample_link_delay,0x4828,1,ro
+csr_register,ptm_scheduler_sample_status,0x482c,1,ro
+csr_register,time_generator_control,0x5000,1,rw
+csr_register,time_generator_read_time,0x5004,2,ro
+csr_register,time_generator_write_time,0x500c,2,rw
+csr_register,time_generator_increment,0x5014,2,rw
+csr_register,time_generator_offset,0x501c,2,rw
+csr_register,time_generator_snapshot,0x5024,2,ro
+"""
+
+class PTMRequesterComm:
+    """Memory-backed PTM Requester: a trigger completes a PTM exchange after a busy status read."""
+    def __init__(self):
+        self.mem          = {}
+        self.writes       = 0
+        self.status_reads = 0
+        self.busy         = 0
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, addr, datas):
+        self.writes += 1
+        for i, data in enumerate(datas):
+            self.mem[addr + 4*i] = data
+        if (addr == 0x3000) and (datas[0] & PTM_CONTROL_TRIGGER):
+            self.busy = 1
+            self.mem.update({
+                0x3010 : 0x00000001, 0x3014 : 0x23456789, # Master Time.
+                0x3018 : 0x000000e1,                      # Link Delay.
+                0x301c : 0x00000001, 0x3020 : 0x23450000, # T1.
+                0x3024 : 0x00000001, 0x3028 : 0x2345f000, # T4.
+            })
+
+    def read(self, addr, length=1, burst="incr"):
+        datas = []
+        for i in range(length):
+            if (addr + 4*i) == 0x3004:
+                self.status_reads += 1
+                datas.append(PTM_STATUS_BUSY if self.busy else PTM_STATUS_VALID)
+                self.busy = max(self.busy - 1, 0)
+            else:
+                datas.append(self.mem.get(addr + 4*i, 0))
+        return datas
+
+class PTMSchedulerComm(PTMRequesterComm):
+    """Memory-backed PTM Scheduler: sample FIFO popped on sample status read."""
+    def __init__(self, samples):
+        PTMRequesterComm.__init__(self)
+        self.samples = list(samples)
+
+    def read(self, addr, length=1, burst="incr"):
+        datas = []
+        for i in range(length):
+            a = addr + 4*i
+            s = self.samples[0] if len(self.samples) else (0, 0, 0, 0, 0)
+            datas.append({
+                0x4808 : len(self.samples),
+                0x480c : 3,
+                0x4810 : s[0] >> 32, 0x4814 : s[0] & 0xffffffff,
+                0x4818 : s[1] >> 32, 0x481c : s[1] & 0xffffffff,
+                0x4820 : s[2] >> 32, 0x4824 : s[2] & 0xffffffff,
+                0x4828 : s[3],
+                0x482c : (len(self.samples) > 0) | (s[4] << 1),
+            }.get(a, 0))
+            if (a == 0x482c) and len(self.samples):
+                self.samples.pop(0)
+        return datas
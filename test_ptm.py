@@ -1,99 +1,86 @@
 #!/usr/bin/env python3
 
-import time
-import vcd
 import argparse
 
-from litex import RemoteClient
-
-# Constants ----------------------------------------------------------------------------------------
-
-PTM_CONTROL_ENABLE  = (1 << 0)
-PTM_CONTROL_TRIGGER = (1 << 1)
-PTM_STATUS_VALID    = (1 << 0)
-PTM_STATUS_BUSY     = (1 << 1)
+from tools.ptm_collector import Board, collect
+from tools.ptm_log       import PTMLogSummary, load_ptm_log, log_to_vcd
 
 # Test ---------------------------------------------------------------------------------------------
 
-def test_ptm(enable=1, loops=16, delay=1e-1, vcd_filename="test_ptm.vcd"):
-    # Create Bus.
-    bus = RemoteClient()
-    bus.open()
-
-    # Parameters.
-    loop = 0
-
-    # Initiate PTM Request and Wait for Response.
-    bus.regs.ptm_requester_control.write(enable * PTM_CONTROL_ENABLE | PTM_CONTROL_TRIGGER)
-    while (bus.regs.ptm_requester_status.read() & PTM_STATUS_BUSY):
-        pass
-
-    # VCD Writer.
-    vcd_writer = vcd.VCDWriter(open(vcd_filename, "w"), timescale="1 ns", date="today")
-    vcd_vars = {}
-    vcd_vars["t1"]    = vcd_writer.register_var("module", "t1",    "real", size=64)
-    vcd_vars["t2"]    = vcd_writer.register_var("module", "t2",    "real", size=64)
-    vcd_vars["t3"]    = vcd_writer.register_var("module", "t3",    "real", size=64)
-    vcd_vars["t4"]    = vcd_writer.register_var("module", "t4",    "real", size=64)
-    vcd_vars["t2-t1"] = vcd_writer.register_var("module", "t2-t1", "real", size=64)
-    vcd_vars["t4-t1"] = vcd_writer.register_var("module", "t4-t1", "real", size=64)
-    # Read Master Time received by PTM Requester.
-    t_start = time.time()
-    while loop < loops:
-        # Time.
-        t_s  = (time.time() - t_start)
-        t_ns = t_s*1e9
-
-        # Loop Delay.
-        if t_s < (loop*delay):
-            continue
-
-        # Initiate PTM Request and Wait for Response.
-        bus.regs.ptm_requester_control.write(enable * PTM_CONTROL_ENABLE | PTM_CONTROL_TRIGGER)
-        while (bus.regs.ptm_requester_status.read() & PTM_STATUS_BUSY):
-            pass
-
-        # Latch FPGA registers.
-        valid          = bus.regs.ptm_requester_status.read() & PTM_STATUS_VALID
-        master_time_ns = bus.regs.ptm_requester_master_time.read()
-        link_delay_ns  = bus.regs.ptm_requester_link_delay.read()
-        t2_ns = master_time_ns
-        t3_ns = master_time_ns + link_delay_ns
-        t1_ns = bus.regs.ptm_requester_t1_time.read()
-        t4_ns = bus.regs.ptm_requester_t4_time.read()
-        if loop > 0:
-            vcd_writer.change(vcd_vars["t1"],    t_ns, t1_ns)
-            vcd_writer.change(vcd_vars["t2"],    t_ns, t2_ns)
-            vcd_writer.change(vcd_vars["t3"],    t_ns, t3_ns)
-            vcd_writer.change(vcd_vars["t4"],    t_ns, t4_ns)
-            vcd_writer.change(vcd_vars["t2-t1"], t_ns, t2_ns - t1_ns)
-            vcd_writer.change(vcd_vars["t4-t1"], t_ns, t4_ns - t1_ns)
-        r =  f"valid : {valid} "
-        r += f"t2    (s): {t2_ns/1e9:.9f} "
-        r += f"t3    (s): {t3_ns/1e9:.9f} "
-        r += f"t1    (s): {t1_ns/1e9:.9f} "
-        r += f"t4    (s): {t4_ns/1e9:.9f} "
-        r += f"t2-t1 (s): {(t2_ns - t1_ns)/1e9:.9f} "
-        r += f"t4-t1 (s): {(t4_ns - t1_ns)/1e9:.9f} "
-        print(r)
-
-        # Increment Loop.
-        loop += 1
-
-    # Close Bus.
-    bus.close()
+def print_sample(board, sample, host_time, lateness):
+    r =  f"[{board}] "
+    r += f"valid : {sample.valid:d} "
+    r += f"t2    (s): {sample.t2/1e9:.9f} "
+    r += f"t3    (s): {sample.t3/1e9:.9f} "
+    r += f"t1    (s): {sample.t1/1e9:.9f} "
+    r += f"t4    (s): {sample.t4/1e9:.9f} "
+    r += f"t2-t1 (s): {(sample.t2 - sample.t1)/1e9:.9f} "
+    r += f"t4-t1 (s): {(sample.t4 - sample.t1)/1e9:.9f} "
+    r += f"late (us): {lateness/1e3:.1f}"
+    print(r)
+
+def test_ptm(enable=1, loops=16, delay=1e-1, boards=None, log_prefix="test_ptm", max_bytes=256*2**20, vcd_filename=None, verbose=False, csr_csv=None):
+    # Boards (one litex_server endpoint per TimeCard).
+    boards = [Board(csr_csv=csr_csv)] if boards is None else boards
+
+    # Collect PTM samples of all the boards on a common schedule (host sleeping between samples),
+    # recorded to a binary PTM log (see tools.ptm_log).
+    stats, files = collect(boards, delay,
+        log_prefix = log_prefix,
+        max_bytes  = max_bytes,
+        metadata   = {"enable": enable},
+        count      = loops,
+        enable     = enable,
+        callback   = print_sample if verbose else None,
+    )
+
+    # Report Sample Rate/Schedule.
+    for n, (board, board_stats) in enumerate(zip(boards, stats)):
+        print(f"[{n}] {board}: {board_stats}")
+
+    # Report Summary/Convert to VCD.
+    if files:
+        with load_ptm_log(files) as ptm_log: # Files of this run only.
+            summaries = [PTMLogSummary() for board in boards]
+            for chunk in ptm_log.chunks():
+                for n, summary in enumerate(summaries):
+                    summary.update(chunk[chunk["board"] == n])
+            for n, summary in enumerate(summaries):
+                print(f"[{n}] t2-t1      (ns): {summary.total['t2-t1']}")
+                print(f"[{n}] link_delay (ns): {summary.total['link_delay']}")
+            if vcd_filename is not None:
+                log_to_vcd(ptm_log, vcd_filename)
 
 # Run ----------------------------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--enable", default=1,    type=int,   help="PTM Enable.")
-    parser.add_argument("--loops",  default=100,  type=int,   help="Test Loops.")
-    parser.add_argument("--delay",  default=1e-1, type=float, help="Loop delay.")
-    parser.add_argument("--vcd",    default="test_ptm.vcd",   help="VCD dump file")
+    parser.add_argument("--enable",    default=1,          type=int,     help="PTM Enable.")
+    parser.add_argument("--loops",     default=100,        type=int,     help="Test Loops (samples per board).")
+    parser.add_argument("--delay",     default=1e-1,       type=float,   help="Loop delay (0 for max sample rate).")
+    parser.add_argument("--board",     default=None,       action="append", help="Board endpoint (host[:port[:csr_csv]], repeat for several boards).")
+    parser.add_argument("--log",       default="test_ptm",               help="PTM log prefix (<log>.<index>.ptmlog files).")
+    parser.add_argument("--max-bytes", default=256*2**20,  type=int,     help="PTM log file rotation size.")
+    parser.add_argument("--vcd",       default=None,                     help="VCD dump file (converted from the PTM log).")
+    parser.add_argument("--verbose",   action="store_true",              help="Print each PTM sample.")
+    parser.add_argument("--csr-csv",   default="csr.csv",                help="CSR configuration file")
     args = parser.parse_args()
 
-    test_ptm(enable=args.enable, loops=args.loops, delay=args.delay, vcd_filename=args.vcd)
+    boards = None
+    if args.board is not None:
+        boards = [Board.parse(board, csr_csv=args.csr_csv) for board in args.board]
+
+    test_ptm(
+        enable       = args.enable,
+        loops        = args.loops,
+        delay        = args.delay,
+        boards       = boards,
+        log_prefix   = args.log,
+        max_bytes    = args.max_bytes,
+        vcd_filename = args.vcd,
+        verbose      = args.verbose,
+        csr_csv      = args.csr_csv,
+    )
 
 if __name__ == "__main__":
     main()
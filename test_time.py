@@ -3,68 +3,57 @@
 import time
 import argparse
 
-from litex import RemoteClient
-
-# Constants ----------------------------------------------------------------------------------------
-
-TIME_CONTROL_ENABLE = (1 << 0)
-TIME_CONTROL_READ   = (1 << 1)
-TIME_CONTROL_WRITE  = (1 << 2)
+from tools.timecard import TimeCardClient, SampleRate
 
 # Test Time ----------------------------------------------------------------------------------------
 
-def test_time(enable=1, loops=16):
-    # Create Bus.
-    bus = RemoteClient()
-    bus.open()
-
-    # Parameters.
-    loop = 0
-
-    # Configure Time Controller.
-
-    bus.regs.time_generator_control.write(enable * TIME_CONTROL_ENABLE | TIME_CONTROL_READ)
+def test_time(enable=1, loops=16, delay=1, csr_csv=None):
+    # Create Client.
+    client = TimeCardClient(csr_csv=csr_csv)
+    client.open()
 
     # Read Time from Time Controller.
     print("Read Time from Time Controller...")
+    rate = SampleRate()
     loop = 0
     while loop < loops:
-        r =   f"time (s): {bus.regs.time_generator_read_time.read()/1e9:0.9f} "
+        r =   f"time (s): {client.read_time(enable=enable)/1e9:0.9f} "
         print(r)
+        rate.update()
         loop += 1
-        bus.regs.time_generator_control.write(enable * TIME_CONTROL_ENABLE | TIME_CONTROL_READ)
-        time.sleep(1)
-
+        time.sleep(delay)
+    print(rate)
 
     # Override Time.
     print("Override Time to 100s...")
-    bus.regs.time_generator_override_time.write(int(100*1e9))
-    bus.regs.time_generator_control.write(enable * TIME_CONTROL_ENABLE | TIME_CONTROL_WRITE)
-    bus.regs.time_generator_control.write(enable * TIME_CONTROL_ENABLE | TIME_CONTROL_READ)
+    client.write_time(int(100*1e9), enable=enable)
 
     # Read Time from Time Controller.
     print("Read Time from Time Controller...")
+    rate = SampleRate()
     loop = 0
     while loop < loops:
-        r =  f"time (s): {bus.regs.time_generator_time.read()/1e9:0.9f} "
+        r =  f"time (s): {client.read_time(enable=enable)/1e9:0.9f} "
         print(r)
+        rate.update()
         loop += 1
-        bus.regs.time_generator_control.write(enable * TIME_CONTROL_ENABLE | TIME_CONTROL_READ)
-        time.sleep(1)
-
+        time.sleep(delay)
+    print(rate)
 
-    # Close Bus.
-    bus.close()
+    # Close Client.
+    client.close()
 
 # Run ----------------------------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--enable", default=1, type=int, help="PTM Enable.")
-    parser.add_argument("--loops",  default=8, type=int, help="Test Loops.")
+    parser.add_argument("--enable",  default=1, type=int,   help="PTM Enable.")
+    parser.add_argument("--loops",   default=8, type=int,   help="Test Loops.")
+    parser.add_argument("--delay",   default=1, type=float, help="Loop delay (0 for max sample rate).")
+    parser.add_argument("--csr-csv", default="csr.csv",     help="CSR configuration file")
     args = parser.parse_args()
 
-    test_time(enable=args.enable, loops=args.loops)
+    test_time(enable=args.enable, loops=args.loops, delay=args.delay, csr_csv=args.csr_csv)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import re
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+# Allan/Time Deviation Analysis: overlapping Allan (ADEV), modified Allan (MDEV) and time (TDEV)
+# deviations of a phase (time error) series sampled every tau0, as used to qualify the TimeCard
+# Time vs the PTM Master Time (PTM logs/samples) or vs an external reference (PPS timestamps).
+#
+# Deviations are computed with vectorized algorithms on the whole series (no per-sample Python
+# loop): second differences of the phase for ADEV and differences of the phase cumulative sum for
+# MDEV/TDEV (the inner m-sample sums being S[i + m] - S[i]). Each tau is processed in cache-sized
+# blocks without large temporaries, so 10^8 samples are analyzed in seconds (about 0.5s/tau on a
+# single core) with about 2x the series in memory.
+
+# Phase Series -------------------------------------------------------------------------------------
+
+PhaseSeries = namedtuple("PhaseSeries", ["x", "tau0", "gaps"])
+
+def phase_series(t, x, tau0=None):
+    """Resample a phase series x (ns) taken at times t (ns) on a uniform tau0 (s) grid.
+
+    tau0 defaults to the median sampling interval. Missing samples (dropped/invalid exchanges) are
+    linearly interpolated and counted in gaps.
+    """
+    t = np.asarray(t, dtype=np.int64)
+    x = np.asarray(x, dtype=np.float64)
+    if len(t) < 2:
+        raise ValueError("At least 2 samples required.")
+    if tau0 is None:
+        tau0 = float(np.median(np.diff(t[:2**20])))*1e-9
+    if tau0 <= 0:
+        raise ValueError("Sample times not increasing, unable to deduce tau0.")
+    index = np.rint((t - t[0])/(tau0*1e9)).astype(np.int64)
+    n     = int(index[-1]) + 1
+    if n == len(x) and np.all(np.diff(index) == 1):
+        return PhaseSeries(x=x, tau0=tau0, gaps=0)
+    index, first = np.unique(index, return_index=True) # Samples on the same grid point: keep first.
+    return PhaseSeries(x=np.interp(np.arange(n), index, x[first]), tau0=tau0, gaps=n - len(index))
+
+# Phase Sources ------------------------------------------------------------------------------------
+
+def ptm_phase(t1, t2, t4, link_delay, valid=None, tau0=None):
+    """PhaseSeries of the Local - Master Time offset of PTM samples (see ptm_servo.ptm_exchanges)."""
+    from tools.ptm_servo import ptm_exchanges
+    exchanges = ptm_exchanges(t1, t2, t4, link_delay, valid=valid)
+    return phase_series(exchanges.t, exchanges.offset, tau0=tau0)
+
+def load_ptm_log_phase(path, board=0, tau0=None):
+    """PhaseSeries of a PTM log (tools.ptm_log, as recorded by test_ptm.py).
+
+    The log is processed chunk by chunk: only the t1/t2/t4/link_delay/valid columns of the board
+    are extracted (to pre-allocated arrays), the records are never loaded in memory.
+    """
+    from tools.ptm_log import PTMLOG_FLAG_VALID, load_ptm_log
+    with load_ptm_log(path) as log:
+        columns = {name: np.empty(len(log), dtype=np.int64) for name in ("t1", "t2", "t4", "link_delay")}
+        valid   = np.empty(len(log), dtype=bool)
+        n       = 0
+        for chunk in log.chunks():
+            select = np.flatnonzero(chunk["board"] == board)
+            for name, column in columns.items():
+                column[n:n + len(select)] = chunk[name][select]
+            valid[n:n + len(select)] = (chunk["flags"][select] & PTMLOG_FLAG_VALID) != 0
+            n += len(select)
+    return ptm_phase(*(columns[name][:n] for name in ("t1", "t2", "t4", "link_delay")), valid=valid[:n], tau0=tau0)
+
+def load_ptm_samples_phase(filename, tau0=None):
+    """PhaseSeries of PTM samples CSV (tools.ptm_servo)."""
+    from tools.ptm_servo import load_samples
+    return ptm_phase(*load_samples(filename), tau0=tau0)
+
+_timestamp_re = re.compile(r"(-?\d+)\.(\d{1,9})\s*$")
+
+def load_pps_phase(filename, tau0=None):
+    """PhaseSeries of PPS timestamps (one "<s>.<ns>" timestamp per line, ex: testptp -e output).
+
+    The phase is the time error of each timestamp vs the nearest second (integer arithmetic, a
+    float64 only has a ~256ns resolution on current Times).
+    """
+    timestamps = []
+    with open(filename) as f:
+        for line in f:
+            m = _timestamp_re.search(line)
+            if m is not None:
+                timestamps.append(int(m.group(1))*10**9 + int(m.group(2).ljust(9, "0")))
+    t = np.array(timestamps, dtype=np.int64)
+    x = (t + 500_000_000) % 1_000_000_000 - 500_000_000
+    return phase_series(t - x, x, tau0=tau0)
+
+def input_format(path):
+    """Detect the format of an input: "ptmlog", "samples" (PTM samples CSV) or "pps"."""
+    from tools.ptm_log import PTMLOG_MAGIC, log_files
+    files = log_files(path)
+    if files:
+        with open(files[0], "rb") as f:
+            if f.read(len(PTMLOG_MAGIC)) == PTMLOG_MAGIC:
+                return "ptmlog"
+    with open(path) as f:
+        return "samples" if f.readline().startswith("# t1,t2,t4") else "pps"
+
+# Deviations ---------------------------------------------------------------------------------------
+
+Deviations = namedtuple("Deviations", ["tau", "m", "adev", "adev_n", "mdev", "mdev_n", "tdev"])
+
+def _sum_squares(a, b, c, d, n, block, k=1.0):
+    """Sum over i in [0, n) of ((a[i] - b[i]) - k*(c[i] - d[i]))**2, evaluated in cache-sized
+    blocks with pre-allocated buffers (no large temporaries)."""
+    u     = np.empty(min(block, n))
+    v     = np.empty(min(block, n))
+    total = 0.0
+    for start in range(0, n, block):
+        stop   = min(start + block, n)
+        uu, vv = u[:stop - start], v[:stop - start]
+        np.subtract(a[start:stop], b[start:stop], out=uu)
+        np.subtract(c[start:stop], d[start:stop], out=vv)
+        if k != 1.0:
+            vv *= k
+        uu -= vv
+        total += np.dot(uu, uu)
+    return total
+
+def adev(x, tau0, m, block=2**15):
+    """Overlapping Allan deviation of phase x (s) at tau = m*tau0, return (adev, terms)."""
+    n = len(x) - 2*m
+    if n < 1:
+        return np.nan, 0
+    # x[i + 2m] - 2x[i + m] + x[i] = (x[i + 2m] - x[i + m]) - (x[i + m] - x[i]).
+    s = _sum_squares(x[2*m:], x[m:], x[m:], x, n, block)
+    return np.sqrt(s/(2*m**2*tau0**2*n)), n
+
+def mdev(x, tau0, m, block=2**15, cumsum=None):
+    """Modified Allan deviation of phase x (s) at tau = m*tau0, return (mdev, terms).
+
+    cumsum (S[0] = 0, S[i + 1] = S[i] + x[i]) can be provided to share it between taus.
+    """
+    n = len(x) - 3*m + 1
+    if n < 1:
+        return np.nan, 0
+    s = np.concatenate([[0.0], np.cumsum(x)]) if cumsum is None else cumsum
+    # Sum over j in [i, i + m) of x[j + 2m] - 2x[j + m] + x[j] = (S[i + 3m] - S[i]) - 3(S[i + 2m] - S[i + m]).
+    return np.sqrt(_sum_squares(s[3*m:], s, s[2*m:], s[m:], n, block, k=3.0)/(2*m**4*tau0**2*n)), n
+
+def tdev(x, tau0, m, **kwargs):
+    """Time deviation of phase x (s) at tau = m*tau0, return (tdev, terms)."""
+    dev, n = mdev(x, tau0, m, **kwargs)
+    return m*tau0*dev/np.sqrt(3), n
+
+def _detrend(x, block=2**22):
+    """Remove the least-squares linear trend of x (in place, in blocks)."""
+    n  = len(x)
+    c  = (n - 1)/2
+    sx = 0.0
+    si = 0.0
+    for start in range(0, n, block):
+        i   = np.arange(start, min(start + block, n)) - c
+        sx += x[start:start + block].sum()
+        si += np.dot(i, x[start:start + block])
+    mean  = sx/n
+    slope = si/(n*(n**2 - 1)/12) if n > 1 else 0.0
+    for start in range(0, n, block):
+        i = np.arange(start, min(start + block, n)) - c
+        x[start:start + block] -= mean + slope*i
+
+def tau_factors(n, taus="octave", max_factor=None):
+    """Return the averaging factors m (tau = m*tau0) for a series of n samples: "octave" (1, 2, 4,
+    ...), "decade" (1, 2, 5, 10, ...) or "all"."""
+    max_factor = (n - 1)//3 if max_factor is None else min(max_factor, (n - 1)//3)
+    if taus == "all":
+        return np.arange(1, max_factor + 1)
+    if taus == "octave":
+        m = 2**np.arange(int(np.log2(max(max_factor, 1))) + 1)
+    elif taus == "decade":
+        m = np.array([k*10**e for e in range(int(np.log10(max(max_factor, 1))) + 1) for k in (1, 2, 5)])
+    else:
+        raise ValueError(f"Unknown taus {taus}.")
+    return m[m <= max_factor]
+
+def deviations(x, tau0, taus="octave", max_factor=None, scale=1.0, copy=True):
+    """Return the ADEV/MDEV/TDEV Deviations of phase x*scale (s) sampled every tau0 (s).
+
+    The phase offset/frequency error (linear phase trend, to which the deviations are insensitive)
+    is removed before the cumulative sum to preserve float64 resolution over long series. Without
+    copy, this is done in place on x (float64 array) to save memory on long series.
+    """
+    x  = np.array(x, dtype=np.float64) if copy else x
+    _detrend(x)
+    x *= scale
+    s  = np.empty(len(x) + 1)
+    s[0] = 0.0
+    np.cumsum(x, out=s[1:])
+    ms = tau_factors(len(x), taus=taus, max_factor=max_factor)
+    results = {name: [] for name in ["adev", "adev_n", "mdev", "mdev_n"]}
+    for m in ms:
+        m = int(m)
+        a, an = adev(x, tau0, m)
+        d, dn = mdev(x, tau0, m, cumsum=s)
+        results["adev"].append(a)
+        results["adev_n"].append(an)
+        results["mdev"].append(d)
+        results["mdev_n"].append(dn)
+    tau   = ms*tau0
+    mdevs = np.array(results["mdev"])
+    return Deviations(
+        tau    = tau,
+        m      = ms,
+        adev   = np.array(results["adev"]),
+        adev_n = np.array(results["adev_n"]),
+        mdev   = mdevs,
+        mdev_n = np.array(results["mdev_n"]),
+        tdev   = tau*mdevs/np.sqrt(3),
+    )
+
+# Output -------------------------------------------------------------------------------------------
+
+def format_deviations(devs):
+    """Return the Deviations as a text table."""
+    lines = [f"{'tau (s)':>12s} {'m':>10s} {'ADEV':>12s} {'MDEV':>12s} {'TDEV (ns)':>12s} {'terms':>10s}"]
+    for tau, m, a, d, t, n in zip(devs.tau, devs.m, devs.adev, devs.mdev, devs.tdev, devs.mdev_n):
+        lines.append(f"{tau:12.6g} {m:10d} {a:12.4e} {d:12.4e} {t*1e9:12.4f} {n:10d}")
+    return "\n".join(lines)
+
+def save_deviations(filename, devs):
+    """Save the Deviations to a CSV file."""
+    np.savetxt(filename, np.stack(devs, axis=1), fmt="%.9g", delimiter=",", header=",".join(Deviations._fields))
+
+def plot_deviations(filename, devs, title=None):
+    """Plot the Deviations (log-log) to filename (requires matplotlib)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    fig, (ax0, ax1) = plt.subplots(1, 2, figsize=(12, 5))
+    ax0.loglog(devs.tau, devs.adev, "o-", label="ADEV")
+    ax0.loglog(devs.tau, devs.mdev, "s-", label="MDEV")
+    ax0.set_xlabel("tau (s)")
+    ax0.set_ylabel("deviation")
+    ax1.loglog(devs.tau, devs.tdev*1e9, "o-", label="TDEV")
+    ax1.set_xlabel("tau (s)")
+    ax1.set_ylabel("TDEV (ns)")
+    for ax in (ax0, ax1):
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend()
+    if title is not None:
+        fig.suptitle(title)
+    fig.tight_layout()
+    fig.savefig(filename)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="ADEV/MDEV/TDEV analysis of PTM logs/samples or PPS timestamps.")
+    parser.add_argument("input",                                    help="PTM log (.ptmlog file or prefix), PTM samples (CSV) or PPS timestamps.")
+    parser.add_argument("--format",     default="auto", choices=["auto", "ptmlog", "samples", "pps"], help="Input format.")
+    parser.add_argument("--board",      default=0,      type=int,   help="Board of the PTM log to analyze.")
+    parser.add_argument("--tau0",       default=None,   type=float, help="Sampling interval (s, default: median interval).")
+    parser.add_argument("--taus",       default="octave", choices=["octave", "decade", "all"], help="Taus.")
+    parser.add_argument("--max-factor", default=None,   type=int,   help="Maximum averaging factor (tau/tau0).")
+    parser.add_argument("--output",     default=None,               help="Deviations output file (CSV).")
+    parser.add_argument("--plot",       default=None,               help="Deviations plot file (ex: adev.png).")
+    args = parser.parse_args()
+
+    # Load phase.
+    fmt = input_format(args.input) if args.format == "auto" else args.format
+    phase = {
+        "ptmlog"  : lambda: load_ptm_log_phase(args.input, board=args.board, tau0=args.tau0),
+        "samples" : lambda: load_ptm_samples_phase(args.input, tau0=args.tau0),
+        "pps"     : lambda: load_pps_phase(args.input, tau0=args.tau0),
+    }[fmt]()
+    print(f"{args.input} ({fmt}): {len(phase.x)} samples, tau0 {phase.tau0:.6g}s, {phase.gaps} interpolated.")
+
+    # Compute/Report deviations.
+    devs = deviations(phase.x, phase.tau0, scale=1e-9, copy=False, taus=args.taus, max_factor=args.max_factor)
+    print(format_deviations(devs))
+    if args.output is not None:
+        save_deviations(args.output, devs)
+    if args.plot is not None:
+        plot_deviations(args.plot, devs, title=args.input)
+
+if __name__ == "__main__":
+    main()
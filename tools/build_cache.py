@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import glob
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import contextlib
+
+# Build Cache --------------------------------------------------------------------------------------
+
+# Content-addressed cache of the FPGA builds: a build is identified by the hash of everything the
+# toolchain consumes (generated Verilog and memory init files, constraints, Vivado project with the
+# pre_optimize/pre_placement commands (ex: PCIe PTM Sniffer post-synthesis rewiring), sources and
+# build parameters) and its outputs (bitstreams, CSR CSV/JSON, generated/driver headers) are stored
+# under <cache>/<hash>/:
+#
+# <cache>/<hash>/build.json    Metadata (build name, date, parameters, build time, stage timings).
+# <cache>/<hash>/<artifact>    Artifacts (files or directories), names chosen by the caller.
+#
+# Generation dates (Verilog comments, build time of the SoC identifier) and the build directory
+# are not hashed: a SoC elaborated again from the same sources and parameters gives the same hash.
+# The cached headers/CSR CSV are restored along with the bitstream so that they keep matching its
+# identifier.
+
+BUILD_CACHE_METADATA = "build.json"
+
+BUILD_TIME_PLACEHOLDER    = b"<build-time>"
+GATEWARE_DIR_PLACEHOLDER  = b"<gateware-dir>"
+
+# Build Timings ------------------------------------------------------------------------------------
+
+class BuildTimings:
+    """Wall-clock duration of the build stages."""
+    def __init__(self):
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    @property
+    def total(self):
+        return sum(duration for _, duration in self.stages)
+
+    def report(self):
+        width = max([len(name) for name, _ in self.stages] + [len("Total")])
+        lines = ["Build timings:"]
+        for name, duration in self.stages + [("Total", self.total)]:
+            lines.append(f"- {name:<{width}} : {duration:8.2f}s")
+        return "\n".join(lines)
+
+# Build Hash ---------------------------------------------------------------------------------------
+
+def soc_build_time(soc):
+    """Return the build time embedded in the SoC identifier (ident_version), None if not present."""
+    identifier = getattr(soc, "identifier", None)
+    if identifier is None:
+        return None
+    ident = bytes(identifier.mem.init).rstrip(b"\x00").decode()
+    match = re.search(r"\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?$", ident)
+    return None if match is None else match.group(0)
+
+def normalize(data, build_time=None, gateware_dir=None, verilog=False):
+    """Remove the generation dates and build directory from a generated file (bytes)."""
+    # Comment lines of the generated Verilog (header/footer with generation dates, module hierarchy
+    # listed in a non-deterministic order).
+    if verilog:
+        data = re.sub(rb"(?m)^[ \t]*//.*\n?", b"", data)
+    # SoC identifier build time (as text and as memory init file, one hex byte per line).
+    if build_time is not None:
+        data = data.replace(build_time.encode(), BUILD_TIME_PLACEHOLDER)
+        init = "\n".join(f"{c:02x}" for c in build_time.encode()).encode()
+        data = data.replace(init, BUILD_TIME_PLACEHOLDER)
+    # Build directory (absolute paths in the Vivado project).
+    if gateware_dir is not None:
+        data = data.replace(os.path.abspath(gateware_dir).encode(), GATEWARE_DIR_PLACEHOLDER)
+    return data
+
+def build_files(gateware_dir, build_name, sources=None):
+    """Return the sorted (name, path) list of the files consumed by the toolchain: generated
+    Verilog/memory init files, constraints, project/script and sources."""
+    files = {}
+    for ext in [".v", ".xdc", ".tcl"]:
+        files[build_name + ext] = os.path.join(gateware_dir, build_name + ext)
+    for script in glob.glob(os.path.join(gateware_dir, "build_" + build_name + ".*")):
+        files[os.path.basename(script)] = script
+    for init in glob.glob(os.path.join(gateware_dir, "*.init")):
+        files[os.path.basename(init)] = init
+    for source in ([] if sources is None else sources):
+        path = source if os.path.isabs(source) else os.path.join(gateware_dir, source)
+        files.setdefault(os.path.basename(path), path)
+    return sorted((name, path) for name, path in files.items() if os.path.isfile(path))
+
+def build_hash(gateware_dir, build_name, sources=None, params=None, build_time=None):
+    """Return the hash (hex) of a generated build (gateware directory, sources, parameters)."""
+    h = hashlib.sha256()
+    def update(name, data):
+        h.update(f"{name}:{len(data)}:".encode())
+        h.update(data)
+    update("params", json.dumps({} if params is None else params, sort_keys=True, default=str).encode())
+    for name, path in build_files(gateware_dir, build_name, sources):
+        with open(path, "rb") as f:
+            update(name, normalize(f.read(),
+                build_time   = build_time,
+                gateware_dir = gateware_dir,
+                verilog      = (name == build_name + ".v"),
+            ))
+    return h.hexdigest()
+
+# Build Cache --------------------------------------------------------------------------------------
+
+def _copy(src, dst):
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+        shutil.copy2(src, dst)
+
+class BuildCache:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, key, *names):
+        return os.path.join(self.directory, key, *names)
+
+    def __contains__(self, key):
+        return os.path.isfile(self.path(key, BUILD_CACHE_METADATA))
+
+    def metadata(self, key):
+        with open(self.path(key, BUILD_CACHE_METADATA)) as f:
+            return json.load(f)
+
+    def keys(self):
+        """Return the keys of the cached builds, most recently used first."""
+        if not os.path.isdir(self.directory):
+            return []
+        keys = [key for key in os.listdir(self.directory) if key in self]
+        return sorted(keys, key=lambda key: os.path.getmtime(self.path(key, BUILD_CACHE_METADATA)), reverse=True)
+
+    def store(self, key, artifacts, metadata=None):
+        """Store the artifacts ({name: path}, files or directories) of a build (artifacts not
+        generated are skipped). The entry is written to a temporary directory and renamed, so that
+        an interrupted store leaves no entry."""
+        artifacts = {name: path for name, path in artifacts.items() if os.path.exists(path)}
+        tmp = self.path(key + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            for name, path in artifacts.items():
+                _copy(path, os.path.join(tmp, name))
+            metadata = dict({} if metadata is None else metadata,
+                artifacts = sorted(artifacts),
+                date      = time.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            with open(os.path.join(tmp, BUILD_CACHE_METADATA), "w") as f:
+                json.dump(metadata, f, indent=4, sort_keys=True, default=str)
+            shutil.rmtree(self.path(key), ignore_errors=True)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def restore(self, key, artifacts):
+        """Restore the cached artifacts ({name: path}) of a build, return the restored names
+        (artifacts not present in the entry are skipped)."""
+        restored = []
+        for name, path in artifacts.items():
+            if os.path.exists(self.path(key, name)):
+                _copy(self.path(key, name), path)
+                # Restored artifacts are newer than the regenerated sources.
+                if os.path.isfile(path):
+                    os.utime(path)
+                restored.append(name)
+        # Mark entry as recently used.
+        os.utime(self.path(key, BUILD_CACHE_METADATA))
+        return restored
+
+    def clean(self, keep=0):
+        """Remove all the cached builds except the keep most recently used ones, return the removed
+        keys."""
+        removed = self.keys()[keep:]
+        for key in removed:
+            shutil.rmtree(self.path(key))
+        return removed
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="FPGA build cache management.")
+    parser.add_argument("command", choices=["list", "clean"],   help="Command.")
+    parser.add_argument("--cache-dir", default="build/cache",   help="Build cache directory.")
+    parser.add_argument("--keep",      default=0, type=int,     help="Number of (most recently used) builds kept by clean.")
+    args = parser.parse_args()
+
+    cache = BuildCache(args.cache_dir)
+    if args.command == "list":
+        for key in cache.keys():
+            metadata = cache.metadata(key)
+            params   = ", ".join(f"{k}={v}" for k, v in sorted(metadata.get("params", {}).get("soc", {}).items()))
+            print(f"{key[:16]} {metadata['date']} {metadata.get('build_name', '')}: {params}")
+    if args.command == "clean":
+        for key in cache.clean(keep=args.keep):
+            print(f"Removed {key[:16]}.")
+
+if __name__ == "__main__":
+    main()
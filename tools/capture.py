@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from tools.dump import DumpWriter
+
+# Sniffer Capture Format ---------------------------------------------------------------------------
+
+# Records of 64-bit little-endian words streamed by the SnifferCapture (gateware/capture.py) over
+# DMA and written to disk by litepcie_capture (software/user):
+#
+# +----------------------------------------------------------------+
+# | Header 0: magic [31:0], length [47:32], flags [55:48],         |
+# |           dropped records since previous record [63:56]        |
+# | Header 1: index of the first sample (capture clk cycles)       |
+# | Sample 0: channel 0 (RX) [31:0], channel 1 (TX) [63:32]        |
+# | ...                                                            |
+# | Sample length - 1                                              |
+# +----------------------------------------------------------------+
+#
+# Channels are raw sniffer words: data in [15:0], ctl in [17:16]. PAD words (magic [31:0]) flushing
+# partial DMA requests/buffers are inserted between records.
+
+SNIFFER_CAPTURE_MAGIC     = 0x50414353 # "SCAP".
+SNIFFER_CAPTURE_PAD_MAGIC = 0x44415053 # "SPAD".
+
+SNIFFER_CAPTURE_FLAG_TRIGGERED = (1 << 0)
+SNIFFER_CAPTURE_FLAG_TX        = (1 << 1)
+
+SNIFFER_CAPTURE_HEADER_WORDS = 2
+
+RAW_DATA_MASK = 0xffff
+RAW_CTL_SHIFT = 16
+RAW_CTL_MASK  = 0b11
+
+CaptureRecord = namedtuple("CaptureRecord", ["offset", "index", "length", "flags", "dropped", "samples"])
+
+def capture_channel(samples, direction="rx"):
+    """Return the (data, ctrl) arrays of a channel of the samples of a record."""
+    words = (samples >> np.uint64({"rx": 0, "tx": 32}[direction])) & np.uint64(2**32 - 1)
+    return words & np.uint64(RAW_DATA_MASK), (words >> np.uint64(RAW_CTL_SHIFT)) & np.uint64(RAW_CTL_MASK)
+
+def is_sniffer_capture(filename):
+    """Return True if the file starts with a Sniffer Capture record (or PAD word)."""
+    with open(filename, "rb") as f:
+        header = f.read(8)
+    if len(header) < 8:
+        return False
+    header = int.from_bytes(header, "little")
+    return (header & (2**32 - 1)) == SNIFFER_CAPTURE_MAGIC or header == SNIFFER_CAPTURE_PAD_MAGIC
+
+# Sniffer Capture Reader ---------------------------------------------------------------------------
+
+class SnifferCapture:
+    """Sniffer Capture file reader.
+
+    The file is memory-mapped and records are decoded one at a time. PAD words are ignored. Data that
+    does not start with a record header (ex: capture started/stopped mid-record) is skipped until the
+    next header and counted in skipped (words); a record truncated at the end of the file is ignored
+    (truncated).
+    """
+    def __init__(self, filename):
+        self.filename  = filename
+        self.skipped   = 0
+        self.truncated = False
+        size = os.path.getsize(filename)//8
+        self.words = np.memmap(filename, dtype="<u8", mode="r", shape=(size,)) if size else np.zeros(0, dtype="<u8")
+
+    def _resync(self, offset, chunk_size=2**20):
+        """Return the offset of the next record header or PAD word (len(words) if none)."""
+        while offset < len(self.words):
+            chunk   = self.words[offset:offset + chunk_size]
+            magic   = chunk & np.uint64(2**32 - 1)
+            matches = np.flatnonzero((magic == SNIFFER_CAPTURE_MAGIC) | (chunk == SNIFFER_CAPTURE_PAD_MAGIC))
+            if len(matches):
+                return offset + int(matches[0])
+            offset += len(chunk)
+        return len(self.words)
+
+    def records(self):
+        """Yield the CaptureRecords of the capture."""
+        self.skipped   = 0
+        self.truncated = False
+        offset = 0
+        while offset < len(self.words):
+            header = int(self.words[offset])
+            if header == SNIFFER_CAPTURE_PAD_MAGIC:
+                offset += 1
+                continue
+            if (header & (2**32 - 1)) != SNIFFER_CAPTURE_MAGIC:
+                start  = offset
+                offset = self._resync(offset + 1)
+                self.skipped += offset - start
+                continue
+            length = (header >> 32) & 0xffff
+            end    = offset + SNIFFER_CAPTURE_HEADER_WORDS + length
+            if end > len(self.words):
+                self.truncated = True
+                break
+            yield CaptureRecord(
+                offset  = offset,
+                index   = int(self.words[offset + 1]),
+                length  = length,
+                flags   = (header >> 48) & 0xff,
+                dropped = (header >> 56) & 0xff,
+                samples = self.words[offset + SNIFFER_CAPTURE_HEADER_WORDS:end],
+            )
+            offset = end
+
+    def close(self):
+        # File unmapped once the records samples are no longer referenced.
+        self.words = np.zeros(0, dtype="<u8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def iter_sniffer_capture_chunks(filename, direction="rx"):
+    """Yield (data, ctrl) chunks (one per record) of a Sniffer Capture."""
+    with SnifferCapture(filename) as capture:
+        for record in capture.records():
+            yield capture_channel(record.samples, direction)
+
+# Summary ------------------------------------------------------------------------------------------
+
+def capture_summary(capture):
+    """Return a dict summary of a capture: records/samples, dropped records, sample gaps between
+    consecutive records (continuous captures), skipped words."""
+    summary = {"records": 0, "samples": 0, "dropped": 0, "gaps": 0, "tx": False}
+    next_index = None
+    for record in capture.records():
+        summary["records"] += 1
+        summary["samples"] += record.length
+        summary["dropped"] += record.dropped
+        summary["tx"]      |= bool(record.flags & SNIFFER_CAPTURE_FLAG_TX)
+        if next_index is not None and not (record.flags & SNIFFER_CAPTURE_FLAG_TRIGGERED):
+            summary["gaps"] += (record.index != next_index)
+        next_index = record.index + record.length
+    summary["skipped"]   = capture.skipped
+    summary["truncated"] = capture.truncated
+    return summary
+
+# Dump Conversion ----------------------------------------------------------------------------------
+
+def capture_to_dump(capture, filename, records=None, prefix="s7pciephy_debug"):
+    """Convert (a slice of) the records of a capture to a dump (tools.dump) with the raw sniffer
+    columns ({prefix}_rx/tx_data/ctl, 1 sample per cycle) and the record/sample index of each
+    sample, return the number of records converted."""
+    selected = list(capture.records())[slice(None) if records is None else records]
+    tx       = any(record.flags & SNIFFER_CAPTURE_FLAG_TX for record in selected)
+    columns  = [("capture_record", 32), ("capture_index", 64), (f"{prefix}_rx_data", 16), (f"{prefix}_rx_ctl", 2)]
+    if tx:
+        columns += [(f"{prefix}_tx_data", 16), (f"{prefix}_tx_ctl", 2)]
+    metadata = {
+        "source"            : os.path.basename(capture.filename),
+        "format"            : "sniffer_capture",
+        "samples_per_cycle" : 1,
+        "records"           : len(selected),
+    }
+    with DumpWriter(filename, columns, metadata) as writer:
+        for n, record in enumerate(selected):
+            chunk = {
+                "capture_record" : [n]*record.length,
+                "capture_index"  : range(record.index, record.index + record.length),
+            }
+            for direction in (["rx", "tx"] if tx else ["rx"]):
+                data, ctrl = capture_channel(record.samples, direction)
+                chunk[f"{prefix}_{direction}_data"] = data.tolist()
+                chunk[f"{prefix}_{direction}_ctl"]  = ctrl.tolist()
+            writer.write(chunk)
+    return len(selected)
+
+# Main ---------------------------------------------------------------------------------------------
+
+def _records(value):
+    start, _, stop = value.partition(":")
+    if not _:
+        return slice(int(start), int(start) + 1)
+    return slice(int(start) if start else None, int(stop) if stop else None)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sniffer Capture (litepcie_capture) summary/conversion.")
+    parser.add_argument("command", choices=["summary", "list", "dump"], help="Command.")
+    parser.add_argument("capture",                                      help="Sniffer Capture file.")
+    parser.add_argument("--records", default=None, type=_records,      help="Records to convert (n or start:stop, default: all).")
+    parser.add_argument("--prefix",  default="s7pciephy_debug",         help="Dump columns prefix.")
+    parser.add_argument("--output",  default=None,                      help="Dump file (default: <capture>.dump.bin).")
+    args = parser.parse_args()
+
+    with SnifferCapture(args.capture) as capture:
+        if args.command == "summary":
+            summary = capture_summary(capture)
+            print(f"{args.capture}: " + ", ".join(f"{k}: {v}" for k, v in summary.items()))
+        if args.command == "list":
+            for n, record in enumerate(capture.records()):
+                kind = "triggered" if record.flags & SNIFFER_CAPTURE_FLAG_TRIGGERED else "continuous"
+                print(f"{n:8d} index: {record.index:16d} length: {record.length:5d} {kind} dropped: {record.dropped}")
+        if args.command == "dump":
+            output = args.output
+            if output is None:
+                output = os.path.splitext(args.capture)[0] + ".dump.bin"
+            n = capture_to_dump(capture, output, records=args.records, prefix=args.prefix)
+            print(f"{args.capture} -> {output} ({n} records)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import sys
+import mmap
+import json
+import time
+import array
+import runpy
+import shutil
+import struct
+import fnmatch
+import argparse
+import tempfile
+import itertools
+
+# Dump Format --------------------------------------------------------------------------------------
+
+# Columnar binary format for LiteScope captures:
+#
+# +--------------------------------+
+# | Header                         | magic, version, columns, samples, metadata size.
+# | Metadata (JSON)                | Free-form capture information (clock domain, samplerate, ...).
+# | Column Table                   | name, width (bits), item size (bytes), data offset.
+# | Column 0 Data                  | samples * item size bytes, little-endian, 8-byte aligned.
+# | ...                            |
+# | Column N Data                  |
+# +--------------------------------+
+#
+# Columns are stored contiguously so that a reader only has to map/decode the columns it uses.
+
+DUMP_MAGIC   = b"LPTMDUMP"
+DUMP_VERSION = 1
+
+DUMP_HEADER       = struct.Struct("<8sIIQI4x")  # magic, version, columns, samples, metadata size.
+DUMP_COLUMN_ENTRY = struct.Struct("<HHB3xQ")    # name size, width, item size, data offset.
+
+DUMP_ALIGNMENT = 8
+
+# Item size (bytes) -> memoryview/array format.
+_formats = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _align(offset, alignment=DUMP_ALIGNMENT):
+    return (offset + alignment - 1) & ~(alignment - 1)
+
+def _itemsize(width):
+    """Return the storage size (in bytes) of a column of the given width (in bits)."""
+    for itemsize in sorted(_formats.keys()):
+        if width <= 8*itemsize:
+            return itemsize
+    return _align((width + 7)//8) # Wide columns: stored as raw little-endian integers.
+
+# Wide Column --------------------------------------------------------------------------------------
+
+class _WideColumn:
+    """Lazy sequence over a column wider than 64-bit (decoded on access)."""
+    def __init__(self, buf, itemsize):
+        self.buf      = buf
+        self.itemsize = itemsize
+
+    def __len__(self):
+        return len(self.buf)//self.itemsize
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not (0 <= key < len(self)):
+            raise IndexError("column index out of range")
+        return int.from_bytes(self.buf[key*self.itemsize:(key + 1)*self.itemsize], "little")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+# Dump Reader --------------------------------------------------------------------------------------
+
+class Dump:
+    """Memory-mapped dump reader.
+
+    Columns are only decoded when accessed and returned as zero-copy integer sequences (supporting
+    len/iteration/indexing/slicing with step), so opening a dump costs a header parse whatever the
+    capture length. The reader can be used as a dict (dump["s7pciephy_debug_rx_data"]).
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf   = memoryview(self._mmap)
+        self._cache = {}
+
+        # Header.
+        magic, version, columns, samples, metadata_size = DUMP_HEADER.unpack_from(self._buf, 0)
+        if magic != DUMP_MAGIC:
+            raise ValueError(f"{filename}: not a dump file.")
+        if version != DUMP_VERSION:
+            raise ValueError(f"{filename}: unsupported dump version {version}.")
+        self.samples = samples
+        offset = DUMP_HEADER.size
+
+        # Metadata.
+        self.metadata = json.loads(bytes(self._buf[offset:offset + metadata_size]).decode("utf-8"))
+        offset += metadata_size
+
+        # Column Table.
+        self._columns = {}
+        for n in range(columns):
+            name_size, width, itemsize, data_offset = DUMP_COLUMN_ENTRY.unpack_from(self._buf, offset)
+            offset += DUMP_COLUMN_ENTRY.size
+            name = bytes(self._buf[offset:offset + name_size]).decode("utf-8")
+            offset += name_size
+            self._columns[name] = (width, itemsize, data_offset)
+
+    # Dict-like interface.
+    def keys(self):
+        return self._columns.keys()
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            self._cache[name] = self._decode(name)
+        return self._cache[name]
+
+    def items(self):
+        for name in self._columns:
+            yield name, self[name]
+
+    def width(self, name):
+        """Return the width (in bits) of a column."""
+        return self._columns[name][0]
+
+    def chunks(self, chunk_size=2**16, names=None):
+        """Yield {name: samples} chunks of chunk_size samples of the (given) columns (as lists)."""
+        names = list(self.keys()) if names is None else names
+        for start in range(0, self.samples, chunk_size):
+            yield {name: list(self[name][start:start + chunk_size]) for name in names}
+
+    def _decode(self, name):
+        width, itemsize, offset = self._columns[name]
+        buf = self._buf[offset:offset + self.samples*itemsize]
+        if itemsize not in _formats:
+            return _WideColumn(buf, itemsize)
+        if sys.byteorder != "little":
+            column = array.array(_formats[itemsize], buf)
+            column.byteswap()
+            return column
+        return buf.cast(_formats[itemsize])
+
+    # Resources.
+    def close(self):
+        """Unmap the dump (columns returned by the reader must no longer be used)."""
+        for column in self._cache.values():
+            if isinstance(column, memoryview):
+                column.release()
+            if isinstance(column, _WideColumn):
+                column.buf.release()
+        self._cache.clear()
+        self._buf.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def load_dump(filename):
+    """Open a dump file (see Dump)."""
+    return Dump(filename)
+
+# LiteScope exports (analyzer.save()) hold 2 samples per analyzer clock cycle (each sample being
+# repeated for the scope_clk column added by LiteScope). Binary dumps record their samples per
+# cycle in their metadata; dumps without this information hold LiteScope exports as-is.
+LITESCOPE_SAMPLES_PER_CYCLE = 2
+
+def samples_per_cycle(dump):
+    """Return the number of samples per analyzer clock cycle of a dump/capture."""
+    return dump.metadata.get("samples_per_cycle", LITESCOPE_SAMPLES_PER_CYCLE)
+
+# Dump Writer --------------------------------------------------------------------------------------
+
+def _pack(values, itemsize):
+    if itemsize in _formats:
+        column = array.array(_formats[itemsize], values)
+        if sys.byteorder != "little":
+            column.byteswap()
+        return column.tobytes()
+    return b"".join(int(v).to_bytes(itemsize, "little") for v in values)
+
+class DumpWriter:
+    """Streaming dump writer.
+
+    Samples are appended chunk by chunk (write({name: samples})) and spooled per column to
+    temporary files; the dump is assembled on close, so metadata can still be completed while
+    writing. Used as a context manager, the dump is discarded on exceptions.
+    """
+    def __init__(self, filename, columns, metadata=None):
+        self.filename = filename
+        self.columns  = [(name, width, _itemsize(width)) for name, width in columns]
+        self.metadata = {} if metadata is None else dict(metadata)
+        self.samples  = 0
+        self._spools  = [tempfile.TemporaryFile() for _ in self.columns]
+
+    def write(self, chunk):
+        """Append a {name: samples} chunk (same number of samples for all the columns)."""
+        samples = None
+        for (name, width, itemsize), spool in zip(self.columns, self._spools):
+            values = chunk[name]
+            if samples is None:
+                samples = len(values)
+            if len(values) != samples:
+                raise ValueError(f"Column {name} has {len(values)} samples, expected {samples}.")
+            spool.write(_pack(values, itemsize))
+        self.samples += samples or 0
+
+    def close(self):
+        """Write the dump file."""
+        # Layout.
+        metadata = json.dumps(self.metadata).encode("utf-8")
+        offset   = DUMP_HEADER.size + len(metadata)
+        offset  += sum(DUMP_COLUMN_ENTRY.size + len(name.encode("utf-8")) for name, _, _ in self.columns)
+        offsets  = []
+        for name, width, itemsize in self.columns:
+            offset = _align(offset)
+            offsets.append(offset)
+            offset += self.samples*itemsize
+
+        # Write.
+        with open(self.filename, "wb") as f:
+            f.write(DUMP_HEADER.pack(DUMP_MAGIC, DUMP_VERSION, len(self.columns), self.samples, len(metadata)))
+            f.write(metadata)
+            for (name, width, itemsize), data_offset in zip(self.columns, offsets):
+                f.write(DUMP_COLUMN_ENTRY.pack(len(name.encode("utf-8")), width, itemsize, data_offset))
+                f.write(name.encode("utf-8"))
+            for spool, data_offset in zip(self._spools, offsets):
+                f.write(bytes(data_offset - f.tell()))
+                spool.seek(0)
+                shutil.copyfileobj(spool, f)
+        self.abort()
+
+    def abort(self):
+        """Discard the spooled samples (without writing the dump file)."""
+        for spool in self._spools:
+            spool.close()
+        self._spools = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def write_dump(filename, dump, widths=None, metadata=None):
+    """Write a {name: samples} dict to a dump file.
+
+    Column widths are deduced from the column values when not provided. Columns are written one
+    at a time, so only one column has to be converted at once.
+    """
+    widths   = {} if widths is None else widths
+    names    = list(dump.keys())
+    samples  = len(dump[names[0]]) if names else 0
+    for name in names:
+        if len(dump[name]) != samples:
+            raise ValueError(f"Column {name} has {len(dump[name])} samples, expected {samples}.")
+    columns = [(name, widths.get(name, max([1] + [v.bit_length() for v in dump[name]]))) for name in names]
+    with DumpWriter(filename, columns, metadata) as writer:
+        writer.write(dump)
+
+# LiteScope Captures -------------------------------------------------------------------------------
+
+# Readers of the LiteScope exports (CSV/VCD streamed line by line, Python/JSON loaded at once),
+# providing the same interface as Dump: keys()/width(name)/metadata/chunks(chunk_size, names).
+
+def _bin2int(value):
+    return int(value.replace("x", "0").replace("z", "0") or "0", 2) # Undefined bits ("x") as 0.
+
+def load_analyzer_config(filename):
+    """Return the (config, widths) of a LiteScope analyzer configuration file (analyzer.csv).
+
+    config: data_width, depth, samplerate; widths: {signal name: width}.
+    """
+    config = {}
+    widths = {}
+    with open(filename) as f:
+        for line in f:
+            fields = line.strip().split(",")
+            if len(fields) != 4:
+                continue
+            kind, group, name, value = fields
+            if kind == "config":
+                value = float(value)
+                config[name] = int(value) if value.is_integer() else value
+            elif kind == "signal":
+                widths[name] = int(value)
+    return config, widths
+
+class _Capture:
+    def __init__(self, filename):
+        self.filename = filename
+        self.metadata = {}
+        self._widths  = {}
+
+    def keys(self):
+        return self._widths.keys()
+
+    def __iter__(self):
+        return iter(self._widths)
+
+    def __contains__(self, name):
+        return name in self._widths
+
+    def __len__(self):
+        return len(self._widths)
+
+    def width(self, name):
+        """Return the width (in bits) of a column."""
+        return self._widths[name]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class LiteScopeCSV(_Capture):
+    """LiteScope CSV export reader (names/widths rows then one row of binary values per sample)."""
+    def __init__(self, filename):
+        _Capture.__init__(self, filename)
+        with open(filename) as f:
+            names  = self._fields(f.readline())
+            widths = self._fields(f.readline())
+        self._widths = {name: int(width) for name, width in zip(names, widths)}
+
+    @staticmethod
+    def _fields(line):
+        fields = [field.strip() for field in line.split(",")]
+        return fields[:-1] if fields[-1] == "" else fields # Rows end with a separator.
+
+    def chunks(self, chunk_size=2**16, names=None):
+        """Yield {name: samples} chunks of chunk_size samples of the (given) columns."""
+        names   = list(self.keys()) if names is None else names
+        indexes = [list(self.keys()).index(name) for name in names]
+        with open(self.filename) as f:
+            f.readline()
+            f.readline()
+            columns = [[] for _ in names]
+            samples = 0
+            for line in f:
+                fields = self._fields(line)
+                if not fields:
+                    continue
+                for column, index in zip(columns, indexes):
+                    column.append(_bin2int(fields[index]))
+                samples += 1
+                if samples == chunk_size:
+                    yield dict(zip(names, columns))
+                    columns = [[] for _ in names]
+                    samples = 0
+            if samples:
+                yield dict(zip(names, columns))
+
+class LiteScopeVCD(_Capture):
+    """LiteScope VCD export reader.
+
+    LiteScope writes a value change per sample index (#t) with a timescale of half the analyzer
+    clock period (2 samples per cycle), the samplerate is deduced from it. Values only being
+    written on changes, the capture ends on the last value change (the scope_clk column toggles
+    on every sample).
+    """
+    _timescale_units = {"": 1, "m": 1e-3, "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15}
+
+    def __init__(self, filename):
+        _Capture.__init__(self, filename)
+        self._codes = {}
+        header = ""
+        with open(filename) as f:
+            while True:
+                line = f.readline()
+                header += line
+                if (not line) or ("$enddefinitions" in line):
+                    break
+            self._data_offset = f.tell()
+        timescale = re.search(r"\$timescale\s+(\d+)\s*([munpf]?)s\s+\$end", header)
+        if timescale is not None:
+            period = int(timescale.group(1))*self._timescale_units[timescale.group(2)]
+            self.metadata["samplerate"] = round(1/(LITESCOPE_SAMPLES_PER_CYCLE*period))
+        for width, code, name in re.findall(r"\$var\s+\S+\s+(\d+)\s+(\S+)\s+(\S+)(?:\s+\[\S*\])?\s+\$end", header):
+            self._codes[code]   = name
+            self._widths[name]  = int(width)
+
+    def chunks(self, chunk_size=2**16, names=None):
+        """Yield {name: samples} chunks of chunk_size samples of the (given) columns."""
+        names   = list(self.keys()) if names is None else names
+        values  = {name: 0 for name in self.keys()} # Initial values ("x") as 0.
+        columns = {name: [] for name in names}
+        samples = 0
+        time    = None
+        with open(self.filename) as f:
+            f.seek(self._data_offset)
+            for line in itertools.chain(f, ["#end"]):
+                line = line.strip()
+                if (not line) or line.startswith("$"):
+                    continue
+                if line[0] == "#":
+                    # Samples of [time, t) hold the current values (last sample on end of file).
+                    if (line == "#end") and (time is None):
+                        break
+                    t = (time + 1) if line == "#end" else int(line[1:])
+                    if time is not None:
+                        for name in names:
+                            columns[name].extend([values[name]]*(t - time))
+                        samples += t - time
+                        while samples >= chunk_size:
+                            yield {name: column[:chunk_size] for name, column in columns.items()}
+                            columns  = {name: column[chunk_size:] for name, column in columns.items()}
+                            samples -= chunk_size
+                    time = t
+                elif line[0] in "bB":
+                    value, code = line[1:].split()
+                    values[self._codes[code]] = _bin2int(value)
+                elif line[0] in "01xXzZ":
+                    values[self._codes[line[1:]]] = _bin2int(line[0].lower())
+        if samples:
+            yield columns
+
+class LiteScopePython(_Capture):
+    """LiteScope Python export reader (dump = {...}, loaded at once).
+
+    Column widths are taken from widths ({name: width}, ex: from the analyzer configuration) or
+    deduced from the values.
+    """
+    def __init__(self, filename, widths=None):
+        _Capture.__init__(self, filename)
+        widths     = {} if widths is None else widths
+        self._dump = self._load(filename)
+        for name, values in self._dump.items():
+            self._widths[name] = widths.get(name, max([1] + [v.bit_length() for v in values]))
+
+    def _load(self, filename):
+        return runpy.run_path(filename)["dump"]
+
+    def chunks(self, chunk_size=2**16, names=None):
+        """Yield {name: samples} chunks of chunk_size samples of the (given) columns."""
+        names   = list(self.keys()) if names is None else names
+        samples = max([len(values) for values in self._dump.values()] + [0])
+        for start in range(0, samples, chunk_size):
+            yield {name: self._dump[name][start:start + chunk_size] for name in names}
+
+class LiteScopeJSON(LiteScopePython):
+    """LiteScope JSON export reader ({name: values}, loaded at once)."""
+    def _load(self, filename):
+        with open(filename) as f:
+            return json.load(f)
+
+CAPTURE_FORMATS = {
+    "dump"   : Dump,
+    "csv"    : LiteScopeCSV,
+    "vcd"    : LiteScopeVCD,
+    "python" : LiteScopePython,
+    "json"   : LiteScopeJSON,
+}
+
+def capture_format(filename):
+    """Detect capture format from its content/extension: "dump", "csv", "vcd", "python" or "json"."""
+    with open(filename, "rb") as f:
+        if f.read(len(DUMP_MAGIC)) == DUMP_MAGIC:
+            return "dump"
+    extensions = {".csv": "csv", ".vcd": "vcd", ".py": "python", ".json": "json"}
+    extension  = os.path.splitext(filename)[1].lower()
+    if extension not in extensions:
+        raise ValueError(f"{filename}: unknown capture format.")
+    return extensions[extension]
+
+def open_capture(filename, format="auto", widths=None):
+    """Open a capture (binary dump or LiteScope export), widths: {name: width} of Python/JSON exports."""
+    if format == "auto":
+        format = capture_format(filename)
+    if format in ["python", "json"]:
+        return CAPTURE_FORMATS[format](filename, widths=widths)
+    return CAPTURE_FORMATS[format](filename)
+
+# Converter ----------------------------------------------------------------------------------------
+
+# Columns added by LiteScope to its exports (not kept by default: scope_clk is redundant once the
+# capture is decimated, the trigger position is recorded in the dump metadata).
+LITESCOPE_COLUMNS = ["scope_clk", "scope_trig"]
+
+def select_columns(names, patterns=None):
+    """Return the names (in capture order) matching fnmatch patterns (default: all but LiteScope's)."""
+    if patterns is None:
+        return [name for name in names if name not in LITESCOPE_COLUMNS]
+    selected = set()
+    for pattern in patterns:
+        matches = fnmatch.filter(names, pattern)
+        if not matches:
+            raise ValueError(f"No column matching {pattern}.")
+        selected.update(matches)
+    return [name for name in names if name in selected]
+
+def convert_capture(src, dst=None, format="auto", columns=None, decimate=None, analyzer_csv=None,
+    clock_domain=None, chunk_size=2**16, metadata=None):
+    """Convert a capture (LiteScope CSV/VCD/Python/JSON export or binary dump) to a binary dump.
+
+    The capture is converted in a single streaming pass: columns are selected (fnmatch patterns,
+    see select_columns), samples decimated (default: to 1 sample per cycle, repeated samples being
+    checked to be identical) and the dump metadata completed with the capture information:
+    source, format, clock_domain, samplerate/depth/data_width (from the capture/analyzer_csv),
+    decimation, samples_per_cycle and trigger (scope_trig rising sample, after decimation).
+    Returns the dump filename (src with a .bin extension by default, can be src itself).
+    """
+    if dst is None:
+        dst = os.path.splitext(src)[0] + ".bin"
+    if format == "auto":
+        format = capture_format(src)
+    config, widths = ({}, {}) if analyzer_csv is None else load_analyzer_config(analyzer_csv)
+    with open_capture(src, format, widths=widths) as capture:
+        names  = select_columns(list(capture.keys()), columns)
+        cycles = samples_per_cycle(capture)
+        if decimate is None:
+            decimate = cycles
+        if (decimate < 1) or (cycles % decimate):
+            raise ValueError(f"{src}: decimation {decimate} not possible with {cycles} sample(s) per cycle.")
+
+        # Metadata.
+        dump_metadata = {**capture.metadata, **config}
+        dump_metadata.setdefault("source", os.path.basename(src))
+        dump_metadata.setdefault("format", format)
+        dump_metadata["clock_domain"]      = clock_domain or capture.metadata.get("clock_domain", "sys")
+        dump_metadata["decimation"]        = capture.metadata.get("decimation", 1)*decimate
+        dump_metadata["samples_per_cycle"] = cycles//decimate
+        dump_metadata.update({} if metadata is None else metadata)
+
+        # Streaming conversion (to a temporary file, allowing in-place conversions).
+        trigger = None
+        read    = names + [name for name in ["scope_trig"] if (name in capture) and (name not in names)]
+        offset  = 0
+        with DumpWriter(dst + ".tmp", [(name, capture.width(name)) for name in names], dump_metadata) as writer:
+            for chunk in capture.chunks(chunk_size*decimate, read):
+                for name in names:
+                    if name == "scope_clk":
+                        continue
+                    values = chunk[name]
+                    for phase in range(1, decimate):
+                        repeated = values[phase::decimate]
+                        if repeated != values[0:len(repeated)*decimate:decimate]:
+                            n = next(n for n in range(len(repeated)) if repeated[n] != values[n*decimate])
+                            raise ValueError(f"{src}: {name} sample {offset + n*decimate + phase} differs "
+                                f"from sample {offset + n*decimate}, use decimate=1 to keep all samples.")
+                if ("scope_trig" in chunk) and (trigger is None) and any(chunk["scope_trig"]):
+                    trigger = (offset + list(chunk["scope_trig"]).index(1))//decimate
+                writer.write({name: chunk[name][::decimate] for name in names})
+                offset += len(chunk[read[0]]) if read else 0
+            writer.metadata["trigger"] = trigger
+            writer.metadata.setdefault("depth", offset//cycles)
+    os.replace(dst + ".tmp", dst)
+    return dst
+
+def convert_dump(src, dst=None, metadata=None):
+    """Convert a LiteScope Python dump (dump = {...}) to a binary dump file (samples kept as-is)."""
+    return convert_capture(src, dst, format="python", columns=["*"], decimate=1, metadata=metadata)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteScope capture (CSV/VCD/Python/JSON export or binary dump) to binary dump converter.")
+    parser.add_argument("captures", nargs="+",           help="Capture(s) to convert.")
+    parser.add_argument("--format",       default="auto", choices=["auto"] + list(CAPTURE_FORMATS.keys()), help="Capture format.")
+    parser.add_argument("--columns",      default=None,  help="Columns to keep (comma separated fnmatch patterns, default: all but scope_clk/scope_trig).")
+    parser.add_argument("--decimate",     default=None,  type=int, help="Decimation (default: to 1 sample per cycle, 2 for LiteScope exports).")
+    parser.add_argument("--analyzer-csv", default=None,  help="LiteScope analyzer configuration (analyzer.csv: widths, depth, samplerate).")
+    parser.add_argument("--clock-domain", default=None,  help="Analyzer clock domain (default: sys).")
+    parser.add_argument("--output-dir",   default=None,  help="Output directory (default: next to source capture).")
+    args = parser.parse_args()
+
+    for src in args.captures:
+        dst = None
+        if args.output_dir is not None:
+            dst = os.path.join(args.output_dir, os.path.splitext(os.path.basename(src))[0] + ".bin")
+        start = time.perf_counter()
+        dst = convert_capture(src, dst,
+            format       = args.format,
+            columns      = None if args.columns is None else args.columns.split(","),
+            decimate     = args.decimate,
+            analyzer_csv = args.analyzer_csv,
+            clock_domain = args.clock_domain,
+        )
+        duration = time.perf_counter() - start
+        with load_dump(dst) as dump:
+            print(f"{src} -> {dst} ({dump.samples} samples, {len(dump)} columns, {os.path.getsize(dst)} bytes, {duration:.2f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.timecard import TimeCardClient
+from tools.ptm_log  import PTMLOG_FIELDS, PTMLogWriter, RunningStats
+
+# Multi-board PTM Collector: samples several TimeCards (litex_server endpoints) concurrently on
+# deadline-based schedules and merges the samples in a single PTM log.
+#
+# - Each board has its own asyncio task and a dedicated worker thread for its (blocking)
+#   RemoteClient accesses; tasks sleep until their next deadline (start + k*period, shared start
+#   so that all boards are sampled at the same instants) instead of busy-polling the clock.
+# - Each sample is timestamped with the host monotonic clock when the PTM Request is issued and
+#   records its lateness vs its scheduled time and the request duration (round-trip).
+# - Deadlines missed by more than a period (slow link/host) are skipped (and counted) rather than
+#   sampled in a burst.
+
+# PTM log record of the collector: default fields + schedule information (ns).
+COLLECTOR_FIELDS = PTMLOG_FIELDS + [
+    ("lateness", "<i8"), # Request issue time - scheduled time.
+    ("duration", "<u4"), # Request duration (issue to sample read).
+]
+
+# Board --------------------------------------------------------------------------------------------
+
+class Board:
+    """litex_server endpoint of a TimeCard."""
+    def __init__(self, host="localhost", port=1234, csr_csv="csr.csv"):
+        self.host    = host
+        self.port    = port
+        self.csr_csv = csr_csv
+
+    @classmethod
+    def parse(cls, description, csr_csv="csr.csv"):
+        """Parse a "host[:port[:csr_csv]]" board description."""
+        fields = description.split(":", 2)
+        return cls(
+            host    = fields[0] or "localhost",
+            port    = int(fields[1]) if len(fields) > 1 and fields[1] else 1234,
+            csr_csv = fields[2] if len(fields) > 2 else csr_csv,
+        )
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+# Board Statistics ---------------------------------------------------------------------------------
+
+class BoardStats:
+    """Samples/missed deadlines count and lateness/duration (ns) statistics of a board."""
+    def __init__(self):
+        self.samples  = 0
+        self.missed   = 0
+        self.lateness = RunningStats()
+        self.duration = RunningStats()
+
+    def __str__(self):
+        return (f"{self.samples} samples, {self.missed} missed, "
+                f"lateness (ns): {self.lateness}, duration (ns): {self.duration}")
+
+# PTM Collector ------------------------------------------------------------------------------------
+
+class PTMCollector:
+    """Asynchronous PTM collector of several boards (see module description).
+
+    Samples are written to log (PTMLogWriter with COLLECTOR_FIELDS, board = index in boards) and
+    passed to callback(board, sample, host_time, lateness) when provided. Collection stops after
+    count samples per board, after duration seconds or when stop() is called.
+    """
+    def __init__(self, boards, period, log=None, count=None, duration=None, enable=1, callback=None,
+        client_factory=None):
+        self.boards         = boards
+        self.period_ns      = int(round(period*1e9))
+        self.log            = log
+        self.count          = count
+        self.duration       = duration
+        self.enable         = enable
+        self.callback       = callback
+        self.client_factory = client_factory
+        self.stats          = [BoardStats() for _ in boards]
+        self._stop          = None
+
+    def stop(self):
+        """Stop collection (from the event loop)."""
+        if self._stop is not None:
+            self._stop.set()
+
+    def _client(self, board):
+        if self.client_factory is not None:
+            return self.client_factory(board)
+        return TimeCardClient(host=board.host, port=board.port, csr_csv=board.csr_csv)
+
+    async def _connect(self, board, executor):
+        loop   = asyncio.get_running_loop()
+        client = self._client(board)
+        await loop.run_in_executor(executor, client.open)
+        # Initial PTM Request (ResponseD of the first sample refers to it).
+        await loop.run_in_executor(executor, client.ptm_request, self.enable)
+        return client
+
+    async def _collect(self, index, client, start_ns, executor):
+        loop  = asyncio.get_running_loop()
+        stats = self.stats[index]
+        k     = 0
+        while not self._stop.is_set():
+            if (self.count is not None) and (stats.samples >= self.count):
+                break
+            deadline = start_ns + k*self.period_ns
+            if (self.duration is not None) and (max(deadline, time.monotonic_ns()) - start_ns) >= self.duration*1e9:
+                break
+
+            # Sleep until deadline (or stop).
+            delay = (deadline - time.monotonic_ns())/1e9
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+
+            # Sample.
+            host_time = time.monotonic_ns()
+            sample    = await loop.run_in_executor(executor, client.ptm_request, self.enable)
+            duration  = time.monotonic_ns() - host_time
+            lateness  = host_time - deadline
+            if self.log is not None:
+                self.log.write(host_time, sample.t1, sample.t2, sample.t4, sample.link_delay,
+                    valid    = sample.valid,
+                    board    = index,
+                    lateness = lateness,
+                    duration = min(duration, 2**32 - 1),
+                )
+            stats.samples += 1
+            stats.lateness.update([lateness])
+            stats.duration.update([duration])
+            if self.callback is not None:
+                self.callback(index, sample, host_time, lateness)
+
+            # Next deadline (skip the ones already missed).
+            k_next = k + 1
+            if self.period_ns:
+                k_next = max(k_next, (time.monotonic_ns() - start_ns)//self.period_ns + 1)
+            stats.missed += k_next - (k + 1)
+            k = k_next
+
+    async def run(self):
+        """Collect the boards until completion/stop, return the BoardStats."""
+        loop       = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        executors  = [ThreadPoolExecutor(max_workers=1) for _ in self.boards]
+        clients    = []
+        try:
+            # Connect all the boards, then start the common schedule.
+            clients  = await asyncio.gather(*[self._connect(board, executor)
+                for board, executor in zip(self.boards, executors)])
+            start_ns = time.monotonic_ns()
+            await asyncio.gather(*[self._collect(n, client, start_ns, executor)
+                for n, (client, executor) in enumerate(zip(clients, executors))])
+        finally:
+            for client, executor in zip(clients, executors):
+                await loop.run_in_executor(executor, client.close)
+            for executor in executors:
+                executor.shutdown(wait=False)
+            if self.log is not None:
+                self.log.flush()
+        return self.stats
+
+def collect(boards, period, log_prefix=None, max_bytes=256*2**20, metadata=None, **kwargs):
+    """Run a PTMCollector over boards, logging to log_prefix (PTM log files), return the
+    (BoardStats, log files)."""
+    log = None
+    if log_prefix is not None:
+        metadata = dict({} if metadata is None else metadata,
+            boards = [str(board) for board in boards],
+            period = period,
+            clock  = "monotonic",
+        )
+        log = PTMLogWriter(log_prefix, max_bytes=max_bytes, metadata=metadata, fields=COLLECTOR_FIELDS)
+    collector = PTMCollector(boards, period, log=log, **kwargs)
+    try:
+        stats = asyncio.run(collector.run())
+    finally:
+        if log is not None:
+            log.close()
+    return stats, ([] if log is None else log.files)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Asynchronous multi-board PTM collector.")
+    parser.add_argument("--board",     action="append", default=None,   help="Board endpoint (host[:port[:csr_csv]], repeat for several boards).")
+    parser.add_argument("--csr-csv",   default="csr.csv",               help="Default CSR configuration file.")
+    parser.add_argument("--enable",    default=1,           type=int,   help="PTM Enable.")
+    parser.add_argument("--period",    default=1e-1,        type=float, help="Sampling period (s).")
+    parser.add_argument("--count",     default=None,        type=int,   help="Samples per board.")
+    parser.add_argument("--duration",  default=None,        type=float, help="Collection duration (s).")
+    parser.add_argument("--log",       default="ptm_collector",         help="PTM log prefix (<log>.<index>.ptmlog files).")
+    parser.add_argument("--max-bytes", default=256*2**20,   type=int,   help="PTM log file rotation size.")
+    args = parser.parse_args()
+
+    boards = [Board.parse(board, csr_csv=args.csr_csv) for board in (args.board or ["localhost"])]
+    try:
+        stats, files = collect(boards, args.period,
+            log_prefix = args.log,
+            max_bytes  = args.max_bytes,
+            count      = args.count,
+            duration   = args.duration,
+            enable     = args.enable,
+        )
+    except KeyboardInterrupt:
+        return
+    for n, (board, board_stats) in enumerate(zip(boards, stats)):
+        print(f"[{n}] {board}: {board_stats}")
+    print(f"Log: {', '.join(files)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import runpy
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from tools.dump import DUMP_MAGIC, LITESCOPE_SAMPLES_PER_CYCLE, load_dump, samples_per_cycle
+from tools.sniffer import RawDecoder, TLPExtractor
+from tools.capture import is_sniffer_capture, iter_sniffer_capture_chunks
+
+# Streaming offline PTM TLP extractor:
+#
+#   raw rx/tx_data/ctl chunks -> RawDecoder -> TLPExtractor -> PTM TLP decoding -> PTMRecord.
+#
+# Software equivalent of TLPAligner -> TLPEndiannessSwap -> TLPFilterFormater -> Depacketizer, with
+# captures processed chunk by chunk so that their size is only limited by the storage.
+
+# PTM TLPs -----------------------------------------------------------------------------------------
+
+PTM_REQUEST_FMT_TYPE   = 0x34 # Message, No Data, Routed to Root Complex (Local).
+PTM_RESPONSE_FMT_TYPE  = 0x34 # Message, No Data, Routed to Root Complex (Local).
+PTM_RESPONSED_FMT_TYPE = 0x74 # Message, With Data, Routed to Root Complex (Local).
+
+PTM_REQUEST_MESSAGE_CODE  = 0x52
+PTM_RESPONSE_MESSAGE_CODE = 0x53
+
+PTM_REQUEST   = "request"
+PTM_RESPONSE  = "response"
+PTM_RESPONSED = "responsed"
+
+PTMRecord = namedtuple("PTMRecord", ["offset", "type", "requester_id", "master_time", "link_delay"])
+
+def decode_ptm_tlp(offset, tlp):
+    """Decode a framed TLP (Sequence Number + TLP + LCRC), return a PTMRecord or None if the TLP is
+    not a PTM TLP.
+
+    As LitePCIe's PTM Sniffer, master_time/link_delay are only decoded on PTM ResponseD and are
+    returned as seen by PTMRequester (Big-Endian, master_time's 32-bit halves in wire order).
+    """
+    tlp = tlp[2:] # Remove Sequence Number.
+    if len(tlp) < 16:
+        return None
+    fmt_type     = tlp[0]
+    message_code = tlp[7]
+    requester_id = int.from_bytes(tlp[4:6], "big")
+    if (fmt_type, message_code) == (PTM_REQUEST_FMT_TYPE, PTM_REQUEST_MESSAGE_CODE):
+        return PTMRecord(offset, PTM_REQUEST, requester_id, None, None)
+    if (fmt_type, message_code) == (PTM_RESPONSE_FMT_TYPE, PTM_RESPONSE_MESSAGE_CODE):
+        return PTMRecord(offset, PTM_RESPONSE, requester_id, None, None)
+    if (fmt_type, message_code) == (PTM_RESPONSED_FMT_TYPE, PTM_RESPONSE_MESSAGE_CODE):
+        if len(tlp) < 20:
+            return None
+        master_time = int.from_bytes(tlp[8:16],  "big")
+        link_delay  = int.from_bytes(tlp[16:20], "big")
+        return PTMRecord(offset, PTM_RESPONSED, requester_id, master_time, link_delay)
+    return None
+
+# Capture Sources ----------------------------------------------------------------------------------
+
+# Raw binary captures: little-endian 32-bit words, data in [15:0], ctl in [17:16].
+RAW_DATA_MASK  = 0xffff
+RAW_CTL_SHIFT  = 16
+RAW_CTL_MASK   = 0b11
+
+def iter_dump_chunks(filename, direction="rx", prefix="s7pciephy_debug", decimate=None, chunk_size=2**20):
+    """Yield (data, ctrl) chunks of a binary dump (see tools.dump, decimated to 1 sample per cycle by default)."""
+    with load_dump(filename) as dump:
+        decimate = samples_per_cycle(dump) if decimate is None else decimate
+        data = dump[f"{prefix}_{direction}_data"]
+        ctrl = dump[f"{prefix}_{direction}_ctl"]
+        for start in range(0, dump.samples, chunk_size*decimate):
+            stop = start + chunk_size*decimate
+            yield (np.array(data[start:stop:decimate]), np.array(ctrl[start:stop:decimate]))
+
+def iter_litescope_chunks(filename, direction="rx", prefix="s7pciephy_debug", decimate=LITESCOPE_SAMPLES_PER_CYCLE, chunk_size=2**20):
+    """Yield (data, ctrl) chunks of a LiteScope Python dump (dump = {...}, loaded at once)."""
+    dump = runpy.run_path(filename)["dump"]
+    data = dump[f"{prefix}_{direction}_data"]
+    ctrl = dump[f"{prefix}_{direction}_ctl"]
+    for start in range(0, len(data), chunk_size*decimate):
+        stop = start + chunk_size*decimate
+        yield (np.array(data[start:stop:decimate]), np.array(ctrl[start:stop:decimate]))
+
+def iter_raw_chunks(filename, decimate=1, chunk_size=2**20):
+    """Yield (data, ctrl) chunks of a raw binary capture."""
+    with open(filename, "rb") as f:
+        while True:
+            words = np.fromfile(f, dtype="<u4", count=chunk_size*decimate)
+            if len(words) == 0:
+                break
+            words = words[::decimate]
+            yield (words & RAW_DATA_MASK, (words >> RAW_CTL_SHIFT) & RAW_CTL_MASK)
+
+def capture_format(filename):
+    """Detect capture format from its content/extension: "dump", "capture", "litescope" or "raw"."""
+    with open(filename, "rb") as f:
+        if f.read(len(DUMP_MAGIC)) == DUMP_MAGIC:
+            return "dump"
+    if is_sniffer_capture(filename):
+        return "capture"
+    if os.path.splitext(filename)[1] == ".py":
+        return "litescope"
+    return "raw"
+
+def iter_capture_chunks(filename, format="auto", direction="rx", prefix="s7pciephy_debug", decimate=None, chunk_size=2**20):
+    """Yield (data, ctrl) chunks of a capture (LiteScope captures/dumps default to 1 sample per cycle)."""
+    if format == "auto":
+        format = capture_format(filename)
+    if format == "raw":
+        return iter_raw_chunks(filename, decimate=1 if decimate is None else decimate, chunk_size=chunk_size)
+    if format == "capture":
+        return iter_sniffer_capture_chunks(filename, direction=direction)
+    if format == "litescope":
+        decimate = LITESCOPE_SAMPLES_PER_CYCLE if decimate is None else decimate
+    iter_chunks = {"dump": iter_dump_chunks, "litescope": iter_litescope_chunks}[format]
+    return iter_chunks(filename,
+        direction  = direction,
+        prefix     = prefix,
+        decimate   = decimate,
+        chunk_size = chunk_size,
+    )
+
+# PTM Extractor ------------------------------------------------------------------------------------
+
+def extract_tlps(chunks, phy_dw=16):
+    """Yield (offset, tlp) tuples of the TLPs of (data, ctrl) chunks (offset in symbols)."""
+    decoder   = RawDecoder(phy_dw=phy_dw)
+    extractor = TLPExtractor()
+    for data, ctrl in chunks:
+        symbols, k, offsets = decoder.decode_symbols(data, ctrl)
+        yield from extractor.extract(symbols, k, offsets)
+
+def extract_ptm(chunks, phy_dw=16):
+    """Yield PTMRecords of the PTM TLPs of (data, ctrl) chunks."""
+    for offset, tlp in extract_tlps(chunks, phy_dw=phy_dw):
+        record = decode_ptm_tlp(offset, tlp)
+        if record is not None:
+            yield record
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline PTM TLP extractor for raw PCIe captures.")
+    parser.add_argument("capture",                                          help="Capture file (binary dump, Sniffer Capture, LiteScope Python dump or raw binary).")
+    parser.add_argument("--format",     default="auto", choices=["auto", "dump", "capture", "litescope", "raw"], help="Capture format.")
+    parser.add_argument("--direction",  default="rx",   choices=["rx", "tx"], help="Capture direction (dump/Sniffer/LiteScope captures).")
+    parser.add_argument("--prefix",     default="s7pciephy_debug",          help="Capture columns prefix (dump/LiteScope captures).")
+    parser.add_argument("--decimate",   default=None,   type=int,           help="Capture decimation (default: 1 sample per cycle, 1 for raw).")
+    parser.add_argument("--chunk-size", default=2**20,  type=int,           help="Samples decoded per chunk.")
+    args = parser.parse_args()
+
+    chunks = iter_capture_chunks(args.capture,
+        format     = args.format,
+        direction  = args.direction,
+        prefix     = args.prefix,
+        decimate   = args.decimate,
+        chunk_size = args.chunk_size,
+    )
+    counts = {PTM_REQUEST: 0, PTM_RESPONSE: 0, PTM_RESPONSED: 0}
+    for record in extract_ptm(chunks):
+        counts[record.type] += 1
+        line = f"{record.offset:12d} {record.type:<9s} requester_id: 0x{record.requester_id:04x}"
+        if record.type == PTM_RESPONSED:
+            line += f" master_time: 0x{record.master_time:016x} link_delay: 0x{record.link_delay:08x}"
+        print(line)
+    print(", ".join(f"{n} PTM {t}(s)" for t, n in counts.items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import glob
+import json
+import struct
+import argparse
+
+import numpy as np
+
+# PTM Log Format -----------------------------------------------------------------------------------
+
+# Append-only binary log of PTM samples, one fixed-size little-endian record per sample:
+#
+# +--------------------------------+
+# | Header                         | magic, version, record size, metadata size.
+# | Metadata (JSON)                | Record fields ([name, NumPy dtype] list) + free-form information.
+# | Record 0                       | 8-byte aligned.
+# | ...                            |
+# | Record N                       |
+# +--------------------------------+
+#
+# Logs are rotated over numbered files (<prefix>.<index>.ptmlog), each file being self-contained.
+# Records are only appended, so a log can be read while being written (a partially written record
+# at the end of a file is ignored) and a crashed recording is still readable up to its last record.
+
+PTMLOG_MAGIC   = b"LPTMPLOG"
+PTMLOG_VERSION = 1
+PTMLOG_SUFFIX  = ".ptmlog"
+
+PTMLOG_HEADER    = struct.Struct("<8sIII4x") # magic, version, record size, metadata size.
+PTMLOG_ALIGNMENT = 8
+
+# Default record: host_time (ns, host clock when the sample was read), t1/t2/t4 (ns), link_delay
+# (ns), flags and board (source of the sample when several boards are merged in a log).
+PTMLOG_FIELDS = [
+    ("host_time",  "<i8"),
+    ("t1",         "<u8"),
+    ("t2",         "<u8"),
+    ("t4",         "<u8"),
+    ("link_delay", "<u4"),
+    ("flags",      "<u2"),
+    ("board",      "<u2"),
+]
+
+PTMLOG_FLAG_VALID = (1 << 0)
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _align(offset, alignment=PTMLOG_ALIGNMENT):
+    return (offset + alignment - 1) & ~(alignment - 1)
+
+def ptm_log_dtype(fields=PTMLOG_FIELDS):
+    """Return the NumPy record dtype of a PTM log with the given fields."""
+    return np.dtype([(name, dtype) for name, dtype in fields])
+
+def log_files(path):
+    """Return the files of a PTM log (a single .ptmlog file, the rotated files of a prefix or a list
+    of files), in recording order."""
+    if isinstance(path, (list, tuple)):
+        return list(path)
+    if os.path.isfile(path):
+        return [path]
+    pattern = re.compile(re.escape(os.path.basename(path)) + r"\.(\d+)" + re.escape(PTMLOG_SUFFIX) + "$")
+    files   = []
+    for filename in glob.glob(glob.escape(path) + ".*" + PTMLOG_SUFFIX):
+        m = pattern.match(os.path.basename(filename))
+        if m is not None:
+            files.append((int(m.group(1)), filename))
+    return [filename for _, filename in sorted(files)]
+
+def _read_header(filename):
+    """Return (dtype, metadata, records offset) of a PTM log file."""
+    with open(filename, "rb") as f:
+        header = f.read(PTMLOG_HEADER.size)
+        if len(header) < PTMLOG_HEADER.size:
+            raise ValueError(f"{filename}: truncated PTM log header.")
+        magic, version, record_size, metadata_size = PTMLOG_HEADER.unpack(header)
+        if magic != PTMLOG_MAGIC:
+            raise ValueError(f"{filename}: not a PTM log file.")
+        if version != PTMLOG_VERSION:
+            raise ValueError(f"{filename}: unsupported PTM log version {version}.")
+        metadata = json.loads(f.read(metadata_size).decode("utf-8"))
+    dtype = ptm_log_dtype([tuple(field) for field in metadata.pop("fields")])
+    if dtype.itemsize != record_size:
+        raise ValueError(f"{filename}: record size mismatch ({record_size} vs {dtype.itemsize}).")
+    return dtype, metadata, _align(PTMLOG_HEADER.size + metadata_size)
+
+# PTM Log Writer -----------------------------------------------------------------------------------
+
+class PTMLogWriter:
+    """Append-only PTM log writer with rotation.
+
+    Records are buffered in a pre-allocated record array and written in blocks (no per-sample
+    formatting). A new file is started when the current one would exceed max_bytes; numbering
+    continues after the existing files of the prefix, so previous recordings are never overwritten.
+    """
+    def __init__(self, prefix, max_bytes=256*2**20, metadata=None, fields=PTMLOG_FIELDS, buffer_records=4096):
+        self.prefix    = prefix
+        self.max_bytes = max_bytes
+        self.metadata  = {} if metadata is None else metadata
+        self.fields    = fields
+        self.dtype     = ptm_log_dtype(fields)
+        self.files     = []
+        self.records   = 0
+        self._buffer   = np.zeros(buffer_records, dtype=self.dtype)
+        self._level    = 0
+        self._file     = None
+        self._size     = 0
+        self._header   = 0
+        existing       = log_files(prefix) if not os.path.isfile(prefix) else []
+        self._index    = int(existing[-1].split(".")[-2]) + 1 if existing else 0
+
+    def _open(self):
+        filename = f"{self.prefix}.{self._index:06d}{PTMLOG_SUFFIX}"
+        self._index += 1
+        metadata = dict(self.metadata, fields=[[name, dtype] for name, dtype in self.fields])
+        metadata = json.dumps(metadata).encode("utf-8")
+        header   = PTMLOG_HEADER.pack(PTMLOG_MAGIC, PTMLOG_VERSION, self.dtype.itemsize, len(metadata)) + metadata
+        header  += bytes(_align(len(header)) - len(header))
+        self._file = open(filename, "xb")
+        self._file.write(header)
+        self._size   = len(header)
+        self._header = len(header)
+        self.files.append(filename)
+
+    def _write(self, records):
+        while len(records):
+            if self._file is None:
+                self._open()
+            count = max((self.max_bytes - self._size)//self.dtype.itemsize, 0)
+            if count == 0:
+                if self._size > self._header:
+                    self._file.close()
+                    self._file = None
+                    continue
+                count = 1 # max_bytes smaller than a record: one record per file.
+            chunk = records[:count]
+            self._file.write(chunk.tobytes())
+            self._size += chunk.nbytes
+            records = records[count:]
+
+    def write(self, host_time, t1, t2, t4, link_delay, valid=True, board=0, **fields):
+        """Append a sample."""
+        record = self._buffer[self._level]
+        record["host_time"]  = host_time
+        record["t1"]         = t1
+        record["t2"]         = t2
+        record["t4"]         = t4
+        record["link_delay"] = link_delay
+        record["flags"]      = valid*PTMLOG_FLAG_VALID
+        record["board"]      = board
+        for name, value in fields.items():
+            record[name] = value
+        self._level   += 1
+        self.records  += 1
+        if self._level == len(self._buffer):
+            self.flush()
+
+    def write_records(self, records):
+        """Append a record array (of the log's dtype)."""
+        self.flush()
+        self._write(np.asarray(records, dtype=self.dtype))
+        self.records += len(records)
+
+    def flush(self):
+        """Write the buffered records to the log file."""
+        if self._level:
+            self._write(self._buffer[:self._level])
+            self._level = 0
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+# PTM Log Reader -----------------------------------------------------------------------------------
+
+class PTMLog:
+    """Memory-mapped PTM log reader (see log_files for the supported paths).
+
+    Records of each file are exposed as a read-only NumPy record array mapped on the file, so a log
+    of any size can be processed chunk by chunk without being loaded in memory.
+    """
+    def __init__(self, path):
+        self.path  = path
+        self.files = log_files(path)
+        if len(self.files) == 0:
+            raise FileNotFoundError(f"{path}: no PTM log file.")
+        self.metadata = None
+        self._records = []
+        for filename in self.files:
+            dtype, metadata, offset = _read_header(filename)
+            if self.metadata is None:
+                self.dtype    = dtype
+                self.metadata = metadata
+            elif dtype != self.dtype:
+                raise ValueError(f"{filename}: record fields differ from {self.files[0]}.")
+            count = (os.path.getsize(filename) - offset)//dtype.itemsize # Ignore partial record.
+            if count > 0:
+                self._records.append(np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(count,)))
+
+    def __len__(self):
+        return sum(len(records) for records in self._records)
+
+    def chunks(self, size=2**20):
+        """Iterate over the records in zero-copy chunks of up to size records."""
+        for records in self._records:
+            for start in range(0, len(records), size):
+                yield records[start:start + size]
+
+    def read(self):
+        """Return all the records (copied in memory)."""
+        if len(self._records) == 0:
+            return np.zeros(0, dtype=self.dtype)
+        return np.concatenate(self._records)
+
+    def close(self):
+        """Unmap the log (chunks returned by the reader must no longer be used)."""
+        for records in self._records:
+            records._mmap.close()
+        self._records = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def load_ptm_log(path):
+    """Open a PTM log (see PTMLog)."""
+    return PTMLog(path)
+
+# Streaming Statistics -----------------------------------------------------------------------------
+
+class RunningStats:
+    """Count/min/max/mean/stddev of a stream of values, updated with chunks of values (Chan's
+    parallel variance merge, constant memory)."""
+    def __init__(self):
+        self.count = 0
+        self.mean  = 0.0
+        self.m2    = 0.0
+        self.min   = np.inf
+        self.max   = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        self.merge(len(values), values.mean(), np.sum((values - values.mean())**2), values.min(), values.max())
+
+    def merge(self, count, mean, m2, vmin, vmax):
+        total      = self.count + count
+        delta      = mean - self.mean
+        self.mean += delta*count/total
+        self.m2   += m2 + delta**2*self.count*count/total
+        self.count = total
+        self.min   = min(self.min, vmin)
+        self.max   = max(self.max, vmax)
+
+    def __iadd__(self, other):
+        if other.count:
+            self.merge(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2/self.count) if self.count else np.nan
+
+    def __str__(self):
+        if self.count == 0:
+            return "no samples"
+        return f"min {self.min:.0f} max {self.max:.0f} mean {self.mean:.1f} std {self.std:.1f}"
+
+class PTMLogSummary:
+    """Streaming statistics of t2-t1 and link_delay (ns) of PTM log records, over the whole stream
+    (total) and over consecutive intervals of interval records (when set)."""
+    names = ["t2-t1", "link_delay"]
+
+    def __init__(self, interval=None, valid_only=True):
+        self.interval   = interval
+        self.valid_only = valid_only
+        self.total      = {name: RunningStats() for name in self.names}
+        self._current   = {name: RunningStats() for name in self.names}
+        self._pending   = 0
+
+    def _add(self, records):
+        if self.valid_only:
+            records = records[(records["flags"] & PTMLOG_FLAG_VALID) != 0]
+        values = {
+            "t2-t1"      : records["t2"].astype(np.int64) - records["t1"].astype(np.int64),
+            "link_delay" : records["link_delay"],
+        }
+        for name in self.names:
+            stats = RunningStats()
+            stats.update(values[name])
+            self.total[name]    += stats
+            self._current[name] += stats
+
+    def update(self, records):
+        """Add records, return the statistics of the intervals completed."""
+        intervals = []
+        start     = 0
+        while start < len(records):
+            stop = len(records)
+            if self.interval is not None:
+                stop = min(stop, start + self.interval - self._pending)
+            self._add(records[start:stop])
+            self._pending += stop - start
+            start          = stop
+            if self._pending == self.interval:
+                intervals.append(self.flush())
+        return intervals
+
+    def flush(self):
+        """Close the current interval, return its statistics (None if empty)."""
+        if self._pending == 0:
+            return None
+        current, self._current = self._current, {name: RunningStats() for name in self.names}
+        self._pending = 0
+        return current
+
+def summarize(log, interval=None, valid_only=True, chunk_size=2**20):
+    """Stream the statistics of a PTM log, yield a {name: RunningStats} dict per interval (the last
+    one possibly partial) or for the whole log (interval=None)."""
+    summary = PTMLogSummary(interval=interval, valid_only=valid_only)
+    for chunk in log.chunks(chunk_size):
+        yield from summary.update(chunk)
+    last = summary.flush()
+    if last is not None:
+        yield last
+
+def log_summary(log, valid_only=True, chunk_size=2**20):
+    """Return the {name: RunningStats} statistics of a whole PTM log."""
+    summary = PTMLogSummary(valid_only=valid_only)
+    for chunk in log.chunks(chunk_size):
+        summary.update(chunk)
+    return summary.total
+
+# VCD Converter ------------------------------------------------------------------------------------
+
+def log_to_vcd(log, filename, chunk_size=2**20):
+    """Convert a PTM log to a VCD (t1/t2/t3/t4/t2-t1/t4-t1 at host time, in ns from the first
+    record). Samples of merged logs are dumped in a boardN scope per board."""
+    import vcd # Only required for VCD conversion.
+    boards = sorted(set().union(*[np.unique(chunk["board"]).tolist() for chunk in log.chunks(chunk_size)]))
+    with open(filename, "w") as f:
+        vcd_writer = vcd.VCDWriter(f, timescale="1 ns", date="today")
+        vcd_vars   = {}
+        for board in boards:
+            scope = "module" if len(boards) == 1 else f"board{board}"
+            for name in ["t1", "t2", "t3", "t4", "t2-t1", "t4-t1"]:
+                vcd_vars[(board, name)] = vcd_writer.register_var(scope, name, "real", size=64)
+        t_start = None
+        t_last  = None
+        for chunk in log.chunks(chunk_size):
+            if t_start is None:
+                t_start = int(chunk["host_time"][0])
+            t1 = chunk["t1"].astype(np.int64)
+            t2 = chunk["t2"].astype(np.int64)
+            t4 = chunk["t4"].astype(np.int64)
+            values = {
+                "t1"    : t1,
+                "t2"    : t2,
+                "t3"    : t2 + chunk["link_delay"],
+                "t4"    : t4,
+                "t2-t1" : t2 - t1,
+                "t4-t1" : t4 - t1,
+            }
+            for n, (t, board) in enumerate(zip(chunk["host_time"] - t_start, chunk["board"])):
+                t = int(t) if t_last is None else max(int(t), t_last) # VCD timestamps must not decrease.
+                t_last = t
+                for name in values.keys():
+                    vcd_writer.change(vcd_vars[(int(board), name)], t, int(values[name][n]))
+        vcd_writer.close()
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="PTM log summary/conversion.")
+    parser.add_argument("command", choices=["summary", "vcd"],  help="Command.")
+    parser.add_argument("log",                                  help="PTM log (.ptmlog file or prefix of rotated files).")
+    parser.add_argument("--interval", default=None, type=int,   help="Summary interval (records, default: whole log).")
+    parser.add_argument("--all",      action="store_true",      help="Include invalid samples in the summary.")
+    parser.add_argument("--board",    default=None, type=int,   help="Only summarize the samples of a board (merged logs).")
+    parser.add_argument("--output",   default=None,             help="VCD file (default: <log>.vcd).")
+    args = parser.parse_args()
+
+    with load_ptm_log(args.log) as log:
+        if args.command == "summary":
+            print(f"{args.log}: {len(log)} records in {len(log.files)} file(s).")
+            summary = PTMLogSummary(interval=args.interval, valid_only=not args.all)
+            def report(label, stats):
+                print(f"[{label:>6}] t2-t1: {stats['t2-t1']} | link_delay: {stats['link_delay']} ({stats['t2-t1'].count} samples)")
+            n = 0
+            for chunk in log.chunks():
+                if args.board is not None:
+                    chunk = chunk[chunk["board"] == args.board]
+                for stats in summary.update(chunk):
+                    report(n, stats)
+                    n += 1
+            stats = summary.flush()
+            if args.interval is not None and stats is not None:
+                report(n, stats)
+            report("total", summary.total)
+        if args.command == "vcd":
+            output = args.output
+            if output is None:
+                output = (os.path.splitext(args.log)[0] if args.log.endswith(PTMLOG_SUFFIX) else args.log) + ".vcd"
+            log_to_vcd(log, output)
+            print(f"{args.log} -> {output}")
+
+if __name__ == "__main__":
+    main()
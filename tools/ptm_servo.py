@@ -0,0 +1,326 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import time
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+# Host-side PTM Servo: estimates the offset/frequency error of the local (TimeCard) Time vs the PTM
+# Master Time from a stream of PTM samples (t1, t2, t4, link_delay, as provided by the PTM Requester
+# or PTM Scheduler):
+#
+# - A PTM ResponseD carries the Master Time (t2) and link delay (t3 - t2) of the *previous* PTM
+#   dialog: t2/link_delay of a sample are paired with t1/t4 of the previous sample (as done by the
+#   driver's getcrosststamp). Consecutive samples must then come from consecutive PTM dialogs.
+# - Exchanges with an excessive round-trip delay (PTM TLPs delayed by PCIe traffic) are rejected
+#   against the round-trip delay history.
+# - Offset/Frequency error are estimated from all the accepted exchanges with a PI or Kalman filter
+#   (vs a single exchange for getcrosststamp/phc2sys). Filters can be tuned offline on recorded
+#   samples or run live against the board (optionally steering the Time Generator).
+
+# PTM Exchanges ------------------------------------------------------------------------------------
+
+PTMExchanges = namedtuple("PTMExchanges", ["t", "offset", "delay"])
+
+def ptm_exchanges(t1, t2, t4, link_delay, valid=None, previous=True):
+    """Return the PTMExchanges (NumPy arrays) of PTM samples arrays (in ns):
+    - t      : Local Time of the exchange (t1, int64).
+    - offset : Local - Master Time offset: ((t1 - t2) + (t4 - t3))/2.
+    - delay  : Round-trip delay: (t4 - t1) - (t3 - t2).
+
+    With previous, t2/link_delay of sample n are paired with t1/t4 of sample n - 1 (exchanges
+    involving an invalid sample are dropped). Differences are computed on int64 before float
+    conversion (a float64 only has a ~256ns resolution on current Times).
+    """
+    t1, t2, t4, link_delay = (np.asarray(v, dtype=np.int64) for v in (t1, t2, t4, link_delay))
+    valid = np.ones(len(t1), dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+    if previous:
+        t1, t4, t2, link_delay = t1[:-1], t4[:-1], t2[1:], link_delay[1:]
+        valid = valid[:-1] & valid[1:]
+    t1, t2, t4, link_delay = t1[valid], t2[valid], t4[valid], link_delay[valid]
+    t3 = t2 + link_delay
+    return PTMExchanges(
+        t      = t1,
+        offset = ((t1 - t2) + (t4 - t3))/2,
+        delay  = ((t4 - t1) - (t3 - t2)).astype(np.float64),
+    )
+
+def load_samples(filename):
+    """Load PTM samples (t1, t2, t4, link_delay int64 arrays) from a CSV file."""
+    samples = np.loadtxt(filename, dtype=np.int64, delimiter=",", ndmin=2)
+    return tuple(samples[:, i] for i in range(4))
+
+def save_samples(filename, t1, t2, t4, link_delay):
+    """Save PTM samples to a CSV file (t1, t2, t4, link_delay columns, in ns)."""
+    samples = np.stack([np.asarray(v, dtype=np.int64) for v in (t1, t2, t4, link_delay)], axis=1)
+    np.savetxt(filename, samples, fmt="%d", delimiter=",", header="t1,t2,t4,link_delay")
+
+# Outlier Rejection --------------------------------------------------------------------------------
+
+class DelayFilter:
+    """Round-trip delay outlier rejection.
+
+    An exchange is rejected when its round-trip delay exceeds the median of the last window delays
+    by more than max(threshold*sigma, margin) ns (sigma estimated from the median absolute
+    deviation). Rejected delays are also kept in the history so that a permanent delay change
+    (ex: link retrain) is followed.
+    """
+    def __init__(self, window=64, threshold=4.0, margin=8.0, min_samples=8):
+        self.threshold   = threshold
+        self.margin      = margin
+        self.min_samples = min_samples
+        self.history     = np.zeros(window)
+        self.count       = 0
+
+    def update(self, delay):
+        """Add a round-trip delay to the history, return True if the exchange is accepted."""
+        n      = min(self.count, len(self.history))
+        accept = True
+        if n >= self.min_samples:
+            history = self.history[:n]
+            median  = np.median(history)
+            sigma   = 1.4826*np.median(np.abs(history - median))
+            accept  = bool(delay <= median + max(self.threshold*sigma, self.margin))
+        self.history[self.count % len(self.history)] = delay
+        self.count += 1
+        return accept
+
+# Servos -------------------------------------------------------------------------------------------
+
+# Servos estimate the offset (ns) and frequency error (ppb, ns/s) of the local Time at each exchange
+# from the measured offsets; innovation is the error of the offset predicted from the previous
+# estimate (ns). shift() compensates the estimates for corrections applied to the local Time.
+
+class PIServo:
+    """PI Servo: second-order phase/frequency tracking loop.
+
+    The first exchange initializes the offset, the second one the frequency (offset difference).
+    The innovation e is then fed back with proportional/integral gains (stable for 0 < kp < 2 and
+    0 < ki < 4 - 2*kp):
+        offset = offset + freq*dt + kp*e
+        freq   = freq + ki*e/dt
+    """
+    def __init__(self, kp=0.1, ki=0.005):
+        self.kp     = kp
+        self.ki     = ki
+        self.t      = None
+        self.state  = 0
+        self.offset = 0.0
+        self.freq   = 0.0
+
+    def update(self, t, offset):
+        """Update with the offset measured at local time t (ns), return (offset, freq, innovation)."""
+        innovation = 0.0
+        if self.state == 0:
+            self.offset = offset
+            self.state  = 1
+        else:
+            dt         = (t - self.t)/1e9
+            innovation = offset - (self.offset + self.freq*dt)
+            if self.state == 1:
+                self.freq   = (offset - self.offset)/dt
+                self.offset = offset
+                self.state  = 2
+            else:
+                self.offset += self.freq*dt + self.kp*innovation
+                self.freq   += self.ki*innovation/dt
+        self.t = t
+        return self.offset, self.freq, innovation
+
+    def shift(self, offset=0.0, freq=0.0):
+        self.offset += offset
+        self.freq   += freq
+
+class KalmanServo:
+    """Kalman Servo: two-state (offset, frequency) Kalman filter.
+
+    Clock model: white frequency noise (q_offset, ns²/s) and random walk frequency noise (q_freq,
+    ppb²/s), offsets measured with a white noise of r ns² (half of the round-trip delay jitter).
+    """
+    def __init__(self, q_offset=1.0, q_freq=1e-2, r=100.0, freq_variance=1e8):
+        self.q_offset      = q_offset
+        self.q_freq        = q_freq
+        self.r             = r
+        self.freq_variance = freq_variance
+        self.t             = None
+        self.x             = np.zeros(2)
+        self.P             = np.zeros((2, 2))
+
+    def update(self, t, offset):
+        """Update with the offset measured at local time t (ns), return (offset, freq, innovation)."""
+        if self.t is None:
+            self.x = np.array([offset, 0.0])
+            self.P = np.diag([self.r, self.freq_variance])
+            self.t = t
+            return offset, 0.0, 0.0
+        dt = (t - self.t)/1e9
+        # Prediction.
+        F = np.array([[1.0, dt], [0.0, 1.0]])
+        Q = np.array([
+            [self.q_offset*dt + self.q_freq*dt**3/3, self.q_freq*dt**2/2],
+            [self.q_freq*dt**2/2,                    self.q_freq*dt],
+        ])
+        self.x = F @ self.x
+        self.P = F @ self.P @ F.T + Q
+        # Correction.
+        innovation = offset - self.x[0]
+        K          = self.P[:, 0]/(self.P[0, 0] + self.r)
+        self.x     = self.x + K*innovation
+        self.P     = self.P - np.outer(K, self.P[0, :])
+        self.t     = t
+        return self.x[0], self.x[1], innovation
+
+    def shift(self, offset=0.0, freq=0.0):
+        self.x += (offset, freq)
+
+servos = {
+    "pi"     : PIServo,
+    "kalman" : KalmanServo,
+}
+
+# Offline Run --------------------------------------------------------------------------------------
+
+ServoResults = namedtuple("ServoResults", ["t", "measured", "delay", "accepted", "offset", "freq", "innovation"])
+
+def run_servo(exchanges, servo, delay_filter=None):
+    """Run a servo over PTMExchanges, return ServoResults (NumPy arrays, estimates of rejected
+    exchanges set to NaN)."""
+    n          = len(exchanges.t)
+    accepted   = np.ones(n, dtype=bool)
+    estimates  = np.full((n, 3), np.nan)
+    for i, (t, offset, delay) in enumerate(zip(exchanges.t.tolist(), exchanges.offset.tolist(), exchanges.delay.tolist())):
+        if delay_filter is not None and not delay_filter.update(delay):
+            accepted[i] = False
+            continue
+        estimates[i] = servo.update(t, offset)
+    return ServoResults(exchanges.t, exchanges.offset, exchanges.delay, accepted,
+        estimates[:, 0], estimates[:, 1], estimates[:, 2])
+
+def servo_stats(results, settle=16):
+    """Return servo statistics (after settle accepted exchanges) used for offline tuning:
+    - innovation_rms : RMS of the offset prediction error (ns).
+    - offset_std     : Deviation of the estimated offsets from a linear fit (ns).
+    - measured_std   : Deviation of the measured (single exchange) offsets from a linear fit (ns).
+    - freq_mean/std  : Estimated frequency error (ppb).
+    """
+    def detrended_std(t, y):
+        t = (t - t[0])/1e9
+        return float(np.std(y - np.polyval(np.polyfit(t, y, 1), t))) if len(t) > 2 else float("nan")
+    accepted = np.nonzero(results.accepted)[0][settle:]
+    t        = results.t[accepted].astype(np.float64)
+    return {
+        "exchanges"      : len(results.t),
+        "rejected"       : int(np.count_nonzero(~results.accepted)),
+        "innovation_rms" : float(np.sqrt(np.mean(results.innovation[accepted]**2))),
+        "offset_std"     : detrended_std(t, results.offset[accepted]),
+        "measured_std"   : detrended_std(t, results.measured[accepted]),
+        "freq_mean"      : float(np.mean(results.freq[accepted])),
+        "freq_std"       : float(np.std(results.freq[accepted])),
+    }
+
+# Live Run -----------------------------------------------------------------------------------------
+
+def run_servo_live(client, servo, delay_filter=None, samples=1000, period=1e-1, steer=False,
+    steer_interval=8, record=None):
+    """Run a servo live on the board's PTM Requester (one PTM dialog every period s).
+
+    With steer, the Time Generator is corrected (offset and increment) every steer_interval accepted
+    exchanges; the following exchange (measured before the correction) is skipped.
+    """
+    history  = ([], [], [], [], [])
+    previous = None
+    skip     = 0
+    count    = 0
+    for n in range(samples):
+        time.sleep(period)
+        sample = client.ptm_request()
+        for values, value in zip(history, (sample.t1, sample.t2, sample.t4, sample.link_delay, sample.valid)):
+            values.append(value)
+        if (previous is None) or not (previous.valid and sample.valid):
+            previous = sample
+            continue
+        exchanges = ptm_exchanges([previous.t1], [sample.t2], [previous.t4], [sample.link_delay], previous=False)
+        previous  = sample
+        if skip:
+            skip -= 1
+            continue
+        t, offset, delay = int(exchanges.t[0]), float(exchanges.offset[0]), float(exchanges.delay[0])
+        if delay_filter is not None and not delay_filter.update(delay):
+            print(f"t (s): {t/1e9:.9f} delay (ns): {delay:8.1f} rejected")
+            continue
+        est_offset, est_freq, innovation = servo.update(t, offset)
+        print(f"t (s): {t/1e9:.9f} delay (ns): {delay:8.1f} offset (ns): {offset:10.1f} "
+              f"estimate (ns): {est_offset:10.1f} freq (ppb): {est_freq:8.1f}")
+        count += 1
+        if steer and (count % steer_interval == 0):
+            increment = client.read_increment()
+            client.adjust_time(-int(round(est_offset)))
+            client.write_increment(int(round(increment*(1 - est_freq*1e-9))))
+            servo.shift(offset=-int(round(est_offset)), freq=-est_freq)
+            skip = 1
+    if record is not None:
+        save_samples(record, *history[:4])
+    return history
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="PTM Servo (offline tuning on recorded samples or live).")
+    parser.add_argument("samples",          nargs="?",                    help="Recorded PTM samples (CSV: t1,t2,t4,link_delay).")
+    parser.add_argument("--servo",          default="kalman", choices=list(servos.keys()), help="Servo.")
+    parser.add_argument("--kp",             default=0.1,   type=float,    help="PI Servo proportional gain.")
+    parser.add_argument("--ki",             default=0.005, type=float,    help="PI Servo integral gain.")
+    parser.add_argument("--q-offset",       default=1.0,   type=float,    help="Kalman Servo offset process noise (ns²/s).")
+    parser.add_argument("--q-freq",         default=1e-2,  type=float,    help="Kalman Servo frequency process noise (ppb²/s).")
+    parser.add_argument("--r",              default=100.0, type=float,    help="Kalman Servo measurement noise (ns²).")
+    parser.add_argument("--window",         default=64,    type=int,      help="Delay filter window (exchanges, 0: disabled).")
+    parser.add_argument("--threshold",      default=4.0,   type=float,    help="Delay filter threshold (sigmas).")
+    parser.add_argument("--margin",         default=8.0,   type=float,    help="Delay filter minimum margin (ns).")
+    parser.add_argument("--output",         default=None,                 help="Estimates output file (CSV).")
+    parser.add_argument("--live",           action="store_true",          help="Run live against the board.")
+    parser.add_argument("--csr-csv",        default="csr.csv",            help="CSR configuration file (live).")
+    parser.add_argument("--count",          default=1000,  type=int,      help="PTM samples (live).")
+    parser.add_argument("--period",         default=1e-1,  type=float,    help="PTM samples period (s, live).")
+    parser.add_argument("--steer",          action="store_true",          help="Steer Time Generator (live).")
+    parser.add_argument("--steer-interval", default=8,     type=int,      help="Exchanges between corrections (live).")
+    parser.add_argument("--record",         default=None,                 help="Record PTM samples to file (live).")
+    args = parser.parse_args()
+
+    servo = {
+        "pi"     : lambda: PIServo(kp=args.kp, ki=args.ki),
+        "kalman" : lambda: KalmanServo(q_offset=args.q_offset, q_freq=args.q_freq, r=args.r),
+    }[args.servo]()
+    delay_filter = DelayFilter(window=args.window, threshold=args.threshold, margin=args.margin) if args.window else None
+
+    # Live.
+    if args.live:
+        from tools.timecard import TimeCardClient
+        with TimeCardClient(csr_csv=args.csr_csv) as client:
+            run_servo_live(client, servo, delay_filter,
+                samples        = args.count,
+                period         = args.period,
+                steer          = args.steer,
+                steer_interval = args.steer_interval,
+                record         = args.record,
+            )
+        return
+
+    # Offline.
+    if args.samples is None:
+        parser.error("samples file required (or --live).")
+    results = run_servo(ptm_exchanges(*load_samples(args.samples)), servo, delay_filter)
+    for name, value in servo_stats(results).items():
+        print(f"{name:>16s}: {value:.3f}" if isinstance(value, float) else f"{name:>16s}: {value}")
+    if args.output is not None:
+        np.savetxt(args.output, np.stack([results.t, results.measured, results.delay, results.accepted,
+            results.offset, results.freq, results.innovation], axis=1),
+            fmt="%.3f", delimiter=",", header=",".join(ServoResults._fields))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+
+import numpy as np
+
+# Software (NumPy) reference model of LitePCIe's PTM sniffer raw datapath:
+#
+#   rx_data/rx_ctl (16-bit) -> RawDatapath (16->32-bit + Word Alignment) -> RawDescrambler.
+#
+# Every stage operates on whole arrays (no per-symbol Python loop), allowing full captures to be
+# decoded in milliseconds and used as a golden model for the gateware.
+
+# Symbols (4.2.1) ----------------------------------------------------------------------------------
+
+def K(x, y):
+    """K code generator ex: K(28, 5) is COM Symbol"""
+    return (y << 5) | x
+
+COM = K(28, 5) # Comma.
+STP = K(27, 7) # Start TLP.
+SDP = K(28, 2) # Start DLLP.
+END = K(29, 7) # End.
+EDB = K(30, 7) # End Bad.
+PAD = K(23, 7) # Pad.
+SKP = K(28, 0) # Skip.
+FTS = K(28, 1) # Fast Training Sequence.
+IDL = K(28, 3) # Idle.
+
+# Scrambler (Appendix C) ---------------------------------------------------------------------------
+
+SCRAMBLER_PERIOD = 2**16 - 1
+
+def scrambler_keystream(length=SCRAMBLER_PERIOD, reset=0xffff):
+    """Return the per-symbol scrambling bytes generated by the G(X) = X^16 + X^5 + X^4 + X^3 + 1
+    LFSR (as described in PCIe Base Specification's Appendix C) after a LFSR reset (COM)."""
+    keystream = np.zeros(length, dtype=np.uint8)
+    lfsr = reset
+    for n in range(length):
+        byte = 0
+        for i in range(8):
+            msb   = (lfsr >> 15) & 0b1
+            byte |= msb << i
+            lfsr  = ((lfsr << 1) & 0xffff) ^ (0b0000_0000_0011_1000 * msb) ^ msb
+        keystream[n] = byte
+    return keystream
+
+_keystream = np.zeros(0, dtype=np.uint8)
+
+def _get_keystream(length):
+    """Return (cached) keystream covering at least length symbols (LFSR resets being frequent, only
+    the beginning of the sequence is generally needed)."""
+    global _keystream
+    if len(_keystream) < min(length, SCRAMBLER_PERIOD):
+        _keystream = scrambler_keystream(min(max(length, 1024), SCRAMBLER_PERIOD))
+    return _keystream
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def words_to_symbols(data, ctrl, dw=32):
+    """Split data/ctrl words in symbols (bytes) / K-flags arrays (first symbol in LSBs)."""
+    n       = dw//8
+    data    = np.asarray(data, dtype=np.uint64)
+    ctrl    = np.asarray(ctrl, dtype=np.uint64)
+    shifts  = np.arange(n, dtype=np.uint64)
+    symbols = ((data[:, None] >> (8*shifts)) & 0xff).astype(np.uint8).reshape(-1)
+    k       = ((ctrl[:, None] >> shifts) & 0b1).astype(bool).reshape(-1)
+    return symbols, k
+
+def symbols_to_words(symbols, k, dw=32):
+    """Pack symbols/K-flags arrays in data/ctrl words (first symbol in LSBs)."""
+    n      = dw//8
+    length = (len(symbols)//n)*n
+    shifts = np.arange(n, dtype=np.uint64)
+    data   = (symbols[:length].reshape(-1, n).astype(np.uint64) << (8*shifts)).sum(axis=1)
+    ctrl   = (k[:length].reshape(-1, n).astype(np.uint64) << shifts).sum(axis=1)
+    return data.astype(np.uint32 if dw <= 32 else np.uint64), ctrl.astype(np.uint8)
+
+def _last_index(mask):
+    """For each position, return the index of the last True element of mask (at or before it, -1
+    if none)."""
+    index = np.where(mask, np.arange(len(mask)), -1)
+    return np.maximum.accumulate(index) if len(index) else index
+
+# Raw Decoder --------------------------------------------------------------------------------------
+
+class RawDecoder:
+    """Streaming model of RawDatapath + RawDescrambler.
+
+    Chunks of the raw capture can be passed to successive decode calls: the aligner/descrambler
+    states are kept between calls, so a capture of any length can be decoded with a bounded memory
+    use. Results are identical to a single call on the whole capture.
+    """
+    def __init__(self, phy_dw=16):
+        self.phy_dw = phy_dw
+
+        # Datapath state: last 32-bit word (Aligner buffer) + incomplete word, and their offset.
+        self._symbols   = np.zeros(0, dtype=np.uint8)
+        self._k         = np.zeros(0, dtype=bool)
+        self._offset    = 0
+        self._alignment = 0
+
+        # Descrambler state: words since last COM word.
+        self._words_since_com = 0
+
+    def datapath(self, symbols, k):
+        """Model of RawDatapath: Data-Width adaptation and Word Alignment.
+
+        As the RawWordAligner, each 32-bit word containing a COM updates the alignment (lowest COM
+        position in the word) that is applied from this word. Output word n is built from input
+        words n/n+1 shifted by the alignment. Returns aligned symbols, K-flags and the offset of
+        each symbol in the raw capture.
+        """
+        symbols = np.concatenate([self._symbols, symbols])
+        k       = np.concatenate([self._k, k])
+        words   = len(symbols)//4
+        if words < 2:
+            self._symbols, self._k = symbols, k
+            return symbols[:0], k[:0], np.zeros(0, dtype=np.int64)
+
+        # Alignment detection: lowest COM position of each word.
+        com_words = ((symbols[:4*words] == COM) & k[:4*words]).reshape(-1, 4)
+        has_com   = com_words.any(axis=1)
+        alignment = np.argmax(com_words, axis=1)
+
+        # Alignment used for each output word: alignment of the last COM word seen.
+        last      = _last_index(has_com)
+        aligned   = np.where(last[:-1] >= 0, alignment[np.maximum(last[:-1], 0)], self._alignment)
+        if last[-1] >= 0:
+            self._alignment = int(alignment[last[-1]])
+
+        # Data selection.
+        index   = 4*np.arange(words - 1)[:, None] + aligned[:, None] + np.arange(4)[None, :]
+        index   = index.reshape(-1)
+        offsets = self._offset + index
+
+        # Keep last word (and incomplete word) for next call.
+        self._symbols, self._k = symbols[4*(words - 1):], k[4*(words - 1):]
+        self._offset += 4*(words - 1)
+
+        return symbols[index], k[index], offsets
+
+    def descrambler(self, symbols, k):
+        """Model of RawDescrambler: Descramble aligned symbols.
+
+        As the gateware, the LFSR is advanced by 4 symbols on each word and is reset after each
+        word containing a COM symbol; K symbols are not descrambled. On an aligned stream, this is
+        equivalent to the per-symbol rules of the specification since COM/SKPs are grouped in SKP
+        Ordered-Set words.
+        """
+        com   = ((symbols == COM) & k).reshape(-1, 4).any(axis=1)
+        words = len(com)
+        if words == 0:
+            return symbols, k
+
+        # LFSR position of each symbol: symbols since the last word containing a COM.
+        word     = np.arange(words)
+        last_com = np.concatenate([[-1], _last_index(com)[:-1]])
+        since    = np.where(last_com >= 0, word - last_com - 1, self._words_since_com + word)
+        position = (4*since[:, None] + np.arange(4)[None, :]).reshape(-1) % SCRAMBLER_PERIOD
+        if com.any():
+            self._words_since_com = words - 1 - int(np.nonzero(com)[0][-1])
+        else:
+            self._words_since_com += words
+        keystream = _get_keystream(int(position.max()) + 1)
+
+        # Descrambling (K symbols are not scrambled).
+        symbols = np.where(k, symbols, symbols ^ keystream[position])
+        return symbols, k
+
+    def decode_symbols(self, data, ctrl):
+        """Decode a chunk of raw data/ctrl words, returns descrambled symbols, K-flags and offsets
+        (symbol index in the raw capture)."""
+        symbols, k          = words_to_symbols(data, ctrl, dw=self.phy_dw)
+        symbols, k, offsets = self.datapath(symbols, k)
+        symbols, k          = self.descrambler(symbols, k)
+        return symbols, k, offsets
+
+    def decode(self, data, ctrl):
+        """Decode a chunk of raw data/ctrl words, returns descrambled 32-bit data/ctrl words (ctrl
+        bits marking K symbols)."""
+        symbols, k, _ = self.decode_symbols(data, ctrl)
+        return symbols_to_words(symbols, k, dw=32)
+
+def raw_datapath(data, ctrl, phy_dw=16):
+    """Model of RawDatapath: returns aligned 32-bit data/ctrl words."""
+    symbols, k    = words_to_symbols(data, ctrl, dw=phy_dw)
+    symbols, k, _ = RawDecoder(phy_dw=phy_dw).datapath(symbols, k)
+    return symbols_to_words(symbols, k, dw=32)
+
+def raw_descrambler(data, ctrl):
+    """Model of RawDescrambler: returns descrambled 32-bit data/ctrl words."""
+    symbols, k = words_to_symbols(data, ctrl, dw=32)
+    symbols, k = RawDecoder().descrambler(symbols, k)
+    return symbols_to_words(symbols, k, dw=32)
+
+def raw_decode(data, ctrl, phy_dw=16):
+    """Model of RawDatapath + RawDescrambler: returns descrambled 32-bit data/ctrl words (ctrl bits
+    marking K symbols)."""
+    return RawDecoder(phy_dw=phy_dw).decode(data, ctrl)
+
+# TLP Extractor ------------------------------------------------------------------------------------
+
+class TLPExtractor:
+    """Streaming model of TLPAligner: extract TLPs framed by STP/END symbols.
+
+    Descrambled symbols are passed to successive extract calls, which yield (offset, tlp) tuples
+    with offset the raw capture offset of the STP symbol and tlp the bytes between STP and END
+    (Sequence Number, TLP, LCRC). TLPs ended by EDB (nullified) or interrupted by another framing
+    symbol are dropped.
+    """
+    def __init__(self, max_length=4096 + 32):
+        self.max_length = max_length
+        self._symbols   = np.zeros(0, dtype=np.uint8)
+        self._k         = np.zeros(0, dtype=bool)
+        self._offsets   = np.zeros(0, dtype=np.int64)
+
+    def extract(self, symbols, k, offsets):
+        symbols = np.concatenate([self._symbols, symbols])
+        k       = np.concatenate([self._k, k])
+        offsets = np.concatenate([self._offsets, offsets])
+
+        # Framing symbols.
+        framing = np.nonzero(k & ((symbols == STP) | (symbols == SDP) | (symbols == END) |
+                                  (symbols == EDB) | (symbols == COM)))[0]
+        starts  = np.nonzero(k & (symbols == STP))[0]
+
+        # TLPs.
+        keep = len(symbols)
+        for start in starts:
+            n = np.searchsorted(framing, start, side="right")
+            if n == len(framing):
+                # TLP not ended in this chunk: keep it for next call (unless too long).
+                if (len(symbols) - start) <= self.max_length:
+                    keep = start
+                break
+            stop = framing[n]
+            if symbols[stop] == END:
+                yield int(offsets[start]), symbols[start + 1:stop].tobytes()
+
+        # Keep unfinished TLP for next call.
+        self._symbols = symbols[keep:]
+        self._k       = k[keep:]
+        self._offsets = offsets[keep:]
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    from tools.dump import load_dump, samples_per_cycle
+    parser = argparse.ArgumentParser(description="Offline PCIe raw capture decoder (RawDatapath/RawDescrambler model).")
+    parser.add_argument("dump",                                         help="Binary dump file.")
+    parser.add_argument("--direction", default="rx", choices=["rx", "tx"], help="Capture direction.")
+    parser.add_argument("--prefix",    default="s7pciephy_debug",        help="Capture columns prefix.")
+    parser.add_argument("--decimate",  default=None, type=int,           help="Capture decimation (default: dump samples per symbol clock).")
+    parser.add_argument("--output",    default=None,                     help="Output file (32-bit words, little-endian).")
+    args = parser.parse_args()
+
+    with load_dump(args.dump) as dump:
+        decimate = samples_per_cycle(dump) if args.decimate is None else args.decimate
+        data = dump[f"{args.prefix}_{args.direction}_data"][::decimate]
+        ctrl = dump[f"{args.prefix}_{args.direction}_ctl"][::decimate]
+        data, ctrl = raw_decode(data, ctrl)
+
+    if args.output is not None:
+        data.astype("<u4").tofile(args.output)
+    else:
+        for d, c in zip(data, ctrl):
+            print(f"0x{d:08x} 0b{c:04b}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import time
+import zlib
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from tools.dump import write_dump
+from tools.sniffer import COM, SKP, STP, SDP, END, SCRAMBLER_PERIOD, scrambler_keystream, symbols_to_words
+from tools.ptm_extract import PTMRecord, PTM_REQUEST, PTM_RESPONSE, PTM_RESPONSED
+from tools.ptm_extract import PTM_REQUEST_FMT_TYPE, PTM_RESPONSE_FMT_TYPE, PTM_RESPONSED_FMT_TYPE
+from tools.ptm_extract import PTM_REQUEST_MESSAGE_CODE, PTM_RESPONSE_MESSAGE_CODE
+from tools.ptm_extract import RAW_CTL_SHIFT
+
+# Synthetic PCIe symbol stream generator:
+#
+#   Packets (TLPs/DLLPs/PTM TLPs) + Logical Idles + SKP Ordered-Sets -> Scrambler -> Symbol errors
+#   -> rx_data/rx_ctl (16-bit, as seen by the sniffer tap: after 8b/10b decoding, K-flags in ctl).
+#
+# Packets are generated per packet but framing, scrambling, error injection and packing operate on
+# whole arrays, so millions of symbols are generated per second. Generated PTM TLPs are returned as
+# ground truth (PTMRecords, as decoded by tools.ptm_extract).
+#
+# Scrambling follows the LitePCIe RawDescrambler convention (validated on hardware captures): the
+# LFSR is reset by the SKP Ordered-Set (COM + 3 SKP), the symbol following it being scrambled with
+# the first keystream byte.
+
+# TLPs ---------------------------------------------------------------------------------------------
+
+MWR32_FMT_TYPE = 0x40 # Memory Write, 3DW Header, With Data.
+MRD32_FMT_TYPE = 0x00 # Memory Read,  3DW Header, No Data.
+CPLD_FMT_TYPE  = 0x4a # Completion With Data.
+
+def tlp_header(fmt_type, length=0, dws=()):
+    """Return a TLP header (bytes): DW0 (Fmt/Type, Length) followed by dws (32-bit, Big-Endian)."""
+    dw0 = (fmt_type << 24) | (length & 0x3ff)
+    return b"".join(dw.to_bytes(4, "big") for dw in (dw0, *dws))
+
+def mwr_tlp(prng, length):
+    address = int(prng.integers(0, 2**30))*4
+    return tlp_header(MWR32_FMT_TYPE, length, (0x0100_00ff, address)) + prng.bytes(4*length)
+
+def mrd_tlp(prng, length):
+    address = int(prng.integers(0, 2**30))*4
+    return tlp_header(MRD32_FMT_TYPE, length, (0x0100_00ff, address))
+
+def cpld_tlp(prng, length):
+    return tlp_header(CPLD_FMT_TYPE, length, (0x0000_0000 | (4*length & 0xfff), 0x0100_0000)) + prng.bytes(4*length)
+
+def ptm_tlp(type, requester_id=0x0008, master_time=0, link_delay=0):
+    """Return a PTM Request/Response/ResponseD TLP (master_time/link_delay as PTMRecord)."""
+    fmt_type, message_code, length = {
+        PTM_REQUEST   : (PTM_REQUEST_FMT_TYPE,   PTM_REQUEST_MESSAGE_CODE,  0),
+        PTM_RESPONSE  : (PTM_RESPONSE_FMT_TYPE,  PTM_RESPONSE_MESSAGE_CODE, 0),
+        PTM_RESPONSED : (PTM_RESPONSED_FMT_TYPE, PTM_RESPONSE_MESSAGE_CODE, 1),
+    }[type]
+    tlp = tlp_header(fmt_type, length, ((requester_id << 16) | message_code,))
+    if type == PTM_RESPONSED:
+        tlp += master_time.to_bytes(8, "big") + link_delay.to_bytes(4, "big")
+    else:
+        tlp += bytes(8)
+    return tlp
+
+tlp_generators = {
+    "mwr"  : mwr_tlp,
+    "mrd"  : mrd_tlp,
+    "cpld" : cpld_tlp,
+}
+
+# Framing ------------------------------------------------------------------------------------------
+
+# Framed packets/Ordered-Sets are bytes objects with K symbols at their first/last symbols.
+
+def frame_tlp(tlp, sequence):
+    """Frame a TLP: STP, Sequence Number, TLP, LCRC, END.
+
+    The LCRC is a plain CRC-32 (not bit-exact with the PCIe LCRC, not checked by the sniffer)."""
+    body  = (sequence & 0xfff).to_bytes(2, "big") + tlp
+    body += zlib.crc32(body).to_bytes(4, "little")
+    return bytes([STP]) + body + bytes([END])
+
+def frame_dllp(dllp):
+    """Frame a DLLP (4 bytes + CRC-16): SDP, DLLP, CRC, END."""
+    return bytes([SDP]) + dllp + (zlib.crc32(dllp) & 0xffff).to_bytes(2, "big") + bytes([END])
+
+SKP_ORDERED_SET = bytes([COM, SKP, SKP, SKP])
+
+# Scrambler ----------------------------------------------------------------------------------------
+
+def scramble(symbols, k):
+    """Scramble D symbols, LFSR reset by the SKP Ordered-Sets (COM + 3 SKP).
+
+    Scrambling being a XOR with the keystream, this is also the descrambler."""
+    # LFSR position of each symbol: symbols since the end of the last Ordered-Set.
+    coms     = np.flatnonzero(k & (symbols == COM))
+    starts   = np.concatenate([[0], coms])
+    lengths  = np.diff(np.concatenate([starts, [len(symbols)]]))
+    resets   = np.concatenate([[0], np.full(len(coms), 4)])
+    position = np.arange(len(symbols)) - np.repeat(starts + resets, lengths)
+    scramble = ~k & (position >= 0)
+    if not scramble.any():
+        return symbols.copy()
+    position  = np.where(scramble, position, 0) % SCRAMBLER_PERIOD
+    keystream = scrambler_keystream(int(position.max()) + 1)
+    return np.where(scramble, symbols ^ keystream[position], symbols).astype(np.uint8)
+
+# Symbol Generator ---------------------------------------------------------------------------------
+
+SymbolStream = namedtuple("SymbolStream", ["symbols", "k", "ptms", "errors"])
+
+class SymbolGenerator:
+    """Synthetic PCIe (x1) symbol stream generator.
+
+    - load         : Link load (fraction of symbols carrying packets, the rest are Logical Idles).
+    - tlp_mix      : {"mwr"/"mrd"/"cpld": weight} TLP mix.
+    - payload_dws  : TLP payload/request lengths (DWs), picked uniformly.
+    - dllp_ratio   : Fraction of DLLPs (Ack/UpdateFC) in the packets.
+    - min_gap      : Minimum Logical Idles (symbols) between packets, also applied inside PTM bursts
+                     (0: back-to-back packets).
+    - skp_interval : SKP Ordered-Set cadence (symbols, Ordered-Sets are inserted between packets).
+    - skp_align    : SKP Ordered-Sets alignment (symbols): 4 keeps the COMs at the same position in
+                     the 32-bit words (as observed on RX captures), 2 lets it change between
+                     Ordered-Sets (as observed on TX captures, Word Aligner re-alignments).
+    - ptm_interval : PTM burst cadence (symbols, 0: no PTM TLPs).
+    - ptm_burst    : PTM TLPs types sent on each burst (separated by min_gap Logical Idles).
+    - error_rate   : Symbol error probability (random symbol corruption after scrambling).
+
+    Packets start on 2-symbol boundaries (16-bit PIPE interface, as observed on captures).
+    """
+    def __init__(self, seed=0, load=0.8,
+        tlp_mix      = {"mwr": 2, "mrd": 1, "cpld": 1},
+        payload_dws  = (16, 32, 64),
+        dllp_ratio   = 0.2,
+        min_gap      = 0,
+        skp_interval = 1180,
+        skp_align    = 4,
+        ptm_interval = 4096,
+        ptm_burst    = (PTM_RESPONSE, PTM_RESPONSED),
+        error_rate   = 0.0):
+        assert 0 < load <= 1
+        assert skp_align in [2, 4]
+        self.prng         = np.random.default_rng(seed)
+        self.load         = load
+        self.tlp_types    = list(tlp_mix.keys())
+        self.tlp_weights  = np.cumsum(list(tlp_mix.values()))/sum(tlp_mix.values())
+        self.payload_dws  = list(payload_dws)
+        self.dllp_ratio   = dllp_ratio
+        self.min_gap      = min_gap
+        self.burst_gap    = min_gap + min_gap%2 # Packets on 2-symbol boundaries.
+        self.skp_interval = skp_interval
+        self.skp_align    = skp_align
+        self.ptm_interval = ptm_interval
+        self.ptm_burst    = list(ptm_burst)
+        self.error_rate   = error_rate
+        self.sequence     = 0
+        self.master_time  = int(self.prng.integers(0, 2**62))
+
+    def packet(self):
+        """Return a random framed TLP/DLLP."""
+        if self.prng.random() < self.dllp_ratio:
+            return frame_dllp(self.prng.bytes(4))
+        tlp_type = self.tlp_types[int(np.searchsorted(self.tlp_weights, self.prng.random(), side="right"))]
+        length   = self.payload_dws[int(self.prng.integers(len(self.payload_dws)))]
+        self.sequence += 1
+        return frame_tlp(tlp_generators[tlp_type](self.prng, length), self.sequence)
+
+    def ptm_packets(self):
+        """Return the framed PTM TLPs of a burst and their PTMRecords (offset relative to the burst)."""
+        packets = []
+        records = []
+        offset  = 0
+        for type in self.ptm_burst:
+            self.master_time += int(self.prng.integers(1, 2**20))
+            master_time = self.master_time if type == PTM_RESPONSED else None
+            link_delay  = int(self.prng.integers(0, 2**10)) if type == PTM_RESPONSED else None
+            self.sequence += 1
+            packet = frame_tlp(ptm_tlp(type, 0x0008, master_time or 0, link_delay or 0), self.sequence)
+            packets.append(packet)
+            records.append((PTMRecord(offset, type, 0x0008, master_time, link_delay), len(packet)))
+            offset += len(packet) + self.burst_gap
+        return packets, records
+
+    def generate(self, nsymbols):
+        """Generate nsymbols symbols, return a SymbolStream (scrambled symbols, K-flags, PTMRecords of
+        the generated PTM TLPs and offsets of the corrupted symbols).
+
+        PTM TLPs containing a corrupted symbol are returned with a None type."""
+        parts     = []
+        k_offsets = [] # Offsets of the K symbols.
+        ptms      = []
+        spans     = []
+        position  = 0
+        since_skp = self.skp_interval # Start with an Ordered-Set (Descrambler synchronization).
+        since_ptm = 0
+        while position < nsymbols:
+            # SKP Ordered-Set (Aligned with Logical Idles).
+            if since_skp >= self.skp_interval:
+                idles = -position % self.skp_align
+                parts.append(bytes(idles) + SKP_ORDERED_SET)
+                k_offsets.extend(range(position + idles, position + idles + 4))
+                position += idles + 4
+                since_skp = 0
+
+            # Packets.
+            if self.ptm_interval and since_ptm >= self.ptm_interval:
+                packets, records = self.ptm_packets()
+                for record, length in records:
+                    ptms.append(record._replace(offset=position + record.offset))
+                    spans.append((position + record.offset, position + record.offset + length))
+                since_ptm = 0
+            else:
+                packets = [self.packet()]
+            length = 0
+            for n, packet in enumerate(packets):
+                if n:
+                    parts.append(bytes(self.burst_gap))
+                    length += self.burst_gap
+                parts.append(packet)
+                k_offsets.extend([position + length, position + length + len(packet) - 1])
+                length += len(packet)
+
+            # Logical Idles (Link load, Packets on 2-symbol boundaries).
+            mean_gap = length*(1 - self.load)/self.load
+            gap      = int(self.prng.geometric(1/(1 + mean_gap))) - 1 + self.min_gap
+            gap     += (length + gap) % 2
+            parts.append(bytes(gap))
+            position  += length + gap
+            since_skp += length + gap
+            since_ptm += length + gap
+
+        # Assemble/Scramble.
+        nsymbols  = 2*(nsymbols//2) # Whole 16-bit words.
+        symbols   = np.frombuffer(b"".join(parts), dtype=np.uint8)[:nsymbols].copy()
+        k         = np.zeros(len(symbols), dtype=bool)
+        k_offsets = np.array(k_offsets, dtype=np.int64)
+        k[k_offsets[k_offsets < nsymbols]] = True
+        symbols   = scramble(symbols, k)
+
+        # Symbol errors.
+        errors = np.nonzero(self.prng.random(nsymbols) < self.error_rate)[0]
+        symbols[errors] ^= self.prng.integers(1, 256, len(errors)).astype(np.uint8)
+
+        # PTM TLPs ground truth (complete, corrupted ones flagged).
+        records = []
+        for record, (start, stop) in zip(ptms, spans):
+            if stop > nsymbols:
+                break
+            corrupted = np.searchsorted(errors, start) != np.searchsorted(errors, stop)
+            records.append(record._replace(type=None) if corrupted else record)
+        return SymbolStream(symbols, k, records, errors)
+
+# Output -------------------------------------------------------------------------------------------
+
+def stream_words(stream, phy_dw=16):
+    """Pack a SymbolStream in rx_data/rx_ctl words (first symbol in LSBs)."""
+    return symbols_to_words(stream.symbols, stream.k, dw=phy_dw)
+
+def write_raw(filename, data, ctrl):
+    """Write rx_data/rx_ctl words as a raw capture (see tools.ptm_extract)."""
+    ((ctrl.astype(np.uint32) << RAW_CTL_SHIFT) | data.astype(np.uint32)).astype("<u4").tofile(filename)
+
+def write_capture_dump(filename, data, ctrl, direction="rx", prefix="s7pciephy_debug", decimate=2, metadata=None):
+    """Write rx_data/rx_ctl words as a binary dump (samples repeated decimate times, as captures)."""
+    write_dump(filename, {
+            f"{prefix}_{direction}_data" : np.repeat(data, decimate),
+            f"{prefix}_{direction}_ctl"  : np.repeat(ctrl, decimate),
+        },
+        widths   = {f"{prefix}_{direction}_data": 16, f"{prefix}_{direction}_ctl": 2},
+        metadata = {"source": "tools.symbol_generator", "samples_per_cycle": decimate, **(metadata or {})},
+    )
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic PCIe symbol stream generator (sniffer stimulus).")
+    parser.add_argument("output",                                         help="Output capture file.")
+    parser.add_argument("--format",       default="raw", choices=["raw", "dump"], help="Output format.")
+    parser.add_argument("--symbols",      default=2**22, type=int,        help="Number of symbols.")
+    parser.add_argument("--seed",         default=0,     type=int,        help="Random seed.")
+    parser.add_argument("--load",         default=0.8,   type=float,      help="Link load (0-1).")
+    parser.add_argument("--tlp-mix",      default="mwr:2,mrd:1,cpld:1",   help="TLP mix (type:weight, comma separated).")
+    parser.add_argument("--payload-dws",  default="16,32,64",             help="TLP lengths in DWs (comma separated).")
+    parser.add_argument("--dllp-ratio",   default=0.2,   type=float,      help="DLLPs ratio.")
+    parser.add_argument("--min-gap",      default=0,     type=int,        help="Minimum Logical Idles between packets (symbols).")
+    parser.add_argument("--skp-interval", default=1180,  type=int,        help="SKP Ordered-Set interval (symbols).")
+    parser.add_argument("--skp-align",    default=4,     type=int, choices=[2, 4], help="SKP Ordered-Set alignment (symbols).")
+    parser.add_argument("--ptm-interval", default=4096,  type=int,        help="PTM burst interval (symbols, 0: disabled).")
+    parser.add_argument("--ptm-burst",    default="response,responsed",   help="PTM TLPs sent on each burst.")
+    parser.add_argument("--error-rate",   default=0.0,   type=float,      help="Symbol error rate.")
+    args = parser.parse_args()
+
+    generator = SymbolGenerator(
+        seed         = args.seed,
+        load         = args.load,
+        tlp_mix      = {t: float(w) for t, w in (e.split(":") for e in args.tlp_mix.split(","))},
+        payload_dws  = [int(n) for n in args.payload_dws.split(",")],
+        dllp_ratio   = args.dllp_ratio,
+        min_gap      = args.min_gap,
+        skp_interval = args.skp_interval,
+        skp_align    = args.skp_align,
+        ptm_interval = args.ptm_interval,
+        ptm_burst    = args.ptm_burst.split(","),
+        error_rate   = args.error_rate,
+    )
+    t0 = time.perf_counter()
+    stream = generator.generate(args.symbols)
+    data, ctrl = stream_words(stream)
+    t1 = time.perf_counter()
+    if args.format == "raw":
+        write_raw(args.output, data, ctrl)
+    else:
+        write_capture_dump(args.output, data, ctrl, metadata={"seed": args.seed, "load": args.load})
+
+    ptms = [r for r in stream.ptms if r.type is not None]
+    print(f"{len(stream.symbols)} symbols ({len(stream.symbols)/(t1 - t0)/1e6:.1f} Msymbols/s), "
+          f"{len(ptms)} PTM TLPs ({len(stream.ptms) - len(ptms)} corrupted), {len(stream.errors)} symbol errors -> {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import csv
+import time
+import mmap
+import fcntl
+import struct
+import argparse
+from collections import Counter
+
+import numpy as np
+
+# Time Event Format --------------------------------------------------------------------------------
+
+# Fixed-size records (4 64-bit little-endian words) streamed by the TimeEventStream
+# (gateware/events.py) to a LitePCIe DMA Writer ring buffer:
+#
+# +----------------------------------------------------------------+
+# | Word 0: Type specific (TIME: Time, PTM: T1, PPS: Timestamp)    |
+# | Word 1: Type specific (TIME: sys_clk cycles, PTM: T2)          |
+# | Word 2: Type specific (PTM: T4)                                |
+# | Header: data [31:0] (PTM: Link Delay), sequence [55:32],       |
+# |         type [59:56], flags [63:60]                            |
+# +----------------------------------------------------------------+
+#
+# The ring is consumed in place (mmapped DMA buffers, no syscall/copy per record): a record is new
+# when its sequence is the expected one, not yet written when it is a cleared one (type NONE) or
+# one of the previous ring lap, and overwritten (overrun) when it is one of a later lap.
+
+TIME_EVENT_RECORD_SIZE   = 32
+TIME_EVENT_SEQUENCE_BITS = 24
+TIME_EVENT_SEQUENCE_MASK = 2**TIME_EVENT_SEQUENCE_BITS - 1
+
+TIME_EVENT_TYPE_NONE = 0x0
+TIME_EVENT_TYPE_PAD  = 0x1
+TIME_EVENT_TYPE_TIME = 0x2
+TIME_EVENT_TYPE_PTM  = 0x3
+TIME_EVENT_TYPE_PPS  = 0x4
+
+TIME_EVENT_TYPES = {
+    TIME_EVENT_TYPE_PAD  : "pad",
+    TIME_EVENT_TYPE_TIME : "time",
+    TIME_EVENT_TYPE_PTM  : "ptm",
+    TIME_EVENT_TYPE_PPS  : "pps",
+}
+
+TIME_EVENT_FLAG_LOST = (1 << 0)
+
+time_event_dtype = np.dtype([
+    ("word0",  "<u8"),
+    ("word1",  "<u8"),
+    ("word2",  "<u8"),
+    ("header", "<u8"),
+])
+
+def time_event_data(records):
+    return (records["header"] & np.uint64(0xffffffff)).astype(np.uint32)
+
+def time_event_sequence(records):
+    return ((records["header"] >> np.uint64(32)) & np.uint64(TIME_EVENT_SEQUENCE_MASK)).astype(np.int64)
+
+def time_event_type(records):
+    return ((records["header"] >> np.uint64(56)) & np.uint64(0xf)).astype(np.uint8)
+
+def time_event_flags(records):
+    return ((records["header"] >> np.uint64(60)) & np.uint64(0xf)).astype(np.uint8)
+
+def time_event_header(sequence, type, data=0, flags=0):
+    return (data & 0xffffffff) | ((sequence & TIME_EVENT_SEQUENCE_MASK) << 32) | (type << 56) | (flags << 60)
+
+# Time Event Ring ----------------------------------------------------------------------------------
+
+class TimeEventRing:
+    """Consumer of a ring buffer of time event records written by DMA.
+
+    buffer is the ring memory (ex: mmapped DMA Writer buffers), decoded in place: poll returns
+    views of the ring (valid until the DMA laps the ring). Records overwritten before being
+    consumed are counted in lost and skipped.
+    """
+    def __init__(self, buffer):
+        self.records  = np.frombuffer(buffer, dtype=time_event_dtype)
+        self.position = 0 # Records consumed since stream start (PAD included).
+        self.lost     = 0 # Records overwritten before being consumed (Overruns).
+
+    def __len__(self):
+        return len(self.records)
+
+    def poll(self, max_records=None):
+        """Return a view of the new contiguous records (PAD included, see events()), empty when
+        no record is available."""
+        while True:
+            index = self.position % len(self.records)
+            count = len(self.records) - index
+            if max_records is not None:
+                count = min(count, max_records)
+            records  = self.records[index:index + count]
+            sequence = time_event_sequence(records)
+            expected = (self.position + np.arange(count)) & TIME_EVENT_SEQUENCE_MASK
+            invalid  = np.flatnonzero((sequence != expected) | (time_event_type(records) == TIME_EVENT_TYPE_NONE))
+            if len(invalid) == 0:
+                self.position += count
+                return records
+            if invalid[0] > 0:
+                self.position += int(invalid[0])
+                return records[:invalid[0]]
+            # First record not the expected one: not written yet or overwritten (later lap).
+            ahead = (int(sequence[0]) - int(expected[0])) & TIME_EVENT_SEQUENCE_MASK
+            if time_event_type(records[:1])[0] == TIME_EVENT_TYPE_NONE or ahead >= 2**(TIME_EVENT_SEQUENCE_BITS - 1):
+                return records[:0]
+            self.lost     += ahead
+            self.position += ahead
+
+    def events(self, max_records=None):
+        """Return the new records without PAD records (copy)."""
+        records = self.poll(max_records)
+        return records[time_event_type(records) != TIME_EVENT_TYPE_PAD]
+
+# LitePCIe Device ----------------------------------------------------------------------------------
+
+# LitePCIe driver ioctls (software/kernel/litepcie.h).
+
+def _ioc(direction, nr, size):
+    return (direction << 30) | (size << 16) | (ord("S") << 8) | nr
+
+_IOC_WRITE = 1
+_IOC_READ  = 2
+
+LITEPCIE_IOCTL_REG            = _ioc(_IOC_READ | _IOC_WRITE, 0, 12)
+LITEPCIE_IOCTL_DMA            = _ioc(_IOC_WRITE,             20, 1)
+LITEPCIE_IOCTL_DMA_WRITER     = _ioc(_IOC_READ | _IOC_WRITE, 21, 24)
+LITEPCIE_IOCTL_MMAP_DMA_INFO  = _ioc(_IOC_READ,              24, 48)
+LITEPCIE_IOCTL_LOCK           = _ioc(_IOC_READ | _IOC_WRITE, 25, 6)
+
+TIME_EVENTS_CONTROL_ENABLE = (1 << 0)
+
+def load_csr_registers(filename):
+    """Return the {name: address} CSR registers of a CSR CSV file."""
+    registers = {}
+    with open(filename) as f:
+        for row in csv.reader(f):
+            if len(row) >= 3 and row[0] == "csr_register":
+                registers[row[1]] = int(row[2], 0)
+    return registers
+
+class LitePCIeTimeEvents:
+    """Time Event Stream consumer on a LitePCIe DMA channel.
+
+    The DMA Writer ring buffers are mmapped (zero-copy, as liblitepcie's zero_copy mode) and
+    consumed with a TimeEventRing: once started, records are read without syscalls.
+    """
+    def __init__(self, device="/dev/litepcie1", csr_csv="csr.csv", time_period=0):
+        self.device      = device
+        self.registers   = load_csr_registers(csr_csv)
+        self.time_period = time_period
+        self.fd          = None
+        self.mmap        = None
+        self.ring        = None
+
+    def _ioctl(self, request, fmt, *values):
+        data = bytearray(struct.pack(fmt, *values))
+        fcntl.ioctl(self.fd, request, data, True)
+        return struct.unpack(fmt, data)
+
+    def read_reg(self, name):
+        return self._ioctl(LITEPCIE_IOCTL_REG, "<IIB3x", self.registers[name], 0, 0)[1]
+
+    def write_reg(self, name, value):
+        self._ioctl(LITEPCIE_IOCTL_REG, "<IIB3x", self.registers[name], value, 1)
+
+    def _dma_writer(self, enable):
+        return self._ioctl(LITEPCIE_IOCTL_DMA_WRITER, "<B7xqq", enable, 0, 0)[1:]
+
+    def open(self):
+        self.fd = os.open(self.device, os.O_RDWR | os.O_CLOEXEC)
+        # Request DMA Writer.
+        if not self._ioctl(LITEPCIE_IOCTL_LOCK, "<6B", 0, 1, 0, 0, 0, 0)[5]:
+            raise OSError(f"{self.device}: DMA Writer not available.")
+        self._ioctl(LITEPCIE_IOCTL_DMA, "<B", 0) # No loopback.
+        # Map DMA Writer buffers.
+        info = self._ioctl(LITEPCIE_IOCTL_MMAP_DMA_INFO, "<6Q", *[0]*6)
+        rx_offset, rx_size, rx_count = info[3:6]
+        self.mmap = mmap.mmap(self.fd, rx_size*rx_count, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE, offset=rx_offset)
+        self.ring = TimeEventRing(self.mmap)
+        # Stop Time Event Stream and clear Ring (Records not written since start detected from their
+        # cleared header).
+        self.write_reg("time_events_control", 0)
+        self.mmap[:] = bytes(len(self.mmap))
+        # Start DMA Writer (Restarting at first buffer) then Time Event Stream (Sequence restarting at 0).
+        self._dma_writer(1)
+        self.write_reg("time_events_time_period", self.time_period)
+        self.write_reg("time_events_control", TIME_EVENTS_CONTROL_ENABLE)
+
+    def close(self):
+        if self.fd is None:
+            return
+        # Stop Time Event Stream (drained/padded) then DMA Writer.
+        self.write_reg("time_events_control", 0)
+        time.sleep(1e-3)
+        self._dma_writer(0)
+        self._ioctl(LITEPCIE_IOCTL_LOCK, "<6B", 0, 0, 0, 1, 0, 0)
+        self.ring = None
+        self.mmap.close()
+        os.close(self.fd)
+        self.fd = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def poll(self, max_records=None):
+        return self.ring.poll(max_records)
+
+    def events(self, max_records=None):
+        return self.ring.events(max_records)
+
+# Main ---------------------------------------------------------------------------------------------
+
+def format_event(record):
+    type  = int(time_event_type(record)[0])
+    flags = " lost" if time_event_flags(record)[0] & TIME_EVENT_FLAG_LOST else ""
+    seq   = int(time_event_sequence(record)[0])
+    if type == TIME_EVENT_TYPE_PTM:
+        return (f"{seq:8d} ptm  t1: {int(record['word0'][0])} t2: {int(record['word1'][0])} "
+                f"t4: {int(record['word2'][0])} link_delay: {int(time_event_data(record)[0])}{flags}")
+    if type == TIME_EVENT_TYPE_PPS:
+        return f"{seq:8d} pps  timestamp: {int(record['word0'][0])}{flags}"
+    if type == TIME_EVENT_TYPE_TIME:
+        return f"{seq:8d} time time: {int(record['word0'][0])} cycles: {int(record['word1'][0])}{flags}"
+    return f"{seq:8d} type {type}{flags}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Event Stream monitor (DMA ring, zero-copy).")
+    parser.add_argument("--device",       default="/dev/litepcie1",  help="LitePCIe DMA channel device of the Time Event Stream.")
+    parser.add_argument("--csr-csv",      default="csr.csv",         help="CSR configuration file.")
+    parser.add_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
+    parser.add_argument("--time-period",  default=0,     type=float, help="TIME records period (s, 0: Disabled).")
+    parser.add_argument("--duration",     default=10,    type=float, help="Monitoring duration (s).")
+    parser.add_argument("--verbose",      action="store_true",       help="Print each event.")
+    args = parser.parse_args()
+
+    counts = Counter()
+    with LitePCIeTimeEvents(args.device, args.csr_csv, int(args.time_period*args.sys_clk_freq)) as events:
+        start = last = time.monotonic()
+        while time.monotonic() - start < args.duration:
+            records = events.events()
+            if len(records) == 0:
+                time.sleep(1e-4)
+            for type, count in zip(*np.unique(time_event_type(records), return_counts=True)):
+                counts[TIME_EVENT_TYPES.get(int(type), type)] += int(count)
+            if args.verbose:
+                for n in range(len(records)):
+                    print(format_event(records[n:n + 1]))
+            if time.monotonic() - last >= 1:
+                last = time.monotonic()
+                print(", ".join(f"{name}: {count}" for name, count in sorted(counts.items())) +
+                      f", lost: {events.ring.lost}, gateware lost: {events.read_reg('time_events_lost')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#
+# This file is part of LitePCIe-PTM.
+#
+# Copyright (c) 2023 NetTimeLogic
+# Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import math
+import time
+from collections import namedtuple
+
+from litex import RemoteClient
+from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
+from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
+
+# TimeCard client built on top of LiteX's RemoteClient (JTAGBone/Etherbone/PCIe through litex_server).
+#
+# Each RemoteClient register access is a full round-trip to the board. To limit round-trips (and
+# skew between related registers), the client:
+# - Caches the register map of each CSR block (registers of the CSR region of a module).
+# - Reads a whole CSR block in a single burst.
+# - Pipelines a control write with the block read in the same Etherbone packet (the write being
+#   served before the reads by the server).
+
+# Constants ----------------------------------------------------------------------------------------
+
+PTM_CONTROL_ENABLE  = (1 << 0)
+PTM_CONTROL_TRIGGER = (1 << 1)
+PTM_STATUS_VALID    = (1 << 0)
+PTM_STATUS_BUSY     = (1 << 1)
+
+PTM_SCHEDULER_CONTROL_ENABLE = (1 << 0)
+PTM_SCHEDULER_CONTROL_FLUSH  = (1 << 1)
+PTM_SCHEDULER_SAMPLE_READABLE  = (1 << 0)
+PTM_SCHEDULER_SAMPLE_COMPLETED = (1 << 1)
+
+PTM_STATISTICS_CONTROL_SNAPSHOT = (1 << 0)
+PTM_STATISTICS_CONTROL_CLEAR    = (1 << 1)
+
+TIME_CONTROL_ENABLE = (1 << 0)
+TIME_CONTROL_READ   = (1 << 1)
+TIME_CONTROL_WRITE  = (1 << 2)
+
+# CSR Block ----------------------------------------------------------------------------------------
+
+class CSRBlock:
+    """Register map of a CSR block: registers of the CSR region of a module, read as a single burst.
+
+    Registers are selected by address, from the region base (csr_base) to the next region: a name
+    prefix could also select the registers of another module sharing it, the burst then reading
+    (and popping/latching) them.
+    """
+    def __init__(self, regs, bases, prefix, data_width=32):
+        self.prefix     = prefix
+        self.data_width = data_width
+        if prefix not in bases:
+            raise KeyError(f"No {prefix} CSR region in CSR map.")
+        start = bases[prefix]
+        end   = min([base for base in bases.values() if base > start], default=math.inf)
+        regs  = sorted([r for r in regs if start <= r.addr < end], key=lambda r: r.addr)
+        if len(regs) == 0:
+            raise KeyError(f"No {prefix} registers in CSR map.")
+        self.regs   = {r.name[len(prefix) + 1:]: r for r in regs}
+        self.base   = regs[0].addr
+        self.length = (regs[-1].addr - self.base)//4 + regs[-1].length
+
+    def decode(self, datas):
+        """Decode a burst read of the block, return a {name: value} dict."""
+        values = {}
+        for name, reg in self.regs.items():
+            value  = 0
+            offset = (reg.addr - self.base)//4
+            for data in datas[offset:offset + reg.length]:
+                value = (value << self.data_width) | data # MSB word first.
+            values[name] = value
+        return values
+
+# PTM Sample ---------------------------------------------------------------------------------------
+
+PTMSample = namedtuple("PTMSample", ["valid", "t1", "t2", "t3", "t4", "link_delay"])
+
+# PTM Statistics -----------------------------------------------------------------------------------
+
+class PTMStatistic(namedtuple("PTMStatistic", ["count", "min", "max", "sum", "sum2", "reference"])):
+    """Statistics (ns) of a PTM exchange value over a window (see gateware.ptm.PTMStatistics).
+
+    min/max are absolute, sum/sum2 are the sum/sum of squares of value - reference.
+    """
+    __slots__ = ()
+
+    @property
+    def mean(self):
+        return (self.reference + self.sum/self.count) if self.count else math.nan
+
+    @property
+    def std(self):
+        if self.count == 0:
+            return math.nan
+        mean = self.sum/self.count
+        return math.sqrt(max(self.sum2/self.count - mean**2, 0))
+
+    def __str__(self):
+        if self.count == 0:
+            return "no samples"
+        return f"min {self.min} max {self.max} mean {self.mean:.1f} std {self.std:.1f}"
+
+PTMStatistics = namedtuple("PTMStatistics", ["count", "invalid", "timeouts", "link_delay", "round_trip", "offset"])
+
+def _signed(value, width):
+    return value - (1 << width) if value & (1 << (width - 1)) else value
+
+def _saturate(value, width=32):
+    return max(-2**(width - 1), min(2**(width - 1) - 1, value))
+
+def decode_ptm_statistics(values):
+    """Return the PTMStatistics of the PTM Statistics registers ({name: value} of read_block)."""
+    def statistic(name, reference=0):
+        return PTMStatistic(
+            count     = values["count"],
+            min       = reference + _signed(values[f"{name}_min"], 32),
+            max       = reference + _signed(values[f"{name}_max"], 32),
+            sum       = _signed(values[f"{name}_sum"], 64),
+            sum2      = values[f"{name}_sum2"],
+            reference = reference,
+        )
+    return PTMStatistics(
+        count      = values["count"],
+        invalid    = values["invalid"],
+        timeouts   = values["timeouts"],
+        link_delay = statistic("link_delay"),
+        round_trip = statistic("round_trip"),
+        offset     = statistic("offset", reference=_signed(values["offset_reference"], 64)),
+    )
+
+def ptm_statistics_reference(samples, invalid=0, timeouts=0):
+    """Software reference of the PTM Statistics: PTMStatistics of the completed PTMSamples of a window."""
+    samples = [sample for sample in samples if sample.valid]
+    def statistic(values, reference=0):
+        values = [_saturate(value - reference) for value in values]
+        return PTMStatistic(
+            count     = len(values),
+            min       = reference + min(values, default=0),
+            max       = reference + max(values, default=0),
+            sum       = sum(values),
+            sum2      = sum(value**2 for value in values),
+            reference = reference,
+        )
+    return PTMStatistics(
+        count      = len(samples),
+        invalid    = invalid,
+        timeouts   = timeouts,
+        link_delay = statistic([s.link_delay  for s in samples]),
+        round_trip = statistic([s.t4 - s.t1   for s in samples]),
+        offset     = statistic([s.t2 - s.t1   for s in samples], reference=(samples[0].t2 - samples[0].t1) if samples else 0),
+    )
+
+# TimeCard Client ----------------------------------------------------------------------------------
+
+class TimeCardClient:
+    def __init__(self, host="localhost", port=1234, csr_csv=None, bus=None):
+        self.bus     = RemoteClient(host=host, port=port, csr_csv=csr_csv) if bus is None else bus
+        self._blocks = {}
+
+    def open(self):
+        self.bus.open()
+
+    def close(self):
+        self.bus.close()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # Bus Accesses.
+    def block(self, prefix):
+        """Return (cached) CSR block of the given prefix."""
+        if prefix not in self._blocks:
+            self._blocks[prefix] = CSRBlock(self.bus.regs.d.values(), self.bus.bases.d, prefix, self.bus.csr_data_width)
+        return self._blocks[prefix]
+
+    def transaction(self, write=None, read=None):
+        """Issue optional write (addr, datas) and read (addr, length) or (addrs list) in a single
+        Etherbone packet, return read datas."""
+        addr_size = self.bus.csr_bus_address_width//8
+        record    = EtherboneRecord(addr_size)
+        if write is not None:
+            addr, datas = write
+            record.writes = EtherboneWrites(
+                base_addr = self.bus.base_address + addr,
+                addr_size = addr_size,
+                datas     = datas
+            )
+            record.wcount = len(record.writes)
+        if read is not None:
+            if isinstance(read, tuple):
+                addr, length = read
+                read = [addr + 4*j for j in range(length)]
+            record.reads = EtherboneReads(
+                addr_size = addr_size,
+                addrs     = [self.bus.base_address + addr for addr in read]
+            )
+            record.rcount = len(record.reads)
+        packet = EtherbonePacket(self.bus.csr_bus_address_width)
+        packet.records = [record]
+        packet.encode()
+        self.bus.send_packet(self.bus.socket, packet)
+        if read is None:
+            return []
+
+        # Wait for read response.
+        response = self.bus.receive_packet(self.bus.socket, addr_size)
+        if response == 0:
+            raise TimeoutError("TimeCard read timeout.")
+        packet = EtherbonePacket(self.bus.csr_bus_address_width, init=response)
+        packet.decode()
+        return packet.records.pop().writes.get_datas()
+
+    def read_block(self, prefix, write=None):
+        """Burst read a CSR block (with an optional pipelined write), return a {name: value} dict."""
+        block = self.block(prefix)
+        return block.decode(self.transaction(write=write, read=(block.base, block.length)))
+
+    # PTM.
+    def ptm_request(self, enable=1, timeout=1.0):
+        """Trigger a PTM Request and return the resulting PTMSample.
+
+        Trigger and PTM Requester block read are sent in the same packet; as the PTM exchange is
+        generally completed by the time the read is served, a single round-trip is generally
+        required (the block is re-read while busy).
+        """
+        block   = self.block("ptm_requester")
+        control = enable*PTM_CONTROL_ENABLE | PTM_CONTROL_TRIGGER
+        values  = self.read_block("ptm_requester", write=(block.regs["control"].addr, [control]))
+        t_start = time.time()
+        while values["status"] & PTM_STATUS_BUSY:
+            if (time.time() - t_start) > timeout:
+                raise TimeoutError("PTM Request timeout.")
+            values = self.read_block("ptm_requester")
+        return PTMSample(
+            valid      = bool(values["status"] & PTM_STATUS_VALID),
+            t1         = values["t1_time"],
+            t2         = values["master_time"],
+            t3         = values["master_time"] + values["link_delay"],
+            t4         = values["t4_time"],
+            link_delay = values["link_delay"],
+        )
+
+    # PTM Scheduler.
+    def ptm_scheduler_start(self, period, flush=True):
+        """Start periodic PTM Requests (period in sys_clk cycles)."""
+        block = self.block("ptm_scheduler")
+        self.transaction(write=(block.regs["period"].addr, [period]))
+        self.transaction(write=(block.regs["control"].addr, [PTM_SCHEDULER_CONTROL_ENABLE | flush*PTM_SCHEDULER_CONTROL_FLUSH]))
+
+    def ptm_scheduler_stop(self):
+        """Stop periodic PTM Requests (Samples are kept in FIFO)."""
+        block = self.block("ptm_scheduler")
+        self.transaction(write=(block.regs["control"].addr, [0]))
+
+    def ptm_scheduler_samples(self, max_samples=64):
+        """Drain up to max_samples PTMSamples from the PTM Scheduler FIFO, return (samples, overflows).
+
+        FIFO level/overflows are read in a first round-trip, then all the available samples are read
+        in a single packet (each sample being popped when its status register is read, after the
+        sample registers). The block is never read as a whole since it would pop a sample.
+        """
+        block = self.block("ptm_scheduler")
+        level, overflows = self.transaction(read=[block.regs["level"].addr, block.regs["overflows"].addr])
+        count = min(level, max_samples)
+        if count == 0:
+            return [], overflows
+        sample_regs  = [reg for name, reg in block.regs.items() if name.startswith("sample_")]
+        sample_addrs = [reg.addr + 4*i for reg in sample_regs for i in range(reg.length)]
+        datas   = self.transaction(read=sample_addrs*count)
+        samples = []
+        for n in range(count):
+            sample = {}
+            words  = datas[n*len(sample_addrs):(n + 1)*len(sample_addrs)]
+            for reg in sample_regs:
+                value = 0
+                for i in range(reg.length):
+                    value = (value << self.bus.csr_data_width) | words.pop(0) # MSB word first.
+                sample[reg.name[len("ptm_scheduler_sample_"):]] = value
+            if not (sample["status"] & PTM_SCHEDULER_SAMPLE_READABLE):
+                continue
+            samples.append(PTMSample(
+                valid      = bool(sample["status"] & PTM_SCHEDULER_SAMPLE_COMPLETED),
+                t1         = sample["t1"],
+                t2         = sample["t2"],
+                t3         = sample["t2"] + sample["link_delay"],
+                t4         = sample["t4"],
+                link_delay = sample["link_delay"],
+            ))
+        return samples, overflows
+
+    # PTM Statistics.
+    def ptm_statistics(self, clear=False):
+        """Snapshot the PTM Statistics (and start a new window when clear) and return the
+        PTMStatistics, in a single round-trip (snapshot write pipelined with the block read)."""
+        block   = self.block("ptm_statistics")
+        control = PTM_STATISTICS_CONTROL_SNAPSHOT | clear*PTM_STATISTICS_CONTROL_CLEAR
+        values  = self.read_block("ptm_statistics", write=(block.regs["control"].addr, [control]))
+        return decode_ptm_statistics(values)
+
+    # Time.
+    def read_time(self, enable=1):
+        """Latch and read Time Generator's time (in ns) in a single round-trip."""
+        block   = self.block("time_generator")
+        control = enable*TIME_CONTROL_ENABLE | TIME_CONTROL_READ
+        values  = self.read_block("time_generator", write=(block.regs["control"].addr, [control]))
+        return values["read_time"]
+
+    def write_time(self, t, enable=1):
+        """Write Time Generator's time (in ns)."""
+        block = self.block("time_generator")
+        reg   = block.regs["write_time"]
+        dw    = self.bus.csr_data_width
+        datas = [(t >> ((reg.length - 1 - i)*dw)) & (2**dw - 1) for i in range(reg.length)]
+        self.transaction(write=(reg.addr, datas))
+        self.transaction(write=(block.regs["control"].addr, [enable*TIME_CONTROL_ENABLE | TIME_CONTROL_WRITE]))
+
+    def _write_reg(self, prefix, name, value):
+        """Write a (multi-word) register, MSB word first (Time Generator registers are applied on
+        LSB write)."""
+        reg   = self.block(prefix).regs[name]
+        dw    = self.bus.csr_data_width
+        datas = [(value >> ((reg.length - 1 - i)*dw)) & (2**dw - 1) for i in range(reg.length)]
+        self.transaction(write=(reg.addr, datas))
+
+    def read_increment(self):
+        """Read Time Generator's increment (ns, 32.32 fixed-point)."""
+        reg   = self.block("time_generator").regs["increment"]
+        value = 0
+        for data in self.transaction(read=(reg.addr, reg.length)):
+            value = (value << self.bus.csr_data_width) | data # MSB word first.
+        return value
+
+    def write_increment(self, increment):
+        """Write Time Generator's increment (ns, 32.32 fixed-point)."""
+        self._write_reg("time_generator", "increment", increment)
+
+    def adjust_time(self, offset):
+        """Atomically add offset (ns, signed) to Time Generator's time."""
+        self._write_reg("time_generator", "offset", offset & (2**64 - 1))
+
+# Sample Rate --------------------------------------------------------------------------------------
+
+class SampleRate:
+    """Achieved samples/s measurement."""
+    def __init__(self):
+        self.samples = 0
+        self.t_start = time.time()
+
+    def update(self, samples=1):
+        self.samples += samples
+
+    @property
+    def elapsed(self):
+        return time.time() - self.t_start
+
+    def __str__(self):
+        return f"{self.samples} samples in {self.elapsed:.3f}s ({self.samples/self.elapsed:.1f} samples/s)"